@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# MolMod is a collection of molecular modelling tools for python.
+# Copyright (C) 2007 - 2012 Toon Verstraelen <Toon.Verstraelen@UGent.be>, Center
+# for Molecular Modeling (CMM), Ghent University, Ghent, Belgium; all rights
+# reserved unless otherwise stated.
+#
+# This file is part of MolMod.
+#
+# MolMod is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 3
+# of the License, or (at your option) any later version.
+#
+# MolMod is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>
+#
+#--
+#!/usr/bin/env python
+
+from molmod import *
+
+import time
+
+# 0) Load the molecules and set the default graphs
+molecules = []
+for fn_xyz in "propane.xyz", "dopamine.xyz", "mfi_fragment.xyz":
+    mol = Molecule.from_file(fn_xyz)
+    mol.set_default_graph()
+    molecules.append((fn_xyz, mol))
+
+# 1) The patterns that are searched in each molecule.
+patterns = [
+    ("bonds", BondPattern([CriteriaSet()])),
+    ("bends", BendingAnglePattern([CriteriaSet()])),
+    ("dihedrals", DihedralAnglePattern([CriteriaSet()])),
+    ("out of planes", OutOfPlanePattern([CriteriaSet()])),
+    ("4-rings", NRingPattern(4, [CriteriaSet()])),
+    ("8-rings", NRingPattern(8, [CriteriaSet()])),
+    ("strong rings", RingPattern(12)),
+]
+
+# 2) Compare the pruned graph search with the exhaustive one of older versions.
+# The exhaustive search may also return invalid matches when a new vertex in
+# the pattern graph has several neighbors in the previous level.
+def run(pattern, graph, prune):
+    begin = time.time()
+    num_matches = len(list(GraphSearch(pattern, prune=prune)(graph)))
+    return num_matches, time.time() - begin
+
+print "%18s %14s %8s %8s %10s %10s" % ("molecule", "pattern", "old", "new", "old [s]", "new [s]")
+for fn_xyz, mol in molecules:
+    for label, pattern in patterns:
+        num_old, time_old = run(pattern, mol.graph, False)
+        num_new, time_new = run(pattern, mol.graph, True)
+        print "%18s %14s %8i %8i %10.4f %10.4f" % (fn_xyz, label, num_old, num_new, time_old, time_new)
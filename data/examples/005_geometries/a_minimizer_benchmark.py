@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# MolMod is a collection of molecular modelling tools for python.
+# Copyright (C) 2007 - 2012 Toon Verstraelen <Toon.Verstraelen@UGent.be>, Center
+# for Molecular Modeling (CMM), Ghent University, Ghent, Belgium; all rights
+# reserved unless otherwise stated.
+#
+# This file is part of MolMod.
+#
+# MolMod is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 3
+# of the License, or (at your option) any later version.
+#
+# MolMod is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>
+#
+#--
+
+from molmod import *
+from molmod.minimizer import *
+
+import numpy, time, sys
+
+# With --quick, only a small molecule and a few methods are tested.
+quick = "--quick" in sys.argv[1:]
+
+# 0) Load the molecular graphs
+graphs = []
+if quick:
+    fns_xyz = ["caffeine.xyz"]
+else:
+    fns_xyz = ["caffeine.xyz", "mfi_fragment.xyz"]
+for fn_xyz in fns_xyz:
+    mol = Molecule.from_file(fn_xyz)
+    graphs.append((fn_xyz, MolecularGraph.from_geometry(mol)))
+
+# 1) A wrapper around the force field that counts the function calls.
+class Counter(object):
+    def __init__(self, ff):
+        self.ff = ff
+        self.calls = 0
+
+    def __call__(self, x, do_gradient=False):
+        self.calls += 1
+        return self.ff(x, do_gradient)
+
+# 2) Go through the same stages as guess_geometry, starting from the same
+# random coordinates, with a given search direction. FIRE does not need a line
+# search.
+def run(graph, search_direction):
+    numpy.random.seed(1)
+    x = numpy.random.normal(0, 1, graph.num_vertices*3)
+    ff = ToyFF(graph)
+    if isinstance(search_direction, FIRE):
+        line_search = None
+    else:
+        line_search = NewtonLineSearch()
+    fun = Counter(ff)
+    iterations = 0
+    begin = time.time()
+    for dm_quad, dm_reci, bond_quad, bond_hyper, span_quad in [
+        (1.0, 0.0, 0.0, 0.0, 0.0), (1.0, 1.0, 0.0, 0.0, 0.0),
+        (0.0, 0.2, 1.0, 0.0, 0.0), (0.0, 0.2, 0.0, 1.0, 1.0)]:
+        ff.dm_quad = dm_quad
+        ff.dm_reci = dm_reci
+        ff.bond_quad = bond_quad
+        ff.bond_hyper = bond_hyper
+        ff.span_quad = span_quad
+        minimizer = Minimizer(
+            x, fun, search_direction, line_search,
+            ConvergenceCondition(grad_rms=1e-6, step_rms=1e-6),
+            StopLossCondition(max_iter=500, fun_margin=0.1),
+            anagrad=True, verbose=False,
+        )
+        x = minimizer.x
+        iterations += minimizer.counter
+    return iterations, fun.calls, time.time() - begin, ff(x)
+
+# 3) Compare the conjugate gradient method and the dense quasi Newton method
+# with L-BFGS for a few history lengths and with FIRE.
+methods = [
+    ("CG", ConjugateGradient()),
+    ("QN", QuasiNewton()),
+    ("LBFGS(5)", LBFGS(5)),
+    ("LBFGS(10)", LBFGS(10)),
+    ("LBFGS(20)", LBFGS(20)),
+    ("FIRE", FIRE(max_step=0.5)),
+]
+if quick:
+    methods = [methods[0], methods[3], methods[5]]
+print "%18s %10s %6s %6s %8s %12s" % ("molecule", "method", "iter", "calls", "time [s]", "energy")
+for fn_xyz, graph in graphs:
+    for label, search_direction in methods:
+        iterations, calls, duration, energy = run(graph, search_direction)
+        print "%18s %10s %6i %6i %8.3f %12.6f" % (fn_xyz, label, iterations, calls, duration, energy)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# MolMod is a collection of molecular modelling tools for python.
+# Copyright (C) 2007 - 2012 Toon Verstraelen <Toon.Verstraelen@UGent.be>, Center
+# for Molecular Modeling (CMM), Ghent University, Ghent, Belgium; all rights
+# reserved unless otherwise stated.
+#
+# This file is part of MolMod.
+#
+# MolMod is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 3
+# of the License, or (at your option) any later version.
+#
+# MolMod is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>
+#
+#--
+
+from molmod import *
+from molmod.minimizer import *
+
+import numpy, time, sys
+
+# 0) The same molecular graph is used several times, each time with different
+# random initial coordinates. With --quick, only a few copies are used.
+mol = Molecule.from_file("caffeine.xyz")
+graph = MolecularGraph.from_geometry(mol)
+if "--quick" in sys.argv[1:]:
+    num_copies = 3
+else:
+    num_copies = 20
+graphs = [graph]*num_copies
+numpy.random.seed(1)
+coordinates = [numpy.random.normal(0, 1, (graph.num_vertices, 3)) for graph in graphs]
+
+# 1) The parameters of the ToyFF in the stages of guess_geometry
+stages = [
+    (1.0, 0.0, 0.0, 0.0, 0.0), (1.0, 1.0, 0.0, 0.0, 0.0),
+    (0.0, 0.2, 1.0, 0.0, 0.0), (0.0, 0.2, 0.0, 1.0, 1.0),
+]
+def configure(ff, stage):
+    ff.dm_quad, ff.dm_reci, ff.bond_quad, ff.bond_hyper, ff.span_quad = stage
+
+# 2) Optimize the geometries one by one.
+begin = time.time()
+energies_serial = []
+for graph, c in zip(graphs, coordinates):
+    ff = ToyFF(graph)
+    x = c.ravel()
+    for stage in stages:
+        configure(ff, stage)
+        minimizer = Minimizer(
+            x, ff, ConjugateGradient(), NewtonLineSearch(),
+            ConvergenceCondition(grad_rms=1e-6, step_rms=1e-6),
+            StopLossCondition(max_iter=500, fun_margin=0.1),
+            anagrad=True, verbose=False,
+        )
+        x = minimizer.x
+    energies_serial.append(ff(x))
+time_serial = time.time() - begin
+
+# 3) Optimize all geometries in lock-step.
+begin = time.time()
+ff = BatchToyFF(graphs)
+x = ff.pack(coordinates)
+for stage in stages:
+    configure(ff, stage)
+    minimizer = BatchMinimizer(
+        x, ff, NewtonLineSearch(),
+        ConvergenceCondition(grad_rms=1e-6, step_rms=1e-6),
+        StopLossCondition(max_iter=500, fun_margin=0.1),
+        sizes=ff.sizes, verbose=False,
+    )
+    x = minimizer.x
+energies_batch = ff(x)
+time_batch = time.time() - begin
+
+print "%10s %10s %10s" % ("", "serial", "batch")
+print "%10s %10.3f %10.3f" % ("time [s]", time_serial, time_batch)
+print "%10s %10.6f %10.6f" % ("energy", numpy.mean(energies_serial), energies_batch.mean())
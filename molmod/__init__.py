@@ -55,8 +55,10 @@ np.seterr(divide='raise', invalid='raise')
 from molmod.context import *
 
 from molmod.binning import *
+from molmod.canonical import *
 from molmod.clusters import *
 from molmod.constants import *
+from molmod.ewald import *
 from molmod.graphs import *
 from molmod.ic import *
 from molmod.log import *
@@ -66,6 +68,7 @@ from molmod.molecular_graphs import *
 from molmod.pairff import *
 from molmod.quaternions import *
 from molmod.randomize import *
+from molmod.rings import *
 from molmod.similarity import *
 from molmod.symmetry import *
 from molmod.toyff import *
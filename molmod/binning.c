@@ -0,0 +1,82 @@
+// MolMod is a collection of molecular modelling tools for python.
+// Copyright (C) 2007 - 2012 Toon Verstraelen <Toon.Verstraelen@UGent.be>, Center
+// for Molecular Modeling (CMM), Ghent University, Ghent, Belgium; all rights
+// reserved unless otherwise stated.
+//
+// This file is part of MolMod.
+//
+// MolMod is free software; you can redistribute it and/or
+// modify it under the terms of the GNU General Public License
+// as published by the Free Software Foundation; either version 3
+// of the License, or (at your option) any later version.
+//
+// MolMod is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License
+// along with this program; if not, see <http://www.gnu.org/licenses/>
+//
+//--
+
+
+
+#include <math.h>
+#include "common.h"
+
+
+int binning_pair_search(int n0, double *cor0, int n1, double *cor1,
+  double cutoff, int intra, int periodic, double *matrix, double *reciprocal,
+  int *order0, int ncs0, int *cell_start0, int *order1, int ncs1, int *cell_start1,
+  int nc, int nn, int *cells0, int *neighbors, int *progress,
+  int m, int *pairs, double *deltas, double *distances) {
+  /* Compute all pairs with a distance below the cutoff between the atoms in
+     the bins cells0[progress[0]:] and the atoms in their neighboring bins.
+
+     The results are written to the preallocated buffers pairs, deltas and
+     distances, which have room for m pairs. When the buffers are full, the
+     routine stops before the first bin whose pairs did not fit and
+     progress[0] is set to that bin. The return value is the number of pairs
+     written to the buffers. The caller can then grow the buffers and call
+     this routine again to process the remaining bins. */
+  int c, k, cell1, a0, a1, i0, i1, counter, counter_begin;
+  double d, delta[3];
+
+  counter = 0;
+  for (c = progress[0]; c < nc; c++) {
+    counter_begin = counter;
+    if ((cells0[c] < 0) || (cells0[c] >= ncs0-1)) continue;
+    for (k = 0; k < nn; k++) {
+      cell1 = neighbors[c*nn + k];
+      if ((cell1 < 0) || (cell1 >= ncs1-1)) continue;
+      for (a0 = cell_start0[cells0[c]]; a0 < cell_start0[cells0[c]+1]; a0++) {
+        i0 = order0[a0];
+        for (a1 = cell_start1[cell1]; a1 < cell_start1[cell1+1]; a1++) {
+          i1 = order1[a1];
+          if (intra && (i1 >= i0)) continue;
+          if (periodic) {
+            d = distance_delta_periodic(cor1 + 3*i1, cor0 + 3*i0, delta, matrix, reciprocal);
+          } else {
+            d = distance_delta(cor1 + 3*i1, cor0 + 3*i0, delta);
+          }
+          if (d > cutoff) continue;
+          if (counter == m) {
+            /* The buffers are full, discard the pairs of the current bin. */
+            progress[0] = c;
+            return counter_begin;
+          }
+          pairs[2*counter] = i0;
+          pairs[2*counter+1] = i1;
+          deltas[3*counter] = delta[0];
+          deltas[3*counter+1] = delta[1];
+          deltas[3*counter+2] = delta[2];
+          distances[counter] = d;
+          counter++;
+        }
+      }
+    }
+  }
+  progress[0] = nc;
+  return counter;
+}
@@ -36,11 +36,21 @@ from molmod.unit_cells import UnitCell
 import numpy
 
 
-__all__ = ["PairSearchIntra", "PairSearchInter"]
+__all__ = [
+    "PairSearchIntra", "PairSearchInter", "VerletList", "SparseDistanceMatrix",
+]
 
 
 class Binning(object):
-    """Division of coordinates in regular bins"""
+    """Division of coordinates in regular bins
+
+       The bins are stored as a compact cell list: the attribute ``order`` is
+       a permutation of the coordinates sorted by bin, and the contents of
+       the i-th occupied bin is ``order[cell_start[i]:cell_start[i+1]]``. The
+       integer keys of the occupied bins are stored in ``cell_keys`` and the
+       sorted linear bin indexes in ``cell_linear``. Bins are looked up by
+       bisection in the latter array.
+    """
     def __init__(self, coordinates, cutoff, grid_cell, integer_cell=None):
         """Initialize a Binning object
 
@@ -58,23 +68,10 @@ class Binning(object):
             | ``integer_cell``  --  the periodicity of the system in terms if
                                     integer grid cells.
         """
+        self.coordinates = coordinates
         self.grid_cell = grid_cell
         self.integer_cell = integer_cell
 
-        # setup the bins
-        self._bins = {}
-
-        fractional = grid_cell.to_fractional(coordinates)
-        for i in xrange(len(coordinates)):
-            key = tuple(fractional[i].astype(int))
-            if integer_cell is not None:
-                key = self.wrap_key(key)
-            bin = self._bins.get(key)
-            if bin is None:
-                bin = []
-                self._bins[key] = bin
-            bin.append((i, coordinates[i]))
-
         # compute the neigbouring bins within the cutoff
         if self.integer_cell is None:
             self.neighbor_indexes = grid_cell.get_radius_indexes(cutoff)
@@ -83,28 +80,125 @@ class Binning(object):
             max_ranges[True^self.integer_cell.active] = -1
             self.neighbor_indexes = grid_cell.get_radius_indexes(cutoff, max_ranges)
 
+        # assign a key to each coordinate
+        keys = grid_cell.to_fractional(coordinates).astype(int)
+        if integer_cell is not None:
+            keys = self.wrap_keys(keys)
+
+        # The linear bin index is defined on a box that contains all occupied
+        # bins, padded such that the neighbors of an occupied bin also lie
+        # inside the box. Hence, in the aperiodic case, the neighbors of a bin
+        # are found by adding the precomputed neighbor_offsets to its linear
+        # index.
+        padding = abs(self.neighbor_indexes).max(axis=0)
+        if len(keys) > 0:
+            self._lower = keys.min(axis=0) - padding
+            self._upper = keys.max(axis=0) + padding
+        else:
+            self._lower = -padding
+            self._upper = padding
+        shape = self._upper - self._lower + 1
+        self._strides = numpy.array([shape[1]*shape[2], shape[2], 1], numpy.int64)
+        self.neighbor_offsets = numpy.dot(self.neighbor_indexes, self._strides)
+
+        # sort the coordinates by linear bin index
+        linear = numpy.dot(keys - self._lower, self._strides)
+        self.order = numpy.argsort(linear, kind="mergesort").astype(numpy.int32)
+        self.cell_linear, first = numpy.unique(linear[self.order], return_index=True)
+        self.cell_start = numpy.zeros(len(first)+1, numpy.int32)
+        self.cell_start[:-1] = first
+        self.cell_start[-1] = len(keys)
+        self.cell_keys = keys[self.order[first]]
+
+    num_cells = property(lambda self: len(self.cell_linear),
+        doc="the number of occupied bins")
+
     def __iter__(self):
-        """Iterate over (key,bin) pairs"""
-        return self._bins.iteritems()
+        """Iterate over (key,bin) pairs
+
+           Each bin is an array with the indexes of the coordinates it
+           contains.
+        """
+        for cell in xrange(self.num_cells):
+            yield tuple(self.cell_keys[cell]), self._get_cell_contents(cell)
 
     def iter_surrounding(self, center_key):
         """Iterate over all bins surrounding the given bin"""
-        for shift in self.neighbor_indexes:
-            key = tuple(numpy.add(center_key, shift).astype(int))
-            if self.integer_cell is not None:
-                key = self.wrap_key(key)
-            bin = self._bins.get(key)
-            if bin is not None:
-                yield key, bin
+        keys = numpy.add(center_key, self.neighbor_indexes).astype(int)
+        if self.integer_cell is not None:
+            keys = self.wrap_keys(keys)
+        cells = self.lookup_keys(keys)
+        for key, cell in zip(keys, cells):
+            if cell >= 0:
+                yield tuple(key), self._get_cell_contents(cell)
+
+    def _get_cell_contents(self, cell):
+        """Return the indexes of the coordinates in the given occupied bin"""
+        return self.order[self.cell_start[cell]:self.cell_start[cell+1]]
 
     def wrap_key(self, key):
         """Translate the key into the central cell
 
            This method is only applicable in case of a periodic system.
         """
-        return tuple(numpy.round(
-            self.integer_cell.shortest_vector(key)
-        ).astype(int))
+        return tuple(self.wrap_keys(numpy.array(key)))
+
+    def wrap_keys(self, keys):
+        """Translate an array of keys into the central cell
+
+           This method is only applicable in case of a periodic system. The
+           last dimension of the array must have size three.
+        """
+        return numpy.round(
+            self.integer_cell.shortest_vector(keys)
+        ).astype(int)
+
+    def _lookup_linear(self, linear):
+        """Return the occupied bin indexes for an array of linear indexes
+
+           Unoccupied bins get index -1.
+        """
+        if self.num_cells == 0:
+            return numpy.zeros(linear.shape, int) - 1
+        cells = numpy.searchsorted(self.cell_linear, linear)
+        cells[cells == self.num_cells] = 0
+        return numpy.where(self.cell_linear[cells] == linear, cells, -1)
+
+    def lookup_keys(self, keys):
+        """Return the occupied bin indexes for an array of (wrapped) keys
+
+           The last dimension of the array must have size three. Unoccupied
+           bins get index -1.
+        """
+        inside = ((keys >= self._lower) & (keys <= self._upper)).all(axis=-1)
+        linear = numpy.dot(keys - self._lower, self._strides)
+        linear[~inside] = -1
+        return self._lookup_linear(linear)
+
+    def get_surrounding_cells(self, cells, other=None):
+        """Return the bins surrounding a set of occupied bins
+
+           Argument:
+            | ``cells``  --  an array with indexes of occupied bins
+
+           Optional argument:
+            | ``other``  --  a Binning object with the same grid in which the
+                             surrounding bins are looked up. [default=self]
+
+           Returns: an array with shape (len(cells), len(neighbor_indexes))
+           with the indexes of the surrounding bins in other. Unoccupied bins
+           get index -1.
+        """
+        if other is None:
+            other = self
+        if self.integer_cell is None and other is self:
+            return self._lookup_linear(
+                self.cell_linear[cells].reshape(-1, 1) + self.neighbor_offsets
+            )
+        keys = self.cell_keys[cells].reshape(-1, 1, 3) + self.neighbor_indexes
+        if self.integer_cell is not None:
+            keys = self.wrap_keys(keys)
+        return other.lookup_keys(keys)
 
 
 class PairSearchBase(object):
@@ -147,6 +241,80 @@ class PairSearchBase(object):
 
         return grid_cell, integer_cell
 
+    def _search(self, bins0, bins1, intra, chunk_size=256):
+        """Compute all pairs with a distance below the cutoff
+
+           Arguments:
+            | ``bins0``, ``bins1``  --  Binning objects with the same grid
+            | ``intra``  --  When True, only pairs with ``index1 < index0``
+                             are retained.
+
+           Optional argument:
+            | ``chunk_size``  --  The number of bins from bins0 whose
+                                  surrounding bins are looked up at once.
+
+           The distances are computed by the ``binning_pair_search`` routine
+           in the extension module. It fills preallocated buffers and returns
+           early when they are full, in which case the buffers are enlarged
+           and the routine is called again for the remaining bins.
+        """
+        from molmod.ext import binning_pair_search
+        if self.unit_cell is None:
+            matrix = None
+            reciprocal = None
+        else:
+            matrix = self.unit_cell.matrix
+            reciprocal = self.unit_cell.reciprocal
+
+        size = max(1024, 8*len(bins0.coordinates))
+        pairs = numpy.zeros((size, 2), numpy.int32)
+        deltas = numpy.zeros((size, 3), float)
+        distances = numpy.zeros(size, float)
+
+        batches = []
+        for begin in xrange(0, bins0.num_cells, chunk_size):
+            cells0 = numpy.arange(begin, min(begin + chunk_size, bins0.num_cells))
+            neighbors = bins0.get_surrounding_cells(cells0, bins1)
+            progress = numpy.zeros(1, numpy.int32)
+            while progress[0] < len(cells0):
+                count = binning_pair_search(
+                    bins0.coordinates, bins1.coordinates, self.cutoff,
+                    intra, bins0.order, bins0.cell_start, bins1.order,
+                    bins1.cell_start, cells0, neighbors, progress, pairs,
+                    deltas, distances, matrix, reciprocal
+                )
+                batches.append((
+                    pairs[:count, 0].copy(), pairs[:count, 1].copy(),
+                    deltas[:count].copy(), distances[:count].copy(),
+                ))
+                if progress[0] < len(cells0):
+                    # the buffers are too small
+                    size *= 2
+                    pairs = numpy.zeros((size, 2), numpy.int32)
+                    deltas = numpy.zeros((size, 3), float)
+                    distances = numpy.zeros(size, float)
+
+        if len(batches) == 0:
+            return (
+                numpy.zeros(0, numpy.int32), numpy.zeros(0, numpy.int32),
+                numpy.zeros((0, 3), float), numpy.zeros(0, float),
+            )
+        return tuple(
+            numpy.concatenate([batch[i] for batch in batches])
+            for i in xrange(4)
+        )
+
+    def __iter__(self):
+        """Iterate over all pairs with a distance below the cutoff
+
+           This is a thin wrapper around :meth:`get_arrays`.
+        """
+        index0, index1, deltas, distances = self.get_arrays()
+        index0 = index0.tolist()
+        index1 = index1.tolist()
+        for k in xrange(len(distances)):
+            yield index0[k], index1[k], deltas[k], distances[k]
+
 
 class PairSearchIntra(PairSearchBase):
     """Iterator over all pairs of coordinates with a distance below a cutoff.
@@ -157,6 +325,11 @@ class PairSearchIntra(PairSearchBase):
            for i, j, distance, delta in PairSearchIntra(coordinates, 2.5):
                print i, j, distance
 
+       All pairs can also be obtained at once as numpy arrays, which is much
+       more efficient for large systems::
+
+           i, j, delta, distance = PairSearchIntra(coordinates, 2.5).get_arrays()
+
        Note that for periodic systems the minimum image convention is applied.
     """
 
@@ -192,20 +365,17 @@ class PairSearchIntra(PairSearchBase):
         grid_cell, integer_cell = self._setup_grid(cutoff, unit_cell, grid)
         self.bins = Binning(coordinates, cutoff, grid_cell, integer_cell)
 
-    def __iter__(self):
-        """Iterate over all pairs with a distance below the cutoff"""
-        for key0, bin0 in self.bins:
-            for key1, bin1 in self.bins.iter_surrounding(key0):
-                for i0, c0 in bin0:
-                    for i1, c1 in bin1:
-                        if i1 >= i0:
-                            continue
-                        delta = c1 - c0
-                        if self.unit_cell is not None:
-                            delta = self.unit_cell.shortest_vector(delta)
-                        distance = numpy.linalg.norm(delta)
-                        if distance <= self.cutoff:
-                            yield i0, i1, delta, distance
+    def get_arrays(self):
+        """Compute all pairs with a distance below the cutoff at once
+
+           Returns: ``(index0, index1, deltas, distances)``, where ``index0``
+           and ``index1`` are integer arrays with the atom indexes of each pair
+           (``index1 < index0``), ``deltas`` is an array with the relative
+           vectors ``coordinates[index1] - coordinates[index0]`` and
+           ``distances`` contains their norms.
+        """
+        return self._search(self.bins, self.bins, True)
+
 
 class PairSearchInter(PairSearchBase):
     """Iterator over all pairs of coordinates with a distance below a cutoff.
@@ -253,15 +423,199 @@ class PairSearchInter(PairSearchBase):
         self.bins0 = Binning(coordinates0, cutoff, grid_cell, integer_cell)
         self.bins1 = Binning(coordinates1, cutoff, grid_cell, integer_cell)
 
-    def __iter__(self):
-        """Iterate over all pairs with a distance below the cutoff"""
-        for key0, bin0 in self.bins0:
-            for key1, bin1 in self.bins1.iter_surrounding(key0):
-                for i0, c0 in bin0:
-                    for i1, c1 in bin1:
-                        delta = c1 - c0
-                        if self.unit_cell is not None:
-                            delta = self.unit_cell.shortest_vector(delta)
-                        distance = numpy.linalg.norm(delta)
-                        if distance <= self.cutoff:
-                            yield i0, i1, delta, distance
+    def get_arrays(self):
+        """Compute all pairs with a distance below the cutoff at once
+
+           Returns: ``(index0, index1, deltas, distances)``, where ``index0``
+           and ``index1`` are integer arrays with the indexes of each pair in
+           coordinates0 and coordinates1, respectively. ``deltas`` is an array
+           with the relative vectors ``coordinates1[index1] -
+           coordinates0[index0]`` and ``distances`` contains their norms.
+        """
+        return self._search(self.bins0, self.bins1, False)
+
+
+class VerletList(object):
+    """A neighbor list that is reused for subsequent frames of a trajectory.
+
+       The pairs are searched with a cutoff that is slightly larger than the
+       actual cutoff, i.e. ``cutoff + skin``. As long as no atom has moved
+       more than half the skin since the last search, no pair can have
+       entered the actual cutoff sphere and it is sufficient to recompute the
+       distances of the stored pairs.
+
+       Example usage::
+
+           verlet_list = VerletList(5*angstrom, 1*angstrom)
+           for title, coordinates in XYZReader("traj.xyz"):
+               i, j, delta, distance = verlet_list.update(coordinates)
+
+       Note that for periodic systems the minimum image convention is applied.
+    """
+
+    def __init__(self, cutoff, skin, unit_cell=None, grid=None):
+        """
+           Arguments:
+            | ``cutoff``  --  The cutoff radius for the pair distances.
+            | ``skin``  --  The margin added to the cutoff when the pairs are
+                            searched with :class:`PairSearchIntra`.
+
+           Optional arguments:
+            | ``unit_cell``  --  Specifies the periodic boundary conditions
+            | ``grid``  --  Specification of the grid, see
+                            :class:`PairSearchIntra`.
+        """
+        if skin < 0:
+            raise ValueError("The skin must be positive.")
+        self.cutoff = cutoff
+        self.skin = skin
+        self.unit_cell = unit_cell
+        self.grid = grid
+        self.num_builds = 0
+        self._reference = None
+        self._index0 = None
+        self._index1 = None
+
+    def _needs_build(self, coordinates):
+        """Test if some atom has moved too far since the last pair search"""
+        if self._reference is None or self._reference.shape != coordinates.shape:
+            return True
+        if len(coordinates) == 0:
+            return False
+        displacements = coordinates - self._reference
+        if self.unit_cell is not None:
+            displacements = self.unit_cell.shortest_vector(displacements)
+        max_sq = (displacements*displacements).sum(axis=1).max()
+        return max_sq > (0.5*self.skin)**2
+
+    def _build(self, coordinates):
+        """Search all pairs within cutoff + skin"""
+        pair_search = PairSearchIntra(
+            coordinates, self.cutoff + self.skin, self.unit_cell, self.grid
+        )
+        self._index0, self._index1 = pair_search.get_arrays()[:2]
+        self._reference = coordinates.copy()
+        self.num_builds += 1
+
+    def get_candidates(self, coordinates):
+        """Return all pairs that may lie within the cutoff for a new frame
+
+           Argument:
+            | ``coordinates``  --  A Nx3 numpy array with Cartesian coordinates
+
+           Returns: ``(index0, index1)``, the pairs with a distance below
+           ``cutoff + skin`` at the last pair search, which includes all pairs
+           within the cutoff in the new frame. The pair search is only
+           repeated when needed. Unlike :meth:`update`, no distances are
+           computed, which is useful when the caller filters the pairs
+           itself, e.g. in compiled code. The same arrays are returned as long
+           as the pairs are not searched again.
+        """
+        if self._needs_build(coordinates):
+            self._build(coordinates)
+        return self._index0, self._index1
+
+    def update(self, coordinates):
+        """Compute all pairs with a distance below the cutoff for a new frame
+
+           Argument:
+            | ``coordinates``  --  A Nx3 numpy array with Cartesian coordinates
+
+           Returns: ``(index0, index1, deltas, distances)``, with the same
+           conventions as :meth:`PairSearchIntra.get_arrays`. The pair search
+           is only repeated when needed.
+        """
+        if self._needs_build(coordinates):
+            self._build(coordinates)
+        deltas = coordinates[self._index1] - coordinates[self._index0]
+        if self.unit_cell is not None:
+            deltas = self.unit_cell.shortest_vector(deltas)
+        distances = numpy.sqrt((deltas*deltas).sum(axis=1))
+        mask = distances <= self.cutoff
+        return self._index0[mask], self._index1[mask], deltas[mask], distances[mask]
+
+
+class SparseDistanceMatrix(object):
+    """A symmetric distance matrix in compressed sparse row (CSR) format
+
+       Only the distances below a cutoff are stored. The column indexes of
+       the non-zero elements in row ``i`` are
+       ``indices[indptr[i]:indptr[i+1]]`` and the corresponding distances are
+       ``data[indptr[i]:indptr[i+1]]``. The column indexes are sorted within
+       each row. Both ``(i, j)`` and ``(j, i)`` are present.
+
+       Example usage::
+
+           dm = SparseDistanceMatrix.from_coordinates(coordinates, 5*angstrom)
+           neighbors, distances = dm.get_row(0)
+    """
+
+    def __init__(self, size, indptr, indices, data):
+        """
+           Arguments:
+            | ``size``  --  The number of rows (and columns)
+            | ``indptr``  --  Integer array with the start of each row in
+                              indices and data, with size+1 elements
+            | ``indices``  --  Integer array with the column indexes
+            | ``data``  --  Array with the distances
+        """
+        if len(indptr) != size+1:
+            raise TypeError("The length of indptr must be size+1.")
+        if len(indices) != len(data):
+            raise TypeError("The arrays indices and data must have the same length.")
+        self.size = size
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+
+    @classmethod
+    def from_pairs(cls, size, index0, index1, distances):
+        """Construct a sparse distance matrix from a list of pairs
+
+           Arguments:
+            | ``size``  --  The number of rows (and columns)
+            | ``index0``, ``index1``, ``distances``  --  Arrays describing the
+                  pairs, e.g. as returned by :meth:`PairSearchIntra.get_arrays`.
+                  Each pair must be included only once.
+        """
+        rows = numpy.concatenate([index0, index1])
+        columns = numpy.concatenate([index1, index0])
+        order = numpy.lexsort([columns, rows])
+        indptr = numpy.zeros(size+1, numpy.int32)
+        indptr[1:] = numpy.bincount(rows, minlength=size).cumsum()
+        indices = columns[order].astype(numpy.int32)
+        data = numpy.concatenate([distances, distances])[order]
+        return cls(size, indptr, indices, data)
+
+    @classmethod
+    def from_coordinates(cls, coordinates, cutoff, unit_cell=None, grid=None):
+        """Compute all distances below a cutoff
+
+           Arguments:
+            | ``coordinates``  --  A Nx3 numpy array with Cartesian coordinates
+            | ``cutoff``  --  The cutoff radius for the pair distances.
+
+           Optional arguments:
+            | ``unit_cell``  --  Specifies the periodic boundary conditions
+            | ``grid``  --  Specification of the grid, see
+                            :class:`PairSearchIntra`.
+        """
+        pair_search = PairSearchIntra(coordinates, cutoff, unit_cell, grid)
+        index0, index1, deltas, distances = pair_search.get_arrays()
+        return cls.from_pairs(len(coordinates), index0, index1, distances)
+
+    num_nonzero = property(lambda self: len(self.data),
+        doc="the number of stored distances")
+
+    def get_row(self, i):
+        """Return the column indexes and the distances in row i"""
+        begin = self.indptr[i]
+        end = self.indptr[i+1]
+        return self.indices[begin:end], self.data[begin:end]
+
+    def to_dense(self):
+        """Return a dense matrix with zeros for the distances not stored"""
+        result = numpy.zeros((self.size, self.size), self.data.dtype)
+        rows = numpy.repeat(numpy.arange(self.size), self.indptr[1:] - self.indptr[:-1])
+        result[rows, self.indices] = self.data
+        return result
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+# MolMod is a collection of molecular modelling tools for python.
+# Copyright (C) 2007 - 2012 Toon Verstraelen <Toon.Verstraelen@UGent.be>, Center
+# for Molecular Modeling (CMM), Ghent University, Ghent, Belgium; all rights
+# reserved unless otherwise stated.
+#
+# This file is part of MolMod.
+#
+# MolMod is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 3
+# of the License, or (at your option) any later version.
+#
+# MolMod is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>
+#
+#--
+"""Canonical labeling of graphs with individualization and refinement
+
+   The search follows the scheme of McKay's nauty:
+
+       B. D. McKay and A. Piperno, "Practical graph isomorphism, II",
+       J. Symbolic Comput. 60, 94-112 (2014)
+
+   The initial coloring of the vertices is derived from the vertex strings and
+   the vertex fingerprints of the graph. The coloring is refined by counting
+   neighbors in each color class, taking into account the edge strings. When
+   the refined coloring is not discrete, the vertices in the first
+   non-singleton class are individualized one by one, which results in a
+   search tree. Each leaf of the tree is a discrete coloring, i.e. a labeling of
+   the vertices, and the best leaf defines the canonical labeling. Two leaves
+   that give the same relabeled graph define an automorphism, which is used to
+   prune equivalent branches of the tree.
+
+   All routines in this module are also available through cached attributes of
+   :class:`molmod.graphs.Graph`, e.g. ``graph.canonical_labeling``,
+   ``graph.automorphism_generators`` and ``graph.canonical_form``.
+"""
+
+
+import numpy
+
+from molmod.graphs import _mix64
+
+
+__all__ = ["get_canonical_labeling", "iter_group"]
+
+
+def _rank(keys):
+    """Return the rank of each key in the sorted list of unique keys"""
+    ranks = dict((key, index) for index, key in enumerate(sorted(set(keys))))
+    return numpy.array([ranks[key] for key in keys], int)
+
+
+def _get_orbits(size, generators):
+    """Return the smallest vertex in the orbit of each vertex"""
+    labels = numpy.arange(size)
+    while True:
+        old = labels
+        labels = labels.copy()
+        for generator in generators:
+            numpy.minimum.at(labels, generator, labels.copy())
+            labels = numpy.minimum(labels, labels[generator])
+        labels = labels[labels]
+        if (labels == old).all():
+            return labels
+
+
+class _Search(object):
+    """The search tree of the individualization-refinement algorithm"""
+
+    def __init__(self, graph):
+        """
+           Argument:
+            | ``graph``  --  the graph to be labeled
+        """
+        self.size = graph.num_vertices
+        vertex_keys = [
+            (graph.get_vertex_string(i), str(buffer(graph.vertex_fingerprints[i])))
+            for i in xrange(self.size)
+        ]
+        self.initial_colors = _rank(vertex_keys)
+        edge_colors = _rank([graph.get_edge_string(i) for i in xrange(graph.num_edges)])
+        self.edges = graph.edge_array
+        self.edge_colors = edge_colors
+        # the neighbors in csr format, used to sum codes over all neighbors
+        indptr, self.neighbors, edge_ids = graph.csr
+        self.edge_codes = _mix64(
+            edge_colors[edge_ids].astype(numpy.uint64) +
+            numpy.uint64(0x9e3779b97f4a7c15)
+        )
+        self.connected = (indptr[1:] > indptr[:-1]).nonzero()[0]
+        self.offsets = indptr[self.connected]
+        self.generators = []
+        self.first = None
+        self.best = None
+
+    def refine(self, colors):
+        """Refine a coloring until the number of color classes is stable
+
+           The new colors are sorted by the old color first, such that the
+           result is always a refinement of the input.
+        """
+        num_classes = colors.max() + 1
+        while num_classes < self.size:
+            codes = _mix64(
+                colors[self.neighbors].astype(numpy.uint64) *
+                numpy.uint64(0xbf58476d1ce4e5b9) + self.edge_codes
+            )
+            sums = numpy.zeros(self.size, numpy.uint64)
+            if len(codes) > 0:
+                sums[self.connected] = numpy.add.reduceat(codes, self.offsets)
+            order = numpy.lexsort([sums, colors])
+            changes = (
+                (colors[order[1:]] != colors[order[:-1]]) |
+                (sums[order[1:]] != sums[order[:-1]])
+            )
+            new_colors = numpy.zeros(self.size, int)
+            new_colors[order[1:]] = changes.cumsum()
+            new_num_classes = new_colors[order[-1]] + 1
+            if new_num_classes == num_classes:
+                break
+            colors = new_colors
+            num_classes = new_num_classes
+        return colors
+
+    def individualize(self, colors, vertex):
+        """Give a vertex a color that precedes the rest of its color class"""
+        color = colors[vertex]
+        colors = colors + (colors > color)
+        colors[colors == color] += 1
+        colors[vertex] = color
+        return self.refine(colors)
+
+    def get_cell(self, colors):
+        """Return the first color class with more than one vertex, or None"""
+        counts = numpy.bincount(colors)
+        if (counts == 1).all():
+            return None
+        return (colors == (counts > 1).argmax()).nonzero()[0].tolist()
+
+    def get_certificate(self, colors):
+        """Return the relabeled edges of a leaf as a string"""
+        lows = colors[self.edges].min(axis=1)
+        highs = colors[self.edges].max(axis=1)
+        order = numpy.lexsort([highs, lows])
+        return numpy.array([lows[order], highs[order], self.edge_colors[order]]).tostring()
+
+    def process_leaf(self, colors, path):
+        """Compare a leaf with the previous ones
+
+           The return value is the level in the search tree where the search
+           should continue.
+        """
+        leaf = (self.get_certificate(colors), colors, path)
+        if self.first is None:
+            self.first = leaf
+            self.best = leaf
+            return len(path) - 1
+        for other in self.first, self.best:
+            if other[0] == leaf[0]:
+                # an automorphism maps the other leaf onto this one
+                labeling = colors.argsort()
+                self.generators.append(labeling[other[1]])
+                level = 0
+                while path[level] == other[2][level]:
+                    level += 1
+                return level
+        if leaf[0] > self.best[0]:
+            self.best = leaf
+        return len(path) - 1
+
+    def get_child(self, frame, path):
+        """Return the next vertex to individualize in a frame, or None
+
+           Vertices are skipped when they are equivalent to an explored vertex
+           under automorphisms that fix the path.
+        """
+        colors, cell, explored = frame[:3]
+        todo = [vertex for vertex in cell if vertex not in explored]
+        if len(todo) == 0:
+            return None
+        if len(explored) > 0:
+            generators = [
+                generator for generator in self.generators
+                if (generator[path] == path).all()
+            ]
+            if len(generators) > 0:
+                orbits = _get_orbits(self.size, generators)
+                done = set(orbits[explored].tolist())
+                todo = [vertex for vertex in todo if orbits[vertex] not in done]
+                if len(todo) == 0:
+                    return None
+        return todo[0]
+
+    def run(self):
+        """Explore the search tree and return the canonical labeling"""
+        if self.size == 0:
+            return numpy.zeros(0, int)
+        # Each frame in the stack is a list [colors, cell, explored, vertex]
+        stack = []
+        colors = self.refine(self.initial_colors)
+        while True:
+            cell = self.get_cell(colors)
+            if cell is None:
+                level = self.process_leaf(colors, [frame[3] for frame in stack])
+                del stack[level+1:]
+            else:
+                stack.append([colors, cell, [], None])
+            colors = None
+            while len(stack) > 0:
+                frame = stack[-1]
+                vertex = self.get_child(frame, [f[3] for f in stack[:-1]])
+                if vertex is None:
+                    stack.pop()
+                    continue
+                frame[2].append(vertex)
+                frame[3] = vertex
+                colors = self.individualize(frame[0], vertex)
+                break
+            if colors is None:
+                break
+        return self.best[1].argsort()
+
+
+def get_canonical_labeling(graph):
+    """Return a canonical labeling and generators of the automorphism group
+
+       Argument:
+        | ``graph``  --  a :class:`molmod.graphs.Graph` instance
+
+       Returns: ``labeling, generators``. The first is an integer array with
+       the vertices in canonical order. Two graphs are isomorphic if and only
+       if their subgraphs in canonical order are identical, also considering
+       the vertex and edge strings. The second is a list of permutations, each
+       an integer array that maps a vertex to its image. Together, they
+       generate the automorphism group of the graph.
+    """
+    search = _Search(graph)
+    labeling = search.run()
+    return labeling, search.generators
+
+
+def iter_group(size, generators):
+    """Iterate over all elements of a permutation group
+
+       Arguments:
+        | ``size``  --  the number of permuted items
+        | ``generators``  --  integer arrays that generate the group
+
+       The identity is always included as the first element.
+    """
+    identity = numpy.arange(size)
+    done = set([identity.tostring()])
+    todo = [identity]
+    yield identity
+    while len(todo) > 0:
+        element = todo.pop()
+        for generator in generators:
+            product = generator[element]
+            key = product.tostring()
+            if key not in done:
+                done.add(key)
+                todo.append(product)
+                yield product
@@ -0,0 +1,76 @@
+// MolMod is a collection of molecular modelling tools for python.
+// Copyright (C) 2007 - 2012 Toon Verstraelen <Toon.Verstraelen@UGent.be>, Center
+// for Molecular Modeling (CMM), Ghent University, Ghent, Belgium; all rights
+// reserved unless otherwise stated.
+//
+// This file is part of MolMod.
+//
+// MolMod is free software; you can redistribute it and/or
+// modify it under the terms of the GNU General Public License
+// as published by the Free Software Foundation; either version 3
+// of the License, or (at your option) any later version.
+//
+// MolMod is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU General Public License for more details.
+//
+// You should have received a copy of the GNU General Public License
+// along with this program; if not, see <http://www.gnu.org/licenses/>
+//
+//--
+
+
+
+int clusters_find(int *parent, int i) {
+  /* Return the root of the set that contains i, with path halving */
+  while (parent[i] != i) {
+    parent[i] = parent[parent[i]];
+    i = parent[i];
+  }
+  return i;
+}
+
+
+int clusters_add_pairs(int n, int *parent, int *rank, int npair, int *pairs) {
+  /* Merge the sets of the elements in each pair, with union by rank. The
+     return value is the number of merges, or -1 when an element is out of
+     range. */
+  int k, i, j, merged;
+  merged = 0;
+  for (k=0; k<npair; k++) {
+    i = pairs[2*k];
+    j = pairs[2*k+1];
+    if ((i < 0) || (i >= n) || (j < 0) || (j >= n)) return -1;
+    i = clusters_find(parent, i);
+    j = clusters_find(parent, j);
+    if (i == j) continue;
+    if (rank[i] < rank[j]) {
+      parent[i] = j;
+    } else {
+      parent[j] = i;
+      if (rank[i] == rank[j]) rank[i]++;
+    }
+    merged++;
+  }
+  return merged;
+}
+
+
+int clusters_get_labels(int n, int *parent, int *labels) {
+  /* Assign a label to each element such that elements have the same label if
+     and only if they are in the same set. The sets are labeled in the order of
+     their lowest element. The return value is the number of sets. */
+  int i, root, count;
+  for (i=0; i<n; i++) labels[i] = -1;
+  count = 0;
+  for (i=0; i<n; i++) {
+    root = clusters_find(parent, i);
+    if (labels[root] < 0) {
+      labels[root] = count;
+      count++;
+    }
+    labels[i] = labels[root];
+  }
+  return count;
+}
@@ -28,12 +28,123 @@
        cf = ClusterFactory()
        while foo:
            cf.add_related(some, related, items)
-       for cluster in cf.iter_clusters():
+       for cluster in cf.get_clusters():
            print cluster
+
+   Both the ClusterFactory and :attr:`molmod.graphs.Graph.independent_vertices`
+   are based on the array-backed :class:`UnionFind`. Large sets of integer pairs
+   can be clustered at once with :meth:`UnionFind.add_pairs`.
 """
 
 
-__all__ = ["Cluster", "RuleCluster", "ClusterFactory"]
+import numpy
+
+
+__all__ = ["UnionFind", "Cluster", "RuleCluster", "ClusterFactory"]
+
+
+class UnionFind(object):
+    """Disjoint sets of the integers 0, 1, ..., size-1
+
+       The sets are stored as a forest in an integer array with the parent of
+       each element. The union of two sets attaches the root of the lower tree
+       to the root of the higher tree (union by rank) and the path to the root
+       is shortened each time it is followed (path compression). Hence, the
+       cost of a sequence of operations is nearly linear.
+    """
+
+    def __init__(self, size=0):
+        """
+           Optional argument:
+            | ``size``  --  the initial number of elements, each in its own set
+        """
+        self.size = 0
+        self._parent = numpy.zeros(0, numpy.int32)
+        self._rank = numpy.zeros(0, numpy.int32)
+        self.grow(size)
+
+    def grow(self, size):
+        """Add new elements, each in its own set, up to the given size"""
+        if size <= self.size:
+            return
+        if size > len(self._parent):
+            capacity = max(size, 2*len(self._parent))
+            parent = numpy.arange(capacity, dtype=numpy.int32)
+            parent[:self.size] = self._parent[:self.size]
+            rank = numpy.zeros(capacity, numpy.int32)
+            rank[:self.size] = self._rank[:self.size]
+            self._parent = parent
+            self._rank = rank
+        self.size = size
+
+    def find(self, i):
+        """Return the root element of the set that contains i"""
+        parent = self._parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, i, j):
+        """Merge the sets that contain i and j
+
+           Returns True when i and j were not in the same set yet.
+        """
+        i = self.find(i)
+        j = self.find(j)
+        if i == j:
+            return False
+        if self._rank[i] < self._rank[j]:
+            i, j = j, i
+        self._parent[j] = i
+        if self._rank[i] == self._rank[j]:
+            self._rank[i] += 1
+        return True
+
+    def add_pairs(self, pairs):
+        """Merge the sets of the elements in each pair
+
+           Argument:
+            | ``pairs``  --  an integer array with shape (N, 2)
+
+           Returns the number of merges. When some elements are out of
+           range, a ValueError is raised and no sets are merged.
+        """
+        from molmod.ext import clusters_add_pairs
+        pairs = numpy.array(pairs, numpy.int32).reshape(-1, 2)
+        if len(pairs) > 0 and (pairs.min() < 0 or pairs.max() >= self.size):
+            raise ValueError("The pairs contain elements out of range.")
+        if len(pairs) == 0:
+            # the extension does not accept empty arrays
+            return 0
+        return clusters_add_pairs(
+            self._parent[:self.size], self._rank[:self.size], pairs
+        )
+
+    def get_labels(self):
+        """Return an array with a set label for each element
+
+           The sets are labeled in the order of their lowest element.
+        """
+        from molmod.ext import clusters_get_labels
+        labels = numpy.zeros(self.size, numpy.int32)
+        if self.size == 0:
+            return labels
+        clusters_get_labels(self._parent[:self.size], labels)
+        return labels
+
+    def get_groups(self):
+        """Return a list with the sorted elements of each set
+
+           The sets are ordered by their lowest element.
+        """
+        if self.size == 0:
+            return []
+        labels = self.get_labels()
+        # a stable sort makes sure that the order of the elements is respected
+        order = labels.argsort(kind="mergesort")
+        bounds = numpy.bincount(labels).cumsum()[:-1]
+        return [group.tolist() for group in numpy.split(order, bounds)]
 
 
 class Cluster(object):
@@ -90,7 +201,13 @@ class RuleCluster(Cluster):
 
 
 class ClusterFactory(object):
-    """A very basic cluster algorithm"""
+    """A very basic cluster algorithm
+
+       Each item gets an integer index in a :class:`UnionFind` object, such
+       that merging clusters does not require a loop over their items. The
+       related pairs of indexes are merged in bulk and the cluster objects
+       are only constructed in get_clusters.
+    """
 
     def __init__(self, cls=Cluster):
         """
@@ -99,8 +216,23 @@ class ClusterFactory(object):
                            [default=Cluster]
         """
         self.cls = cls
-        # mapping: item -> cluster. Each cluster is a tuple of related items.
-        self.lookup = {}
+        # mapping: item -> integer index in the union-find structure
+        self.indexes = {}
+        self.items = []
+        self.union_find = UnionFind()
+        # pairs of related indexes that are not merged yet
+        self.pairs = []
+        # cluster objects given to add_related, with the index of an item
+        self.sources = []
+
+    def _get_index(self, item):
+        """Return the index of an item, add the item if needed"""
+        index = self.indexes.get(item)
+        if index is None:
+            index = len(self.items)
+            self.indexes[item] = index
+            self.items.append(item)
+        return index
 
     def add_related(self, *objects):
         """Add related items
@@ -111,45 +243,28 @@ class ClusterFactory(object):
            When two groups of related items share one or more common members,
            they will be merged into one cluster.
         """
-        master = None # this will become the common cluster of all related items
-        slaves = set([]) # set of clusters that are going to be merged in the master
-        solitaire = set([]) # set of new items that are not yet part of a cluster
+        indexes = []
         for new in objects:
             if isinstance(new, self.cls):
-                if master is None:
-                    master = new
-                else:
-                    slaves.add(new)
-                for item in new.items:
-                    existing = self.lookup.get(item)
-                    if existing is not None:
-                        slaves.add(existing)
+                new_indexes = [self._get_index(item) for item in new.items]
+                if len(new_indexes) == 0:
+                    continue
+                self.sources.append((new_indexes[0], new))
+                indexes.extend(new_indexes)
             else:
-                cluster = self.lookup.get(new)
-                if cluster is None:
-                    #print "solitaire", new
-                    solitaire.add(new)
-                elif master is None:
-                    #print "starting master", new
-                    master = cluster
-                elif master != cluster:
-                    #print "in slave", new
-                    slaves.add(cluster)
-                #else:
-                    ##nothing to do
-                    #print "new in master", new
-
-        if master is None:
-            master = self.cls([])
-
-        for slave in slaves:
-            master.update(slave)
-        for item in solitaire:
-            master.add_item(item)
-
-        for item in master.items:
-            self.lookup[item] = master
+                indexes.append(self._get_index(new))
+        for index in indexes[1:]:
+            self.pairs.append((indexes[0], index))
 
     def get_clusters(self):
         """Returns a set with the clusters"""
-        return set(self.lookup.itervalues())
+        self.union_find.grow(len(self.items))
+        self.union_find.add_pairs(self.pairs)
+        self.pairs = []
+        labels = self.union_find.get_labels().tolist()
+        clusters = [self.cls([]) for label in xrange(len(set(labels)))]
+        for index, cluster in self.sources:
+            clusters[labels[index]].update(cluster)
+        for item, label in zip(self.items, labels):
+            clusters[label].add_item(item)
+        return set(clusters)
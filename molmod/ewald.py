@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+# MolMod is a collection of molecular modelling tools for python.
+# Copyright (C) 2007 - 2012 Toon Verstraelen <Toon.Verstraelen@UGent.be>, Center
+# for Molecular Modeling (CMM), Ghent University, Ghent, Belgium; all rights
+# reserved unless otherwise stated.
+#
+# This file is part of MolMod.
+#
+# MolMod is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 3
+# of the License, or (at your option) any later version.
+#
+# MolMod is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>
+#
+#--
+"""Ewald summation of electrostatic interactions in periodic systems
+
+   The Coulomb energy of a set of point charges in a three-dimensional periodic
+   system is split into a real-space part, a reciprocal-space part and a
+   constant self-interaction correction. The real-space part is a short-ranged
+   pair potential with kernel erfc(alpha*r)/r that is evaluated with a cutoff,
+   e.g. by :class:`molmod.pairff.CoulombFF`. The classes in this module compute
+   the remaining long-ranged terms:
+
+   * EwaldSum  --  the conventional Ewald sum over all reciprocal vectors
+     below a cutoff, which scales as O(N*M) for N charges and M reciprocal
+     vectors.
+   * ParticleMeshEwald  --  the smooth particle mesh Ewald method (Essmann et
+     al., J. Chem. Phys. 103, 8577 (1995)), in which the charges are spread
+     on a regular grid with cardinal B-splines such that the reciprocal sum
+     can be carried out with fast Fourier transforms, i.e. O(N log N).
+
+   Typical usage:
+
+   ewald = ParticleMeshEwald(alpha=0.3, grid=1.0)
+   ff = CoulombFF(None, charges, coordinates=coordinates, cutoff=10.0,
+                  unit_cell=unit_cell, ewald=ewald)
+   print ff.energy()
+"""
+
+
+from molmod.ext import ewald_erfc
+from molmod.unit_cells import UnitCell
+
+import numpy
+
+
+__all__ = ["EwaldSum", "ParticleMeshEwald"]
+
+
+class EwaldBase(object):
+    """Common functionality of the Ewald summation methods
+
+       Derived classes must implement the method _compute_reciprocal.
+    """
+    def __init__(self, alpha):
+        """Initialize an Ewald summation object
+
+           Argument:
+            | ``alpha``  --  the inverse width of the Gaussian charge
+                             distributions that separate the short- and
+                             long-range parts.
+        """
+        if alpha <= 0:
+            raise ValueError("The parameter alpha must be strictly positive.")
+        self.alpha = alpha
+
+    def check_unit_cell(self, unit_cell):
+        """Raise a ValueError when the unit cell is not 3D periodic"""
+        if unit_cell is None or not unit_cell.active.all():
+            raise ValueError("Ewald summation requires a three-dimensional periodic unit cell.")
+
+    def get_real_kernel(self, distances):
+        """Compute the real-space kernel and its first two derivatives
+
+           Argument:
+            | ``distances``  --  an array with interatomic distances
+
+           Returns: three arrays with the values of erfc(alpha*r)/r and its
+           first and second derivative towards r.
+        """
+        distances = numpy.asarray(distances, float)
+        erfc = ewald_erfc(self.alpha*distances.ravel()).reshape(distances.shape)
+        gauss = 2*self.alpha/numpy.sqrt(numpy.pi)*numpy.exp(-(self.alpha*distances)**2)
+        kernel = erfc/distances
+        kernel_deriv = -(kernel + gauss)/distances
+        kernel_deriv2 = 2*kernel/distances**2 + gauss*(2/distances**2 + 2*self.alpha**2)
+        return kernel, kernel_deriv, kernel_deriv2
+
+    def compute(self, coordinates, charges, unit_cell):
+        """Compute the long-range part of the electrostatic interactions
+
+           Arguments:
+            | ``coordinates``  --  the Cartesian coordinates, shape (N,3)
+            | ``charges``  --  the point charges, shape (N,)
+            | ``unit_cell``  --  a three-dimensional periodic UnitCell object
+
+           Returns: energy, esp, efield
+
+           The energy includes the reciprocal-space sum, the self-interaction
+           correction and, for systems that are not neutral, the interaction
+           with a uniform neutralizing background. The esp (shape (N,)) and the
+           efield (shape (N,3)) are the electrostatic potential and the electric
+           field at each charge due to these terms, such that the energy is half
+           the sum of charges times the esp and the gradient of the energy is
+           minus the charges times the efield.
+        """
+        self.check_unit_cell(unit_cell)
+        coordinates = numpy.asarray(coordinates, float)
+        charges = numpy.asarray(charges, float)
+        energy, esp, efield = self._compute_reciprocal(coordinates, charges, unit_cell)
+        # self-interaction of the Gaussian charge distributions
+        esp = esp - 2*self.alpha/numpy.sqrt(numpy.pi)*charges
+        # neutralizing background
+        esp -= numpy.pi*charges.sum()/(unit_cell.volume*self.alpha**2)
+        energy = 0.5*numpy.dot(charges, esp)
+        return energy, esp, efield
+
+    def _compute_reciprocal(self, coordinates, charges, unit_cell):
+        """Compute the reciprocal-space energy, esp and efield"""
+        raise NotImplementedError
+
+
+class EwaldSum(EwaldBase):
+    """Conventional Ewald summation of the reciprocal-space terms"""
+    def __init__(self, alpha, gcut):
+        """Initialize an EwaldSum object
+
+           Arguments:
+            | ``alpha``  --  see :class:`EwaldBase`
+            | ``gcut``  --  the cutoff for the norm of the reciprocal vectors,
+                            including the factor 2*pi.
+        """
+        EwaldBase.__init__(self, alpha)
+        self.gcut = gcut
+
+    def get_kvectors(self, unit_cell):
+        """Return all non-zero reciprocal vectors with a norm below gcut"""
+        kcell = UnitCell(2*numpy.pi*unit_cell.reciprocal)
+        ranges = kcell.get_radius_ranges(self.gcut)
+        indexes = numpy.indices(2*ranges+1).reshape(3, -1).transpose() - ranges
+        kvectors = numpy.dot(indexes, kcell.matrix.transpose())
+        knorms_sq = (kvectors**2).sum(axis=1)
+        mask = (knorms_sq > 0) & (knorms_sq <= self.gcut**2)
+        return kvectors[mask]
+
+    def _compute_reciprocal(self, coordinates, charges, unit_cell):
+        """Compute the reciprocal-space energy, esp and efield"""
+        kvectors = self.get_kvectors(unit_cell)
+        knorms_sq = (kvectors**2).sum(axis=1)
+        prefactors = 4*numpy.pi/unit_cell.volume*numpy.exp(-0.25*knorms_sq/self.alpha**2)/knorms_sq
+        phases = numpy.dot(coordinates, kvectors.transpose())
+        cosines = numpy.cos(phases)
+        sines = numpy.sin(phases)
+        # the real and imaginary part of the structure factors, scaled
+        sf_real = prefactors*numpy.dot(charges, cosines)
+        sf_imag = prefactors*numpy.dot(charges, sines)
+        esp = numpy.dot(cosines, sf_real) + numpy.dot(sines, sf_imag)
+        efield = numpy.dot(sines, sf_real.reshape(-1, 1)*kvectors) - \
+                 numpy.dot(cosines, sf_imag.reshape(-1, 1)*kvectors)
+        energy = 0.5*numpy.dot(charges, esp)
+        return energy, esp, efield
+
+
+def _bspline_weights(fractions, order):
+    """Evaluate cardinal B-splines and their derivatives at shifted points
+
+       Arguments:
+        | ``fractions``  --  an array with values in the range [0,1[
+        | ``order``  --  the order of the B-splines, at least 3
+
+       Returns: values, derivatives. Both arrays have one additional trailing
+       axis with length order. Element j along this axis contains M(w+j) and
+       M'(w+j) respectively, where M is the cardinal B-spline and w are the
+       fractions.
+    """
+    # M_2(w+j) for j=0,1
+    values = [fractions, 1 - fractions]
+    for k in xrange(3, order+1):
+        if k == order:
+            derivatives = [values[0]] + [
+                values[j] - values[j-1] for j in xrange(1, k-1)
+            ] + [-values[k-2]]
+        new_values = []
+        for j in xrange(k):
+            value = 0.0
+            if j < k-1:
+                value = value + (fractions + j)*values[j]
+            if j > 0:
+                value = value + (k - fractions - j)*values[j-1]
+            new_values.append(value/(k-1))
+        values = new_values
+    return numpy.array(values).transpose(range(1, numpy.ndim(fractions)+1) + [0]), \
+           numpy.array(derivatives).transpose(range(1, numpy.ndim(fractions)+1) + [0])
+
+
+class ParticleMeshEwald(EwaldBase):
+    """Smooth particle mesh Ewald summation of the reciprocal-space terms"""
+    def __init__(self, alpha, grid, order=4):
+        """Initialize a ParticleMeshEwald object
+
+           Arguments:
+            | ``alpha``  --  see :class:`EwaldBase`
+            | ``grid``  --  the number of grid points along each cell vector
+                            (three integers) or a floating point number with
+                            the maximal grid spacing.
+
+           Optional argument:
+            | ``order``  --  the order of the B-splines used for the charge
+                             spreading, at least 3. [default=4]
+        """
+        EwaldBase.__init__(self, alpha)
+        if order < 3:
+            raise ValueError("The order of the B-splines must be at least 3.")
+        self.grid = grid
+        self.order = order
+
+    def get_mesh_shape(self, unit_cell):
+        """Return the number of grid points along each cell vector"""
+        if isinstance(self.grid, float):
+            lengths = numpy.sqrt((unit_cell.matrix**2).sum(axis=0))
+            result = numpy.ceil(lengths/self.grid).astype(int)
+        else:
+            result = numpy.array(self.grid, int)
+            if result.shape != (3,):
+                raise TypeError("The grid must be a float or three integers.")
+        return numpy.maximum(result, self.order)
+
+    def _get_influence(self, unit_cell, shape):
+        """Compute the influence function on the reciprocal grid"""
+        # integer indexes of the reciprocal vectors, in the order of the fft
+        ms = [numpy.fft.fftfreq(size)*size for size in shape]
+        # the moduli of the Euler exponential splines
+        spline_values = _bspline_weights(numpy.zeros(1), self.order)[0][0, 1:]
+        bmods = []
+        for size, m in zip(shape, ms):
+            phases = 2*numpy.pi*numpy.outer(m, numpy.arange(self.order-1))/size
+            denominator = numpy.dot(numpy.cos(phases), spline_values)**2 + \
+                          numpy.dot(numpy.sin(phases), spline_values)**2
+            bmod = numpy.zeros(size, float)
+            mask = denominator > 1e-10
+            bmod[mask] = 1/denominator[mask]
+            bmods.append(bmod)
+        mvectors = (
+            ms[0].reshape(-1, 1, 1, 1)*unit_cell.reciprocal[:, 0] +
+            ms[1].reshape(1, -1, 1, 1)*unit_cell.reciprocal[:, 1] +
+            ms[2].reshape(1, 1, -1, 1)*unit_cell.reciprocal[:, 2]
+        )
+        mnorms_sq = (mvectors**2).sum(axis=3)
+        mnorms_sq[0, 0, 0] = 1.0
+        result = numpy.exp(-(numpy.pi/self.alpha)**2*mnorms_sq)/(numpy.pi*unit_cell.volume*mnorms_sq)
+        result[0, 0, 0] = 0.0
+        result *= bmods[0].reshape(-1, 1, 1)*bmods[1].reshape(1, -1, 1)*bmods[2]
+        return result
+
+    def _compute_reciprocal(self, coordinates, charges, unit_cell):
+        """Compute the reciprocal-space energy, esp and efield"""
+        shape = self.get_mesh_shape(unit_cell)
+        order = self.order
+        # scaled fractional coordinates in the range [0,shape[
+        scaled = unit_cell.to_fractional(coordinates)
+        scaled = (scaled - numpy.floor(scaled))*shape
+        floors = numpy.floor(scaled).astype(int)
+        values, derivatives = _bspline_weights(scaled - floors, order)
+        # the grid points affected by each charge, shape (N,3,order)
+        points = (floors.reshape(-1, 3, 1) - numpy.arange(order)) % shape.reshape(1, 3, 1)
+        flat = (
+            points[:, 0].reshape(-1, order, 1, 1)*(shape[1]*shape[2]) +
+            points[:, 1].reshape(-1, 1, order, 1)*shape[2] +
+            points[:, 2].reshape(-1, 1, 1, order)
+        ).ravel()
+        v0 = values[:, 0].reshape(-1, order, 1, 1)
+        v1 = values[:, 1].reshape(-1, 1, order, 1)
+        v2 = values[:, 2].reshape(-1, 1, 1, order)
+        weights = (v0*v1*v2).reshape(len(coordinates), -1)
+        # spread the charges on the grid
+        charge_grid = numpy.bincount(
+            flat, (charges.reshape(-1, 1)*weights).ravel(), minlength=shape.prod()
+        ).reshape(shape)
+        # convolution with the influence function
+        influence = self._get_influence(unit_cell, shape)
+        potential_grid = numpy.fft.ifftn(influence*numpy.fft.fftn(charge_grid)).real*shape.prod()
+        potentials = potential_grid.ravel()[flat].reshape(len(coordinates), -1)
+        esp = (weights*potentials).sum(axis=1)
+        # derivatives of the esp towards the scaled fractional coordinates
+        d0 = derivatives[:, 0].reshape(-1, order, 1, 1)
+        d1 = derivatives[:, 1].reshape(-1, 1, order, 1)
+        d2 = derivatives[:, 2].reshape(-1, 1, 1, order)
+        gradient_scaled = numpy.array([
+            ((d0*v1*v2).reshape(len(coordinates), -1)*potentials).sum(axis=1),
+            ((v0*d1*v2).reshape(len(coordinates), -1)*potentials).sum(axis=1),
+            ((v0*v1*d2).reshape(len(coordinates), -1)*potentials).sum(axis=1),
+        ]).transpose()
+        efield = -numpy.dot(gradient_scaled*shape, unit_cell.reciprocal.transpose())
+        energy = 0.5*numpy.dot(charges, esp)
+        return energy, esp, efield
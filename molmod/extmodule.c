@@ -0,0 +1,4999 @@
+/* File: extmodule.c
+ * This file is auto-generated with f2py (version:2).
+ * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
+ * written by Pearu Peterson <pearu@cens.ioc.ee>.
+ * Generation date: Fri Oct 16 23:41:26 2026
+ * Do not edit this file directly unless you know what you are doing!!!
+ */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*********************** See f2py2e/cfuncs.py: includes ***********************/
+#include "Python.h"
+#include <stdarg.h>
+#include "fortranobject.h"
+#include <math.h>
+
+/**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
+static PyObject *ext_error;
+static PyObject *ext_module;
+
+/*********************** See f2py2e/cfuncs.py: typedefs ***********************/
+/*need_typedefs*/
+
+/****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
+/*need_typedefs_generated*/
+
+/********************** See f2py2e/cfuncs.py: cppmacros **********************/
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F
+#else
+#define F_FUNC(f,F) _##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F##_
+#else
+#define F_FUNC(f,F) _##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F
+#else
+#define F_FUNC(f,F) f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F##_
+#else
+#define F_FUNC(f,F) f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_FUNC_US(f,F) F_FUNC(f##_,F##_)
+#else
+#define F_FUNC_US(f,F) F_FUNC(f,F)
+#endif
+
+#define rank(var) var ## _Rank
+#define shape(var,dim) var ## _Dims[dim]
+#define old_rank(var) (PyArray_NDIM((PyArrayObject *)(capi_ ## var ## _tmp)))
+#define old_shape(var,dim) PyArray_DIM(((PyArrayObject *)(capi_ ## var ## _tmp)),dim)
+#define fshape(var,dim) shape(var,rank(var)-dim-1)
+#define len(var) shape(var,0)
+#define flen(var) fshape(var,0)
+#define old_size(var) PyArray_SIZE((PyArrayObject *)(capi_ ## var ## _tmp))
+/* #define index(i) capi_i ## i */
+#define slen(var) capi_ ## var ## _len
+#define size(var, ...) f2py_size((PyArrayObject *)(capi_ ## var ## _tmp), ## __VA_ARGS__, -1)
+
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
+#ifndef max
+#define max(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef min
+#define min(a,b) ((a < b) ? (a) : (b))
+#endif
+#ifndef MAX
+#define MAX(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef MIN
+#define MIN(a,b) ((a < b) ? (a) : (b))
+#endif
+
+#define CHECKSCALAR(check,tcheck,name,show,var)\
+    if (!(check)) {\
+        char errstring[256];\
+        sprintf(errstring, "%s: "show, "("tcheck") failed for "name, var);\
+        PyErr_SetString(ext_error,errstring);\
+        /*goto capi_fail;*/\
+    } else 
+
+/************************ See f2py2e/cfuncs.py: cfuncs ************************/
+static int f2py_size(PyArrayObject* var, ...)
+{
+  npy_int sz = 0;
+  npy_int dim;
+  npy_int rank;
+  va_list argp;
+  va_start(argp, var);
+  dim = va_arg(argp, npy_int);
+  if (dim==-1)
+    {
+      sz = PyArray_SIZE(var);
+    }
+  else
+    {
+      rank = PyArray_NDIM(var);
+      if (dim>=1 && dim<=rank)
+        sz = PyArray_DIM(var, dim-1);
+      else
+        fprintf(stderr, "f2py_size: 2nd argument value=%d fails to satisfy 1<=value<=%d. Result will be 0.\n", dim, rank);
+    }
+  va_end(argp);
+  return sz;
+}
+
+static struct { int nd;npy_intp *d;int *i,*i_tr,tr; } forcombcache;
+static int initforcomb(npy_intp *dims,int nd,int tr) {
+  int k;
+  if (dims==NULL) return 0;
+  if (nd<0) return 0;
+  forcombcache.nd = nd;
+  forcombcache.d = dims;
+  forcombcache.tr = tr;
+  if ((forcombcache.i = (int *)malloc(sizeof(int)*nd))==NULL) return 0;
+  if ((forcombcache.i_tr = (int *)malloc(sizeof(int)*nd))==NULL) return 0;
+  for (k=1;k<nd;k++) {
+    forcombcache.i[k] = forcombcache.i_tr[nd-k-1] = 0;
+  }
+  forcombcache.i[0] = forcombcache.i_tr[nd-1] = -1;
+  return 1;
+}
+static int *nextforcomb(void) {
+  int j,*i,*i_tr,k;
+  int nd=forcombcache.nd;
+  if ((i=forcombcache.i) == NULL) return NULL;
+  if ((i_tr=forcombcache.i_tr) == NULL) return NULL;
+  if (forcombcache.d == NULL) return NULL;
+  i[0]++;
+  if (i[0]==forcombcache.d[0]) {
+    j=1;
+    while ((j<nd) && (i[j]==forcombcache.d[j]-1)) j++;
+    if (j==nd) {
+      free(i);
+      free(i_tr);
+      return NULL;
+    }
+    for (k=0;k<j;k++) i[k] = i_tr[nd-k-1] = 0;
+    i[j]++;
+    i_tr[nd-j-1]++;
+  } else
+    i_tr[nd-1]++;
+  if (forcombcache.tr) return i_tr;
+  return i;
+}
+static int double_from_pyobj(double* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyFloat_Check(obj)) {
+#ifdef __sgi
+        *v = PyFloat_AsDouble(obj);
+#else
+        *v = PyFloat_AS_DOUBLE(obj);
+#endif
+        return 1;
+    }
+    tmp = PyNumber_Float(obj);
+    if (tmp) {
+#ifdef __sgi
+        *v = PyFloat_AsDouble(tmp);
+#else
+        *v = PyFloat_AS_DOUBLE(tmp);
+#endif
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (double_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = ext_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int int_from_pyobj(int* v,PyObject *obj,const char *errmess) {
+    PyObject* tmp = NULL;
+    if (PyInt_Check(obj)) {
+        *v = (int)PyInt_AS_LONG(obj);
+        return 1;
+    }
+    tmp = PyNumber_Int(obj);
+    if (tmp) {
+        *v = PyInt_AS_LONG(tmp);
+        Py_DECREF(tmp);
+        return 1;
+    }
+    if (PyComplex_Check(obj))
+        tmp = PyObject_GetAttrString(obj,"real");
+    else if (PyString_Check(obj) || PyUnicode_Check(obj))
+        /*pass*/;
+    else if (PySequence_Check(obj))
+        tmp = PySequence_GetItem(obj,0);
+    if (tmp) {
+        PyErr_Clear();
+        if (int_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = ext_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+
+/********************* See f2py2e/cfuncs.py: userincludes *********************/
+/*need_userincludes*/
+
+/********************* See f2py2e/capi_rules.py: usercode *********************/
+
+
+/* See f2py2e/rules.py */
+extern double ff_dm_quad(int,int,double*,double*,double*,double,double*,double*,double*);
+extern double ff_dm_reci(int,int,double*,double*,int*,double,double*,double*,double*);
+extern double ff_pair_reci(int,int,int,double*,int*,double*,double,double*,double*,double*);
+extern double ff_pair_quad(int,int,int,double*,int*,double*,double*,double,double*,double*,double*);
+extern double ff_bond_quad(int,int,int,double*,int*,double*,double,double*,double*,double*);
+extern double ff_bond_hyper(int,int,int,double*,int*,double*,double,double,double*,double*,double*);
+extern void ff_batch(int,int,int,int,int,double*,int*,int*,int*,double*,double*,int*,double*,int*,int*,double*,int*,int*,double*,double*,double*,double*);
+extern void ewald_erfc(int,double*,double*);
+extern int clusters_add_pairs(int,int*,int*,int,int*);
+extern int clusters_get_labels(int,int*,int*);
+extern void graphs_floyd_warshall(int,int*);
+extern int graphs_bfs_dense(int,int,int*,int,int*,int*);
+extern int graphs_bfs_sparse(int,int,int*,int,int*,int,int*,int,int*,int*);
+extern int graphs_bfs(int,int,int*,int,int*,int,int,int*,int*);
+extern int graphs_bfs_count(int,int,int*,int,int*,int,int,int,int*,int*,int*);
+extern int graphs_bfs_part(int,int,int*,int,int*,int,int*,int*);
+extern void molecules_distance_matrix(int,double*,int,double*,double*,double*);
+extern void molecules_distance_condensed(int,double*,int,double*,double*,double*);
+extern void similarity_table_labels(int,int*,int*);
+extern void similarity_table_distances(int,double*,double*);
+extern double similarity_measure(int,int*,double*,int,int*,double*,double,double);
+extern int binning_pair_search(int,double*,int,double*,double,int,int,double*,double*,int*,int,int*,int*,int,int*,int,int,int*,int*,int*,int,int*,double*,double*);
+extern int unit_cell_get_radius_indexes(int,double*,double*,double,int*,int*);
+/*eof externroutines*/
+
+/******************** See f2py2e/capi_rules.py: usercode1 ********************/
+
+
+/******************* See f2py2e/cb_rules.py: buildcallback *******************/
+/*need_callbacks*/
+
+/*********************** See f2py2e/rules.py: buildapi ***********************/
+
+/********************************* ff_dm_quad *********************************/
+static char doc_f2py_rout_ext_ff_dm_quad[] = "\
+ff_dm_quad = ff_dm_quad(cor,dm0,dmk,amp,gradient,[matrix,reciprocal])\n\nWrapper for ``ff_dm_quad``.\
+\n\nParameters\n----------\n"
+"cor : input rank-2 array('d') with bounds (n,3)\n"
+"dm0 : input rank-2 array('d') with bounds (n,n)\n"
+"dmk : input rank-2 array('d') with bounds (n,n)\n"
+"amp : input float\n"
+"gradient : in/output rank-2 array('d') with bounds (n,3)\n"
+"\nOther Parameters\n----------------\n"
+"matrix : input rank-2 array('d') with bounds (3,3), optional\n    Default: 0\n"
+"reciprocal : input rank-2 array('d') with bounds (3,3), optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"ff_dm_quad : float";
+/* extern double ff_dm_quad(int,int,double*,double*,double*,double,double*,double*,double*); */
+static PyObject *f2py_rout_ext_ff_dm_quad(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           double (*f2py_func)(int,int,double*,double*,double*,double,double*,double*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double ff_dm_quad_return_value=0;
+  int n = 0;
+  int periodic = 0;
+  double *cor = NULL;
+  npy_intp cor_Dims[2] = {-1, -1};
+  const int cor_Rank = 2;
+  PyArrayObject *capi_cor_tmp = NULL;
+  int capi_cor_intent = 0;
+  PyObject *cor_capi = Py_None;
+  double *dm0 = NULL;
+  npy_intp dm0_Dims[2] = {-1, -1};
+  const int dm0_Rank = 2;
+  PyArrayObject *capi_dm0_tmp = NULL;
+  int capi_dm0_intent = 0;
+  PyObject *dm0_capi = Py_None;
+  double *dmk = NULL;
+  npy_intp dmk_Dims[2] = {-1, -1};
+  const int dmk_Rank = 2;
+  PyArrayObject *capi_dmk_tmp = NULL;
+  int capi_dmk_intent = 0;
+  PyObject *dmk_capi = Py_None;
+  double amp = 0;
+  PyObject *amp_capi = Py_None;
+  double *gradient = NULL;
+  npy_intp gradient_Dims[2] = {-1, -1};
+  const int gradient_Rank = 2;
+  PyArrayObject *capi_gradient_tmp = NULL;
+  int capi_gradient_intent = 0;
+  PyObject *gradient_capi = Py_None;
+  double *matrix = NULL;
+  npy_intp matrix_Dims[2] = {-1, -1};
+  const int matrix_Rank = 2;
+  PyArrayObject *capi_matrix_tmp = NULL;
+  int capi_matrix_intent = 0;
+  PyObject *matrix_capi = Py_None;
+  double *reciprocal = NULL;
+  npy_intp reciprocal_Dims[2] = {-1, -1};
+  const int reciprocal_Rank = 2;
+  PyArrayObject *capi_reciprocal_tmp = NULL;
+  int capi_reciprocal_intent = 0;
+  PyObject *reciprocal_capi = Py_None;
+  static char *capi_kwlist[] = {"cor","dm0","dmk","amp","gradient","matrix","reciprocal",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOO|OO:ext.ff_dm_quad",\
+    capi_kwlist,&cor_capi,&dm0_capi,&dmk_capi,&amp_capi,&gradient_capi,&matrix_capi,&reciprocal_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable cor */
+  cor_Dims[1]=3;
+  capi_cor_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_cor_tmp = array_from_pyobj(NPY_DOUBLE,cor_Dims,cor_Rank,capi_cor_intent,cor_capi);
+  if (capi_cor_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `cor' of ext.ff_dm_quad to C/Fortran array" );
+  } else {
+    cor = (double *)(PyArray_DATA(capi_cor_tmp));
+
+  /* Processing variable matrix */
+  matrix_Dims[0]=3,matrix_Dims[1]=3;
+  capi_matrix_intent |= F2PY_OPTIONAL|F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_matrix_tmp = array_from_pyobj(NPY_DOUBLE,matrix_Dims,matrix_Rank,capi_matrix_intent,matrix_capi);
+  if (capi_matrix_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st keyword `matrix' of ext.ff_dm_quad to C/Fortran array" );
+  } else {
+    matrix = (double *)(PyArray_DATA(capi_matrix_tmp));
+
+  if (matrix_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("ff_dm_quad: Initializing matrix=0\n");
+    if (initforcomb(PyArray_DIMS(capi_matrix_tmp),PyArray_NDIM(capi_matrix_tmp),1)) {
+      while ((_i = nextforcomb()))
+        matrix[capi_i++] = 0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(ext_error,"Initialization of 1st keyword matrix failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable reciprocal */
+  reciprocal_Dims[0]=3,reciprocal_Dims[1]=3;
+  capi_reciprocal_intent |= F2PY_OPTIONAL|F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_reciprocal_tmp = array_from_pyobj(NPY_DOUBLE,reciprocal_Dims,reciprocal_Rank,capi_reciprocal_intent,reciprocal_capi);
+  if (capi_reciprocal_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd keyword `reciprocal' of ext.ff_dm_quad to C/Fortran array" );
+  } else {
+    reciprocal = (double *)(PyArray_DATA(capi_reciprocal_tmp));
+
+  if (reciprocal_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("ff_dm_quad: Initializing reciprocal=0\n");
+    if (initforcomb(PyArray_DIMS(capi_reciprocal_tmp),PyArray_NDIM(capi_reciprocal_tmp),1)) {
+      while ((_i = nextforcomb()))
+        reciprocal[capi_i++] = 0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(ext_error,"Initialization of 2nd keyword reciprocal failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable amp */
+    f2py_success = double_from_pyobj(&amp,amp_capi,"ext.ff_dm_quad() 4th argument (amp) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = len(cor);
+  /* Processing variable dm0 */
+  dm0_Dims[0]=n,dm0_Dims[1]=n;
+  capi_dm0_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_dm0_tmp = array_from_pyobj(NPY_DOUBLE,dm0_Dims,dm0_Rank,capi_dm0_intent,dm0_capi);
+  if (capi_dm0_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd argument `dm0' of ext.ff_dm_quad to C/Fortran array" );
+  } else {
+    dm0 = (double *)(PyArray_DATA(capi_dm0_tmp));
+
+  /* Processing variable periodic */
+  periodic = (matrix_capi-Py_None);
+  /* Processing variable gradient */
+  gradient_Dims[0]=n,gradient_Dims[1]=3;
+  capi_gradient_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_gradient_tmp = array_from_pyobj(NPY_DOUBLE,gradient_Dims,gradient_Rank,capi_gradient_intent,gradient_capi);
+  if (capi_gradient_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 5th argument `gradient' of ext.ff_dm_quad to C/Fortran array" );
+  } else {
+    gradient = (double *)(PyArray_DATA(capi_gradient_tmp));
+
+  /* Processing variable dmk */
+  dmk_Dims[0]=n,dmk_Dims[1]=n;
+  capi_dmk_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_dmk_tmp = array_from_pyobj(NPY_DOUBLE,dmk_Dims,dmk_Rank,capi_dmk_intent,dmk_capi);
+  if (capi_dmk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 3rd argument `dmk' of ext.ff_dm_quad to C/Fortran array" );
+  } else {
+    dmk = (double *)(PyArray_DATA(capi_dmk_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  ff_dm_quad_return_value = (*f2py_func)(n,periodic,cor,dm0,dmk,amp,gradient,matrix,reciprocal);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("d",ff_dm_quad_return_value);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_dmk_tmp!=dmk_capi) {
+    Py_XDECREF(capi_dmk_tmp); }
+  }  /*if (capi_dmk_tmp == NULL) ... else of dmk*/
+  /* End of cleaning variable dmk */
+  if((PyObject *)capi_gradient_tmp!=gradient_capi) {
+    Py_XDECREF(capi_gradient_tmp); }
+  }  /*if (capi_gradient_tmp == NULL) ... else of gradient*/
+  /* End of cleaning variable gradient */
+  /* End of cleaning variable periodic */
+  if((PyObject *)capi_dm0_tmp!=dm0_capi) {
+    Py_XDECREF(capi_dm0_tmp); }
+  }  /*if (capi_dm0_tmp == NULL) ... else of dm0*/
+  /* End of cleaning variable dm0 */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of amp*/
+  /* End of cleaning variable amp */
+  }  /*if (f2py_success) of reciprocal init*/
+  if((PyObject *)capi_reciprocal_tmp!=reciprocal_capi) {
+    Py_XDECREF(capi_reciprocal_tmp); }
+  }  /*if (capi_reciprocal_tmp == NULL) ... else of reciprocal*/
+  /* End of cleaning variable reciprocal */
+  }  /*if (f2py_success) of matrix init*/
+  if((PyObject *)capi_matrix_tmp!=matrix_capi) {
+    Py_XDECREF(capi_matrix_tmp); }
+  }  /*if (capi_matrix_tmp == NULL) ... else of matrix*/
+  /* End of cleaning variable matrix */
+  if((PyObject *)capi_cor_tmp!=cor_capi) {
+    Py_XDECREF(capi_cor_tmp); }
+  }  /*if (capi_cor_tmp == NULL) ... else of cor*/
+  /* End of cleaning variable cor */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of ff_dm_quad *****************************/
+
+/********************************* ff_dm_reci *********************************/
+static char doc_f2py_rout_ext_ff_dm_reci[] = "\
+ff_dm_reci = ff_dm_reci(cor,radii,dm0,amp,gradient,[matrix,reciprocal])\n\nWrapper for ``ff_dm_reci``.\
+\n\nParameters\n----------\n"
+"cor : input rank-2 array('d') with bounds (n,3)\n"
+"radii : input rank-1 array('d') with bounds (n)\n"
+"dm0 : input rank-2 array('i') with bounds (n,n)\n"
+"amp : input float\n"
+"gradient : in/output rank-2 array('d') with bounds (n,3)\n"
+"\nOther Parameters\n----------------\n"
+"matrix : input rank-2 array('d') with bounds (3,3), optional\n    Default: 0\n"
+"reciprocal : input rank-2 array('d') with bounds (3,3), optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"ff_dm_reci : float";
+/* extern double ff_dm_reci(int,int,double*,double*,int*,double,double*,double*,double*); */
+static PyObject *f2py_rout_ext_ff_dm_reci(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           double (*f2py_func)(int,int,double*,double*,int*,double,double*,double*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double ff_dm_reci_return_value=0;
+  int n = 0;
+  int periodic = 0;
+  double *cor = NULL;
+  npy_intp cor_Dims[2] = {-1, -1};
+  const int cor_Rank = 2;
+  PyArrayObject *capi_cor_tmp = NULL;
+  int capi_cor_intent = 0;
+  PyObject *cor_capi = Py_None;
+  double *radii = NULL;
+  npy_intp radii_Dims[1] = {-1};
+  const int radii_Rank = 1;
+  PyArrayObject *capi_radii_tmp = NULL;
+  int capi_radii_intent = 0;
+  PyObject *radii_capi = Py_None;
+  int *dm0 = NULL;
+  npy_intp dm0_Dims[2] = {-1, -1};
+  const int dm0_Rank = 2;
+  PyArrayObject *capi_dm0_tmp = NULL;
+  int capi_dm0_intent = 0;
+  PyObject *dm0_capi = Py_None;
+  double amp = 0;
+  PyObject *amp_capi = Py_None;
+  double *gradient = NULL;
+  npy_intp gradient_Dims[2] = {-1, -1};
+  const int gradient_Rank = 2;
+  PyArrayObject *capi_gradient_tmp = NULL;
+  int capi_gradient_intent = 0;
+  PyObject *gradient_capi = Py_None;
+  double *matrix = NULL;
+  npy_intp matrix_Dims[2] = {-1, -1};
+  const int matrix_Rank = 2;
+  PyArrayObject *capi_matrix_tmp = NULL;
+  int capi_matrix_intent = 0;
+  PyObject *matrix_capi = Py_None;
+  double *reciprocal = NULL;
+  npy_intp reciprocal_Dims[2] = {-1, -1};
+  const int reciprocal_Rank = 2;
+  PyArrayObject *capi_reciprocal_tmp = NULL;
+  int capi_reciprocal_intent = 0;
+  PyObject *reciprocal_capi = Py_None;
+  static char *capi_kwlist[] = {"cor","radii","dm0","amp","gradient","matrix","reciprocal",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOO|OO:ext.ff_dm_reci",\
+    capi_kwlist,&cor_capi,&radii_capi,&dm0_capi,&amp_capi,&gradient_capi,&matrix_capi,&reciprocal_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable cor */
+  cor_Dims[1]=3;
+  capi_cor_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_cor_tmp = array_from_pyobj(NPY_DOUBLE,cor_Dims,cor_Rank,capi_cor_intent,cor_capi);
+  if (capi_cor_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `cor' of ext.ff_dm_reci to C/Fortran array" );
+  } else {
+    cor = (double *)(PyArray_DATA(capi_cor_tmp));
+
+  /* Processing variable matrix */
+  matrix_Dims[0]=3,matrix_Dims[1]=3;
+  capi_matrix_intent |= F2PY_OPTIONAL|F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_matrix_tmp = array_from_pyobj(NPY_DOUBLE,matrix_Dims,matrix_Rank,capi_matrix_intent,matrix_capi);
+  if (capi_matrix_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st keyword `matrix' of ext.ff_dm_reci to C/Fortran array" );
+  } else {
+    matrix = (double *)(PyArray_DATA(capi_matrix_tmp));
+
+  if (matrix_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("ff_dm_reci: Initializing matrix=0\n");
+    if (initforcomb(PyArray_DIMS(capi_matrix_tmp),PyArray_NDIM(capi_matrix_tmp),1)) {
+      while ((_i = nextforcomb()))
+        matrix[capi_i++] = 0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(ext_error,"Initialization of 1st keyword matrix failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable reciprocal */
+  reciprocal_Dims[0]=3,reciprocal_Dims[1]=3;
+  capi_reciprocal_intent |= F2PY_OPTIONAL|F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_reciprocal_tmp = array_from_pyobj(NPY_DOUBLE,reciprocal_Dims,reciprocal_Rank,capi_reciprocal_intent,reciprocal_capi);
+  if (capi_reciprocal_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd keyword `reciprocal' of ext.ff_dm_reci to C/Fortran array" );
+  } else {
+    reciprocal = (double *)(PyArray_DATA(capi_reciprocal_tmp));
+
+  if (reciprocal_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("ff_dm_reci: Initializing reciprocal=0\n");
+    if (initforcomb(PyArray_DIMS(capi_reciprocal_tmp),PyArray_NDIM(capi_reciprocal_tmp),1)) {
+      while ((_i = nextforcomb()))
+        reciprocal[capi_i++] = 0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(ext_error,"Initialization of 2nd keyword reciprocal failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable amp */
+    f2py_success = double_from_pyobj(&amp,amp_capi,"ext.ff_dm_reci() 4th argument (amp) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable n */
+  n = len(cor);
+  /* Processing variable dm0 */
+  dm0_Dims[0]=n,dm0_Dims[1]=n;
+  capi_dm0_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_dm0_tmp = array_from_pyobj(NPY_INT,dm0_Dims,dm0_Rank,capi_dm0_intent,dm0_capi);
+  if (capi_dm0_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 3rd argument `dm0' of ext.ff_dm_reci to C/Fortran array" );
+  } else {
+    dm0 = (int *)(PyArray_DATA(capi_dm0_tmp));
+
+  /* Processing variable radii */
+  radii_Dims[0]=n;
+  capi_radii_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_radii_tmp = array_from_pyobj(NPY_DOUBLE,radii_Dims,radii_Rank,capi_radii_intent,radii_capi);
+  if (capi_radii_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd argument `radii' of ext.ff_dm_reci to C/Fortran array" );
+  } else {
+    radii = (double *)(PyArray_DATA(capi_radii_tmp));
+
+  /* Processing variable periodic */
+  periodic = (matrix_capi-Py_None);
+  /* Processing variable gradient */
+  gradient_Dims[0]=n,gradient_Dims[1]=3;
+  capi_gradient_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_gradient_tmp = array_from_pyobj(NPY_DOUBLE,gradient_Dims,gradient_Rank,capi_gradient_intent,gradient_capi);
+  if (capi_gradient_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 5th argument `gradient' of ext.ff_dm_reci to C/Fortran array" );
+  } else {
+    gradient = (double *)(PyArray_DATA(capi_gradient_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  ff_dm_reci_return_value = (*f2py_func)(n,periodic,cor,radii,dm0,amp,gradient,matrix,reciprocal);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("d",ff_dm_reci_return_value);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_gradient_tmp!=gradient_capi) {
+    Py_XDECREF(capi_gradient_tmp); }
+  }  /*if (capi_gradient_tmp == NULL) ... else of gradient*/
+  /* End of cleaning variable gradient */
+  /* End of cleaning variable periodic */
+  if((PyObject *)capi_radii_tmp!=radii_capi) {
+    Py_XDECREF(capi_radii_tmp); }
+  }  /*if (capi_radii_tmp == NULL) ... else of radii*/
+  /* End of cleaning variable radii */
+  if((PyObject *)capi_dm0_tmp!=dm0_capi) {
+    Py_XDECREF(capi_dm0_tmp); }
+  }  /*if (capi_dm0_tmp == NULL) ... else of dm0*/
+  /* End of cleaning variable dm0 */
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of amp*/
+  /* End of cleaning variable amp */
+  }  /*if (f2py_success) of reciprocal init*/
+  if((PyObject *)capi_reciprocal_tmp!=reciprocal_capi) {
+    Py_XDECREF(capi_reciprocal_tmp); }
+  }  /*if (capi_reciprocal_tmp == NULL) ... else of reciprocal*/
+  /* End of cleaning variable reciprocal */
+  }  /*if (f2py_success) of matrix init*/
+  if((PyObject *)capi_matrix_tmp!=matrix_capi) {
+    Py_XDECREF(capi_matrix_tmp); }
+  }  /*if (capi_matrix_tmp == NULL) ... else of matrix*/
+  /* End of cleaning variable matrix */
+  if((PyObject *)capi_cor_tmp!=cor_capi) {
+    Py_XDECREF(capi_cor_tmp); }
+  }  /*if (capi_cor_tmp == NULL) ... else of cor*/
+  /* End of cleaning variable cor */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of ff_dm_reci *****************************/
+
+/******************************** ff_pair_reci ********************************/
+static char doc_f2py_rout_ext_ff_pair_reci[] = "\
+ff_pair_reci = ff_pair_reci(cor,pairs,radii,amp,gradient,[matrix,reciprocal])\n\nWrapper for ``ff_pair_reci``.\
+\n\nParameters\n----------\n"
+"cor : input rank-2 array('d') with bounds (n,3)\n"
+"pairs : input rank-2 array('i') with bounds (m,2)\n"
+"radii : input rank-1 array('d') with bounds (n)\n"
+"amp : input float\n"
+"gradient : in/output rank-2 array('d') with bounds (n,3)\n"
+"\nOther Parameters\n----------------\n"
+"matrix : input rank-2 array('d') with bounds (3,3), optional\n    Default: 0\n"
+"reciprocal : input rank-2 array('d') with bounds (3,3), optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"ff_pair_reci : float";
+/* extern double ff_pair_reci(int,int,int,double*,int*,double*,double,double*,double*,double*); */
+static PyObject *f2py_rout_ext_ff_pair_reci(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           double (*f2py_func)(int,int,int,double*,int*,double*,double,double*,double*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double ff_pair_reci_return_value=0;
+  int m = 0;
+  int n = 0;
+  int periodic = 0;
+  double *cor = NULL;
+  npy_intp cor_Dims[2] = {-1, -1};
+  const int cor_Rank = 2;
+  PyArrayObject *capi_cor_tmp = NULL;
+  int capi_cor_intent = 0;
+  PyObject *cor_capi = Py_None;
+  int *pairs = NULL;
+  npy_intp pairs_Dims[2] = {-1, -1};
+  const int pairs_Rank = 2;
+  PyArrayObject *capi_pairs_tmp = NULL;
+  int capi_pairs_intent = 0;
+  PyObject *pairs_capi = Py_None;
+  double *radii = NULL;
+  npy_intp radii_Dims[1] = {-1};
+  const int radii_Rank = 1;
+  PyArrayObject *capi_radii_tmp = NULL;
+  int capi_radii_intent = 0;
+  PyObject *radii_capi = Py_None;
+  double amp = 0;
+  PyObject *amp_capi = Py_None;
+  double *gradient = NULL;
+  npy_intp gradient_Dims[2] = {-1, -1};
+  const int gradient_Rank = 2;
+  PyArrayObject *capi_gradient_tmp = NULL;
+  int capi_gradient_intent = 0;
+  PyObject *gradient_capi = Py_None;
+  double *matrix = NULL;
+  npy_intp matrix_Dims[2] = {-1, -1};
+  const int matrix_Rank = 2;
+  PyArrayObject *capi_matrix_tmp = NULL;
+  int capi_matrix_intent = 0;
+  PyObject *matrix_capi = Py_None;
+  double *reciprocal = NULL;
+  npy_intp reciprocal_Dims[2] = {-1, -1};
+  const int reciprocal_Rank = 2;
+  PyArrayObject *capi_reciprocal_tmp = NULL;
+  int capi_reciprocal_intent = 0;
+  PyObject *reciprocal_capi = Py_None;
+  static char *capi_kwlist[] = {"cor","pairs","radii","amp","gradient","matrix","reciprocal",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOO|OO:ext.ff_pair_reci",\
+    capi_kwlist,&cor_capi,&pairs_capi,&radii_capi,&amp_capi,&gradient_capi,&matrix_capi,&reciprocal_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable pairs */
+  pairs_Dims[1]=2;
+  capi_pairs_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_pairs_tmp = array_from_pyobj(NPY_INT,pairs_Dims,pairs_Rank,capi_pairs_intent,pairs_capi);
+  if (capi_pairs_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd argument `pairs' of ext.ff_pair_reci to C/Fortran array" );
+  } else {
+    pairs = (int *)(PyArray_DATA(capi_pairs_tmp));
+
+  /* Processing variable cor */
+  cor_Dims[1]=3;
+  capi_cor_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_cor_tmp = array_from_pyobj(NPY_DOUBLE,cor_Dims,cor_Rank,capi_cor_intent,cor_capi);
+  if (capi_cor_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `cor' of ext.ff_pair_reci to C/Fortran array" );
+  } else {
+    cor = (double *)(PyArray_DATA(capi_cor_tmp));
+
+  /* Processing variable matrix */
+  matrix_Dims[0]=3,matrix_Dims[1]=3;
+  capi_matrix_intent |= F2PY_OPTIONAL|F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_matrix_tmp = array_from_pyobj(NPY_DOUBLE,matrix_Dims,matrix_Rank,capi_matrix_intent,matrix_capi);
+  if (capi_matrix_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st keyword `matrix' of ext.ff_pair_reci to C/Fortran array" );
+  } else {
+    matrix = (double *)(PyArray_DATA(capi_matrix_tmp));
+
+  if (matrix_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("ff_pair_reci: Initializing matrix=0\n");
+    if (initforcomb(PyArray_DIMS(capi_matrix_tmp),PyArray_NDIM(capi_matrix_tmp),1)) {
+      while ((_i = nextforcomb()))
+        matrix[capi_i++] = 0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(ext_error,"Initialization of 1st keyword matrix failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable reciprocal */
+  reciprocal_Dims[0]=3,reciprocal_Dims[1]=3;
+  capi_reciprocal_intent |= F2PY_OPTIONAL|F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_reciprocal_tmp = array_from_pyobj(NPY_DOUBLE,reciprocal_Dims,reciprocal_Rank,capi_reciprocal_intent,reciprocal_capi);
+  if (capi_reciprocal_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd keyword `reciprocal' of ext.ff_pair_reci to C/Fortran array" );
+  } else {
+    reciprocal = (double *)(PyArray_DATA(capi_reciprocal_tmp));
+
+  if (reciprocal_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("ff_pair_reci: Initializing reciprocal=0\n");
+    if (initforcomb(PyArray_DIMS(capi_reciprocal_tmp),PyArray_NDIM(capi_reciprocal_tmp),1)) {
+      while ((_i = nextforcomb()))
+        reciprocal[capi_i++] = 0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(ext_error,"Initialization of 2nd keyword reciprocal failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable amp */
+    f2py_success = double_from_pyobj(&amp,amp_capi,"ext.ff_pair_reci() 4th argument (amp) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable m */
+  m = shape(pairs,0);
+  /* Processing variable n */
+  n = len(cor);
+  /* Processing variable radii */
+  radii_Dims[0]=n;
+  capi_radii_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_radii_tmp = array_from_pyobj(NPY_DOUBLE,radii_Dims,radii_Rank,capi_radii_intent,radii_capi);
+  if (capi_radii_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 3rd argument `radii' of ext.ff_pair_reci to C/Fortran array" );
+  } else {
+    radii = (double *)(PyArray_DATA(capi_radii_tmp));
+
+  /* Processing variable periodic */
+  periodic = (matrix_capi-Py_None);
+  /* Processing variable gradient */
+  gradient_Dims[0]=n,gradient_Dims[1]=3;
+  capi_gradient_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_gradient_tmp = array_from_pyobj(NPY_DOUBLE,gradient_Dims,gradient_Rank,capi_gradient_intent,gradient_capi);
+  if (capi_gradient_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 5th argument `gradient' of ext.ff_pair_reci to C/Fortran array" );
+  } else {
+    gradient = (double *)(PyArray_DATA(capi_gradient_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  ff_pair_reci_return_value = (*f2py_func)(m,n,periodic,cor,pairs,radii,amp,gradient,matrix,reciprocal);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("d",ff_pair_reci_return_value);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_gradient_tmp!=gradient_capi) {
+    Py_XDECREF(capi_gradient_tmp); }
+  }  /*if (capi_gradient_tmp == NULL) ... else of gradient*/
+  /* End of cleaning variable gradient */
+  /* End of cleaning variable periodic */
+  if((PyObject *)capi_radii_tmp!=radii_capi) {
+    Py_XDECREF(capi_radii_tmp); }
+  }  /*if (capi_radii_tmp == NULL) ... else of radii*/
+  /* End of cleaning variable radii */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  } /*if (f2py_success) of amp*/
+  /* End of cleaning variable amp */
+  }  /*if (f2py_success) of reciprocal init*/
+  if((PyObject *)capi_reciprocal_tmp!=reciprocal_capi) {
+    Py_XDECREF(capi_reciprocal_tmp); }
+  }  /*if (capi_reciprocal_tmp == NULL) ... else of reciprocal*/
+  /* End of cleaning variable reciprocal */
+  }  /*if (f2py_success) of matrix init*/
+  if((PyObject *)capi_matrix_tmp!=matrix_capi) {
+    Py_XDECREF(capi_matrix_tmp); }
+  }  /*if (capi_matrix_tmp == NULL) ... else of matrix*/
+  /* End of cleaning variable matrix */
+  if((PyObject *)capi_cor_tmp!=cor_capi) {
+    Py_XDECREF(capi_cor_tmp); }
+  }  /*if (capi_cor_tmp == NULL) ... else of cor*/
+  /* End of cleaning variable cor */
+  if((PyObject *)capi_pairs_tmp!=pairs_capi) {
+    Py_XDECREF(capi_pairs_tmp); }
+  }  /*if (capi_pairs_tmp == NULL) ... else of pairs*/
+  /* End of cleaning variable pairs */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/**************************** end of ff_pair_reci ****************************/
+
+/******************************** ff_pair_quad ********************************/
+static char doc_f2py_rout_ext_ff_pair_quad[] = "\
+ff_pair_quad = ff_pair_quad(cor,pairs,lengths,weights,amp,gradient,[matrix,reciprocal])\n\nWrapper for ``ff_pair_quad``.\
+\n\nParameters\n----------\n"
+"cor : input rank-2 array('d') with bounds (n,3)\n"
+"pairs : input rank-2 array('i') with bounds (m,2)\n"
+"lengths : input rank-1 array('d') with bounds (*)\n"
+"weights : input rank-1 array('d') with bounds (*)\n"
+"amp : input float\n"
+"gradient : in/output rank-2 array('d') with bounds (n,3)\n"
+"\nOther Parameters\n----------------\n"
+"matrix : input rank-2 array('d') with bounds (3,3), optional\n    Default: 0\n"
+"reciprocal : input rank-2 array('d') with bounds (3,3), optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"ff_pair_quad : float";
+/* extern double ff_pair_quad(int,int,int,double*,int*,double*,double*,double,double*,double*,double*); */
+static PyObject *f2py_rout_ext_ff_pair_quad(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           double (*f2py_func)(int,int,int,double*,int*,double*,double*,double,double*,double*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double ff_pair_quad_return_value=0;
+  int m = 0;
+  int n = 0;
+  int periodic = 0;
+  double *cor = NULL;
+  npy_intp cor_Dims[2] = {-1, -1};
+  const int cor_Rank = 2;
+  PyArrayObject *capi_cor_tmp = NULL;
+  int capi_cor_intent = 0;
+  PyObject *cor_capi = Py_None;
+  int *pairs = NULL;
+  npy_intp pairs_Dims[2] = {-1, -1};
+  const int pairs_Rank = 2;
+  PyArrayObject *capi_pairs_tmp = NULL;
+  int capi_pairs_intent = 0;
+  PyObject *pairs_capi = Py_None;
+  double *lengths = NULL;
+  npy_intp lengths_Dims[1] = {-1};
+  const int lengths_Rank = 1;
+  PyArrayObject *capi_lengths_tmp = NULL;
+  int capi_lengths_intent = 0;
+  PyObject *lengths_capi = Py_None;
+  double *weights = NULL;
+  npy_intp weights_Dims[1] = {-1};
+  const int weights_Rank = 1;
+  PyArrayObject *capi_weights_tmp = NULL;
+  int capi_weights_intent = 0;
+  PyObject *weights_capi = Py_None;
+  double amp = 0;
+  PyObject *amp_capi = Py_None;
+  double *gradient = NULL;
+  npy_intp gradient_Dims[2] = {-1, -1};
+  const int gradient_Rank = 2;
+  PyArrayObject *capi_gradient_tmp = NULL;
+  int capi_gradient_intent = 0;
+  PyObject *gradient_capi = Py_None;
+  double *matrix = NULL;
+  npy_intp matrix_Dims[2] = {-1, -1};
+  const int matrix_Rank = 2;
+  PyArrayObject *capi_matrix_tmp = NULL;
+  int capi_matrix_intent = 0;
+  PyObject *matrix_capi = Py_None;
+  double *reciprocal = NULL;
+  npy_intp reciprocal_Dims[2] = {-1, -1};
+  const int reciprocal_Rank = 2;
+  PyArrayObject *capi_reciprocal_tmp = NULL;
+  int capi_reciprocal_intent = 0;
+  PyObject *reciprocal_capi = Py_None;
+  static char *capi_kwlist[] = {"cor","pairs","lengths","weights","amp","gradient","matrix","reciprocal",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOO|OO:ext.ff_pair_quad",\
+    capi_kwlist,&cor_capi,&pairs_capi,&lengths_capi,&weights_capi,&amp_capi,&gradient_capi,&matrix_capi,&reciprocal_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable pairs */
+  pairs_Dims[1]=2;
+  capi_pairs_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_pairs_tmp = array_from_pyobj(NPY_INT,pairs_Dims,pairs_Rank,capi_pairs_intent,pairs_capi);
+  if (capi_pairs_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd argument `pairs' of ext.ff_pair_quad to C/Fortran array" );
+  } else {
+    pairs = (int *)(PyArray_DATA(capi_pairs_tmp));
+
+  /* Processing variable matrix */
+  matrix_Dims[0]=3,matrix_Dims[1]=3;
+  capi_matrix_intent |= F2PY_OPTIONAL|F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_matrix_tmp = array_from_pyobj(NPY_DOUBLE,matrix_Dims,matrix_Rank,capi_matrix_intent,matrix_capi);
+  if (capi_matrix_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st keyword `matrix' of ext.ff_pair_quad to C/Fortran array" );
+  } else {
+    matrix = (double *)(PyArray_DATA(capi_matrix_tmp));
+
+  if (matrix_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("ff_pair_quad: Initializing matrix=0\n");
+    if (initforcomb(PyArray_DIMS(capi_matrix_tmp),PyArray_NDIM(capi_matrix_tmp),1)) {
+      while ((_i = nextforcomb()))
+        matrix[capi_i++] = 0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(ext_error,"Initialization of 1st keyword matrix failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable reciprocal */
+  reciprocal_Dims[0]=3,reciprocal_Dims[1]=3;
+  capi_reciprocal_intent |= F2PY_OPTIONAL|F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_reciprocal_tmp = array_from_pyobj(NPY_DOUBLE,reciprocal_Dims,reciprocal_Rank,capi_reciprocal_intent,reciprocal_capi);
+  if (capi_reciprocal_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd keyword `reciprocal' of ext.ff_pair_quad to C/Fortran array" );
+  } else {
+    reciprocal = (double *)(PyArray_DATA(capi_reciprocal_tmp));
+
+  if (reciprocal_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("ff_pair_quad: Initializing reciprocal=0\n");
+    if (initforcomb(PyArray_DIMS(capi_reciprocal_tmp),PyArray_NDIM(capi_reciprocal_tmp),1)) {
+      while ((_i = nextforcomb()))
+        reciprocal[capi_i++] = 0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(ext_error,"Initialization of 2nd keyword reciprocal failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable lengths */
+  ;
+  capi_lengths_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_lengths_tmp = array_from_pyobj(NPY_DOUBLE,lengths_Dims,lengths_Rank,capi_lengths_intent,lengths_capi);
+  if (capi_lengths_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 3rd argument `lengths' of ext.ff_pair_quad to C/Fortran array" );
+  } else {
+    lengths = (double *)(PyArray_DATA(capi_lengths_tmp));
+
+  /* Processing variable cor */
+  cor_Dims[1]=3;
+  capi_cor_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_cor_tmp = array_from_pyobj(NPY_DOUBLE,cor_Dims,cor_Rank,capi_cor_intent,cor_capi);
+  if (capi_cor_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `cor' of ext.ff_pair_quad to C/Fortran array" );
+  } else {
+    cor = (double *)(PyArray_DATA(capi_cor_tmp));
+
+  /* Processing variable weights */
+  ;
+  capi_weights_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_weights_tmp = array_from_pyobj(NPY_DOUBLE,weights_Dims,weights_Rank,capi_weights_intent,weights_capi);
+  if (capi_weights_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 4th argument `weights' of ext.ff_pair_quad to C/Fortran array" );
+  } else {
+    weights = (double *)(PyArray_DATA(capi_weights_tmp));
+
+  /* Processing variable amp */
+    f2py_success = double_from_pyobj(&amp,amp_capi,"ext.ff_pair_quad() 5th argument (amp) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable periodic */
+  periodic = (matrix_capi-Py_None);
+  /* Processing variable m */
+  m = shape(pairs,0);
+  /* Processing variable n */
+  n = len(cor);
+  /* Processing variable gradient */
+  gradient_Dims[0]=n,gradient_Dims[1]=3;
+  capi_gradient_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_gradient_tmp = array_from_pyobj(NPY_DOUBLE,gradient_Dims,gradient_Rank,capi_gradient_intent,gradient_capi);
+  if (capi_gradient_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 6th argument `gradient' of ext.ff_pair_quad to C/Fortran array" );
+  } else {
+    gradient = (double *)(PyArray_DATA(capi_gradient_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  ff_pair_quad_return_value = (*f2py_func)(m,n,periodic,cor,pairs,lengths,weights,amp,gradient,matrix,reciprocal);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("d",ff_pair_quad_return_value);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_gradient_tmp!=gradient_capi) {
+    Py_XDECREF(capi_gradient_tmp); }
+  }  /*if (capi_gradient_tmp == NULL) ... else of gradient*/
+  /* End of cleaning variable gradient */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  /* End of cleaning variable periodic */
+  } /*if (f2py_success) of amp*/
+  /* End of cleaning variable amp */
+  if((PyObject *)capi_weights_tmp!=weights_capi) {
+    Py_XDECREF(capi_weights_tmp); }
+  }  /*if (capi_weights_tmp == NULL) ... else of weights*/
+  /* End of cleaning variable weights */
+  if((PyObject *)capi_cor_tmp!=cor_capi) {
+    Py_XDECREF(capi_cor_tmp); }
+  }  /*if (capi_cor_tmp == NULL) ... else of cor*/
+  /* End of cleaning variable cor */
+  if((PyObject *)capi_lengths_tmp!=lengths_capi) {
+    Py_XDECREF(capi_lengths_tmp); }
+  }  /*if (capi_lengths_tmp == NULL) ... else of lengths*/
+  /* End of cleaning variable lengths */
+  }  /*if (f2py_success) of reciprocal init*/
+  if((PyObject *)capi_reciprocal_tmp!=reciprocal_capi) {
+    Py_XDECREF(capi_reciprocal_tmp); }
+  }  /*if (capi_reciprocal_tmp == NULL) ... else of reciprocal*/
+  /* End of cleaning variable reciprocal */
+  }  /*if (f2py_success) of matrix init*/
+  if((PyObject *)capi_matrix_tmp!=matrix_capi) {
+    Py_XDECREF(capi_matrix_tmp); }
+  }  /*if (capi_matrix_tmp == NULL) ... else of matrix*/
+  /* End of cleaning variable matrix */
+  if((PyObject *)capi_pairs_tmp!=pairs_capi) {
+    Py_XDECREF(capi_pairs_tmp); }
+  }  /*if (capi_pairs_tmp == NULL) ... else of pairs*/
+  /* End of cleaning variable pairs */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/**************************** end of ff_pair_quad ****************************/
+
+/******************************** ff_bond_quad ********************************/
+static char doc_f2py_rout_ext_ff_bond_quad[] = "\
+ff_bond_quad = ff_bond_quad(cor,pairs,lengths,amp,gradient,[matrix,reciprocal])\n\nWrapper for ``ff_bond_quad``.\
+\n\nParameters\n----------\n"
+"cor : input rank-2 array('d') with bounds (n,3)\n"
+"pairs : input rank-2 array('i') with bounds (m,2)\n"
+"lengths : input rank-1 array('d') with bounds (m)\n"
+"amp : input float\n"
+"gradient : in/output rank-2 array('d') with bounds (n,3)\n"
+"\nOther Parameters\n----------------\n"
+"matrix : input rank-2 array('d') with bounds (3,3), optional\n    Default: 0\n"
+"reciprocal : input rank-2 array('d') with bounds (3,3), optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"ff_bond_quad : float";
+/* extern double ff_bond_quad(int,int,int,double*,int*,double*,double,double*,double*,double*); */
+static PyObject *f2py_rout_ext_ff_bond_quad(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           double (*f2py_func)(int,int,int,double*,int*,double*,double,double*,double*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double ff_bond_quad_return_value=0;
+  int m = 0;
+  int n = 0;
+  int periodic = 0;
+  double *cor = NULL;
+  npy_intp cor_Dims[2] = {-1, -1};
+  const int cor_Rank = 2;
+  PyArrayObject *capi_cor_tmp = NULL;
+  int capi_cor_intent = 0;
+  PyObject *cor_capi = Py_None;
+  int *pairs = NULL;
+  npy_intp pairs_Dims[2] = {-1, -1};
+  const int pairs_Rank = 2;
+  PyArrayObject *capi_pairs_tmp = NULL;
+  int capi_pairs_intent = 0;
+  PyObject *pairs_capi = Py_None;
+  double *lengths = NULL;
+  npy_intp lengths_Dims[1] = {-1};
+  const int lengths_Rank = 1;
+  PyArrayObject *capi_lengths_tmp = NULL;
+  int capi_lengths_intent = 0;
+  PyObject *lengths_capi = Py_None;
+  double amp = 0;
+  PyObject *amp_capi = Py_None;
+  double *gradient = NULL;
+  npy_intp gradient_Dims[2] = {-1, -1};
+  const int gradient_Rank = 2;
+  PyArrayObject *capi_gradient_tmp = NULL;
+  int capi_gradient_intent = 0;
+  PyObject *gradient_capi = Py_None;
+  double *matrix = NULL;
+  npy_intp matrix_Dims[2] = {-1, -1};
+  const int matrix_Rank = 2;
+  PyArrayObject *capi_matrix_tmp = NULL;
+  int capi_matrix_intent = 0;
+  PyObject *matrix_capi = Py_None;
+  double *reciprocal = NULL;
+  npy_intp reciprocal_Dims[2] = {-1, -1};
+  const int reciprocal_Rank = 2;
+  PyArrayObject *capi_reciprocal_tmp = NULL;
+  int capi_reciprocal_intent = 0;
+  PyObject *reciprocal_capi = Py_None;
+  static char *capi_kwlist[] = {"cor","pairs","lengths","amp","gradient","matrix","reciprocal",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOO|OO:ext.ff_bond_quad",\
+    capi_kwlist,&cor_capi,&pairs_capi,&lengths_capi,&amp_capi,&gradient_capi,&matrix_capi,&reciprocal_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable pairs */
+  pairs_Dims[1]=2;
+  capi_pairs_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_pairs_tmp = array_from_pyobj(NPY_INT,pairs_Dims,pairs_Rank,capi_pairs_intent,pairs_capi);
+  if (capi_pairs_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd argument `pairs' of ext.ff_bond_quad to C/Fortran array" );
+  } else {
+    pairs = (int *)(PyArray_DATA(capi_pairs_tmp));
+
+  /* Processing variable cor */
+  cor_Dims[1]=3;
+  capi_cor_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_cor_tmp = array_from_pyobj(NPY_DOUBLE,cor_Dims,cor_Rank,capi_cor_intent,cor_capi);
+  if (capi_cor_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `cor' of ext.ff_bond_quad to C/Fortran array" );
+  } else {
+    cor = (double *)(PyArray_DATA(capi_cor_tmp));
+
+  /* Processing variable matrix */
+  matrix_Dims[0]=3,matrix_Dims[1]=3;
+  capi_matrix_intent |= F2PY_OPTIONAL|F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_matrix_tmp = array_from_pyobj(NPY_DOUBLE,matrix_Dims,matrix_Rank,capi_matrix_intent,matrix_capi);
+  if (capi_matrix_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st keyword `matrix' of ext.ff_bond_quad to C/Fortran array" );
+  } else {
+    matrix = (double *)(PyArray_DATA(capi_matrix_tmp));
+
+  if (matrix_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("ff_bond_quad: Initializing matrix=0\n");
+    if (initforcomb(PyArray_DIMS(capi_matrix_tmp),PyArray_NDIM(capi_matrix_tmp),1)) {
+      while ((_i = nextforcomb()))
+        matrix[capi_i++] = 0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(ext_error,"Initialization of 1st keyword matrix failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable reciprocal */
+  reciprocal_Dims[0]=3,reciprocal_Dims[1]=3;
+  capi_reciprocal_intent |= F2PY_OPTIONAL|F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_reciprocal_tmp = array_from_pyobj(NPY_DOUBLE,reciprocal_Dims,reciprocal_Rank,capi_reciprocal_intent,reciprocal_capi);
+  if (capi_reciprocal_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd keyword `reciprocal' of ext.ff_bond_quad to C/Fortran array" );
+  } else {
+    reciprocal = (double *)(PyArray_DATA(capi_reciprocal_tmp));
+
+  if (reciprocal_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("ff_bond_quad: Initializing reciprocal=0\n");
+    if (initforcomb(PyArray_DIMS(capi_reciprocal_tmp),PyArray_NDIM(capi_reciprocal_tmp),1)) {
+      while ((_i = nextforcomb()))
+        reciprocal[capi_i++] = 0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(ext_error,"Initialization of 2nd keyword reciprocal failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable amp */
+    f2py_success = double_from_pyobj(&amp,amp_capi,"ext.ff_bond_quad() 4th argument (amp) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable m */
+  m = len(pairs);
+  /* Processing variable n */
+  n = len(cor);
+  /* Processing variable gradient */
+  gradient_Dims[0]=n,gradient_Dims[1]=3;
+  capi_gradient_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_gradient_tmp = array_from_pyobj(NPY_DOUBLE,gradient_Dims,gradient_Rank,capi_gradient_intent,gradient_capi);
+  if (capi_gradient_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 5th argument `gradient' of ext.ff_bond_quad to C/Fortran array" );
+  } else {
+    gradient = (double *)(PyArray_DATA(capi_gradient_tmp));
+
+  /* Processing variable periodic */
+  periodic = (matrix_capi-Py_None);
+  /* Processing variable lengths */
+  lengths_Dims[0]=m;
+  capi_lengths_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_lengths_tmp = array_from_pyobj(NPY_DOUBLE,lengths_Dims,lengths_Rank,capi_lengths_intent,lengths_capi);
+  if (capi_lengths_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 3rd argument `lengths' of ext.ff_bond_quad to C/Fortran array" );
+  } else {
+    lengths = (double *)(PyArray_DATA(capi_lengths_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  ff_bond_quad_return_value = (*f2py_func)(m,n,periodic,cor,pairs,lengths,amp,gradient,matrix,reciprocal);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("d",ff_bond_quad_return_value);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_lengths_tmp!=lengths_capi) {
+    Py_XDECREF(capi_lengths_tmp); }
+  }  /*if (capi_lengths_tmp == NULL) ... else of lengths*/
+  /* End of cleaning variable lengths */
+  /* End of cleaning variable periodic */
+  if((PyObject *)capi_gradient_tmp!=gradient_capi) {
+    Py_XDECREF(capi_gradient_tmp); }
+  }  /*if (capi_gradient_tmp == NULL) ... else of gradient*/
+  /* End of cleaning variable gradient */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  } /*if (f2py_success) of amp*/
+  /* End of cleaning variable amp */
+  }  /*if (f2py_success) of reciprocal init*/
+  if((PyObject *)capi_reciprocal_tmp!=reciprocal_capi) {
+    Py_XDECREF(capi_reciprocal_tmp); }
+  }  /*if (capi_reciprocal_tmp == NULL) ... else of reciprocal*/
+  /* End of cleaning variable reciprocal */
+  }  /*if (f2py_success) of matrix init*/
+  if((PyObject *)capi_matrix_tmp!=matrix_capi) {
+    Py_XDECREF(capi_matrix_tmp); }
+  }  /*if (capi_matrix_tmp == NULL) ... else of matrix*/
+  /* End of cleaning variable matrix */
+  if((PyObject *)capi_cor_tmp!=cor_capi) {
+    Py_XDECREF(capi_cor_tmp); }
+  }  /*if (capi_cor_tmp == NULL) ... else of cor*/
+  /* End of cleaning variable cor */
+  if((PyObject *)capi_pairs_tmp!=pairs_capi) {
+    Py_XDECREF(capi_pairs_tmp); }
+  }  /*if (capi_pairs_tmp == NULL) ... else of pairs*/
+  /* End of cleaning variable pairs */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/**************************** end of ff_bond_quad ****************************/
+
+/******************************* ff_bond_hyper *******************************/
+static char doc_f2py_rout_ext_ff_bond_hyper[] = "\
+ff_bond_hyper = ff_bond_hyper(cor,pairs,lengths,scale,amp,gradient,[matrix,reciprocal])\n\nWrapper for ``ff_bond_hyper``.\
+\n\nParameters\n----------\n"
+"cor : input rank-2 array('d') with bounds (n,3)\n"
+"pairs : input rank-2 array('i') with bounds (m,2)\n"
+"lengths : input rank-1 array('d') with bounds (m)\n"
+"scale : input float\n"
+"amp : input float\n"
+"gradient : in/output rank-2 array('d') with bounds (n,3)\n"
+"\nOther Parameters\n----------------\n"
+"matrix : input rank-2 array('d') with bounds (3,3), optional\n    Default: 0\n"
+"reciprocal : input rank-2 array('d') with bounds (3,3), optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"ff_bond_hyper : float";
+/* extern double ff_bond_hyper(int,int,int,double*,int*,double*,double,double,double*,double*,double*); */
+static PyObject *f2py_rout_ext_ff_bond_hyper(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           double (*f2py_func)(int,int,int,double*,int*,double*,double,double,double*,double*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double ff_bond_hyper_return_value=0;
+  int m = 0;
+  int n = 0;
+  int periodic = 0;
+  double *cor = NULL;
+  npy_intp cor_Dims[2] = {-1, -1};
+  const int cor_Rank = 2;
+  PyArrayObject *capi_cor_tmp = NULL;
+  int capi_cor_intent = 0;
+  PyObject *cor_capi = Py_None;
+  int *pairs = NULL;
+  npy_intp pairs_Dims[2] = {-1, -1};
+  const int pairs_Rank = 2;
+  PyArrayObject *capi_pairs_tmp = NULL;
+  int capi_pairs_intent = 0;
+  PyObject *pairs_capi = Py_None;
+  double *lengths = NULL;
+  npy_intp lengths_Dims[1] = {-1};
+  const int lengths_Rank = 1;
+  PyArrayObject *capi_lengths_tmp = NULL;
+  int capi_lengths_intent = 0;
+  PyObject *lengths_capi = Py_None;
+  double scale = 0;
+  PyObject *scale_capi = Py_None;
+  double amp = 0;
+  PyObject *amp_capi = Py_None;
+  double *gradient = NULL;
+  npy_intp gradient_Dims[2] = {-1, -1};
+  const int gradient_Rank = 2;
+  PyArrayObject *capi_gradient_tmp = NULL;
+  int capi_gradient_intent = 0;
+  PyObject *gradient_capi = Py_None;
+  double *matrix = NULL;
+  npy_intp matrix_Dims[2] = {-1, -1};
+  const int matrix_Rank = 2;
+  PyArrayObject *capi_matrix_tmp = NULL;
+  int capi_matrix_intent = 0;
+  PyObject *matrix_capi = Py_None;
+  double *reciprocal = NULL;
+  npy_intp reciprocal_Dims[2] = {-1, -1};
+  const int reciprocal_Rank = 2;
+  PyArrayObject *capi_reciprocal_tmp = NULL;
+  int capi_reciprocal_intent = 0;
+  PyObject *reciprocal_capi = Py_None;
+  static char *capi_kwlist[] = {"cor","pairs","lengths","scale","amp","gradient","matrix","reciprocal",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOO|OO:ext.ff_bond_hyper",\
+    capi_kwlist,&cor_capi,&pairs_capi,&lengths_capi,&scale_capi,&amp_capi,&gradient_capi,&matrix_capi,&reciprocal_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable pairs */
+  pairs_Dims[1]=2;
+  capi_pairs_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_pairs_tmp = array_from_pyobj(NPY_INT,pairs_Dims,pairs_Rank,capi_pairs_intent,pairs_capi);
+  if (capi_pairs_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd argument `pairs' of ext.ff_bond_hyper to C/Fortran array" );
+  } else {
+    pairs = (int *)(PyArray_DATA(capi_pairs_tmp));
+
+  /* Processing variable cor */
+  cor_Dims[1]=3;
+  capi_cor_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_cor_tmp = array_from_pyobj(NPY_DOUBLE,cor_Dims,cor_Rank,capi_cor_intent,cor_capi);
+  if (capi_cor_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `cor' of ext.ff_bond_hyper to C/Fortran array" );
+  } else {
+    cor = (double *)(PyArray_DATA(capi_cor_tmp));
+
+  /* Processing variable matrix */
+  matrix_Dims[0]=3,matrix_Dims[1]=3;
+  capi_matrix_intent |= F2PY_OPTIONAL|F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_matrix_tmp = array_from_pyobj(NPY_DOUBLE,matrix_Dims,matrix_Rank,capi_matrix_intent,matrix_capi);
+  if (capi_matrix_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st keyword `matrix' of ext.ff_bond_hyper to C/Fortran array" );
+  } else {
+    matrix = (double *)(PyArray_DATA(capi_matrix_tmp));
+
+  if (matrix_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("ff_bond_hyper: Initializing matrix=0\n");
+    if (initforcomb(PyArray_DIMS(capi_matrix_tmp),PyArray_NDIM(capi_matrix_tmp),1)) {
+      while ((_i = nextforcomb()))
+        matrix[capi_i++] = 0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(ext_error,"Initialization of 1st keyword matrix failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable reciprocal */
+  reciprocal_Dims[0]=3,reciprocal_Dims[1]=3;
+  capi_reciprocal_intent |= F2PY_OPTIONAL|F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_reciprocal_tmp = array_from_pyobj(NPY_DOUBLE,reciprocal_Dims,reciprocal_Rank,capi_reciprocal_intent,reciprocal_capi);
+  if (capi_reciprocal_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd keyword `reciprocal' of ext.ff_bond_hyper to C/Fortran array" );
+  } else {
+    reciprocal = (double *)(PyArray_DATA(capi_reciprocal_tmp));
+
+  if (reciprocal_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("ff_bond_hyper: Initializing reciprocal=0\n");
+    if (initforcomb(PyArray_DIMS(capi_reciprocal_tmp),PyArray_NDIM(capi_reciprocal_tmp),1)) {
+      while ((_i = nextforcomb()))
+        reciprocal[capi_i++] = 0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(ext_error,"Initialization of 2nd keyword reciprocal failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable scale */
+    f2py_success = double_from_pyobj(&scale,scale_capi,"ext.ff_bond_hyper() 4th argument (scale) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable amp */
+    f2py_success = double_from_pyobj(&amp,amp_capi,"ext.ff_bond_hyper() 5th argument (amp) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable m */
+  m = len(pairs);
+  /* Processing variable n */
+  n = len(cor);
+  /* Processing variable gradient */
+  gradient_Dims[0]=n,gradient_Dims[1]=3;
+  capi_gradient_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_gradient_tmp = array_from_pyobj(NPY_DOUBLE,gradient_Dims,gradient_Rank,capi_gradient_intent,gradient_capi);
+  if (capi_gradient_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 6th argument `gradient' of ext.ff_bond_hyper to C/Fortran array" );
+  } else {
+    gradient = (double *)(PyArray_DATA(capi_gradient_tmp));
+
+  /* Processing variable periodic */
+  periodic = (matrix_capi-Py_None);
+  /* Processing variable lengths */
+  lengths_Dims[0]=m;
+  capi_lengths_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_lengths_tmp = array_from_pyobj(NPY_DOUBLE,lengths_Dims,lengths_Rank,capi_lengths_intent,lengths_capi);
+  if (capi_lengths_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 3rd argument `lengths' of ext.ff_bond_hyper to C/Fortran array" );
+  } else {
+    lengths = (double *)(PyArray_DATA(capi_lengths_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  ff_bond_hyper_return_value = (*f2py_func)(m,n,periodic,cor,pairs,lengths,scale,amp,gradient,matrix,reciprocal);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("d",ff_bond_hyper_return_value);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_lengths_tmp!=lengths_capi) {
+    Py_XDECREF(capi_lengths_tmp); }
+  }  /*if (capi_lengths_tmp == NULL) ... else of lengths*/
+  /* End of cleaning variable lengths */
+  /* End of cleaning variable periodic */
+  if((PyObject *)capi_gradient_tmp!=gradient_capi) {
+    Py_XDECREF(capi_gradient_tmp); }
+  }  /*if (capi_gradient_tmp == NULL) ... else of gradient*/
+  /* End of cleaning variable gradient */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  } /*if (f2py_success) of amp*/
+  /* End of cleaning variable amp */
+  } /*if (f2py_success) of scale*/
+  /* End of cleaning variable scale */
+  }  /*if (f2py_success) of reciprocal init*/
+  if((PyObject *)capi_reciprocal_tmp!=reciprocal_capi) {
+    Py_XDECREF(capi_reciprocal_tmp); }
+  }  /*if (capi_reciprocal_tmp == NULL) ... else of reciprocal*/
+  /* End of cleaning variable reciprocal */
+  }  /*if (f2py_success) of matrix init*/
+  if((PyObject *)capi_matrix_tmp!=matrix_capi) {
+    Py_XDECREF(capi_matrix_tmp); }
+  }  /*if (capi_matrix_tmp == NULL) ... else of matrix*/
+  /* End of cleaning variable matrix */
+  if((PyObject *)capi_cor_tmp!=cor_capi) {
+    Py_XDECREF(capi_cor_tmp); }
+  }  /*if (capi_cor_tmp == NULL) ... else of cor*/
+  /* End of cleaning variable cor */
+  if((PyObject *)capi_pairs_tmp!=pairs_capi) {
+    Py_XDECREF(capi_pairs_tmp); }
+  }  /*if (capi_pairs_tmp == NULL) ... else of pairs*/
+  /* End of cleaning variable pairs */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/**************************** end of ff_bond_hyper ****************************/
+
+/********************************** ff_batch **********************************/
+static char doc_f2py_rout_ext_ff_batch[] = "\
+ff_batch(cor,active,atom_offsets,dm_offsets,dm0,dmk,dm,radii,bond_offsets,bond_pairs,bond_lengths,span_offsets,span_pairs,span_lengths,amps,gradient,energies)\n\nWrapper for ``ff_batch``.\
+\n\nParameters\n----------\n"
+"cor : input rank-2 array('d') with bounds (natom,3)\n"
+"active : input rank-1 array('i') with bounds (nproblem)\n"
+"atom_offsets : input rank-1 array('i') with bounds (nproblem + 1)\n"
+"dm_offsets : input rank-1 array('i') with bounds (nproblem + 1)\n"
+"dm0 : input rank-1 array('d') with bounds (ndm)\n"
+"dmk : input rank-1 array('d') with bounds (ndm)\n"
+"dm : input rank-1 array('i') with bounds (ndm)\n"
+"radii : input rank-1 array('d') with bounds (natom)\n"
+"bond_offsets : input rank-1 array('i') with bounds (nproblem + 1)\n"
+"bond_pairs : input rank-2 array('i') with bounds (nbond,2)\n"
+"bond_lengths : input rank-1 array('d') with bounds (*)\n"
+"span_offsets : input rank-1 array('i') with bounds (nproblem + 1)\n"
+"span_pairs : input rank-2 array('i') with bounds (nspan,2)\n"
+"span_lengths : input rank-1 array('d') with bounds (*)\n"
+"amps : input rank-1 array('d') with bounds (6)\n"
+"gradient : in/output rank-2 array('d') with bounds (natom,3)\n"
+"energies : in/output rank-1 array('d') with bounds (nproblem)";
+/* extern void ff_batch(int,int,int,int,int,double*,int*,int*,int*,double*,double*,int*,double*,int*,int*,double*,int*,int*,double*,double*,double*,double*); */
+static PyObject *f2py_rout_ext_ff_batch(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int,int,int,int,int,double*,int*,int*,int*,double*,double*,int*,double*,int*,int*,double*,int*,int*,double*,double*,double*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int nproblem = 0;
+  int natom = 0;
+  int ndm = 0;
+  int nbond = 0;
+  int nspan = 0;
+  double *cor = NULL;
+  npy_intp cor_Dims[2] = {-1, -1};
+  const int cor_Rank = 2;
+  PyArrayObject *capi_cor_tmp = NULL;
+  int capi_cor_intent = 0;
+  PyObject *cor_capi = Py_None;
+  int *active = NULL;
+  npy_intp active_Dims[1] = {-1};
+  const int active_Rank = 1;
+  PyArrayObject *capi_active_tmp = NULL;
+  int capi_active_intent = 0;
+  PyObject *active_capi = Py_None;
+  int *atom_offsets = NULL;
+  npy_intp atom_offsets_Dims[1] = {-1};
+  const int atom_offsets_Rank = 1;
+  PyArrayObject *capi_atom_offsets_tmp = NULL;
+  int capi_atom_offsets_intent = 0;
+  PyObject *atom_offsets_capi = Py_None;
+  int *dm_offsets = NULL;
+  npy_intp dm_offsets_Dims[1] = {-1};
+  const int dm_offsets_Rank = 1;
+  PyArrayObject *capi_dm_offsets_tmp = NULL;
+  int capi_dm_offsets_intent = 0;
+  PyObject *dm_offsets_capi = Py_None;
+  double *dm0 = NULL;
+  npy_intp dm0_Dims[1] = {-1};
+  const int dm0_Rank = 1;
+  PyArrayObject *capi_dm0_tmp = NULL;
+  int capi_dm0_intent = 0;
+  PyObject *dm0_capi = Py_None;
+  double *dmk = NULL;
+  npy_intp dmk_Dims[1] = {-1};
+  const int dmk_Rank = 1;
+  PyArrayObject *capi_dmk_tmp = NULL;
+  int capi_dmk_intent = 0;
+  PyObject *dmk_capi = Py_None;
+  int *dm = NULL;
+  npy_intp dm_Dims[1] = {-1};
+  const int dm_Rank = 1;
+  PyArrayObject *capi_dm_tmp = NULL;
+  int capi_dm_intent = 0;
+  PyObject *dm_capi = Py_None;
+  double *radii = NULL;
+  npy_intp radii_Dims[1] = {-1};
+  const int radii_Rank = 1;
+  PyArrayObject *capi_radii_tmp = NULL;
+  int capi_radii_intent = 0;
+  PyObject *radii_capi = Py_None;
+  int *bond_offsets = NULL;
+  npy_intp bond_offsets_Dims[1] = {-1};
+  const int bond_offsets_Rank = 1;
+  PyArrayObject *capi_bond_offsets_tmp = NULL;
+  int capi_bond_offsets_intent = 0;
+  PyObject *bond_offsets_capi = Py_None;
+  int *bond_pairs = NULL;
+  npy_intp bond_pairs_Dims[2] = {-1, -1};
+  const int bond_pairs_Rank = 2;
+  PyArrayObject *capi_bond_pairs_tmp = NULL;
+  int capi_bond_pairs_intent = 0;
+  PyObject *bond_pairs_capi = Py_None;
+  double *bond_lengths = NULL;
+  npy_intp bond_lengths_Dims[1] = {-1};
+  const int bond_lengths_Rank = 1;
+  PyArrayObject *capi_bond_lengths_tmp = NULL;
+  int capi_bond_lengths_intent = 0;
+  PyObject *bond_lengths_capi = Py_None;
+  int *span_offsets = NULL;
+  npy_intp span_offsets_Dims[1] = {-1};
+  const int span_offsets_Rank = 1;
+  PyArrayObject *capi_span_offsets_tmp = NULL;
+  int capi_span_offsets_intent = 0;
+  PyObject *span_offsets_capi = Py_None;
+  int *span_pairs = NULL;
+  npy_intp span_pairs_Dims[2] = {-1, -1};
+  const int span_pairs_Rank = 2;
+  PyArrayObject *capi_span_pairs_tmp = NULL;
+  int capi_span_pairs_intent = 0;
+  PyObject *span_pairs_capi = Py_None;
+  double *span_lengths = NULL;
+  npy_intp span_lengths_Dims[1] = {-1};
+  const int span_lengths_Rank = 1;
+  PyArrayObject *capi_span_lengths_tmp = NULL;
+  int capi_span_lengths_intent = 0;
+  PyObject *span_lengths_capi = Py_None;
+  double *amps = NULL;
+  npy_intp amps_Dims[1] = {-1};
+  const int amps_Rank = 1;
+  PyArrayObject *capi_amps_tmp = NULL;
+  int capi_amps_intent = 0;
+  PyObject *amps_capi = Py_None;
+  double *gradient = NULL;
+  npy_intp gradient_Dims[2] = {-1, -1};
+  const int gradient_Rank = 2;
+  PyArrayObject *capi_gradient_tmp = NULL;
+  int capi_gradient_intent = 0;
+  PyObject *gradient_capi = Py_None;
+  double *energies = NULL;
+  npy_intp energies_Dims[1] = {-1};
+  const int energies_Rank = 1;
+  PyArrayObject *capi_energies_tmp = NULL;
+  int capi_energies_intent = 0;
+  PyObject *energies_capi = Py_None;
+  static char *capi_kwlist[] = {"cor","active","atom_offsets","dm_offsets","dm0","dmk","dm","radii","bond_offsets","bond_pairs","bond_lengths","span_offsets","span_pairs","span_lengths","amps","gradient","energies",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOOOOOOOOOO:ext.ff_batch",\
+    capi_kwlist,&cor_capi,&active_capi,&atom_offsets_capi,&dm_offsets_capi,&dm0_capi,&dmk_capi,&dm_capi,&radii_capi,&bond_offsets_capi,&bond_pairs_capi,&bond_lengths_capi,&span_offsets_capi,&span_pairs_capi,&span_lengths_capi,&amps_capi,&gradient_capi,&energies_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable span_lengths */
+  ;
+  capi_span_lengths_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_span_lengths_tmp = array_from_pyobj(NPY_DOUBLE,span_lengths_Dims,span_lengths_Rank,capi_span_lengths_intent,span_lengths_capi);
+  if (capi_span_lengths_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 14th argument `span_lengths' of ext.ff_batch to C/Fortran array" );
+  } else {
+    span_lengths = (double *)(PyArray_DATA(capi_span_lengths_tmp));
+
+  /* Processing variable bond_lengths */
+  ;
+  capi_bond_lengths_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_bond_lengths_tmp = array_from_pyobj(NPY_DOUBLE,bond_lengths_Dims,bond_lengths_Rank,capi_bond_lengths_intent,bond_lengths_capi);
+  if (capi_bond_lengths_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 11st argument `bond_lengths' of ext.ff_batch to C/Fortran array" );
+  } else {
+    bond_lengths = (double *)(PyArray_DATA(capi_bond_lengths_tmp));
+
+  /* Processing variable bond_pairs */
+  bond_pairs_Dims[1]=2;
+  capi_bond_pairs_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_bond_pairs_tmp = array_from_pyobj(NPY_INT,bond_pairs_Dims,bond_pairs_Rank,capi_bond_pairs_intent,bond_pairs_capi);
+  if (capi_bond_pairs_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 10th argument `bond_pairs' of ext.ff_batch to C/Fortran array" );
+  } else {
+    bond_pairs = (int *)(PyArray_DATA(capi_bond_pairs_tmp));
+
+  /* Processing variable active */
+  ;
+  capi_active_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_active_tmp = array_from_pyobj(NPY_INT,active_Dims,active_Rank,capi_active_intent,active_capi);
+  if (capi_active_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd argument `active' of ext.ff_batch to C/Fortran array" );
+  } else {
+    active = (int *)(PyArray_DATA(capi_active_tmp));
+
+  /* Processing variable span_pairs */
+  span_pairs_Dims[1]=2;
+  capi_span_pairs_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_span_pairs_tmp = array_from_pyobj(NPY_INT,span_pairs_Dims,span_pairs_Rank,capi_span_pairs_intent,span_pairs_capi);
+  if (capi_span_pairs_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 13rd argument `span_pairs' of ext.ff_batch to C/Fortran array" );
+  } else {
+    span_pairs = (int *)(PyArray_DATA(capi_span_pairs_tmp));
+
+  /* Processing variable cor */
+  cor_Dims[1]=3;
+  capi_cor_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_cor_tmp = array_from_pyobj(NPY_DOUBLE,cor_Dims,cor_Rank,capi_cor_intent,cor_capi);
+  if (capi_cor_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `cor' of ext.ff_batch to C/Fortran array" );
+  } else {
+    cor = (double *)(PyArray_DATA(capi_cor_tmp));
+
+  /* Processing variable dm0 */
+  ;
+  capi_dm0_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_dm0_tmp = array_from_pyobj(NPY_DOUBLE,dm0_Dims,dm0_Rank,capi_dm0_intent,dm0_capi);
+  if (capi_dm0_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 5th argument `dm0' of ext.ff_batch to C/Fortran array" );
+  } else {
+    dm0 = (double *)(PyArray_DATA(capi_dm0_tmp));
+
+  /* Processing variable amps */
+  amps_Dims[0]=6;
+  capi_amps_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_amps_tmp = array_from_pyobj(NPY_DOUBLE,amps_Dims,amps_Rank,capi_amps_intent,amps_capi);
+  if (capi_amps_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 15th argument `amps' of ext.ff_batch to C/Fortran array" );
+  } else {
+    amps = (double *)(PyArray_DATA(capi_amps_tmp));
+
+  /* Processing variable nbond */
+  nbond = shape(bond_pairs,0);
+  /* Processing variable ndm */
+  ndm = len(dm0);
+  /* Processing variable nproblem */
+  nproblem = len(active);
+  /* Processing variable bond_offsets */
+  bond_offsets_Dims[0]=nproblem + 1;
+  capi_bond_offsets_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_bond_offsets_tmp = array_from_pyobj(NPY_INT,bond_offsets_Dims,bond_offsets_Rank,capi_bond_offsets_intent,bond_offsets_capi);
+  if (capi_bond_offsets_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 9th argument `bond_offsets' of ext.ff_batch to C/Fortran array" );
+  } else {
+    bond_offsets = (int *)(PyArray_DATA(capi_bond_offsets_tmp));
+
+  /* Processing variable energies */
+  energies_Dims[0]=nproblem;
+  capi_energies_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_energies_tmp = array_from_pyobj(NPY_DOUBLE,energies_Dims,energies_Rank,capi_energies_intent,energies_capi);
+  if (capi_energies_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 17th argument `energies' of ext.ff_batch to C/Fortran array" );
+  } else {
+    energies = (double *)(PyArray_DATA(capi_energies_tmp));
+
+  /* Processing variable natom */
+  natom = len(cor);
+  /* Processing variable atom_offsets */
+  atom_offsets_Dims[0]=nproblem + 1;
+  capi_atom_offsets_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_atom_offsets_tmp = array_from_pyobj(NPY_INT,atom_offsets_Dims,atom_offsets_Rank,capi_atom_offsets_intent,atom_offsets_capi);
+  if (capi_atom_offsets_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 3rd argument `atom_offsets' of ext.ff_batch to C/Fortran array" );
+  } else {
+    atom_offsets = (int *)(PyArray_DATA(capi_atom_offsets_tmp));
+
+  /* Processing variable nspan */
+  nspan = shape(span_pairs,0);
+  /* Processing variable span_offsets */
+  span_offsets_Dims[0]=nproblem + 1;
+  capi_span_offsets_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_span_offsets_tmp = array_from_pyobj(NPY_INT,span_offsets_Dims,span_offsets_Rank,capi_span_offsets_intent,span_offsets_capi);
+  if (capi_span_offsets_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 12nd argument `span_offsets' of ext.ff_batch to C/Fortran array" );
+  } else {
+    span_offsets = (int *)(PyArray_DATA(capi_span_offsets_tmp));
+
+  /* Processing variable dm */
+  dm_Dims[0]=ndm;
+  capi_dm_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_dm_tmp = array_from_pyobj(NPY_INT,dm_Dims,dm_Rank,capi_dm_intent,dm_capi);
+  if (capi_dm_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 7th argument `dm' of ext.ff_batch to C/Fortran array" );
+  } else {
+    dm = (int *)(PyArray_DATA(capi_dm_tmp));
+
+  /* Processing variable dmk */
+  dmk_Dims[0]=ndm;
+  capi_dmk_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_dmk_tmp = array_from_pyobj(NPY_DOUBLE,dmk_Dims,dmk_Rank,capi_dmk_intent,dmk_capi);
+  if (capi_dmk_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 6th argument `dmk' of ext.ff_batch to C/Fortran array" );
+  } else {
+    dmk = (double *)(PyArray_DATA(capi_dmk_tmp));
+
+  /* Processing variable radii */
+  radii_Dims[0]=natom;
+  capi_radii_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_radii_tmp = array_from_pyobj(NPY_DOUBLE,radii_Dims,radii_Rank,capi_radii_intent,radii_capi);
+  if (capi_radii_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 8th argument `radii' of ext.ff_batch to C/Fortran array" );
+  } else {
+    radii = (double *)(PyArray_DATA(capi_radii_tmp));
+
+  /* Processing variable dm_offsets */
+  dm_offsets_Dims[0]=nproblem + 1;
+  capi_dm_offsets_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_dm_offsets_tmp = array_from_pyobj(NPY_INT,dm_offsets_Dims,dm_offsets_Rank,capi_dm_offsets_intent,dm_offsets_capi);
+  if (capi_dm_offsets_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 4th argument `dm_offsets' of ext.ff_batch to C/Fortran array" );
+  } else {
+    dm_offsets = (int *)(PyArray_DATA(capi_dm_offsets_tmp));
+
+  /* Processing variable gradient */
+  gradient_Dims[0]=natom,gradient_Dims[1]=3;
+  capi_gradient_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_gradient_tmp = array_from_pyobj(NPY_DOUBLE,gradient_Dims,gradient_Rank,capi_gradient_intent,gradient_capi);
+  if (capi_gradient_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 16th argument `gradient' of ext.ff_batch to C/Fortran array" );
+  } else {
+    gradient = (double *)(PyArray_DATA(capi_gradient_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(nproblem,natom,ndm,nbond,nspan,cor,active,atom_offsets,dm_offsets,dm0,dmk,dm,radii,bond_offsets,bond_pairs,bond_lengths,span_offsets,span_pairs,span_lengths,amps,gradient,energies);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_gradient_tmp!=gradient_capi) {
+    Py_XDECREF(capi_gradient_tmp); }
+  }  /*if (capi_gradient_tmp == NULL) ... else of gradient*/
+  /* End of cleaning variable gradient */
+  if((PyObject *)capi_dm_offsets_tmp!=dm_offsets_capi) {
+    Py_XDECREF(capi_dm_offsets_tmp); }
+  }  /*if (capi_dm_offsets_tmp == NULL) ... else of dm_offsets*/
+  /* End of cleaning variable dm_offsets */
+  if((PyObject *)capi_radii_tmp!=radii_capi) {
+    Py_XDECREF(capi_radii_tmp); }
+  }  /*if (capi_radii_tmp == NULL) ... else of radii*/
+  /* End of cleaning variable radii */
+  if((PyObject *)capi_dmk_tmp!=dmk_capi) {
+    Py_XDECREF(capi_dmk_tmp); }
+  }  /*if (capi_dmk_tmp == NULL) ... else of dmk*/
+  /* End of cleaning variable dmk */
+  if((PyObject *)capi_dm_tmp!=dm_capi) {
+    Py_XDECREF(capi_dm_tmp); }
+  }  /*if (capi_dm_tmp == NULL) ... else of dm*/
+  /* End of cleaning variable dm */
+  if((PyObject *)capi_span_offsets_tmp!=span_offsets_capi) {
+    Py_XDECREF(capi_span_offsets_tmp); }
+  }  /*if (capi_span_offsets_tmp == NULL) ... else of span_offsets*/
+  /* End of cleaning variable span_offsets */
+  /* End of cleaning variable nspan */
+  if((PyObject *)capi_atom_offsets_tmp!=atom_offsets_capi) {
+    Py_XDECREF(capi_atom_offsets_tmp); }
+  }  /*if (capi_atom_offsets_tmp == NULL) ... else of atom_offsets*/
+  /* End of cleaning variable atom_offsets */
+  /* End of cleaning variable natom */
+  if((PyObject *)capi_energies_tmp!=energies_capi) {
+    Py_XDECREF(capi_energies_tmp); }
+  }  /*if (capi_energies_tmp == NULL) ... else of energies*/
+  /* End of cleaning variable energies */
+  if((PyObject *)capi_bond_offsets_tmp!=bond_offsets_capi) {
+    Py_XDECREF(capi_bond_offsets_tmp); }
+  }  /*if (capi_bond_offsets_tmp == NULL) ... else of bond_offsets*/
+  /* End of cleaning variable bond_offsets */
+  /* End of cleaning variable nproblem */
+  /* End of cleaning variable ndm */
+  /* End of cleaning variable nbond */
+  if((PyObject *)capi_amps_tmp!=amps_capi) {
+    Py_XDECREF(capi_amps_tmp); }
+  }  /*if (capi_amps_tmp == NULL) ... else of amps*/
+  /* End of cleaning variable amps */
+  if((PyObject *)capi_dm0_tmp!=dm0_capi) {
+    Py_XDECREF(capi_dm0_tmp); }
+  }  /*if (capi_dm0_tmp == NULL) ... else of dm0*/
+  /* End of cleaning variable dm0 */
+  if((PyObject *)capi_cor_tmp!=cor_capi) {
+    Py_XDECREF(capi_cor_tmp); }
+  }  /*if (capi_cor_tmp == NULL) ... else of cor*/
+  /* End of cleaning variable cor */
+  if((PyObject *)capi_span_pairs_tmp!=span_pairs_capi) {
+    Py_XDECREF(capi_span_pairs_tmp); }
+  }  /*if (capi_span_pairs_tmp == NULL) ... else of span_pairs*/
+  /* End of cleaning variable span_pairs */
+  if((PyObject *)capi_active_tmp!=active_capi) {
+    Py_XDECREF(capi_active_tmp); }
+  }  /*if (capi_active_tmp == NULL) ... else of active*/
+  /* End of cleaning variable active */
+  if((PyObject *)capi_bond_pairs_tmp!=bond_pairs_capi) {
+    Py_XDECREF(capi_bond_pairs_tmp); }
+  }  /*if (capi_bond_pairs_tmp == NULL) ... else of bond_pairs*/
+  /* End of cleaning variable bond_pairs */
+  if((PyObject *)capi_bond_lengths_tmp!=bond_lengths_capi) {
+    Py_XDECREF(capi_bond_lengths_tmp); }
+  }  /*if (capi_bond_lengths_tmp == NULL) ... else of bond_lengths*/
+  /* End of cleaning variable bond_lengths */
+  if((PyObject *)capi_span_lengths_tmp!=span_lengths_capi) {
+    Py_XDECREF(capi_span_lengths_tmp); }
+  }  /*if (capi_span_lengths_tmp == NULL) ... else of span_lengths*/
+  /* End of cleaning variable span_lengths */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/****************************** end of ff_batch ******************************/
+
+/********************************* ewald_erfc *********************************/
+static char doc_f2py_rout_ext_ewald_erfc[] = "\
+y = ewald_erfc(x)\n\nWrapper for ``ewald_erfc``.\
+\n\nParameters\n----------\n"
+"x : input rank-1 array('d') with bounds (n)\n"
+"\nReturns\n-------\n"
+"y : rank-1 array('d') with bounds (n)";
+/* extern void ewald_erfc(int,double*,double*); */
+static PyObject *f2py_rout_ext_ewald_erfc(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int,double*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *x = NULL;
+  npy_intp x_Dims[1] = {-1};
+  const int x_Rank = 1;
+  PyArrayObject *capi_x_tmp = NULL;
+  int capi_x_intent = 0;
+  PyObject *x_capi = Py_None;
+  double *y = NULL;
+  npy_intp y_Dims[1] = {-1};
+  const int y_Rank = 1;
+  PyArrayObject *capi_y_tmp = NULL;
+  int capi_y_intent = 0;
+  static char *capi_kwlist[] = {"x",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O:ext.ewald_erfc",\
+    capi_kwlist,&x_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable x */
+  ;
+  capi_x_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_x_tmp = array_from_pyobj(NPY_DOUBLE,x_Dims,x_Rank,capi_x_intent,x_capi);
+  if (capi_x_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `x' of ext.ewald_erfc to C/Fortran array" );
+  } else {
+    x = (double *)(PyArray_DATA(capi_x_tmp));
+
+  /* Processing variable n */
+  n = len(x);
+  /* Processing variable y */
+  y_Dims[0]=n;
+  capi_y_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT|F2PY_INTENT_C;
+  capi_y_tmp = array_from_pyobj(NPY_DOUBLE,y_Dims,y_Rank,capi_y_intent,Py_None);
+  if (capi_y_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting hidden `y' of ext.ewald_erfc to C/Fortran array" );
+  } else {
+    y = (double *)(PyArray_DATA(capi_y_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(n,x,y);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_y_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_y_tmp == NULL) ... else of y*/
+  /* End of cleaning variable y */
+  /* End of cleaning variable n */
+  if((PyObject *)capi_x_tmp!=x_capi) {
+    Py_XDECREF(capi_x_tmp); }
+  }  /*if (capi_x_tmp == NULL) ... else of x*/
+  /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of ewald_erfc *****************************/
+
+/***************************** clusters_add_pairs *****************************/
+static char doc_f2py_rout_ext_clusters_add_pairs[] = "\
+clusters_add_pairs = clusters_add_pairs(parent,rank_bn,pairs)\n\nWrapper for ``clusters_add_pairs``.\
+\n\nParameters\n----------\n"
+"parent : in/output rank-1 array('i') with bounds (n)\n"
+"rank_bn : in/output rank-1 array('i') with bounds (n)\n"
+"pairs : input rank-2 array('i') with bounds (npair,2)\n"
+"\nReturns\n-------\n"
+"clusters_add_pairs : int";
+/* extern int clusters_add_pairs(int,int*,int*,int,int*); */
+static PyObject *f2py_rout_ext_clusters_add_pairs(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           int (*f2py_func)(int,int*,int*,int,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int clusters_add_pairs_return_value=0;
+  int n = 0;
+  int *parent = NULL;
+  npy_intp parent_Dims[1] = {-1};
+  const int parent_Rank = 1;
+  PyArrayObject *capi_parent_tmp = NULL;
+  int capi_parent_intent = 0;
+  PyObject *parent_capi = Py_None;
+  int *rank_bn = NULL;
+  npy_intp rank_bn_Dims[1] = {-1};
+  const int rank_bn_Rank = 1;
+  PyArrayObject *capi_rank_bn_tmp = NULL;
+  int capi_rank_bn_intent = 0;
+  PyObject *rank_bn_capi = Py_None;
+  int npair = 0;
+  int *pairs = NULL;
+  npy_intp pairs_Dims[2] = {-1, -1};
+  const int pairs_Rank = 2;
+  PyArrayObject *capi_pairs_tmp = NULL;
+  int capi_pairs_intent = 0;
+  PyObject *pairs_capi = Py_None;
+  static char *capi_kwlist[] = {"parent","rank_bn","pairs",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO:ext.clusters_add_pairs",\
+    capi_kwlist,&parent_capi,&rank_bn_capi,&pairs_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable pairs */
+  pairs_Dims[1]=2;
+  capi_pairs_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_pairs_tmp = array_from_pyobj(NPY_INT,pairs_Dims,pairs_Rank,capi_pairs_intent,pairs_capi);
+  if (capi_pairs_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 3rd argument `pairs' of ext.clusters_add_pairs to C/Fortran array" );
+  } else {
+    pairs = (int *)(PyArray_DATA(capi_pairs_tmp));
+
+  /* Processing variable parent */
+  ;
+  capi_parent_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_parent_tmp = array_from_pyobj(NPY_INT,parent_Dims,parent_Rank,capi_parent_intent,parent_capi);
+  if (capi_parent_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `parent' of ext.clusters_add_pairs to C/Fortran array" );
+  } else {
+    parent = (int *)(PyArray_DATA(capi_parent_tmp));
+
+  /* Processing variable npair */
+  npair = shape(pairs,0);
+  /* Processing variable n */
+  n = len(parent);
+  /* Processing variable rank_bn */
+  rank_bn_Dims[0]=n;
+  capi_rank_bn_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_rank_bn_tmp = array_from_pyobj(NPY_INT,rank_bn_Dims,rank_bn_Rank,capi_rank_bn_intent,rank_bn_capi);
+  if (capi_rank_bn_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd argument `rank_bn' of ext.clusters_add_pairs to C/Fortran array" );
+  } else {
+    rank_bn = (int *)(PyArray_DATA(capi_rank_bn_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  clusters_add_pairs_return_value = (*f2py_func)(n,parent,rank_bn,npair,pairs);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("i",clusters_add_pairs_return_value);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_rank_bn_tmp!=rank_bn_capi) {
+    Py_XDECREF(capi_rank_bn_tmp); }
+  }  /*if (capi_rank_bn_tmp == NULL) ... else of rank_bn*/
+  /* End of cleaning variable rank_bn */
+  /* End of cleaning variable n */
+  /* End of cleaning variable npair */
+  if((PyObject *)capi_parent_tmp!=parent_capi) {
+    Py_XDECREF(capi_parent_tmp); }
+  }  /*if (capi_parent_tmp == NULL) ... else of parent*/
+  /* End of cleaning variable parent */
+  if((PyObject *)capi_pairs_tmp!=pairs_capi) {
+    Py_XDECREF(capi_pairs_tmp); }
+  }  /*if (capi_pairs_tmp == NULL) ... else of pairs*/
+  /* End of cleaning variable pairs */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/************************* end of clusters_add_pairs *************************/
+
+/**************************** clusters_get_labels ****************************/
+static char doc_f2py_rout_ext_clusters_get_labels[] = "\
+clusters_get_labels = clusters_get_labels(parent,labels)\n\nWrapper for ``clusters_get_labels``.\
+\n\nParameters\n----------\n"
+"parent : in/output rank-1 array('i') with bounds (n)\n"
+"labels : in/output rank-1 array('i') with bounds (n)\n"
+"\nReturns\n-------\n"
+"clusters_get_labels : int";
+/* extern int clusters_get_labels(int,int*,int*); */
+static PyObject *f2py_rout_ext_clusters_get_labels(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           int (*f2py_func)(int,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int clusters_get_labels_return_value=0;
+  int n = 0;
+  int *parent = NULL;
+  npy_intp parent_Dims[1] = {-1};
+  const int parent_Rank = 1;
+  PyArrayObject *capi_parent_tmp = NULL;
+  int capi_parent_intent = 0;
+  PyObject *parent_capi = Py_None;
+  int *labels = NULL;
+  npy_intp labels_Dims[1] = {-1};
+  const int labels_Rank = 1;
+  PyArrayObject *capi_labels_tmp = NULL;
+  int capi_labels_intent = 0;
+  PyObject *labels_capi = Py_None;
+  static char *capi_kwlist[] = {"parent","labels",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OO:ext.clusters_get_labels",\
+    capi_kwlist,&parent_capi,&labels_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable parent */
+  ;
+  capi_parent_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_parent_tmp = array_from_pyobj(NPY_INT,parent_Dims,parent_Rank,capi_parent_intent,parent_capi);
+  if (capi_parent_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `parent' of ext.clusters_get_labels to C/Fortran array" );
+  } else {
+    parent = (int *)(PyArray_DATA(capi_parent_tmp));
+
+  /* Processing variable n */
+  n = len(parent);
+  /* Processing variable labels */
+  labels_Dims[0]=n;
+  capi_labels_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_labels_tmp = array_from_pyobj(NPY_INT,labels_Dims,labels_Rank,capi_labels_intent,labels_capi);
+  if (capi_labels_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd argument `labels' of ext.clusters_get_labels to C/Fortran array" );
+  } else {
+    labels = (int *)(PyArray_DATA(capi_labels_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  clusters_get_labels_return_value = (*f2py_func)(n,parent,labels);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("i",clusters_get_labels_return_value);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_labels_tmp!=labels_capi) {
+    Py_XDECREF(capi_labels_tmp); }
+  }  /*if (capi_labels_tmp == NULL) ... else of labels*/
+  /* End of cleaning variable labels */
+  /* End of cleaning variable n */
+  if((PyObject *)capi_parent_tmp!=parent_capi) {
+    Py_XDECREF(capi_parent_tmp); }
+  }  /*if (capi_parent_tmp == NULL) ... else of parent*/
+  /* End of cleaning variable parent */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/************************* end of clusters_get_labels *************************/
+
+/*************************** graphs_floyd_warshall ***************************/
+static char doc_f2py_rout_ext_graphs_floyd_warshall[] = "\
+graphs_floyd_warshall(dm)\n\nWrapper for ``graphs_floyd_warshall``.\
+\n\nParameters\n----------\n"
+"dm : in/output rank-2 array('i') with bounds (n,n)";
+/* extern void graphs_floyd_warshall(int,int*); */
+static PyObject *f2py_rout_ext_graphs_floyd_warshall(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int *dm = NULL;
+  npy_intp dm_Dims[2] = {-1, -1};
+  const int dm_Rank = 2;
+  PyArrayObject *capi_dm_tmp = NULL;
+  int capi_dm_intent = 0;
+  PyObject *dm_capi = Py_None;
+  static char *capi_kwlist[] = {"dm",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O:ext.graphs_floyd_warshall",\
+    capi_kwlist,&dm_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable dm */
+  ;
+  capi_dm_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_dm_tmp = array_from_pyobj(NPY_INT,dm_Dims,dm_Rank,capi_dm_intent,dm_capi);
+  if (capi_dm_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `dm' of ext.graphs_floyd_warshall to C/Fortran array" );
+  } else {
+    dm = (int *)(PyArray_DATA(capi_dm_tmp));
+
+  /* Processing variable n */
+  n = len(dm);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(n,dm);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable n */
+  if((PyObject *)capi_dm_tmp!=dm_capi) {
+    Py_XDECREF(capi_dm_tmp); }
+  }  /*if (capi_dm_tmp == NULL) ... else of dm*/
+  /* End of cleaning variable dm */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/************************ end of graphs_floyd_warshall ************************/
+
+/****************************** graphs_bfs_dense ******************************/
+static char doc_f2py_rout_ext_graphs_bfs_dense[] = "\
+graphs_bfs_dense = graphs_bfs_dense(indptr,indices,dm)\n\nWrapper for ``graphs_bfs_dense``.\
+\n\nParameters\n----------\n"
+"indptr : input rank-1 array('i') with bounds (nindptr)\n"
+"indices : input rank-1 array('i') with bounds (nindices)\n"
+"dm : in/output rank-2 array('i') with bounds (n,n)\n"
+"\nReturns\n-------\n"
+"graphs_bfs_dense : int";
+/* extern int graphs_bfs_dense(int,int,int*,int,int*,int*); */
+static PyObject *f2py_rout_ext_graphs_bfs_dense(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           int (*f2py_func)(int,int,int*,int,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int graphs_bfs_dense_return_value=0;
+  int n = 0;
+  int nindptr = 0;
+  int *indptr = NULL;
+  npy_intp indptr_Dims[1] = {-1};
+  const int indptr_Rank = 1;
+  PyArrayObject *capi_indptr_tmp = NULL;
+  int capi_indptr_intent = 0;
+  PyObject *indptr_capi = Py_None;
+  int nindices = 0;
+  int *indices = NULL;
+  npy_intp indices_Dims[1] = {-1};
+  const int indices_Rank = 1;
+  PyArrayObject *capi_indices_tmp = NULL;
+  int capi_indices_intent = 0;
+  PyObject *indices_capi = Py_None;
+  int *dm = NULL;
+  npy_intp dm_Dims[2] = {-1, -1};
+  const int dm_Rank = 2;
+  PyArrayObject *capi_dm_tmp = NULL;
+  int capi_dm_intent = 0;
+  PyObject *dm_capi = Py_None;
+  static char *capi_kwlist[] = {"indptr","indices","dm",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOO:ext.graphs_bfs_dense",\
+    capi_kwlist,&indptr_capi,&indices_capi,&dm_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable indptr */
+  ;
+  capi_indptr_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_indptr_tmp = array_from_pyobj(NPY_INT,indptr_Dims,indptr_Rank,capi_indptr_intent,indptr_capi);
+  if (capi_indptr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `indptr' of ext.graphs_bfs_dense to C/Fortran array" );
+  } else {
+    indptr = (int *)(PyArray_DATA(capi_indptr_tmp));
+
+  /* Processing variable dm */
+  ;
+  capi_dm_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_dm_tmp = array_from_pyobj(NPY_INT,dm_Dims,dm_Rank,capi_dm_intent,dm_capi);
+  if (capi_dm_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 3rd argument `dm' of ext.graphs_bfs_dense to C/Fortran array" );
+  } else {
+    dm = (int *)(PyArray_DATA(capi_dm_tmp));
+
+  /* Processing variable indices */
+  ;
+  capi_indices_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_indices_tmp = array_from_pyobj(NPY_INT,indices_Dims,indices_Rank,capi_indices_intent,indices_capi);
+  if (capi_indices_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd argument `indices' of ext.graphs_bfs_dense to C/Fortran array" );
+  } else {
+    indices = (int *)(PyArray_DATA(capi_indices_tmp));
+
+  /* Processing variable nindptr */
+  nindptr = len(indptr);
+  /* Processing variable nindices */
+  nindices = len(indices);
+  /* Processing variable n */
+  n = len(dm);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  graphs_bfs_dense_return_value = (*f2py_func)(n,nindptr,indptr,nindices,indices,dm);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("i",graphs_bfs_dense_return_value);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable n */
+  /* End of cleaning variable nindices */
+  /* End of cleaning variable nindptr */
+  if((PyObject *)capi_indices_tmp!=indices_capi) {
+    Py_XDECREF(capi_indices_tmp); }
+  }  /*if (capi_indices_tmp == NULL) ... else of indices*/
+  /* End of cleaning variable indices */
+  if((PyObject *)capi_dm_tmp!=dm_capi) {
+    Py_XDECREF(capi_dm_tmp); }
+  }  /*if (capi_dm_tmp == NULL) ... else of dm*/
+  /* End of cleaning variable dm */
+  if((PyObject *)capi_indptr_tmp!=indptr_capi) {
+    Py_XDECREF(capi_indptr_tmp); }
+  }  /*if (capi_indptr_tmp == NULL) ... else of indptr*/
+  /* End of cleaning variable indptr */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/************************** end of graphs_bfs_dense **************************/
+
+/***************************** graphs_bfs_sparse *****************************/
+static char doc_f2py_rout_ext_graphs_bfs_sparse[] = "\
+graphs_bfs_sparse = graphs_bfs_sparse(indptr,indices,max_depth,rowptr,columns,distances)\n\nWrapper for ``graphs_bfs_sparse``.\
+\n\nParameters\n----------\n"
+"indptr : input rank-1 array('i') with bounds (nindptr)\n"
+"indices : input rank-1 array('i') with bounds (nindices)\n"
+"max_depth : input int\n"
+"rowptr : in/output rank-1 array('i') with bounds (n + 1)\n"
+"columns : in/output rank-1 array('i') with bounds (m)\n"
+"distances : in/output rank-1 array('i') with bounds (m)\n"
+"\nReturns\n-------\n"
+"graphs_bfs_sparse : int";
+/* extern int graphs_bfs_sparse(int,int,int*,int,int*,int,int*,int,int*,int*); */
+static PyObject *f2py_rout_ext_graphs_bfs_sparse(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           int (*f2py_func)(int,int,int*,int,int*,int,int*,int,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int graphs_bfs_sparse_return_value=0;
+  int n = 0;
+  int nindptr = 0;
+  int *indptr = NULL;
+  npy_intp indptr_Dims[1] = {-1};
+  const int indptr_Rank = 1;
+  PyArrayObject *capi_indptr_tmp = NULL;
+  int capi_indptr_intent = 0;
+  PyObject *indptr_capi = Py_None;
+  int nindices = 0;
+  int *indices = NULL;
+  npy_intp indices_Dims[1] = {-1};
+  const int indices_Rank = 1;
+  PyArrayObject *capi_indices_tmp = NULL;
+  int capi_indices_intent = 0;
+  PyObject *indices_capi = Py_None;
+  int max_depth = 0;
+  PyObject *max_depth_capi = Py_None;
+  int *rowptr = NULL;
+  npy_intp rowptr_Dims[1] = {-1};
+  const int rowptr_Rank = 1;
+  PyArrayObject *capi_rowptr_tmp = NULL;
+  int capi_rowptr_intent = 0;
+  PyObject *rowptr_capi = Py_None;
+  int m = 0;
+  int *columns = NULL;
+  npy_intp columns_Dims[1] = {-1};
+  const int columns_Rank = 1;
+  PyArrayObject *capi_columns_tmp = NULL;
+  int capi_columns_intent = 0;
+  PyObject *columns_capi = Py_None;
+  int *distances = NULL;
+  npy_intp distances_Dims[1] = {-1};
+  const int distances_Rank = 1;
+  PyArrayObject *capi_distances_tmp = NULL;
+  int capi_distances_intent = 0;
+  PyObject *distances_capi = Py_None;
+  static char *capi_kwlist[] = {"indptr","indices","max_depth","rowptr","columns","distances",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOO:ext.graphs_bfs_sparse",\
+    capi_kwlist,&indptr_capi,&indices_capi,&max_depth_capi,&rowptr_capi,&columns_capi,&distances_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable indptr */
+  ;
+  capi_indptr_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_indptr_tmp = array_from_pyobj(NPY_INT,indptr_Dims,indptr_Rank,capi_indptr_intent,indptr_capi);
+  if (capi_indptr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `indptr' of ext.graphs_bfs_sparse to C/Fortran array" );
+  } else {
+    indptr = (int *)(PyArray_DATA(capi_indptr_tmp));
+
+  /* Processing variable indices */
+  ;
+  capi_indices_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_indices_tmp = array_from_pyobj(NPY_INT,indices_Dims,indices_Rank,capi_indices_intent,indices_capi);
+  if (capi_indices_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd argument `indices' of ext.graphs_bfs_sparse to C/Fortran array" );
+  } else {
+    indices = (int *)(PyArray_DATA(capi_indices_tmp));
+
+  /* Processing variable rowptr */
+  ;
+  capi_rowptr_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_rowptr_tmp = array_from_pyobj(NPY_INT,rowptr_Dims,rowptr_Rank,capi_rowptr_intent,rowptr_capi);
+  if (capi_rowptr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 4th argument `rowptr' of ext.graphs_bfs_sparse to C/Fortran array" );
+  } else {
+    rowptr = (int *)(PyArray_DATA(capi_rowptr_tmp));
+
+  /* Processing variable max_depth */
+    f2py_success = int_from_pyobj(&max_depth,max_depth_capi,"ext.graphs_bfs_sparse() 3rd argument (max_depth) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable columns */
+  ;
+  capi_columns_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_columns_tmp = array_from_pyobj(NPY_INT,columns_Dims,columns_Rank,capi_columns_intent,columns_capi);
+  if (capi_columns_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 5th argument `columns' of ext.graphs_bfs_sparse to C/Fortran array" );
+  } else {
+    columns = (int *)(PyArray_DATA(capi_columns_tmp));
+
+  /* Processing variable nindptr */
+  nindptr = len(indptr);
+  /* Processing variable nindices */
+  nindices = len(indices);
+  /* Processing variable m */
+  m = len(columns);
+  /* Processing variable n */
+  n = len(rowptr)-1;
+  /* Processing variable distances */
+  distances_Dims[0]=m;
+  capi_distances_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_distances_tmp = array_from_pyobj(NPY_INT,distances_Dims,distances_Rank,capi_distances_intent,distances_capi);
+  if (capi_distances_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 6th argument `distances' of ext.graphs_bfs_sparse to C/Fortran array" );
+  } else {
+    distances = (int *)(PyArray_DATA(capi_distances_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  graphs_bfs_sparse_return_value = (*f2py_func)(n,nindptr,indptr,nindices,indices,max_depth,rowptr,m,columns,distances);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("i",graphs_bfs_sparse_return_value);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_distances_tmp!=distances_capi) {
+    Py_XDECREF(capi_distances_tmp); }
+  }  /*if (capi_distances_tmp == NULL) ... else of distances*/
+  /* End of cleaning variable distances */
+  /* End of cleaning variable n */
+  /* End of cleaning variable m */
+  /* End of cleaning variable nindices */
+  /* End of cleaning variable nindptr */
+  if((PyObject *)capi_columns_tmp!=columns_capi) {
+    Py_XDECREF(capi_columns_tmp); }
+  }  /*if (capi_columns_tmp == NULL) ... else of columns*/
+  /* End of cleaning variable columns */
+  } /*if (f2py_success) of max_depth*/
+  /* End of cleaning variable max_depth */
+  if((PyObject *)capi_rowptr_tmp!=rowptr_capi) {
+    Py_XDECREF(capi_rowptr_tmp); }
+  }  /*if (capi_rowptr_tmp == NULL) ... else of rowptr*/
+  /* End of cleaning variable rowptr */
+  if((PyObject *)capi_indices_tmp!=indices_capi) {
+    Py_XDECREF(capi_indices_tmp); }
+  }  /*if (capi_indices_tmp == NULL) ... else of indices*/
+  /* End of cleaning variable indices */
+  if((PyObject *)capi_indptr_tmp!=indptr_capi) {
+    Py_XDECREF(capi_indptr_tmp); }
+  }  /*if (capi_indptr_tmp == NULL) ... else of indptr*/
+  /* End of cleaning variable indptr */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/************************** end of graphs_bfs_sparse **************************/
+
+/********************************* graphs_bfs *********************************/
+static char doc_f2py_rout_ext_graphs_bfs[] = "\
+graphs_bfs = graphs_bfs(indptr,indices,source,max_depth,queue,depth)\n\nWrapper for ``graphs_bfs``.\
+\n\nParameters\n----------\n"
+"indptr : input rank-1 array('i') with bounds (nindptr)\n"
+"indices : input rank-1 array('i') with bounds (nindices)\n"
+"source : input int\n"
+"max_depth : input int\n"
+"queue : in/output rank-1 array('i') with bounds (n)\n"
+"depth : in/output rank-1 array('i') with bounds (n)\n"
+"\nReturns\n-------\n"
+"graphs_bfs : int";
+/* extern int graphs_bfs(int,int,int*,int,int*,int,int,int*,int*); */
+static PyObject *f2py_rout_ext_graphs_bfs(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           int (*f2py_func)(int,int,int*,int,int*,int,int,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int graphs_bfs_return_value=0;
+  int n = 0;
+  int nindptr = 0;
+  int *indptr = NULL;
+  npy_intp indptr_Dims[1] = {-1};
+  const int indptr_Rank = 1;
+  PyArrayObject *capi_indptr_tmp = NULL;
+  int capi_indptr_intent = 0;
+  PyObject *indptr_capi = Py_None;
+  int nindices = 0;
+  int *indices = NULL;
+  npy_intp indices_Dims[1] = {-1};
+  const int indices_Rank = 1;
+  PyArrayObject *capi_indices_tmp = NULL;
+  int capi_indices_intent = 0;
+  PyObject *indices_capi = Py_None;
+  int source = 0;
+  PyObject *source_capi = Py_None;
+  int max_depth = 0;
+  PyObject *max_depth_capi = Py_None;
+  int *queue = NULL;
+  npy_intp queue_Dims[1] = {-1};
+  const int queue_Rank = 1;
+  PyArrayObject *capi_queue_tmp = NULL;
+  int capi_queue_intent = 0;
+  PyObject *queue_capi = Py_None;
+  int *depth = NULL;
+  npy_intp depth_Dims[1] = {-1};
+  const int depth_Rank = 1;
+  PyArrayObject *capi_depth_tmp = NULL;
+  int capi_depth_intent = 0;
+  PyObject *depth_capi = Py_None;
+  static char *capi_kwlist[] = {"indptr","indices","source","max_depth","queue","depth",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOO:ext.graphs_bfs",\
+    capi_kwlist,&indptr_capi,&indices_capi,&source_capi,&max_depth_capi,&queue_capi,&depth_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable indptr */
+  ;
+  capi_indptr_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_indptr_tmp = array_from_pyobj(NPY_INT,indptr_Dims,indptr_Rank,capi_indptr_intent,indptr_capi);
+  if (capi_indptr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `indptr' of ext.graphs_bfs to C/Fortran array" );
+  } else {
+    indptr = (int *)(PyArray_DATA(capi_indptr_tmp));
+
+  /* Processing variable source */
+    f2py_success = int_from_pyobj(&source,source_capi,"ext.graphs_bfs() 3rd argument (source) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable depth */
+  ;
+  capi_depth_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_depth_tmp = array_from_pyobj(NPY_INT,depth_Dims,depth_Rank,capi_depth_intent,depth_capi);
+  if (capi_depth_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 6th argument `depth' of ext.graphs_bfs to C/Fortran array" );
+  } else {
+    depth = (int *)(PyArray_DATA(capi_depth_tmp));
+
+  /* Processing variable indices */
+  ;
+  capi_indices_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_indices_tmp = array_from_pyobj(NPY_INT,indices_Dims,indices_Rank,capi_indices_intent,indices_capi);
+  if (capi_indices_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd argument `indices' of ext.graphs_bfs to C/Fortran array" );
+  } else {
+    indices = (int *)(PyArray_DATA(capi_indices_tmp));
+
+  /* Processing variable max_depth */
+    f2py_success = int_from_pyobj(&max_depth,max_depth_capi,"ext.graphs_bfs() 4th argument (max_depth) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable nindptr */
+  nindptr = len(indptr);
+  /* Processing variable nindices */
+  nindices = len(indices);
+  /* Processing variable n */
+  n = len(depth);
+  /* Processing variable queue */
+  queue_Dims[0]=n;
+  capi_queue_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_queue_tmp = array_from_pyobj(NPY_INT,queue_Dims,queue_Rank,capi_queue_intent,queue_capi);
+  if (capi_queue_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 5th argument `queue' of ext.graphs_bfs to C/Fortran array" );
+  } else {
+    queue = (int *)(PyArray_DATA(capi_queue_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  graphs_bfs_return_value = (*f2py_func)(n,nindptr,indptr,nindices,indices,source,max_depth,queue,depth);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("i",graphs_bfs_return_value);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_queue_tmp!=queue_capi) {
+    Py_XDECREF(capi_queue_tmp); }
+  }  /*if (capi_queue_tmp == NULL) ... else of queue*/
+  /* End of cleaning variable queue */
+  /* End of cleaning variable n */
+  /* End of cleaning variable nindices */
+  /* End of cleaning variable nindptr */
+  } /*if (f2py_success) of max_depth*/
+  /* End of cleaning variable max_depth */
+  if((PyObject *)capi_indices_tmp!=indices_capi) {
+    Py_XDECREF(capi_indices_tmp); }
+  }  /*if (capi_indices_tmp == NULL) ... else of indices*/
+  /* End of cleaning variable indices */
+  if((PyObject *)capi_depth_tmp!=depth_capi) {
+    Py_XDECREF(capi_depth_tmp); }
+  }  /*if (capi_depth_tmp == NULL) ... else of depth*/
+  /* End of cleaning variable depth */
+  } /*if (f2py_success) of source*/
+  /* End of cleaning variable source */
+  if((PyObject *)capi_indptr_tmp!=indptr_capi) {
+    Py_XDECREF(capi_indptr_tmp); }
+  }  /*if (capi_indptr_tmp == NULL) ... else of indptr*/
+  /* End of cleaning variable indptr */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/***************************** end of graphs_bfs *****************************/
+
+/****************************** graphs_bfs_count ******************************/
+static char doc_f2py_rout_ext_graphs_bfs_count[] = "\
+graphs_bfs_count = graphs_bfs_count(indptr,indices,source,max_depth,limit,queue,depth,counts)\n\nWrapper for ``graphs_bfs_count``.\
+\n\nParameters\n----------\n"
+"indptr : input rank-1 array('i') with bounds (nindptr)\n"
+"indices : input rank-1 array('i') with bounds (nindices)\n"
+"source : input int\n"
+"max_depth : input int\n"
+"limit : input int\n"
+"queue : in/output rank-1 array('i') with bounds (n)\n"
+"depth : in/output rank-1 array('i') with bounds (n)\n"
+"counts : in/output rank-1 array('i') with bounds (n)\n"
+"\nReturns\n-------\n"
+"graphs_bfs_count : int";
+/* extern int graphs_bfs_count(int,int,int*,int,int*,int,int,int,int*,int*,int*); */
+static PyObject *f2py_rout_ext_graphs_bfs_count(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           int (*f2py_func)(int,int,int*,int,int*,int,int,int,int*,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int graphs_bfs_count_return_value=0;
+  int n = 0;
+  int nindptr = 0;
+  int *indptr = NULL;
+  npy_intp indptr_Dims[1] = {-1};
+  const int indptr_Rank = 1;
+  PyArrayObject *capi_indptr_tmp = NULL;
+  int capi_indptr_intent = 0;
+  PyObject *indptr_capi = Py_None;
+  int nindices = 0;
+  int *indices = NULL;
+  npy_intp indices_Dims[1] = {-1};
+  const int indices_Rank = 1;
+  PyArrayObject *capi_indices_tmp = NULL;
+  int capi_indices_intent = 0;
+  PyObject *indices_capi = Py_None;
+  int source = 0;
+  PyObject *source_capi = Py_None;
+  int max_depth = 0;
+  PyObject *max_depth_capi = Py_None;
+  int limit = 0;
+  PyObject *limit_capi = Py_None;
+  int *queue = NULL;
+  npy_intp queue_Dims[1] = {-1};
+  const int queue_Rank = 1;
+  PyArrayObject *capi_queue_tmp = NULL;
+  int capi_queue_intent = 0;
+  PyObject *queue_capi = Py_None;
+  int *depth = NULL;
+  npy_intp depth_Dims[1] = {-1};
+  const int depth_Rank = 1;
+  PyArrayObject *capi_depth_tmp = NULL;
+  int capi_depth_intent = 0;
+  PyObject *depth_capi = Py_None;
+  int *counts = NULL;
+  npy_intp counts_Dims[1] = {-1};
+  const int counts_Rank = 1;
+  PyArrayObject *capi_counts_tmp = NULL;
+  int capi_counts_intent = 0;
+  PyObject *counts_capi = Py_None;
+  static char *capi_kwlist[] = {"indptr","indices","source","max_depth","limit","queue","depth","counts",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOO:ext.graphs_bfs_count",\
+    capi_kwlist,&indptr_capi,&indices_capi,&source_capi,&max_depth_capi,&limit_capi,&queue_capi,&depth_capi,&counts_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable indptr */
+  ;
+  capi_indptr_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_indptr_tmp = array_from_pyobj(NPY_INT,indptr_Dims,indptr_Rank,capi_indptr_intent,indptr_capi);
+  if (capi_indptr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `indptr' of ext.graphs_bfs_count to C/Fortran array" );
+  } else {
+    indptr = (int *)(PyArray_DATA(capi_indptr_tmp));
+
+  /* Processing variable source */
+    f2py_success = int_from_pyobj(&source,source_capi,"ext.graphs_bfs_count() 3rd argument (source) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable depth */
+  ;
+  capi_depth_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_depth_tmp = array_from_pyobj(NPY_INT,depth_Dims,depth_Rank,capi_depth_intent,depth_capi);
+  if (capi_depth_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 7th argument `depth' of ext.graphs_bfs_count to C/Fortran array" );
+  } else {
+    depth = (int *)(PyArray_DATA(capi_depth_tmp));
+
+  /* Processing variable limit */
+    f2py_success = int_from_pyobj(&limit,limit_capi,"ext.graphs_bfs_count() 5th argument (limit) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable indices */
+  ;
+  capi_indices_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_indices_tmp = array_from_pyobj(NPY_INT,indices_Dims,indices_Rank,capi_indices_intent,indices_capi);
+  if (capi_indices_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd argument `indices' of ext.graphs_bfs_count to C/Fortran array" );
+  } else {
+    indices = (int *)(PyArray_DATA(capi_indices_tmp));
+
+  /* Processing variable max_depth */
+    f2py_success = int_from_pyobj(&max_depth,max_depth_capi,"ext.graphs_bfs_count() 4th argument (max_depth) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable nindptr */
+  nindptr = len(indptr);
+  /* Processing variable nindices */
+  nindices = len(indices);
+  /* Processing variable n */
+  n = len(depth);
+  /* Processing variable queue */
+  queue_Dims[0]=n;
+  capi_queue_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_queue_tmp = array_from_pyobj(NPY_INT,queue_Dims,queue_Rank,capi_queue_intent,queue_capi);
+  if (capi_queue_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 6th argument `queue' of ext.graphs_bfs_count to C/Fortran array" );
+  } else {
+    queue = (int *)(PyArray_DATA(capi_queue_tmp));
+
+  /* Processing variable counts */
+  counts_Dims[0]=n;
+  capi_counts_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_counts_tmp = array_from_pyobj(NPY_INT,counts_Dims,counts_Rank,capi_counts_intent,counts_capi);
+  if (capi_counts_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 8th argument `counts' of ext.graphs_bfs_count to C/Fortran array" );
+  } else {
+    counts = (int *)(PyArray_DATA(capi_counts_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  graphs_bfs_count_return_value = (*f2py_func)(n,nindptr,indptr,nindices,indices,source,max_depth,limit,queue,depth,counts);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("i",graphs_bfs_count_return_value);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_counts_tmp!=counts_capi) {
+    Py_XDECREF(capi_counts_tmp); }
+  }  /*if (capi_counts_tmp == NULL) ... else of counts*/
+  /* End of cleaning variable counts */
+  if((PyObject *)capi_queue_tmp!=queue_capi) {
+    Py_XDECREF(capi_queue_tmp); }
+  }  /*if (capi_queue_tmp == NULL) ... else of queue*/
+  /* End of cleaning variable queue */
+  /* End of cleaning variable n */
+  /* End of cleaning variable nindices */
+  /* End of cleaning variable nindptr */
+  } /*if (f2py_success) of max_depth*/
+  /* End of cleaning variable max_depth */
+  if((PyObject *)capi_indices_tmp!=indices_capi) {
+    Py_XDECREF(capi_indices_tmp); }
+  }  /*if (capi_indices_tmp == NULL) ... else of indices*/
+  /* End of cleaning variable indices */
+  } /*if (f2py_success) of limit*/
+  /* End of cleaning variable limit */
+  if((PyObject *)capi_depth_tmp!=depth_capi) {
+    Py_XDECREF(capi_depth_tmp); }
+  }  /*if (capi_depth_tmp == NULL) ... else of depth*/
+  /* End of cleaning variable depth */
+  } /*if (f2py_success) of source*/
+  /* End of cleaning variable source */
+  if((PyObject *)capi_indptr_tmp!=indptr_capi) {
+    Py_XDECREF(capi_indptr_tmp); }
+  }  /*if (capi_indptr_tmp == NULL) ... else of indptr*/
+  /* End of cleaning variable indptr */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/************************** end of graphs_bfs_count **************************/
+
+/****************************** graphs_bfs_part ******************************/
+static char doc_f2py_rout_ext_graphs_bfs_part[] = "\
+graphs_bfs_part = graphs_bfs_part(indptr,indices,source,mask,hits)\n\nWrapper for ``graphs_bfs_part``.\
+\n\nParameters\n----------\n"
+"indptr : input rank-1 array('i') with bounds (nindptr)\n"
+"indices : input rank-1 array('i') with bounds (nindices)\n"
+"source : input int\n"
+"mask : in/output rank-1 array('i') with bounds (n)\n"
+"hits : in/output rank-1 array('i') with bounds (1)\n"
+"\nReturns\n-------\n"
+"graphs_bfs_part : int";
+/* extern int graphs_bfs_part(int,int,int*,int,int*,int,int*,int*); */
+static PyObject *f2py_rout_ext_graphs_bfs_part(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           int (*f2py_func)(int,int,int*,int,int*,int,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int graphs_bfs_part_return_value=0;
+  int n = 0;
+  int nindptr = 0;
+  int *indptr = NULL;
+  npy_intp indptr_Dims[1] = {-1};
+  const int indptr_Rank = 1;
+  PyArrayObject *capi_indptr_tmp = NULL;
+  int capi_indptr_intent = 0;
+  PyObject *indptr_capi = Py_None;
+  int nindices = 0;
+  int *indices = NULL;
+  npy_intp indices_Dims[1] = {-1};
+  const int indices_Rank = 1;
+  PyArrayObject *capi_indices_tmp = NULL;
+  int capi_indices_intent = 0;
+  PyObject *indices_capi = Py_None;
+  int source = 0;
+  PyObject *source_capi = Py_None;
+  int *mask = NULL;
+  npy_intp mask_Dims[1] = {-1};
+  const int mask_Rank = 1;
+  PyArrayObject *capi_mask_tmp = NULL;
+  int capi_mask_intent = 0;
+  PyObject *mask_capi = Py_None;
+  int *hits = NULL;
+  npy_intp hits_Dims[1] = {-1};
+  const int hits_Rank = 1;
+  PyArrayObject *capi_hits_tmp = NULL;
+  int capi_hits_intent = 0;
+  PyObject *hits_capi = Py_None;
+  static char *capi_kwlist[] = {"indptr","indices","source","mask","hits",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOO:ext.graphs_bfs_part",\
+    capi_kwlist,&indptr_capi,&indices_capi,&source_capi,&mask_capi,&hits_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable indptr */
+  ;
+  capi_indptr_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_indptr_tmp = array_from_pyobj(NPY_INT,indptr_Dims,indptr_Rank,capi_indptr_intent,indptr_capi);
+  if (capi_indptr_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `indptr' of ext.graphs_bfs_part to C/Fortran array" );
+  } else {
+    indptr = (int *)(PyArray_DATA(capi_indptr_tmp));
+
+  /* Processing variable mask */
+  ;
+  capi_mask_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_mask_tmp = array_from_pyobj(NPY_INT,mask_Dims,mask_Rank,capi_mask_intent,mask_capi);
+  if (capi_mask_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 4th argument `mask' of ext.graphs_bfs_part to C/Fortran array" );
+  } else {
+    mask = (int *)(PyArray_DATA(capi_mask_tmp));
+
+  /* Processing variable hits */
+  hits_Dims[0]=1;
+  capi_hits_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_hits_tmp = array_from_pyobj(NPY_INT,hits_Dims,hits_Rank,capi_hits_intent,hits_capi);
+  if (capi_hits_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 5th argument `hits' of ext.graphs_bfs_part to C/Fortran array" );
+  } else {
+    hits = (int *)(PyArray_DATA(capi_hits_tmp));
+
+  /* Processing variable source */
+    f2py_success = int_from_pyobj(&source,source_capi,"ext.graphs_bfs_part() 3rd argument (source) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable indices */
+  ;
+  capi_indices_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_indices_tmp = array_from_pyobj(NPY_INT,indices_Dims,indices_Rank,capi_indices_intent,indices_capi);
+  if (capi_indices_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd argument `indices' of ext.graphs_bfs_part to C/Fortran array" );
+  } else {
+    indices = (int *)(PyArray_DATA(capi_indices_tmp));
+
+  /* Processing variable nindptr */
+  nindptr = len(indptr);
+  /* Processing variable n */
+  n = len(mask);
+  /* Processing variable nindices */
+  nindices = len(indices);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  graphs_bfs_part_return_value = (*f2py_func)(n,nindptr,indptr,nindices,indices,source,mask,hits);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("i",graphs_bfs_part_return_value);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable nindices */
+  /* End of cleaning variable n */
+  /* End of cleaning variable nindptr */
+  if((PyObject *)capi_indices_tmp!=indices_capi) {
+    Py_XDECREF(capi_indices_tmp); }
+  }  /*if (capi_indices_tmp == NULL) ... else of indices*/
+  /* End of cleaning variable indices */
+  } /*if (f2py_success) of source*/
+  /* End of cleaning variable source */
+  if((PyObject *)capi_hits_tmp!=hits_capi) {
+    Py_XDECREF(capi_hits_tmp); }
+  }  /*if (capi_hits_tmp == NULL) ... else of hits*/
+  /* End of cleaning variable hits */
+  if((PyObject *)capi_mask_tmp!=mask_capi) {
+    Py_XDECREF(capi_mask_tmp); }
+  }  /*if (capi_mask_tmp == NULL) ... else of mask*/
+  /* End of cleaning variable mask */
+  if((PyObject *)capi_indptr_tmp!=indptr_capi) {
+    Py_XDECREF(capi_indptr_tmp); }
+  }  /*if (capi_indptr_tmp == NULL) ... else of indptr*/
+  /* End of cleaning variable indptr */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/*************************** end of graphs_bfs_part ***************************/
+
+/************************* molecules_distance_matrix *************************/
+static char doc_f2py_rout_ext_molecules_distance_matrix[] = "\
+dm = molecules_distance_matrix(cor,[matrix,reciprocal])\n\nWrapper for ``molecules_distance_matrix``.\
+\n\nParameters\n----------\n"
+"cor : input rank-2 array('d') with bounds (n,3)\n"
+"\nOther Parameters\n----------------\n"
+"matrix : input rank-2 array('d') with bounds (3,3), optional\n    Default: 0\n"
+"reciprocal : input rank-2 array('d') with bounds (3,3), optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"dm : rank-2 array('d') with bounds (n,n)";
+/* extern void molecules_distance_matrix(int,double*,int,double*,double*,double*); */
+static PyObject *f2py_rout_ext_molecules_distance_matrix(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int,double*,int,double*,double*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *cor = NULL;
+  npy_intp cor_Dims[2] = {-1, -1};
+  const int cor_Rank = 2;
+  PyArrayObject *capi_cor_tmp = NULL;
+  int capi_cor_intent = 0;
+  PyObject *cor_capi = Py_None;
+  int periodic = 0;
+  double *matrix = NULL;
+  npy_intp matrix_Dims[2] = {-1, -1};
+  const int matrix_Rank = 2;
+  PyArrayObject *capi_matrix_tmp = NULL;
+  int capi_matrix_intent = 0;
+  PyObject *matrix_capi = Py_None;
+  double *reciprocal = NULL;
+  npy_intp reciprocal_Dims[2] = {-1, -1};
+  const int reciprocal_Rank = 2;
+  PyArrayObject *capi_reciprocal_tmp = NULL;
+  int capi_reciprocal_intent = 0;
+  PyObject *reciprocal_capi = Py_None;
+  double *dm = NULL;
+  npy_intp dm_Dims[2] = {-1, -1};
+  const int dm_Rank = 2;
+  PyArrayObject *capi_dm_tmp = NULL;
+  int capi_dm_intent = 0;
+  static char *capi_kwlist[] = {"cor","matrix","reciprocal",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OO:ext.molecules_distance_matrix",\
+    capi_kwlist,&cor_capi,&matrix_capi,&reciprocal_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable matrix */
+  matrix_Dims[0]=3,matrix_Dims[1]=3;
+  capi_matrix_intent |= F2PY_OPTIONAL|F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_matrix_tmp = array_from_pyobj(NPY_DOUBLE,matrix_Dims,matrix_Rank,capi_matrix_intent,matrix_capi);
+  if (capi_matrix_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st keyword `matrix' of ext.molecules_distance_matrix to C/Fortran array" );
+  } else {
+    matrix = (double *)(PyArray_DATA(capi_matrix_tmp));
+
+  if (matrix_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("molecules_distance_matrix: Initializing matrix=0\n");
+    if (initforcomb(PyArray_DIMS(capi_matrix_tmp),PyArray_NDIM(capi_matrix_tmp),1)) {
+      while ((_i = nextforcomb()))
+        matrix[capi_i++] = 0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(ext_error,"Initialization of 1st keyword matrix failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable reciprocal */
+  reciprocal_Dims[0]=3,reciprocal_Dims[1]=3;
+  capi_reciprocal_intent |= F2PY_OPTIONAL|F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_reciprocal_tmp = array_from_pyobj(NPY_DOUBLE,reciprocal_Dims,reciprocal_Rank,capi_reciprocal_intent,reciprocal_capi);
+  if (capi_reciprocal_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd keyword `reciprocal' of ext.molecules_distance_matrix to C/Fortran array" );
+  } else {
+    reciprocal = (double *)(PyArray_DATA(capi_reciprocal_tmp));
+
+  if (reciprocal_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("molecules_distance_matrix: Initializing reciprocal=0\n");
+    if (initforcomb(PyArray_DIMS(capi_reciprocal_tmp),PyArray_NDIM(capi_reciprocal_tmp),1)) {
+      while ((_i = nextforcomb()))
+        reciprocal[capi_i++] = 0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(ext_error,"Initialization of 2nd keyword reciprocal failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable cor */
+  cor_Dims[1]=3;
+  capi_cor_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_cor_tmp = array_from_pyobj(NPY_DOUBLE,cor_Dims,cor_Rank,capi_cor_intent,cor_capi);
+  if (capi_cor_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `cor' of ext.molecules_distance_matrix to C/Fortran array" );
+  } else {
+    cor = (double *)(PyArray_DATA(capi_cor_tmp));
+
+  /* Processing variable periodic */
+  periodic = (matrix_capi-Py_None);
+  /* Processing variable n */
+  n = len(cor);
+  /* Processing variable dm */
+  dm_Dims[0]=n,dm_Dims[1]=n;
+  capi_dm_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT|F2PY_INTENT_C;
+  capi_dm_tmp = array_from_pyobj(NPY_DOUBLE,dm_Dims,dm_Rank,capi_dm_intent,Py_None);
+  if (capi_dm_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting hidden `dm' of ext.molecules_distance_matrix to C/Fortran array" );
+  } else {
+    dm = (double *)(PyArray_DATA(capi_dm_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(n,cor,periodic,matrix,reciprocal,dm);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_dm_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_dm_tmp == NULL) ... else of dm*/
+  /* End of cleaning variable dm */
+  /* End of cleaning variable n */
+  /* End of cleaning variable periodic */
+  if((PyObject *)capi_cor_tmp!=cor_capi) {
+    Py_XDECREF(capi_cor_tmp); }
+  }  /*if (capi_cor_tmp == NULL) ... else of cor*/
+  /* End of cleaning variable cor */
+  }  /*if (f2py_success) of reciprocal init*/
+  if((PyObject *)capi_reciprocal_tmp!=reciprocal_capi) {
+    Py_XDECREF(capi_reciprocal_tmp); }
+  }  /*if (capi_reciprocal_tmp == NULL) ... else of reciprocal*/
+  /* End of cleaning variable reciprocal */
+  }  /*if (f2py_success) of matrix init*/
+  if((PyObject *)capi_matrix_tmp!=matrix_capi) {
+    Py_XDECREF(capi_matrix_tmp); }
+  }  /*if (capi_matrix_tmp == NULL) ... else of matrix*/
+  /* End of cleaning variable matrix */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/********************** end of molecules_distance_matrix **********************/
+
+/************************ molecules_distance_condensed ************************/
+static char doc_f2py_rout_ext_molecules_distance_condensed[] = "\
+condensed = molecules_distance_condensed(cor,[matrix,reciprocal])\n\nWrapper for ``molecules_distance_condensed``.\
+\n\nParameters\n----------\n"
+"cor : input rank-2 array('d') with bounds (n,3)\n"
+"\nOther Parameters\n----------------\n"
+"matrix : input rank-2 array('d') with bounds (3,3), optional\n    Default: 0\n"
+"reciprocal : input rank-2 array('d') with bounds (3,3), optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"condensed : rank-1 array('d') with bounds ((n*(n-1))/2)";
+/* extern void molecules_distance_condensed(int,double*,int,double*,double*,double*); */
+static PyObject *f2py_rout_ext_molecules_distance_condensed(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int,double*,int,double*,double*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *cor = NULL;
+  npy_intp cor_Dims[2] = {-1, -1};
+  const int cor_Rank = 2;
+  PyArrayObject *capi_cor_tmp = NULL;
+  int capi_cor_intent = 0;
+  PyObject *cor_capi = Py_None;
+  int periodic = 0;
+  double *matrix = NULL;
+  npy_intp matrix_Dims[2] = {-1, -1};
+  const int matrix_Rank = 2;
+  PyArrayObject *capi_matrix_tmp = NULL;
+  int capi_matrix_intent = 0;
+  PyObject *matrix_capi = Py_None;
+  double *reciprocal = NULL;
+  npy_intp reciprocal_Dims[2] = {-1, -1};
+  const int reciprocal_Rank = 2;
+  PyArrayObject *capi_reciprocal_tmp = NULL;
+  int capi_reciprocal_intent = 0;
+  PyObject *reciprocal_capi = Py_None;
+  double *condensed = NULL;
+  npy_intp condensed_Dims[1] = {-1};
+  const int condensed_Rank = 1;
+  PyArrayObject *capi_condensed_tmp = NULL;
+  int capi_condensed_intent = 0;
+  static char *capi_kwlist[] = {"cor","matrix","reciprocal",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O|OO:ext.molecules_distance_condensed",\
+    capi_kwlist,&cor_capi,&matrix_capi,&reciprocal_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable cor */
+  cor_Dims[1]=3;
+  capi_cor_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_cor_tmp = array_from_pyobj(NPY_DOUBLE,cor_Dims,cor_Rank,capi_cor_intent,cor_capi);
+  if (capi_cor_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `cor' of ext.molecules_distance_condensed to C/Fortran array" );
+  } else {
+    cor = (double *)(PyArray_DATA(capi_cor_tmp));
+
+  /* Processing variable matrix */
+  matrix_Dims[0]=3,matrix_Dims[1]=3;
+  capi_matrix_intent |= F2PY_OPTIONAL|F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_matrix_tmp = array_from_pyobj(NPY_DOUBLE,matrix_Dims,matrix_Rank,capi_matrix_intent,matrix_capi);
+  if (capi_matrix_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st keyword `matrix' of ext.molecules_distance_condensed to C/Fortran array" );
+  } else {
+    matrix = (double *)(PyArray_DATA(capi_matrix_tmp));
+
+  if (matrix_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("molecules_distance_condensed: Initializing matrix=0\n");
+    if (initforcomb(PyArray_DIMS(capi_matrix_tmp),PyArray_NDIM(capi_matrix_tmp),1)) {
+      while ((_i = nextforcomb()))
+        matrix[capi_i++] = 0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(ext_error,"Initialization of 1st keyword matrix failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable reciprocal */
+  reciprocal_Dims[0]=3,reciprocal_Dims[1]=3;
+  capi_reciprocal_intent |= F2PY_OPTIONAL|F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_reciprocal_tmp = array_from_pyobj(NPY_DOUBLE,reciprocal_Dims,reciprocal_Rank,capi_reciprocal_intent,reciprocal_capi);
+  if (capi_reciprocal_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd keyword `reciprocal' of ext.molecules_distance_condensed to C/Fortran array" );
+  } else {
+    reciprocal = (double *)(PyArray_DATA(capi_reciprocal_tmp));
+
+  if (reciprocal_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("molecules_distance_condensed: Initializing reciprocal=0\n");
+    if (initforcomb(PyArray_DIMS(capi_reciprocal_tmp),PyArray_NDIM(capi_reciprocal_tmp),1)) {
+      while ((_i = nextforcomb()))
+        reciprocal[capi_i++] = 0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(ext_error,"Initialization of 2nd keyword reciprocal failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable periodic */
+  periodic = (matrix_capi-Py_None);
+  /* Processing variable n */
+  n = len(cor);
+  /* Processing variable condensed */
+  condensed_Dims[0]=(n*(n-1))/2;
+  capi_condensed_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT|F2PY_INTENT_C;
+  capi_condensed_tmp = array_from_pyobj(NPY_DOUBLE,condensed_Dims,condensed_Rank,capi_condensed_intent,Py_None);
+  if (capi_condensed_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting hidden `condensed' of ext.molecules_distance_condensed to C/Fortran array" );
+  } else {
+    condensed = (double *)(PyArray_DATA(capi_condensed_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(n,cor,periodic,matrix,reciprocal,condensed);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_condensed_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_condensed_tmp == NULL) ... else of condensed*/
+  /* End of cleaning variable condensed */
+  /* End of cleaning variable n */
+  /* End of cleaning variable periodic */
+  }  /*if (f2py_success) of reciprocal init*/
+  if((PyObject *)capi_reciprocal_tmp!=reciprocal_capi) {
+    Py_XDECREF(capi_reciprocal_tmp); }
+  }  /*if (capi_reciprocal_tmp == NULL) ... else of reciprocal*/
+  /* End of cleaning variable reciprocal */
+  }  /*if (f2py_success) of matrix init*/
+  if((PyObject *)capi_matrix_tmp!=matrix_capi) {
+    Py_XDECREF(capi_matrix_tmp); }
+  }  /*if (capi_matrix_tmp == NULL) ... else of matrix*/
+  /* End of cleaning variable matrix */
+  if((PyObject *)capi_cor_tmp!=cor_capi) {
+    Py_XDECREF(capi_cor_tmp); }
+  }  /*if (capi_cor_tmp == NULL) ... else of cor*/
+  /* End of cleaning variable cor */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************** end of molecules_distance_condensed ********************/
+
+/************************** similarity_table_labels **************************/
+static char doc_f2py_rout_ext_similarity_table_labels[] = "\
+labels_table = similarity_table_labels(labels)\n\nWrapper for ``similarity_table_labels``.\
+\n\nParameters\n----------\n"
+"labels : input rank-1 array('i') with bounds (n)\n"
+"\nReturns\n-------\n"
+"labels_table : rank-2 array('i') with bounds ((n*(n-1))/2,2)";
+/* extern void similarity_table_labels(int,int*,int*); */
+static PyObject *f2py_rout_ext_similarity_table_labels(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  int *labels = NULL;
+  npy_intp labels_Dims[1] = {-1};
+  const int labels_Rank = 1;
+  PyArrayObject *capi_labels_tmp = NULL;
+  int capi_labels_intent = 0;
+  PyObject *labels_capi = Py_None;
+  int *labels_table = NULL;
+  npy_intp labels_table_Dims[2] = {-1, -1};
+  const int labels_table_Rank = 2;
+  PyArrayObject *capi_labels_table_tmp = NULL;
+  int capi_labels_table_intent = 0;
+  static char *capi_kwlist[] = {"labels",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O:ext.similarity_table_labels",\
+    capi_kwlist,&labels_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable labels */
+  ;
+  capi_labels_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_labels_tmp = array_from_pyobj(NPY_INT,labels_Dims,labels_Rank,capi_labels_intent,labels_capi);
+  if (capi_labels_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `labels' of ext.similarity_table_labels to C/Fortran array" );
+  } else {
+    labels = (int *)(PyArray_DATA(capi_labels_tmp));
+
+  /* Processing variable n */
+  n = len(labels);
+  /* Processing variable labels_table */
+  labels_table_Dims[0]=(n*(n-1))/2,labels_table_Dims[1]=2;
+  capi_labels_table_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT|F2PY_INTENT_C;
+  capi_labels_table_tmp = array_from_pyobj(NPY_INT,labels_table_Dims,labels_table_Rank,capi_labels_table_intent,Py_None);
+  if (capi_labels_table_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting hidden `labels_table' of ext.similarity_table_labels to C/Fortran array" );
+  } else {
+    labels_table = (int *)(PyArray_DATA(capi_labels_table_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(n,labels,labels_table);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_labels_table_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_labels_table_tmp == NULL) ... else of labels_table*/
+  /* End of cleaning variable labels_table */
+  /* End of cleaning variable n */
+  if((PyObject *)capi_labels_tmp!=labels_capi) {
+    Py_XDECREF(capi_labels_tmp); }
+  }  /*if (capi_labels_tmp == NULL) ... else of labels*/
+  /* End of cleaning variable labels */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/*********************** end of similarity_table_labels ***********************/
+
+/************************* similarity_table_distances *************************/
+static char doc_f2py_rout_ext_similarity_table_distances[] = "\
+distances_table = similarity_table_distances(distance_matrix)\n\nWrapper for ``similarity_table_distances``.\
+\n\nParameters\n----------\n"
+"distance_matrix : input rank-2 array('d') with bounds (n,n)\n"
+"\nReturns\n-------\n"
+"distances_table : rank-1 array('d') with bounds ((n*(n-1))/2)";
+/* extern void similarity_table_distances(int,double*,double*); */
+static PyObject *f2py_rout_ext_similarity_table_distances(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int,double*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int n = 0;
+  double *distance_matrix = NULL;
+  npy_intp distance_matrix_Dims[2] = {-1, -1};
+  const int distance_matrix_Rank = 2;
+  PyArrayObject *capi_distance_matrix_tmp = NULL;
+  int capi_distance_matrix_intent = 0;
+  PyObject *distance_matrix_capi = Py_None;
+  double *distances_table = NULL;
+  npy_intp distances_table_Dims[1] = {-1};
+  const int distances_table_Rank = 1;
+  PyArrayObject *capi_distances_table_tmp = NULL;
+  int capi_distances_table_intent = 0;
+  static char *capi_kwlist[] = {"distance_matrix",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "O:ext.similarity_table_distances",\
+    capi_kwlist,&distance_matrix_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable distance_matrix */
+  ;
+  capi_distance_matrix_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_distance_matrix_tmp = array_from_pyobj(NPY_DOUBLE,distance_matrix_Dims,distance_matrix_Rank,capi_distance_matrix_intent,distance_matrix_capi);
+  if (capi_distance_matrix_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `distance_matrix' of ext.similarity_table_distances to C/Fortran array" );
+  } else {
+    distance_matrix = (double *)(PyArray_DATA(capi_distance_matrix_tmp));
+
+  /* Processing variable n */
+  n = len(distance_matrix);
+  /* Processing variable distances_table */
+  distances_table_Dims[0]=(n*(n-1))/2;
+  capi_distances_table_intent |= F2PY_INTENT_HIDE|F2PY_INTENT_OUT|F2PY_INTENT_C;
+  capi_distances_table_tmp = array_from_pyobj(NPY_DOUBLE,distances_table_Dims,distances_table_Rank,capi_distances_table_intent,Py_None);
+  if (capi_distances_table_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting hidden `distances_table' of ext.similarity_table_distances to C/Fortran array" );
+  } else {
+    distances_table = (double *)(PyArray_DATA(capi_distances_table_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(n,distance_matrix,distances_table);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("N",capi_distances_table_tmp);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  }  /*if (capi_distances_table_tmp == NULL) ... else of distances_table*/
+  /* End of cleaning variable distances_table */
+  /* End of cleaning variable n */
+  if((PyObject *)capi_distance_matrix_tmp!=distance_matrix_capi) {
+    Py_XDECREF(capi_distance_matrix_tmp); }
+  }  /*if (capi_distance_matrix_tmp == NULL) ... else of distance_matrix*/
+  /* End of cleaning variable distance_matrix */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/********************* end of similarity_table_distances *********************/
+
+/***************************** similarity_measure *****************************/
+static char doc_f2py_rout_ext_similarity_measure[] = "\
+similarity_measure = similarity_measure(labels1,distances1,labels2,distances2,margin,cutoff)\n\nWrapper for ``similarity_measure``.\
+\n\nParameters\n----------\n"
+"labels1 : input rank-2 array('i') with bounds (n1,2)\n"
+"distances1 : input rank-1 array('d') with bounds (n1)\n"
+"labels2 : input rank-2 array('i') with bounds (n2,2)\n"
+"distances2 : input rank-1 array('d') with bounds (n2)\n"
+"margin : input float\n"
+"cutoff : input float\n"
+"\nReturns\n-------\n"
+"similarity_measure : float";
+/* extern double similarity_measure(int,int*,double*,int,int*,double*,double,double); */
+static PyObject *f2py_rout_ext_similarity_measure(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           double (*f2py_func)(int,int*,double*,int,int*,double*,double,double)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  double similarity_measure_return_value=0;
+  int n1 = 0;
+  int *labels1 = NULL;
+  npy_intp labels1_Dims[2] = {-1, -1};
+  const int labels1_Rank = 2;
+  PyArrayObject *capi_labels1_tmp = NULL;
+  int capi_labels1_intent = 0;
+  PyObject *labels1_capi = Py_None;
+  double *distances1 = NULL;
+  npy_intp distances1_Dims[1] = {-1};
+  const int distances1_Rank = 1;
+  PyArrayObject *capi_distances1_tmp = NULL;
+  int capi_distances1_intent = 0;
+  PyObject *distances1_capi = Py_None;
+  int n2 = 0;
+  int *labels2 = NULL;
+  npy_intp labels2_Dims[2] = {-1, -1};
+  const int labels2_Rank = 2;
+  PyArrayObject *capi_labels2_tmp = NULL;
+  int capi_labels2_intent = 0;
+  PyObject *labels2_capi = Py_None;
+  double *distances2 = NULL;
+  npy_intp distances2_Dims[1] = {-1};
+  const int distances2_Rank = 1;
+  PyArrayObject *capi_distances2_tmp = NULL;
+  int capi_distances2_intent = 0;
+  PyObject *distances2_capi = Py_None;
+  double margin = 0;
+  PyObject *margin_capi = Py_None;
+  double cutoff = 0;
+  PyObject *cutoff_capi = Py_None;
+  static char *capi_kwlist[] = {"labels1","distances1","labels2","distances2","margin","cutoff",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOO:ext.similarity_measure",\
+    capi_kwlist,&labels1_capi,&distances1_capi,&labels2_capi,&distances2_capi,&margin_capi,&cutoff_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable cutoff */
+    f2py_success = double_from_pyobj(&cutoff,cutoff_capi,"ext.similarity_measure() 6th argument (cutoff) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable labels1 */
+  labels1_Dims[1]=2;
+  capi_labels1_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_labels1_tmp = array_from_pyobj(NPY_INT,labels1_Dims,labels1_Rank,capi_labels1_intent,labels1_capi);
+  if (capi_labels1_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `labels1' of ext.similarity_measure to C/Fortran array" );
+  } else {
+    labels1 = (int *)(PyArray_DATA(capi_labels1_tmp));
+
+  /* Processing variable labels2 */
+  labels2_Dims[1]=2;
+  capi_labels2_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_labels2_tmp = array_from_pyobj(NPY_INT,labels2_Dims,labels2_Rank,capi_labels2_intent,labels2_capi);
+  if (capi_labels2_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 3rd argument `labels2' of ext.similarity_measure to C/Fortran array" );
+  } else {
+    labels2 = (int *)(PyArray_DATA(capi_labels2_tmp));
+
+  /* Processing variable margin */
+    f2py_success = double_from_pyobj(&margin,margin_capi,"ext.similarity_measure() 5th argument (margin) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable n1 */
+  n1 = len(labels1);
+  /* Processing variable n2 */
+  n2 = len(labels2);
+  /* Processing variable distances2 */
+  distances2_Dims[0]=n2;
+  capi_distances2_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_distances2_tmp = array_from_pyobj(NPY_DOUBLE,distances2_Dims,distances2_Rank,capi_distances2_intent,distances2_capi);
+  if (capi_distances2_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 4th argument `distances2' of ext.similarity_measure to C/Fortran array" );
+  } else {
+    distances2 = (double *)(PyArray_DATA(capi_distances2_tmp));
+
+  /* Processing variable distances1 */
+  distances1_Dims[0]=n1;
+  capi_distances1_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_distances1_tmp = array_from_pyobj(NPY_DOUBLE,distances1_Dims,distances1_Rank,capi_distances1_intent,distances1_capi);
+  if (capi_distances1_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd argument `distances1' of ext.similarity_measure to C/Fortran array" );
+  } else {
+    distances1 = (double *)(PyArray_DATA(capi_distances1_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  similarity_measure_return_value = (*f2py_func)(n1,labels1,distances1,n2,labels2,distances2,margin,cutoff);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("d",similarity_measure_return_value);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_distances1_tmp!=distances1_capi) {
+    Py_XDECREF(capi_distances1_tmp); }
+  }  /*if (capi_distances1_tmp == NULL) ... else of distances1*/
+  /* End of cleaning variable distances1 */
+  if((PyObject *)capi_distances2_tmp!=distances2_capi) {
+    Py_XDECREF(capi_distances2_tmp); }
+  }  /*if (capi_distances2_tmp == NULL) ... else of distances2*/
+  /* End of cleaning variable distances2 */
+  /* End of cleaning variable n2 */
+  /* End of cleaning variable n1 */
+  } /*if (f2py_success) of margin*/
+  /* End of cleaning variable margin */
+  if((PyObject *)capi_labels2_tmp!=labels2_capi) {
+    Py_XDECREF(capi_labels2_tmp); }
+  }  /*if (capi_labels2_tmp == NULL) ... else of labels2*/
+  /* End of cleaning variable labels2 */
+  if((PyObject *)capi_labels1_tmp!=labels1_capi) {
+    Py_XDECREF(capi_labels1_tmp); }
+  }  /*if (capi_labels1_tmp == NULL) ... else of labels1*/
+  /* End of cleaning variable labels1 */
+  } /*if (f2py_success) of cutoff*/
+  /* End of cleaning variable cutoff */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/************************* end of similarity_measure *************************/
+
+/**************************** binning_pair_search ****************************/
+static char doc_f2py_rout_ext_binning_pair_search[] = "\
+binning_pair_search = binning_pair_search(cor0,cor1,cutoff,intra,order0,cell_start0,order1,cell_start1,cells0,neighbors,progress,pairs,deltas,distances,[matrix,reciprocal])\n\nWrapper for ``binning_pair_search``.\
+\n\nParameters\n----------\n"
+"cor0 : input rank-2 array('d') with bounds (n0,3)\n"
+"cor1 : input rank-2 array('d') with bounds (n1,3)\n"
+"cutoff : input float\n"
+"intra : input int\n"
+"order0 : input rank-1 array('i') with bounds (n0)\n"
+"cell_start0 : input rank-1 array('i') with bounds (ncs0)\n"
+"order1 : input rank-1 array('i') with bounds (n1)\n"
+"cell_start1 : input rank-1 array('i') with bounds (ncs1)\n"
+"cells0 : input rank-1 array('i') with bounds (nc)\n"
+"neighbors : input rank-2 array('i') with bounds (nc,nn)\n"
+"progress : in/output rank-1 array('i') with bounds (1)\n"
+"pairs : in/output rank-2 array('i') with bounds (m,2)\n"
+"deltas : in/output rank-2 array('d') with bounds (m,3)\n"
+"distances : in/output rank-1 array('d') with bounds (m)\n"
+"\nOther Parameters\n----------------\n"
+"matrix : input rank-2 array('d') with bounds (3,3), optional\n    Default: 0\n"
+"reciprocal : input rank-2 array('d') with bounds (3,3), optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"binning_pair_search : int";
+/* extern int binning_pair_search(int,double*,int,double*,double,int,int,double*,double*,int*,int,int*,int*,int,int*,int,int,int*,int*,int*,int,int*,double*,double*); */
+static PyObject *f2py_rout_ext_binning_pair_search(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           int (*f2py_func)(int,double*,int,double*,double,int,int,double*,double*,int*,int,int*,int*,int,int*,int,int,int*,int*,int*,int,int*,double*,double*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int binning_pair_search_return_value=0;
+  int n0 = 0;
+  double *cor0 = NULL;
+  npy_intp cor0_Dims[2] = {-1, -1};
+  const int cor0_Rank = 2;
+  PyArrayObject *capi_cor0_tmp = NULL;
+  int capi_cor0_intent = 0;
+  PyObject *cor0_capi = Py_None;
+  int n1 = 0;
+  double *cor1 = NULL;
+  npy_intp cor1_Dims[2] = {-1, -1};
+  const int cor1_Rank = 2;
+  PyArrayObject *capi_cor1_tmp = NULL;
+  int capi_cor1_intent = 0;
+  PyObject *cor1_capi = Py_None;
+  double cutoff = 0;
+  PyObject *cutoff_capi = Py_None;
+  int intra = 0;
+  PyObject *intra_capi = Py_None;
+  int periodic = 0;
+  double *matrix = NULL;
+  npy_intp matrix_Dims[2] = {-1, -1};
+  const int matrix_Rank = 2;
+  PyArrayObject *capi_matrix_tmp = NULL;
+  int capi_matrix_intent = 0;
+  PyObject *matrix_capi = Py_None;
+  double *reciprocal = NULL;
+  npy_intp reciprocal_Dims[2] = {-1, -1};
+  const int reciprocal_Rank = 2;
+  PyArrayObject *capi_reciprocal_tmp = NULL;
+  int capi_reciprocal_intent = 0;
+  PyObject *reciprocal_capi = Py_None;
+  int *order0 = NULL;
+  npy_intp order0_Dims[1] = {-1};
+  const int order0_Rank = 1;
+  PyArrayObject *capi_order0_tmp = NULL;
+  int capi_order0_intent = 0;
+  PyObject *order0_capi = Py_None;
+  int ncs0 = 0;
+  int *cell_start0 = NULL;
+  npy_intp cell_start0_Dims[1] = {-1};
+  const int cell_start0_Rank = 1;
+  PyArrayObject *capi_cell_start0_tmp = NULL;
+  int capi_cell_start0_intent = 0;
+  PyObject *cell_start0_capi = Py_None;
+  int *order1 = NULL;
+  npy_intp order1_Dims[1] = {-1};
+  const int order1_Rank = 1;
+  PyArrayObject *capi_order1_tmp = NULL;
+  int capi_order1_intent = 0;
+  PyObject *order1_capi = Py_None;
+  int ncs1 = 0;
+  int *cell_start1 = NULL;
+  npy_intp cell_start1_Dims[1] = {-1};
+  const int cell_start1_Rank = 1;
+  PyArrayObject *capi_cell_start1_tmp = NULL;
+  int capi_cell_start1_intent = 0;
+  PyObject *cell_start1_capi = Py_None;
+  int nc = 0;
+  int nn = 0;
+  int *cells0 = NULL;
+  npy_intp cells0_Dims[1] = {-1};
+  const int cells0_Rank = 1;
+  PyArrayObject *capi_cells0_tmp = NULL;
+  int capi_cells0_intent = 0;
+  PyObject *cells0_capi = Py_None;
+  int *neighbors = NULL;
+  npy_intp neighbors_Dims[2] = {-1, -1};
+  const int neighbors_Rank = 2;
+  PyArrayObject *capi_neighbors_tmp = NULL;
+  int capi_neighbors_intent = 0;
+  PyObject *neighbors_capi = Py_None;
+  int *progress = NULL;
+  npy_intp progress_Dims[1] = {-1};
+  const int progress_Rank = 1;
+  PyArrayObject *capi_progress_tmp = NULL;
+  int capi_progress_intent = 0;
+  PyObject *progress_capi = Py_None;
+  int m = 0;
+  int *pairs = NULL;
+  npy_intp pairs_Dims[2] = {-1, -1};
+  const int pairs_Rank = 2;
+  PyArrayObject *capi_pairs_tmp = NULL;
+  int capi_pairs_intent = 0;
+  PyObject *pairs_capi = Py_None;
+  double *deltas = NULL;
+  npy_intp deltas_Dims[2] = {-1, -1};
+  const int deltas_Rank = 2;
+  PyArrayObject *capi_deltas_tmp = NULL;
+  int capi_deltas_intent = 0;
+  PyObject *deltas_capi = Py_None;
+  double *distances = NULL;
+  npy_intp distances_Dims[1] = {-1};
+  const int distances_Rank = 1;
+  PyArrayObject *capi_distances_tmp = NULL;
+  int capi_distances_intent = 0;
+  PyObject *distances_capi = Py_None;
+  static char *capi_kwlist[] = {"cor0","cor1","cutoff","intra","order0","cell_start0","order1","cell_start1","cells0","neighbors","progress","pairs","deltas","distances","matrix","reciprocal",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOOOOOOOOOOO|OO:ext.binning_pair_search",\
+    capi_kwlist,&cor0_capi,&cor1_capi,&cutoff_capi,&intra_capi,&order0_capi,&cell_start0_capi,&order1_capi,&cell_start1_capi,&cells0_capi,&neighbors_capi,&progress_capi,&pairs_capi,&deltas_capi,&distances_capi,&matrix_capi,&reciprocal_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable neighbors */
+  ;
+  capi_neighbors_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_neighbors_tmp = array_from_pyobj(NPY_INT,neighbors_Dims,neighbors_Rank,capi_neighbors_intent,neighbors_capi);
+  if (capi_neighbors_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 10th argument `neighbors' of ext.binning_pair_search to C/Fortran array" );
+  } else {
+    neighbors = (int *)(PyArray_DATA(capi_neighbors_tmp));
+
+  /* Processing variable cutoff */
+    f2py_success = double_from_pyobj(&cutoff,cutoff_capi,"ext.binning_pair_search() 3rd argument (cutoff) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable cor0 */
+  cor0_Dims[1]=3;
+  capi_cor0_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_cor0_tmp = array_from_pyobj(NPY_DOUBLE,cor0_Dims,cor0_Rank,capi_cor0_intent,cor0_capi);
+  if (capi_cor0_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `cor0' of ext.binning_pair_search to C/Fortran array" );
+  } else {
+    cor0 = (double *)(PyArray_DATA(capi_cor0_tmp));
+
+  /* Processing variable cor1 */
+  cor1_Dims[1]=3;
+  capi_cor1_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_cor1_tmp = array_from_pyobj(NPY_DOUBLE,cor1_Dims,cor1_Rank,capi_cor1_intent,cor1_capi);
+  if (capi_cor1_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd argument `cor1' of ext.binning_pair_search to C/Fortran array" );
+  } else {
+    cor1 = (double *)(PyArray_DATA(capi_cor1_tmp));
+
+  /* Processing variable intra */
+    f2py_success = int_from_pyobj(&intra,intra_capi,"ext.binning_pair_search() 4th argument (intra) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable cell_start0 */
+  ;
+  capi_cell_start0_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_cell_start0_tmp = array_from_pyobj(NPY_INT,cell_start0_Dims,cell_start0_Rank,capi_cell_start0_intent,cell_start0_capi);
+  if (capi_cell_start0_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 6th argument `cell_start0' of ext.binning_pair_search to C/Fortran array" );
+  } else {
+    cell_start0 = (int *)(PyArray_DATA(capi_cell_start0_tmp));
+
+  /* Processing variable cell_start1 */
+  ;
+  capi_cell_start1_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_cell_start1_tmp = array_from_pyobj(NPY_INT,cell_start1_Dims,cell_start1_Rank,capi_cell_start1_intent,cell_start1_capi);
+  if (capi_cell_start1_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 8th argument `cell_start1' of ext.binning_pair_search to C/Fortran array" );
+  } else {
+    cell_start1 = (int *)(PyArray_DATA(capi_cell_start1_tmp));
+
+  /* Processing variable pairs */
+  pairs_Dims[1]=2;
+  capi_pairs_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_pairs_tmp = array_from_pyobj(NPY_INT,pairs_Dims,pairs_Rank,capi_pairs_intent,pairs_capi);
+  if (capi_pairs_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 12nd argument `pairs' of ext.binning_pair_search to C/Fortran array" );
+  } else {
+    pairs = (int *)(PyArray_DATA(capi_pairs_tmp));
+
+  /* Processing variable matrix */
+  matrix_Dims[0]=3,matrix_Dims[1]=3;
+  capi_matrix_intent |= F2PY_OPTIONAL|F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_matrix_tmp = array_from_pyobj(NPY_DOUBLE,matrix_Dims,matrix_Rank,capi_matrix_intent,matrix_capi);
+  if (capi_matrix_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st keyword `matrix' of ext.binning_pair_search to C/Fortran array" );
+  } else {
+    matrix = (double *)(PyArray_DATA(capi_matrix_tmp));
+
+  if (matrix_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("binning_pair_search: Initializing matrix=0\n");
+    if (initforcomb(PyArray_DIMS(capi_matrix_tmp),PyArray_NDIM(capi_matrix_tmp),1)) {
+      while ((_i = nextforcomb()))
+        matrix[capi_i++] = 0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(ext_error,"Initialization of 1st keyword matrix failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable reciprocal */
+  reciprocal_Dims[0]=3,reciprocal_Dims[1]=3;
+  capi_reciprocal_intent |= F2PY_OPTIONAL|F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_reciprocal_tmp = array_from_pyobj(NPY_DOUBLE,reciprocal_Dims,reciprocal_Rank,capi_reciprocal_intent,reciprocal_capi);
+  if (capi_reciprocal_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd keyword `reciprocal' of ext.binning_pair_search to C/Fortran array" );
+  } else {
+    reciprocal = (double *)(PyArray_DATA(capi_reciprocal_tmp));
+
+  if (reciprocal_capi == Py_None) {
+
+
+    int *_i,capi_i=0;
+    CFUNCSMESS("binning_pair_search: Initializing reciprocal=0\n");
+    if (initforcomb(PyArray_DIMS(capi_reciprocal_tmp),PyArray_NDIM(capi_reciprocal_tmp),1)) {
+      while ((_i = nextforcomb()))
+        reciprocal[capi_i++] = 0; /* fortran way */
+    } else {
+      if (!PyErr_Occurred())
+        PyErr_SetString(ext_error,"Initialization of 2nd keyword reciprocal failed (initforcomb).");
+      f2py_success = 0;
+    }
+  }
+  if (f2py_success) {
+  /* Processing variable progress */
+  progress_Dims[0]=1;
+  capi_progress_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_progress_tmp = array_from_pyobj(NPY_INT,progress_Dims,progress_Rank,capi_progress_intent,progress_capi);
+  if (capi_progress_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 11st argument `progress' of ext.binning_pair_search to C/Fortran array" );
+  } else {
+    progress = (int *)(PyArray_DATA(capi_progress_tmp));
+
+  /* Processing variable ncs0 */
+  ncs0 = len(cell_start0);
+  /* Processing variable n1 */
+  n1 = len(cor1);
+  /* Processing variable order1 */
+  order1_Dims[0]=n1;
+  capi_order1_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_order1_tmp = array_from_pyobj(NPY_INT,order1_Dims,order1_Rank,capi_order1_intent,order1_capi);
+  if (capi_order1_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 7th argument `order1' of ext.binning_pair_search to C/Fortran array" );
+  } else {
+    order1 = (int *)(PyArray_DATA(capi_order1_tmp));
+
+  /* Processing variable nn */
+  nn = shape(neighbors,1);
+  /* Processing variable nc */
+  nc = shape(neighbors,0);
+  /* Processing variable m */
+  m = len(pairs);
+  /* Processing variable ncs1 */
+  ncs1 = len(cell_start1);
+  /* Processing variable periodic */
+  periodic = (matrix_capi-Py_None);
+  /* Processing variable n0 */
+  n0 = len(cor0);
+  /* Processing variable cells0 */
+  cells0_Dims[0]=nc;
+  capi_cells0_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_cells0_tmp = array_from_pyobj(NPY_INT,cells0_Dims,cells0_Rank,capi_cells0_intent,cells0_capi);
+  if (capi_cells0_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 9th argument `cells0' of ext.binning_pair_search to C/Fortran array" );
+  } else {
+    cells0 = (int *)(PyArray_DATA(capi_cells0_tmp));
+
+  /* Processing variable deltas */
+  deltas_Dims[0]=m,deltas_Dims[1]=3;
+  capi_deltas_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_deltas_tmp = array_from_pyobj(NPY_DOUBLE,deltas_Dims,deltas_Rank,capi_deltas_intent,deltas_capi);
+  if (capi_deltas_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 13rd argument `deltas' of ext.binning_pair_search to C/Fortran array" );
+  } else {
+    deltas = (double *)(PyArray_DATA(capi_deltas_tmp));
+
+  /* Processing variable distances */
+  distances_Dims[0]=m;
+  capi_distances_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_distances_tmp = array_from_pyobj(NPY_DOUBLE,distances_Dims,distances_Rank,capi_distances_intent,distances_capi);
+  if (capi_distances_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 14th argument `distances' of ext.binning_pair_search to C/Fortran array" );
+  } else {
+    distances = (double *)(PyArray_DATA(capi_distances_tmp));
+
+  /* Processing variable order0 */
+  order0_Dims[0]=n0;
+  capi_order0_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_order0_tmp = array_from_pyobj(NPY_INT,order0_Dims,order0_Rank,capi_order0_intent,order0_capi);
+  if (capi_order0_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 5th argument `order0' of ext.binning_pair_search to C/Fortran array" );
+  } else {
+    order0 = (int *)(PyArray_DATA(capi_order0_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  binning_pair_search_return_value = (*f2py_func)(n0,cor0,n1,cor1,cutoff,intra,periodic,matrix,reciprocal,order0,ncs0,cell_start0,order1,ncs1,cell_start1,nc,nn,cells0,neighbors,progress,m,pairs,deltas,distances);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("i",binning_pair_search_return_value);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_order0_tmp!=order0_capi) {
+    Py_XDECREF(capi_order0_tmp); }
+  }  /*if (capi_order0_tmp == NULL) ... else of order0*/
+  /* End of cleaning variable order0 */
+  if((PyObject *)capi_distances_tmp!=distances_capi) {
+    Py_XDECREF(capi_distances_tmp); }
+  }  /*if (capi_distances_tmp == NULL) ... else of distances*/
+  /* End of cleaning variable distances */
+  if((PyObject *)capi_deltas_tmp!=deltas_capi) {
+    Py_XDECREF(capi_deltas_tmp); }
+  }  /*if (capi_deltas_tmp == NULL) ... else of deltas*/
+  /* End of cleaning variable deltas */
+  if((PyObject *)capi_cells0_tmp!=cells0_capi) {
+    Py_XDECREF(capi_cells0_tmp); }
+  }  /*if (capi_cells0_tmp == NULL) ... else of cells0*/
+  /* End of cleaning variable cells0 */
+  /* End of cleaning variable n0 */
+  /* End of cleaning variable periodic */
+  /* End of cleaning variable ncs1 */
+  /* End of cleaning variable m */
+  /* End of cleaning variable nc */
+  /* End of cleaning variable nn */
+  if((PyObject *)capi_order1_tmp!=order1_capi) {
+    Py_XDECREF(capi_order1_tmp); }
+  }  /*if (capi_order1_tmp == NULL) ... else of order1*/
+  /* End of cleaning variable order1 */
+  /* End of cleaning variable n1 */
+  /* End of cleaning variable ncs0 */
+  if((PyObject *)capi_progress_tmp!=progress_capi) {
+    Py_XDECREF(capi_progress_tmp); }
+  }  /*if (capi_progress_tmp == NULL) ... else of progress*/
+  /* End of cleaning variable progress */
+  }  /*if (f2py_success) of reciprocal init*/
+  if((PyObject *)capi_reciprocal_tmp!=reciprocal_capi) {
+    Py_XDECREF(capi_reciprocal_tmp); }
+  }  /*if (capi_reciprocal_tmp == NULL) ... else of reciprocal*/
+  /* End of cleaning variable reciprocal */
+  }  /*if (f2py_success) of matrix init*/
+  if((PyObject *)capi_matrix_tmp!=matrix_capi) {
+    Py_XDECREF(capi_matrix_tmp); }
+  }  /*if (capi_matrix_tmp == NULL) ... else of matrix*/
+  /* End of cleaning variable matrix */
+  if((PyObject *)capi_pairs_tmp!=pairs_capi) {
+    Py_XDECREF(capi_pairs_tmp); }
+  }  /*if (capi_pairs_tmp == NULL) ... else of pairs*/
+  /* End of cleaning variable pairs */
+  if((PyObject *)capi_cell_start1_tmp!=cell_start1_capi) {
+    Py_XDECREF(capi_cell_start1_tmp); }
+  }  /*if (capi_cell_start1_tmp == NULL) ... else of cell_start1*/
+  /* End of cleaning variable cell_start1 */
+  if((PyObject *)capi_cell_start0_tmp!=cell_start0_capi) {
+    Py_XDECREF(capi_cell_start0_tmp); }
+  }  /*if (capi_cell_start0_tmp == NULL) ... else of cell_start0*/
+  /* End of cleaning variable cell_start0 */
+  } /*if (f2py_success) of intra*/
+  /* End of cleaning variable intra */
+  if((PyObject *)capi_cor1_tmp!=cor1_capi) {
+    Py_XDECREF(capi_cor1_tmp); }
+  }  /*if (capi_cor1_tmp == NULL) ... else of cor1*/
+  /* End of cleaning variable cor1 */
+  if((PyObject *)capi_cor0_tmp!=cor0_capi) {
+    Py_XDECREF(capi_cor0_tmp); }
+  }  /*if (capi_cor0_tmp == NULL) ... else of cor0*/
+  /* End of cleaning variable cor0 */
+  } /*if (f2py_success) of cutoff*/
+  /* End of cleaning variable cutoff */
+  if((PyObject *)capi_neighbors_tmp!=neighbors_capi) {
+    Py_XDECREF(capi_neighbors_tmp); }
+  }  /*if (capi_neighbors_tmp == NULL) ... else of neighbors*/
+  /* End of cleaning variable neighbors */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/************************* end of binning_pair_search *************************/
+
+/************************ unit_cell_get_radius_indexes ************************/
+static char doc_f2py_rout_ext_unit_cell_get_radius_indexes[] = "\
+unit_cell_get_radius_indexes = unit_cell_get_radius_indexes(matrix,reciprocal,radius,max_ranges,indexes)\n\nWrapper for ``unit_cell_get_radius_indexes``.\
+\n\nParameters\n----------\n"
+"matrix : input rank-2 array('d') with bounds (3,3)\n"
+"reciprocal : input rank-2 array('d') with bounds (3,3)\n"
+"radius : input float\n"
+"max_ranges : input rank-1 array('i') with bounds (3)\n"
+"indexes : in/output rank-2 array('i') with bounds (n,3)\n"
+"\nReturns\n-------\n"
+"unit_cell_get_radius_indexes : int";
+/* extern int unit_cell_get_radius_indexes(int,double*,double*,double,int*,int*); */
+static PyObject *f2py_rout_ext_unit_cell_get_radius_indexes(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           int (*f2py_func)(int,double*,double*,double,int*,int*)) {
+  PyObject * volatile capi_buildvalue = NULL;
+  volatile int f2py_success = 1;
+/*decl*/
+
+  int unit_cell_get_radius_indexes_return_value=0;
+  int n = 0;
+  double *matrix = NULL;
+  npy_intp matrix_Dims[2] = {-1, -1};
+  const int matrix_Rank = 2;
+  PyArrayObject *capi_matrix_tmp = NULL;
+  int capi_matrix_intent = 0;
+  PyObject *matrix_capi = Py_None;
+  double *reciprocal = NULL;
+  npy_intp reciprocal_Dims[2] = {-1, -1};
+  const int reciprocal_Rank = 2;
+  PyArrayObject *capi_reciprocal_tmp = NULL;
+  int capi_reciprocal_intent = 0;
+  PyObject *reciprocal_capi = Py_None;
+  double radius = 0;
+  PyObject *radius_capi = Py_None;
+  int *max_ranges = NULL;
+  npy_intp max_ranges_Dims[1] = {-1};
+  const int max_ranges_Rank = 1;
+  PyArrayObject *capi_max_ranges_tmp = NULL;
+  int capi_max_ranges_intent = 0;
+  PyObject *max_ranges_capi = Py_None;
+  int *indexes = NULL;
+  npy_intp indexes_Dims[2] = {-1, -1};
+  const int indexes_Rank = 2;
+  PyArrayObject *capi_indexes_tmp = NULL;
+  int capi_indexes_intent = 0;
+  PyObject *indexes_capi = Py_None;
+  static char *capi_kwlist[] = {"matrix","reciprocal","radius","max_ranges","indexes",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+  if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+    "OOOOO:ext.unit_cell_get_radius_indexes",\
+    capi_kwlist,&matrix_capi,&reciprocal_capi,&radius_capi,&max_ranges_capi,&indexes_capi))
+    return NULL;
+/*frompyobj*/
+  /* Processing variable max_ranges */
+  max_ranges_Dims[0]=3;
+  capi_max_ranges_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_max_ranges_tmp = array_from_pyobj(NPY_INT,max_ranges_Dims,max_ranges_Rank,capi_max_ranges_intent,max_ranges_capi);
+  if (capi_max_ranges_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 4th argument `max_ranges' of ext.unit_cell_get_radius_indexes to C/Fortran array" );
+  } else {
+    max_ranges = (int *)(PyArray_DATA(capi_max_ranges_tmp));
+
+  /* Processing variable radius */
+    f2py_success = double_from_pyobj(&radius,radius_capi,"ext.unit_cell_get_radius_indexes() 3rd argument (radius) can't be converted to double");
+  if (f2py_success) {
+  /* Processing variable matrix */
+  matrix_Dims[0]=3,matrix_Dims[1]=3;
+  capi_matrix_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_matrix_tmp = array_from_pyobj(NPY_DOUBLE,matrix_Dims,matrix_Rank,capi_matrix_intent,matrix_capi);
+  if (capi_matrix_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 1st argument `matrix' of ext.unit_cell_get_radius_indexes to C/Fortran array" );
+  } else {
+    matrix = (double *)(PyArray_DATA(capi_matrix_tmp));
+
+  /* Processing variable reciprocal */
+  reciprocal_Dims[0]=3,reciprocal_Dims[1]=3;
+  capi_reciprocal_intent |= F2PY_INTENT_C|F2PY_INTENT_IN;
+  capi_reciprocal_tmp = array_from_pyobj(NPY_DOUBLE,reciprocal_Dims,reciprocal_Rank,capi_reciprocal_intent,reciprocal_capi);
+  if (capi_reciprocal_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 2nd argument `reciprocal' of ext.unit_cell_get_radius_indexes to C/Fortran array" );
+  } else {
+    reciprocal = (double *)(PyArray_DATA(capi_reciprocal_tmp));
+
+  /* Processing variable indexes */
+  indexes_Dims[1]=3;
+  capi_indexes_intent |= F2PY_INTENT_C|F2PY_INTENT_INOUT;
+  capi_indexes_tmp = array_from_pyobj(NPY_INT,indexes_Dims,indexes_Rank,capi_indexes_intent,indexes_capi);
+  if (capi_indexes_tmp == NULL) {
+    if (!PyErr_Occurred())
+      PyErr_SetString(ext_error,"failed in converting 5th argument `indexes' of ext.unit_cell_get_radius_indexes to C/Fortran array" );
+  } else {
+    indexes = (int *)(PyArray_DATA(capi_indexes_tmp));
+
+  /* Processing variable n */
+  n = shape(indexes,0);
+  CHECKSCALAR(shape(indexes,0)==n,"shape(indexes,0)==n","hidden n","unit_cell_get_radius_indexes:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+  unit_cell_get_radius_indexes_return_value = (*f2py_func)(n,matrix,reciprocal,radius,max_ranges,indexes);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+    if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+    CFUNCSMESS("Building return value.\n");
+    capi_buildvalue = Py_BuildValue("i",unit_cell_get_radius_indexes_return_value);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+    } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(shape(indexes,0)==n)*/
+  /* End of cleaning variable n */
+  if((PyObject *)capi_indexes_tmp!=indexes_capi) {
+    Py_XDECREF(capi_indexes_tmp); }
+  }  /*if (capi_indexes_tmp == NULL) ... else of indexes*/
+  /* End of cleaning variable indexes */
+  if((PyObject *)capi_reciprocal_tmp!=reciprocal_capi) {
+    Py_XDECREF(capi_reciprocal_tmp); }
+  }  /*if (capi_reciprocal_tmp == NULL) ... else of reciprocal*/
+  /* End of cleaning variable reciprocal */
+  if((PyObject *)capi_matrix_tmp!=matrix_capi) {
+    Py_XDECREF(capi_matrix_tmp); }
+  }  /*if (capi_matrix_tmp == NULL) ... else of matrix*/
+  /* End of cleaning variable matrix */
+  } /*if (f2py_success) of radius*/
+  /* End of cleaning variable radius */
+  if((PyObject *)capi_max_ranges_tmp!=max_ranges_capi) {
+    Py_XDECREF(capi_max_ranges_tmp); }
+  }  /*if (capi_max_ranges_tmp == NULL) ... else of max_ranges*/
+  /* End of cleaning variable max_ranges */
+/*end of cleanupfrompyobj*/
+  if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+  } else {
+/*routdebugleave*/
+  }
+  CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+  return capi_buildvalue;
+}
+/******************** end of unit_cell_get_radius_indexes ********************/
+/*eof body*/
+
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
+/*need_f90modhooks*/
+
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+
+/******************* See f2py2e/common_rules.py: buildhooks *******************/
+
+/*need_commonhooks*/
+
+/**************************** See f2py2e/rules.py ****************************/
+
+static FortranDataDef f2py_routine_defs[] = {
+  {"ff_dm_quad",-1,{{-1}},0,(char *)ff_dm_quad,(f2py_init_func)f2py_rout_ext_ff_dm_quad,doc_f2py_rout_ext_ff_dm_quad},
+  {"ff_dm_reci",-1,{{-1}},0,(char *)ff_dm_reci,(f2py_init_func)f2py_rout_ext_ff_dm_reci,doc_f2py_rout_ext_ff_dm_reci},
+  {"ff_pair_reci",-1,{{-1}},0,(char *)ff_pair_reci,(f2py_init_func)f2py_rout_ext_ff_pair_reci,doc_f2py_rout_ext_ff_pair_reci},
+  {"ff_pair_quad",-1,{{-1}},0,(char *)ff_pair_quad,(f2py_init_func)f2py_rout_ext_ff_pair_quad,doc_f2py_rout_ext_ff_pair_quad},
+  {"ff_bond_quad",-1,{{-1}},0,(char *)ff_bond_quad,(f2py_init_func)f2py_rout_ext_ff_bond_quad,doc_f2py_rout_ext_ff_bond_quad},
+  {"ff_bond_hyper",-1,{{-1}},0,(char *)ff_bond_hyper,(f2py_init_func)f2py_rout_ext_ff_bond_hyper,doc_f2py_rout_ext_ff_bond_hyper},
+  {"ff_batch",-1,{{-1}},0,(char *)ff_batch,(f2py_init_func)f2py_rout_ext_ff_batch,doc_f2py_rout_ext_ff_batch},
+  {"ewald_erfc",-1,{{-1}},0,(char *)ewald_erfc,(f2py_init_func)f2py_rout_ext_ewald_erfc,doc_f2py_rout_ext_ewald_erfc},
+  {"clusters_add_pairs",-1,{{-1}},0,(char *)clusters_add_pairs,(f2py_init_func)f2py_rout_ext_clusters_add_pairs,doc_f2py_rout_ext_clusters_add_pairs},
+  {"clusters_get_labels",-1,{{-1}},0,(char *)clusters_get_labels,(f2py_init_func)f2py_rout_ext_clusters_get_labels,doc_f2py_rout_ext_clusters_get_labels},
+  {"graphs_floyd_warshall",-1,{{-1}},0,(char *)graphs_floyd_warshall,(f2py_init_func)f2py_rout_ext_graphs_floyd_warshall,doc_f2py_rout_ext_graphs_floyd_warshall},
+  {"graphs_bfs_dense",-1,{{-1}},0,(char *)graphs_bfs_dense,(f2py_init_func)f2py_rout_ext_graphs_bfs_dense,doc_f2py_rout_ext_graphs_bfs_dense},
+  {"graphs_bfs_sparse",-1,{{-1}},0,(char *)graphs_bfs_sparse,(f2py_init_func)f2py_rout_ext_graphs_bfs_sparse,doc_f2py_rout_ext_graphs_bfs_sparse},
+  {"graphs_bfs",-1,{{-1}},0,(char *)graphs_bfs,(f2py_init_func)f2py_rout_ext_graphs_bfs,doc_f2py_rout_ext_graphs_bfs},
+  {"graphs_bfs_count",-1,{{-1}},0,(char *)graphs_bfs_count,(f2py_init_func)f2py_rout_ext_graphs_bfs_count,doc_f2py_rout_ext_graphs_bfs_count},
+  {"graphs_bfs_part",-1,{{-1}},0,(char *)graphs_bfs_part,(f2py_init_func)f2py_rout_ext_graphs_bfs_part,doc_f2py_rout_ext_graphs_bfs_part},
+  {"molecules_distance_matrix",-1,{{-1}},0,(char *)molecules_distance_matrix,(f2py_init_func)f2py_rout_ext_molecules_distance_matrix,doc_f2py_rout_ext_molecules_distance_matrix},
+  {"molecules_distance_condensed",-1,{{-1}},0,(char *)molecules_distance_condensed,(f2py_init_func)f2py_rout_ext_molecules_distance_condensed,doc_f2py_rout_ext_molecules_distance_condensed},
+  {"similarity_table_labels",-1,{{-1}},0,(char *)similarity_table_labels,(f2py_init_func)f2py_rout_ext_similarity_table_labels,doc_f2py_rout_ext_similarity_table_labels},
+  {"similarity_table_distances",-1,{{-1}},0,(char *)similarity_table_distances,(f2py_init_func)f2py_rout_ext_similarity_table_distances,doc_f2py_rout_ext_similarity_table_distances},
+  {"similarity_measure",-1,{{-1}},0,(char *)similarity_measure,(f2py_init_func)f2py_rout_ext_similarity_measure,doc_f2py_rout_ext_similarity_measure},
+  {"binning_pair_search",-1,{{-1}},0,(char *)binning_pair_search,(f2py_init_func)f2py_rout_ext_binning_pair_search,doc_f2py_rout_ext_binning_pair_search},
+  {"unit_cell_get_radius_indexes",-1,{{-1}},0,(char *)unit_cell_get_radius_indexes,(f2py_init_func)f2py_rout_ext_unit_cell_get_radius_indexes,doc_f2py_rout_ext_unit_cell_get_radius_indexes},
+
+/*eof routine_defs*/
+  {NULL}
+};
+
+static PyMethodDef f2py_module_methods[] = {
+
+  {NULL,NULL}
+};
+
+#if PY_VERSION_HEX >= 0x03000000
+static struct PyModuleDef moduledef = {
+  PyModuleDef_HEAD_INIT,
+  "ext",
+  NULL,
+  -1,
+  f2py_module_methods,
+  NULL,
+  NULL,
+  NULL,
+  NULL
+};
+#endif
+
+#if PY_VERSION_HEX >= 0x03000000
+#define RETVAL m
+PyMODINIT_FUNC PyInit_ext(void) {
+#else
+#define RETVAL
+PyMODINIT_FUNC initext(void) {
+#endif
+  int i;
+  PyObject *m,*d, *s;
+#if PY_VERSION_HEX >= 0x03000000
+  m = ext_module = PyModule_Create(&moduledef);
+#else
+  m = ext_module = Py_InitModule("ext", f2py_module_methods);
+#endif
+  Py_TYPE(&PyFortran_Type) = &PyType_Type;
+  import_array();
+  if (PyErr_Occurred())
+    {PyErr_SetString(PyExc_ImportError, "can't initialize module ext (failed to import numpy)"); return RETVAL;}
+  d = PyModule_GetDict(m);
+  s = PyString_FromString("$Revision: $");
+  PyDict_SetItemString(d, "__version__", s);
+#if PY_VERSION_HEX >= 0x03000000
+  s = PyUnicode_FromString(
+#else
+  s = PyString_FromString(
+#endif
+    "This module 'ext' is auto-generated with f2py (version:2).\nFunctions:\n"
+"  ff_dm_quad = ff_dm_quad(cor,dm0,dmk,amp,gradient,matrix=0,reciprocal=0)\n"
+"  ff_dm_reci = ff_dm_reci(cor,radii,dm0,amp,gradient,matrix=0,reciprocal=0)\n"
+"  ff_pair_reci = ff_pair_reci(cor,pairs,radii,amp,gradient,matrix=0,reciprocal=0)\n"
+"  ff_pair_quad = ff_pair_quad(cor,pairs,lengths,weights,amp,gradient,matrix=0,reciprocal=0)\n"
+"  ff_bond_quad = ff_bond_quad(cor,pairs,lengths,amp,gradient,matrix=0,reciprocal=0)\n"
+"  ff_bond_hyper = ff_bond_hyper(cor,pairs,lengths,scale,amp,gradient,matrix=0,reciprocal=0)\n"
+"  ff_batch(cor,active,atom_offsets,dm_offsets,dm0,dmk,dm,radii,bond_offsets,bond_pairs,bond_lengths,span_offsets,span_pairs,span_lengths,amps,gradient,energies)\n"
+"  y = ewald_erfc(x)\n"
+"  clusters_add_pairs = clusters_add_pairs(parent,rank_bn,pairs)\n"
+"  clusters_get_labels = clusters_get_labels(parent,labels)\n"
+"  graphs_floyd_warshall(dm)\n"
+"  graphs_bfs_dense = graphs_bfs_dense(indptr,indices,dm)\n"
+"  graphs_bfs_sparse = graphs_bfs_sparse(indptr,indices,max_depth,rowptr,columns,distances)\n"
+"  graphs_bfs = graphs_bfs(indptr,indices,source,max_depth,queue,depth)\n"
+"  graphs_bfs_count = graphs_bfs_count(indptr,indices,source,max_depth,limit,queue,depth,counts)\n"
+"  graphs_bfs_part = graphs_bfs_part(indptr,indices,source,mask,hits)\n"
+"  dm = molecules_distance_matrix(cor,matrix=0,reciprocal=0)\n"
+"  condensed = molecules_distance_condensed(cor,matrix=0,reciprocal=0)\n"
+"  labels_table = similarity_table_labels(labels)\n"
+"  distances_table = similarity_table_distances(distance_matrix)\n"
+"  similarity_measure = similarity_measure(labels1,distances1,labels2,distances2,margin,cutoff)\n"
+"  binning_pair_search = binning_pair_search(cor0,cor1,cutoff,intra,order0,cell_start0,order1,cell_start1,cells0,neighbors,progress,pairs,deltas,distances,matrix=0,reciprocal=0)\n"
+"  unit_cell_get_radius_indexes = unit_cell_get_radius_indexes(matrix,reciprocal,radius,max_ranges,indexes)\n"
+".");
+  PyDict_SetItemString(d, "__doc__", s);
+  ext_error = PyErr_NewException ("ext.error", NULL, NULL);
+  Py_DECREF(s);
+  for(i=0;f2py_routine_defs[i].name!=NULL;i++)
+    PyDict_SetItemString(d, f2py_routine_defs[i].name,PyFortranObject_NewAsAttr(&f2py_routine_defs[i]));
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+/*eof initf2pywraphooks*/
+/*eof initf90modhooks*/
+
+/*eof initcommonhooks*/
+
+
+#ifdef F2PY_REPORT_ATEXIT
+  if (! PyErr_Occurred())
+    on_exit(f2py_report_on_exit,(void*)"ext");
+#endif
+
+  return RETVAL;
+}
+#ifdef __cplusplus
+}
+#endif
@@ -73,31 +73,41 @@ double ff_dm_quad(
 }
 
 
+inline double reci_term(
+  int i, int j, int periodic, double *cor, double *radii, double amp,
+  double *gradient, double *matrix, double *reciprocal
+) {
+  double delta[3], d, r0, tmp;
+
+  if (periodic) {
+    d = distance_delta_periodic(cor + 3*i, cor + 3*j, delta, matrix, reciprocal);
+  } else {
+    d = distance_delta(cor + 3*i, cor + 3*j, delta);
+  }
+  r0 = radii[i]+radii[j];
+  if (d >= r0) return 0.0;
+  d /= r0;
+  if (gradient!=NULL) {
+    tmp = amp*(1-1/d/d)/r0/d/r0;
+    add_grad(i, j, tmp, cor, delta, gradient);
+  }
+  return amp*(d-1)*(d-1)/d;
+}
+
+
 double ff_dm_reci(
   int n, int periodic, double *cor, double *radii, int *dm0,
   double amp, double *gradient, double *matrix, double *reciprocal
 ) {
   int i, j;
-  double delta[3], d, r0, tmp, result;
+  double result;
 
   result = 0.0;
   for (i=0; i<n; i++) {
     for (j=0; j<i; j++) {
       if (dm0[i*n+j]>1) {
-        if (periodic) {
-          d = distance_delta_periodic(cor + 3*i, cor + 3*j, delta, matrix, reciprocal);
-        } else {
-          d = distance_delta(cor + 3*i, cor + 3*j, delta);
-        }
-        r0 = radii[i]+radii[j];
-        if (d < r0) {
-            d /= r0;
-            result += amp*(d-1)*(d-1)/d;
-            if (gradient!=NULL) {
-              tmp = amp*(1-1/d/d)/r0/d/r0;
-              add_grad(i, j, tmp, cor, delta, gradient);
-            }
-        }
+        result += reci_term(i, j, periodic, cor, radii, amp, gradient,
+                            matrix, reciprocal);
       }
     }
   }
@@ -105,6 +115,54 @@ double ff_dm_reci(
 }
 
 
+double ff_pair_reci(
+  int m, int n, int periodic, double *cor, int *pairs, double *radii,
+  double amp, double *gradient, double *matrix, double *reciprocal
+) {
+  // Same as ff_dm_reci, but only for the given pairs, e.g. from a
+  // neighbor list. Excluded pairs must already be removed.
+  int p;
+  double result;
+
+  result = 0.0;
+  for (p=0; p<m; p++) {
+    result += reci_term(pairs[2*p], pairs[2*p+1], periodic, cor, radii, amp,
+                        gradient, matrix, reciprocal);
+  }
+  return result;
+}
+
+
+double ff_pair_quad(
+  int m, int n, int periodic, double *cor, int *pairs, double *lengths,
+  double *weights, double amp, double *gradient, double *matrix,
+  double *reciprocal
+) {
+  // Same as ff_dm_quad, but only for the given pairs, with a force constant
+  // for each pair.
+  int p, i, j;
+  double delta[3], d, tmp, result;
+
+  result = 0.0;
+  for (p=0; p<m; p++) {
+    i = pairs[2*p  ];
+    j = pairs[2*p+1];
+    if (periodic) {
+      d = distance_delta_periodic(cor + 3*i, cor + 3*j, delta, matrix, reciprocal);
+    } else {
+      d = distance_delta(cor + 3*i, cor + 3*j, delta);
+    }
+    tmp = d-lengths[p];
+    result += amp*weights[p]*tmp*tmp;
+    if (gradient!=NULL) {
+      tmp = 2*amp*weights[p]*tmp/d;
+      add_grad(i, j, tmp, cor, delta, gradient);
+    }
+  }
+  return result;
+}
+
+
 double ff_bond_quad(
   int m, int n, int periodic, double *cor, int *pairs, double *lengths,
   double amp, double *gradient, double *matrix, double *reciprocal
@@ -159,3 +217,53 @@ double ff_bond_hyper(
   }
   return result;
 }
+
+void ff_batch(
+  int nproblem, int natom, int ndm, int nbond, int nspan, double *cor,
+  int *active, int *atom_offsets, int *dm_offsets, double *dm0, double *dmk,
+  int *dm, double *radii,
+  int *bond_offsets, int *bond_pairs, double *bond_lengths,
+  int *span_offsets, int *span_pairs, double *span_lengths,
+  double *amps, double *gradient, double *energies
+) {
+  // The atoms, distance matrices, bonds and spans of all problems are
+  // concatenated. The offsets arrays have nproblem+1 elements. The pairs
+  // contain global atom indexes. amps contains the parameters dm_quad,
+  // dm_reci, bond_quad, span_quad, bond_hyper and bond_hyper_scale.
+  int p, n, a, d, b0, m0, s0;
+  double result;
+
+  for (p=0; p<nproblem; p++) {
+    if (!active[p]) continue;
+    a = atom_offsets[p];
+    n = atom_offsets[p+1] - a;
+    d = dm_offsets[p];
+    b0 = bond_offsets[p];
+    m0 = bond_offsets[p+1] - b0;
+    s0 = span_offsets[p];
+    result = 0.0;
+    if (amps[0] > 0) {
+      result += ff_dm_quad(n, 0, cor + 3*a, dm0 + d, dmk + d, amps[0],
+                           gradient + 3*a, NULL, NULL);
+    }
+    if (amps[1] != 0) {
+      result += ff_dm_reci(n, 0, cor + 3*a, radii + a, dm + d, amps[1],
+                           gradient + 3*a, NULL, NULL);
+    }
+    if (amps[2] != 0) {
+      result += ff_bond_quad(m0, natom, 0, cor, bond_pairs + 2*b0,
+                             bond_lengths + b0, amps[2], gradient, NULL, NULL);
+    }
+    if (amps[3] != 0) {
+      result += ff_bond_quad(span_offsets[p+1] - s0, natom, 0, cor,
+                             span_pairs + 2*s0, span_lengths + s0, amps[3],
+                             gradient, NULL, NULL);
+    }
+    if (amps[4] != 0) {
+      result += ff_bond_hyper(m0, natom, 0, cor, bond_pairs + 2*b0,
+                              bond_lengths + b0, amps[5], amps[4], gradient,
+                              NULL, NULL);
+    }
+    energies[p] = result;
+  }
+}
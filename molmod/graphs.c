@@ -21,6 +21,10 @@
 //--
 
 
+#include <stdlib.h>
+#include <limits.h>
+
+
 void graphs_floyd_warshall(int n, int* dm) {
   int i, j, k, d_ik, d_kj, d_orig, d_new;
 
@@ -44,3 +48,202 @@ void graphs_floyd_warshall(int n, int* dm) {
     }
   }
 }
+
+
+int graphs_bfs_level(int source, int n, int *indptr, int *indices,
+  int max_depth, int *queue, int *depth) {
+  /* Breadth first search from source, up to the given depth (no limit when
+     max_depth is negative). On entry, all elements of depth must be -1. On
+     exit, queue contains the visited vertices in the order of their distance
+     to the source and depth contains the distances of the visited vertices.
+     The return value is the number of visited vertices. */
+  int head, tail, i, j, k, d;
+  queue[0] = source;
+  depth[source] = 0;
+  head = 0;
+  tail = 1;
+  while (head < tail) {
+    i = queue[head];
+    head++;
+    d = depth[i] + 1;
+    if ((max_depth >= 0) && (d > max_depth)) break;
+    for (k=indptr[i]; k<indptr[i+1]; k++) {
+      j = indices[k];
+      if (depth[j] < 0) {
+        depth[j] = d;
+        queue[tail] = j;
+        tail++;
+      }
+    }
+  }
+  return tail;
+}
+
+
+int graphs_bfs(int n, int nindptr, int *indptr, int nindices, int *indices,
+  int source, int max_depth, int *queue, int *depth) {
+  /* Python interface to graphs_bfs_level */
+  return graphs_bfs_level(source, n, indptr, indices, max_depth, queue, depth);
+}
+
+
+int graphs_bfs_dense(int n, int nindptr, int *indptr, int nindices, int *indices, int *dm) {
+  /* All-pairs shortest paths with a breadth first search from each vertex.
+     Unreachable pairs and the diagonal are set to zero, consistent with
+     graphs_floyd_warshall. The return value is non-zero when memory could not
+     be allocated. */
+  int failed;
+  failed = 0;
+#ifdef _OPENMP
+  #pragma omp parallel
+#endif
+  {
+    int source, i, count;
+    int *queue, *depth;
+    size_t row;
+    queue = malloc(n*sizeof(int));
+    depth = malloc(n*sizeof(int));
+    if ((queue == NULL) || (depth == NULL)) {
+#ifdef _OPENMP
+      #pragma omp atomic
+#endif
+      failed++;
+    }
+    /* All threads must either enter or skip the work-sharing loop, so they
+       first wait until every allocation has been checked. */
+#ifdef _OPENMP
+    #pragma omp barrier
+#endif
+    if (!failed) {
+      for (i=0; i<n; i++) depth[i] = -1;
+#ifdef _OPENMP
+      #pragma omp for schedule(dynamic, 16)
+#endif
+      for (source=0; source<n; source++) {
+        count = graphs_bfs_level(source, n, indptr, indices, -1, queue, depth);
+        /* avoid int overflow of the index for large n */
+        row = (size_t)source*n;
+        for (i=0; i<n; i++) dm[row+i] = 0;
+        for (i=1; i<count; i++) {
+          dm[row+queue[i]] = depth[queue[i]];
+        }
+        for (i=0; i<count; i++) depth[queue[i]] = -1;
+      }
+    }
+    free(queue);
+    free(depth);
+  }
+  return failed != 0;
+}
+
+
+int graphs_bfs_sparse(int n, int nindptr, int *indptr, int nindices, int *indices,
+  int max_depth, int *rowptr, int m, int *columns, int *distances) {
+  /* Shortest paths up to max_depth with a breadth first search from each
+     vertex. The result is stored in compressed sparse row format: the
+     distances from vertex i are stored in columns and distances, from
+     rowptr[i] to rowptr[i+1], sorted by distance. The diagonal is not stored.
+     When the arrays columns and distances, with m elements, are too small,
+     the remaining pairs are only counted. The return value is the total
+     number of pairs, or -1 when memory could not be allocated. */
+  int source, i, count, total;
+  int *queue, *depth;
+  queue = malloc(n*sizeof(int));
+  depth = malloc(n*sizeof(int));
+  if ((queue == NULL) || (depth == NULL)) {
+    free(queue);
+    free(depth);
+    return -1;
+  }
+  for (i=0; i<n; i++) depth[i] = -1;
+  total = 0;
+  for (source=0; source<n; source++) {
+    rowptr[source] = total;
+    count = graphs_bfs_level(source, n, indptr, indices, max_depth, queue, depth);
+    for (i=1; i<count; i++) {
+      if (total < m) {
+        columns[total] = queue[i];
+        distances[total] = depth[queue[i]];
+      }
+      total++;
+    }
+    for (i=0; i<count; i++) depth[queue[i]] = -1;
+  }
+  rowptr[n] = total;
+  free(queue);
+  free(depth);
+  return total;
+}
+
+
+int graphs_bfs_part(int n, int nindptr, int *indptr, int nindices, int *indices,
+  int source, int *mask, int *hits) {
+  /* Breadth first search from source that does not enter border vertices.
+     On entry, border vertices have mask equal to one and all other vertices
+     have mask equal to zero. On exit, the visited vertices have mask equal to
+     two and hits[0] is the number of edges from visited to border vertices.
+     The return value is the number of visited vertices, or -1 when memory
+     could not be allocated. */
+  int head, tail, i, j, k;
+  int *queue;
+  queue = malloc(n*sizeof(int));
+  if (queue == NULL) return -1;
+  mask[source] = 2;
+  queue[0] = source;
+  head = 0;
+  tail = 1;
+  hits[0] = 0;
+  while (head < tail) {
+    i = queue[head];
+    head++;
+    for (k=indptr[i]; k<indptr[i+1]; k++) {
+      j = indices[k];
+      if (mask[j] == 0) {
+        mask[j] = 2;
+        queue[tail] = j;
+        tail++;
+      } else if (mask[j] == 1) {
+        hits[0]++;
+      }
+    }
+  }
+  free(queue);
+  return tail;
+}
+
+
+int graphs_bfs_count(int n, int nindptr, int *indptr, int nindices, int *indices,
+  int source, int max_depth, int limit, int *queue, int *depth, int *counts) {
+  /* Breadth first search from source, up to the given depth (no limit when
+     max_depth is negative), that only enters vertices with an index below
+     limit. Besides the distances, the number of shortest paths from source
+     to each visited vertex is stored in counts. These numbers saturate at
+     INT_MAX/2 to avoid overflow. On entry, all elements of depth must be -1.
+     The return value is the number of visited vertices. */
+  int head, tail, i, j, k, d, c;
+  queue[0] = source;
+  depth[source] = 0;
+  counts[source] = 1;
+  head = 0;
+  tail = 1;
+  while (head < tail) {
+    i = queue[head];
+    head++;
+    d = depth[i] + 1;
+    if ((max_depth >= 0) && (d > max_depth)) break;
+    for (k=indptr[i]; k<indptr[i+1]; k++) {
+      j = indices[k];
+      if (j >= limit) continue;
+      if (depth[j] < 0) {
+        depth[j] = d;
+        counts[j] = counts[i];
+        queue[tail] = j;
+        tail++;
+      } else if (depth[j] == d) {
+        c = counts[j] + counts[i];
+        counts[j] = (c > INT_MAX/2) ? INT_MAX/2 : c;
+      }
+    }
+  }
+  return tail;
+}
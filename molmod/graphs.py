@@ -56,7 +56,7 @@ from molmod.utils import cached, ReadOnly, ReadOnlyAttribute
 
 
 __all__ = [
-    "GraphError", "Graph", "OneToOne", "Match", "Pattern",
+    "GraphError", "Graph", "GraphIndex", "OneToOne", "Match", "Pattern",
     "CriteriaSet", "Anything", "CritOr", "CritAnd", "CritXor", "CritNot",
     "CustomPattern", "EqualPattern", "RingPattern", "GraphSearch",
 ]
@@ -67,6 +67,69 @@ class GraphError(Exception):
     pass
 
 
+# Constants of the splitmix64 finalizer and one seed for each 64-bit lane of
+# the (fast) vertex fingerprints.
+_MIX_SHIFTS = numpy.array([30, 27, 31], numpy.uint64)
+_MIX_FACTORS = numpy.array([0xbf58476d1ce4e5b9, 0x94d049bb133111eb], numpy.uint64)
+_LANE_SEEDS = numpy.array([
+    0x9e3779b97f4a7c15, 0x632be59bd9b4e019, 0x85157af5dc8b4c2f
+], numpy.uint64)
+
+
+def _mix64(x):
+    """Apply the splitmix64 finalizer element-wise to an uint64 array"""
+    x = x ^ (x >> _MIX_SHIFTS[0])
+    x *= _MIX_FACTORS[0]
+    x ^= x >> _MIX_SHIFTS[1]
+    x *= _MIX_FACTORS[1]
+    x ^= x >> _MIX_SHIFTS[2]
+    return x
+
+
+def _sha1_digests(keys):
+    """Return the SHA-1 digests of a list of strings as an (N, 20) byte array
+
+       Duplicate strings are only hashed once.
+    """
+    import hashlib
+    cache = {}
+    digests = []
+    for key in keys:
+        digest = cache.get(key)
+        if digest is None:
+            digest = hashlib.sha1(key).digest()
+            cache[key] = digest
+        digests.append(digest)
+    if len(digests) == 0:
+        return numpy.zeros((0, 20), numpy.ubyte)
+    return numpy.frombuffer("".join(digests), numpy.ubyte).reshape(-1, 20).copy()
+
+
+def _hash_strings(keys, seeds):
+    """Hash a list of strings to an uint64 array with one column per seed"""
+    digests = _sha1_digests(keys)[:, :8].copy()
+    codes = digests.view("<u8").reshape(-1, 1)
+    return _mix64(codes + seeds)
+
+
+class _EdgesAttribute(ReadOnlyAttribute):
+    """The edges attribute of a graph
+
+       When a graph is constructed from an integer array, the tuple of
+       frozensets is only built when the attribute is accessed for the first
+       time.
+    """
+
+    def __get__(self, instance, cls=None):
+        result = ReadOnlyAttribute.__get__(self, instance, cls)
+        if result is None and instance is not None:
+            edge_array = getattr(instance, "_edge_array", None)
+            if edge_array is not None:
+                result = tuple(frozenset(edge) for edge in edge_array.tolist())
+                setattr(instance, self.attribute_name, result)
+        return result
+
+
 class Graph(ReadOnly):
     """An undirected graph, where edges have equal weight
 
@@ -96,7 +159,7 @@ class Graph(ReadOnly):
        >>> # bond orders of ethene
        >>> graph.edge_property = numpy.array([2, 1, 1, 1, 1], int)
     """
-    edges = ReadOnlyAttribute(tuple, none=False, doc="the incidence list")
+    edges = _EdgesAttribute(tuple, none=False, doc="the incidence list")
     num_vertices = ReadOnlyAttribute(int, none=False, doc="the number of vertices")
 
     def __init__(self, edges, num_vertices=None):
@@ -110,27 +173,49 @@ class Graph(ReadOnly):
            num_vertices argument to tell what the total number of vertices is.
 
            If the edges argument does not have the correct format, it will be
-           converted.
+           converted. The edges may also be given as an integer numpy array
+           with shape (M, 2). This array is validated as a whole and the
+           tuple of frozensets is only constructed when the edges attribute is
+           accessed, which makes the construction of large graphs fast.
         """
 
-        tmp = []
-        for edge in edges:
-            if len(edge) != 2:
-                raise TypeError("The edges must be a iterable with 2 elements")
-            i, j = edge
-            if i == j:
-                raise ValueError("A edge must contain two different values.")
-            if not (isinstance(i, int) and isinstance(j, int)):
+        if isinstance(edges, numpy.ndarray):
+            if edges.size == 0:
+                edges = edges.reshape(0, 2)
+            if len(edges.shape) != 2 or edges.shape[1] != 2:
+                raise TypeError("An array of edges must have shape (M, 2).")
+            if not numpy.issubdtype(edges.dtype, numpy.integer):
                 raise TypeError("The edges must contain integers.")
-            if i < 0 or j < 0:
+            if (edges < 0).any():
                 raise TypeError("The edges must contain positive integers.")
-            tmp.append(frozenset([i, j]))
-        edges = tuple(tmp)
-
-        if len(edges) == 0:
-            real_num_vertices = 0
+            if (edges[:, 0] == edges[:, 1]).any():
+                raise ValueError("A edge must contain two different values.")
+            edge_array = edges.astype(int)
+            edge_array.setflags(write=False)
+            if len(edge_array) == 0:
+                real_num_vertices = 0
+            else:
+                real_num_vertices = int(edge_array.max())+1
         else:
-            real_num_vertices = max(max(a, b) for a, b in edges)+1
+            edge_array = None
+            tmp = []
+            for edge in edges:
+                if len(edge) != 2:
+                    raise TypeError("The edges must be a iterable with 2 elements")
+                i, j = edge
+                if i == j:
+                    raise ValueError("A edge must contain two different values.")
+                if not (isinstance(i, int) and isinstance(j, int)):
+                    raise TypeError("The edges must contain integers.")
+                if i < 0 or j < 0:
+                    raise TypeError("The edges must contain positive integers.")
+                tmp.append(frozenset([i, j]))
+            edges = tuple(tmp)
+
+            if len(edges) == 0:
+                real_num_vertices = 0
+            else:
+                real_num_vertices = max(max(a, b) for a, b in edges)+1
         if num_vertices is not None:
             if not isinstance(num_vertices, int):
                 raise TypeError("The optional argument num_vertices must be an "
@@ -140,10 +225,21 @@ class Graph(ReadOnly):
                     "number of vertices deduced from the edge list.")
             real_num_vertices = num_vertices
 
-        self.edges = edges
+        if edge_array is None:
+            self.edges = edges
+        else:
+            self._edge_array = edge_array
         self.num_vertices = real_num_vertices
 
-    num_edges = property(lambda self: len(self.edges),
+    def _get_num_edges(self):
+        """the number of edges in the graph"""
+        edge_array = getattr(self, "_edge_array", None)
+        if edge_array is None:
+            return len(self.edges)
+        else:
+            return len(edge_array)
+
+    num_edges = property(_get_num_edges,
         doc="*Read-only attribute:* the number of edges in the graph.")
 
     def __mul__(self, repeat):
@@ -154,13 +250,8 @@ class Graph(ReadOnly):
         """
         if not isinstance(repeat, int):
             raise TypeError("Can only multiply a graph with an integer")
-        new_edges = []
-        for i in xrange(repeat):
-            for vertex1, vertex2 in self.edges:
-                new_edges.append(frozenset([
-                    vertex1+i*self.num_vertices,
-                    vertex2+i*self.num_vertices
-                ]))
+        offsets = numpy.arange(max(repeat, 0))*self.num_vertices
+        new_edges = (self.edge_array + offsets.reshape(-1, 1, 1)).reshape(-1, 2)
         return Graph(new_edges, self.num_vertices*repeat)
 
     __rmul__ = __mul__
@@ -212,19 +303,130 @@ class Graph(ReadOnly):
         neighbors = dict((key, frozenset(val)) for key, val in neighbors.iteritems())
         return neighbors
 
+    @cached
+    def edge_array(self):
+        """The edges as an integer array with shape (num_edges, 2)"""
+        result = getattr(self, "_edge_array", None)
+        if result is None:
+            result = numpy.array([tuple(edge) for edge in self.edges], int).reshape(-1, 2)
+        return result
+
+    @cached
+    def csr(self):
+        """The adjacency structure in compressed sparse row format
+
+           This is a tuple (indptr, indices, edge_ids) of int32 arrays. The
+           neighbors of vertex i are ``indices[indptr[i]:indptr[i+1]]``, in
+           increasing order, and ``edge_ids`` contains the corresponding
+           indexes in the edges attribute.
+        """
+        edges = self.edge_array
+        heads = numpy.concatenate([edges[:, 0], edges[:, 1]])
+        tails = numpy.concatenate([edges[:, 1], edges[:, 0]])
+        edge_ids = numpy.concatenate([numpy.arange(len(edges))]*2)
+        order = numpy.lexsort([tails, heads])
+        indptr = numpy.zeros(self.num_vertices+1, numpy.int32)
+        indptr[1:] = numpy.bincount(heads, minlength=self.num_vertices).cumsum()
+        return indptr, tails[order].astype(numpy.int32), edge_ids[order].astype(numpy.int32)
+
     @cached
     def distances(self):
-        """The matrix with the all-pairs shortest path lenghts"""
-        from molmod.ext import graphs_floyd_warshall
+        """The matrix with the all-pairs shortest path lenghts
+
+           The distances are computed with a breadth first search from each
+           vertex. Pairs of vertices that are not connected have a zero
+           distance.
+        """
+        from molmod.ext import graphs_bfs_dense
+        indptr, indices = self.csr[:2]
         distances = numpy.zeros((self.num_vertices,)*2, numpy.int32)
-        #distances[:] = -1 # set all -1, which is just a very big integer
-        #distances.ravel()[::len(distances)+1] = 0 # set diagonal to zero
-        for i, j in self.edges: # set edges to one
-            distances[i, j] = 1
-            distances[j, i] = 1
-        graphs_floyd_warshall(distances)
+        if graphs_bfs_dense(indptr, indices, distances) != 0:
+            raise MemoryError("Could not allocate the work arrays for the breadth first search.")
         return distances
 
+    def get_distances(self, max_depth=None):
+        """Return the shortest path lengths, optionally up to a maximum depth
+
+           Optional argument:
+            | ``max_depth``  --  When given, only the path lengths up to this
+                                 value are computed.
+
+           When max_depth is not given, the dense distances attribute is
+           returned. Otherwise, the result is a
+           :class:`molmod.binning.SparseDistanceMatrix` with integer path
+           lengths in the range [1, max_depth]. The memory usage then scales
+           linearly with the number of vertices for graphs with a bounded
+           degree, such as molecular graphs.
+        """
+        if max_depth is None:
+            return self.distances
+        from molmod.ext import graphs_bfs_sparse
+        from molmod.binning import SparseDistanceMatrix
+        indptr, indices = self.csr[:2]
+        rowptr = numpy.zeros(self.num_vertices+1, numpy.int32)
+        size = 8*self.num_vertices + 1
+        while True:
+            columns = numpy.zeros(size, numpy.int32)
+            distances = numpy.zeros(size, numpy.int32)
+            total = graphs_bfs_sparse(indptr, indices, max_depth, rowptr, columns, distances)
+            if total < 0:
+                raise MemoryError("Could not allocate the work arrays for the breadth first search.")
+            if total <= size:
+                break
+            size = total
+        # sort the columns within each row
+        rows = numpy.repeat(numpy.arange(self.num_vertices), rowptr[1:] - rowptr[:-1])
+        order = numpy.lexsort([columns[:total], rows])
+        return SparseDistanceMatrix(self.num_vertices, rowptr, columns[order], distances[order])
+
+    def get_path_counter(self, max_depth):
+        """Return a counter for the shortest paths up to a given length
+
+           Argument:
+            | ``max_depth``  --  the maximum length of the counted paths
+
+           The result is a :class:`molmod.rings.PathCounter` instance that is
+           shared by all callers with the same max_depth.
+        """
+        counters = getattr(self, "_path_counters", None)
+        if counters is None:
+            counters = {}
+            self._path_counters = counters
+        counter = counters.get(max_depth)
+        if counter is None:
+            from molmod.rings import PathCounter
+            counter = PathCounter(self, max_depth)
+            counters[max_depth] = counter
+        return counter
+
+    @cached
+    def cycle_basis(self):
+        """A fundamental cycle basis derived from breadth first search trees
+
+           See :func:`molmod.rings.get_cycle_basis`.
+        """
+        from molmod.rings import get_cycle_basis
+        return get_cycle_basis(self)
+
+    @cached
+    def ring_perception(self):
+        """The smallest set of smallest rings and the relevant cycles
+
+           See :func:`molmod.rings.perceive_rings`.
+        """
+        from molmod.rings import perceive_rings
+        return perceive_rings(self)
+
+    @cached
+    def sssr(self):
+        """The smallest set of smallest rings, a list of integer arrays"""
+        return self.ring_perception[0]
+
+    @cached
+    def relevant_cycles(self):
+        """All rings that are part of some minimum cycle basis"""
+        return self.ring_perception[1]
+
     @cached
     def max_distance(self):
         """The maximum value in the distances matrix."""
@@ -257,21 +459,10 @@ class Graph(ReadOnly):
            vertex in another list. In case of a molecular graph, this would
            yield the atoms that belong to individual molecules.
         """
-        candidates = set(xrange(self.num_vertices))
-
-        result = []
-        while len(candidates) > 0:
-            pivot = candidates.pop()
-            group = [
-                vertex for vertex, distance
-                in self.iter_breadth_first(pivot)
-            ]
-            candidates.difference_update(group)
-
-            # this sort makes sure that the order of the vertices is respected
-            group.sort()
-            result.append(group)
-        return result
+        from molmod.clusters import UnionFind
+        union_find = UnionFind(self.num_vertices)
+        union_find.add_pairs(self.edge_array)
+        return union_find.get_groups()
 
     @cached
     def fingerprint(self):
@@ -317,13 +508,67 @@ class Graph(ReadOnly):
                 level2[vertex] = vertices
         return level2
 
+    @cached
+    def canonical_search(self):
+        """The canonical labeling and the automorphism group generators
+
+           See :func:`molmod.canonical.get_canonical_labeling`.
+        """
+        from molmod.canonical import get_canonical_labeling
+        return get_canonical_labeling(self)
+
+    @cached
+    def canonical_labeling(self):
+        """All vertices in canonical order, an integer array
+
+           Unlike canonical_order, this also includes vertices without edges
+           and no attempt is made to obtain a natural order.
+        """
+        return self.canonical_search[0]
+
+    @cached
+    def automorphism_generators(self):
+        """A list of permutations that generate the automorphism group
+
+           Each permutation is an integer array that maps a vertex to its
+           image.
+        """
+        return self.canonical_search[1]
+
+    @cached
+    def canonical_form(self):
+        """A hashable representation of the graph in canonical order
+
+           Two graphs have the same canonical form if and only if they are
+           isomorphic, taking into account the vertex and edge strings.
+        """
+        labeling = self.canonical_labeling
+        positions = labeling.argsort()
+        edges = positions[self.edge_array]
+        edges.sort(axis=1)
+        return (
+            tuple(self.get_vertex_string(vertex) for vertex in labeling),
+            tuple(sorted(
+                (a, b, self.get_edge_string(i)) for i, (a, b)
+                in enumerate(edges.tolist())
+            )),
+        )
+
     @cached
     def symmetries(self):
-        """Graph symmetries (permutations) that map the graph onto itself."""
+        """Graph symmetries (permutations) that map the graph onto itself.
 
+           The permutations are generated from the automorphism_generators
+           attribute.
+        """
+        if len(self.independent_vertices) != 1:
+            raise ValueError("Symmetries are only computed for connected "
+                             "graphs.")
+        from molmod.canonical import iter_group
         symmetry_cycles = set([])
         symmetries = set([])
-        for match in GraphSearch(EqualPattern(self))(self):
+        for permutation in iter_group(self.num_vertices, self.automorphism_generators):
+            match = EqualMatch(enumerate(permutation.tolist()))
             match.cycles = match.get_closed_cycles()
             if match.cycles in symmetry_cycles:
                 raise RuntimeError("Duplicates in EqualMatch")
@@ -359,6 +604,9 @@ class Graph(ReadOnly):
            nature of the vertices and  their bonds to atoms closer to the center
            will also play a role, but only as a last resort.
         """
+        # The canonical labeling is only used to break the remaining ties.
+        positions = self.canonical_labeling.argsort()
+
         # A) find an appropriate starting vertex.
         # Here we take a central vertex that has a minimal number of symmetrical
         # equivalents, 'the highest atom number', and the highest fingerprint.
@@ -369,6 +617,7 @@ class Graph(ReadOnly):
                 -len(self.equivalent_vertices[vertex]),
                 self.get_vertex_string(vertex),
                 str(buffer(self.vertex_fingerprints[vertex])),
+                -positions[vertex],
                 vertex
             ) for vertex in self.central_vertices
         )[-1]
@@ -378,43 +627,31 @@ class Graph(ReadOnly):
         #      2) number of equivalent vertices
         #      3) vertex string, (higher atom numbers come first)
         #      4) fingerprint
-        #      5) vertex index
+        #      5) position in the canonical labeling
+        #      6) vertex index
         # The last field is only included to collect the result of the sort.
-        # The fingerprint on itself would be sufficient, but the three first are
-        # there to have a naturally appealing result.
+        # The canonical labeling on itself would be sufficient, but the first
+        # four are there to have a naturally appealing result.
         l = [
             [
                 -distance,
                 -len(self.equivalent_vertices[vertex]),
                 self.get_vertex_string(vertex),
                 str(buffer(self.vertex_fingerprints[vertex])),
+                -positions[vertex],
                 vertex
             ] for vertex, distance in self.iter_breadth_first(starting_vertex)
             if len(self.neighbors[vertex]) > 0
         ]
         l.sort(reverse=True)
 
-        # C) The order of some vertices is still not completely set. e.g.
+        # C) The fingerprints do not always fix the order of the vertices. e.g.
         # consider the case of allene. The four hydrogen atoms are equivalent,
         # but one can have two different orders: make geminiles consecutive or
-        # don't. It is more trikcy than one would think at first sight. In the
-        # case of allene, geminility could easily solve the problem. Consider a
-        # big flat rotationally symmetric molecule (order 2). The first five
-        # shells are order 4 and one would just give a random order to four
-        # segemnts in the first shell. Only when one reaches the outer part that
-        # has order two, it turns out that the arbitrary choices in the inner
-        # shell play a role. So it does not help to look at relations with
-        # vertices at inner or current shells only. One has to consider the
-        # whole picture. (unit testing reveals troubles like these)
-
-        # I need some sleep now. The code below checks for potential fuzz and
-        # will raise an error if the ordering is not fully determined yet. One
-        # day, I'll need this code more than I do now, and I'll fix things up.
-        # I know how to do this, but I don't care enough right now.
-        # -- Toon
-        for i in xrange(1, len(l)):
-            if l[i][:-1] == l[i-1][:-1]:
-                raise NotImplementedError
+        # don't. Such ties can not be resolved by looking at relations with
+        # vertices at inner or current shells only. This is why the position in
+        # the canonical labeling, which considers the whole graph, is part of
+        # the sort key above.
 
         # D) Return only the vertex indexes.
         return [record[-1] for record in l]
@@ -434,6 +671,9 @@ class Graph(ReadOnly):
            When duplicate is True, then vertices that can be reached through
            different  paths of equal length, will be iterated twice. This
            typically only makes sense when path==True.
+
+           Without paths and duplicates, the search is carried out at once on
+           the csr attribute and the vertices are yielded afterwards.
         """
         if start is None:
             start = self.central_vertex
@@ -445,6 +685,17 @@ class Graph(ReadOnly):
             if start < 0 or start >= self.num_vertices:
                 raise ValueError("start must be in the range [0, %i[" %
                                  self.num_vertices)
+        if not (do_paths or do_duplicates):
+            from molmod.ext import graphs_bfs
+            indptr, indices = self.csr[:2]
+            queue = numpy.zeros(self.num_vertices, numpy.int32)
+            depth = numpy.zeros(self.num_vertices, numpy.int32)
+            depth[:] = -1
+            count = graphs_bfs(indptr, indices, start, -1, queue, depth)
+            queue = queue[:count]
+            for vertex, distance in zip(queue.tolist(), depth[queue].tolist()):
+                yield vertex, distance
+            return
         from collections import deque
         work = numpy.zeros(self.num_vertices, int)
         work[:] = -1
@@ -561,35 +812,36 @@ class Graph(ReadOnly):
            ``normalize==True``.
         """
         if normalize:
-            revorder = dict((j, i) for i, j in enumerate(subvertices))
-            new_edges = []
-            old_edge_indexes = []
-            for counter, (i, j) in enumerate(self.edges):
-                new_i = revorder.get(i)
-                if new_i is None:
-                    continue
-                new_j = revorder.get(j)
-                if new_j is None:
-                    continue
-                new_edges.append((new_i, new_j))
-                old_edge_indexes.append(counter)
+            subvertices = numpy.array(subvertices, dtype=int).ravel()
+            revorder = numpy.zeros(self.num_vertices, int)
+            revorder[:] = -1
+            revorder[subvertices] = numpy.arange(len(subvertices))
+            # visit the neighbors of the subvertices in the csr structure
+            indptr, indices, edge_ids = self.csr
+            lengths = indptr[subvertices+1] - indptr[subvertices]
+            offsets = numpy.cumsum(lengths) - lengths
+            slots = numpy.arange(lengths.sum()) + numpy.repeat(indptr[subvertices] - offsets, lengths)
+            heads = numpy.repeat(subvertices, lengths)
+            tails = indices[slots]
+            mask = (revorder[tails] >= 0) & (heads < tails)
+            old_edge_indexes = edge_ids[slots[mask]].astype(int)
+            new_edges = revorder[self.edge_array[old_edge_indexes]].reshape(-1, 2)
             # sort the edges
-            order = range(len(new_edges))
-            # argsort in pure python
-            order.sort( key=(lambda i: tuple(sorted(new_edges[i]))) )
-            new_edges = [new_edges[i] for i in order]
-            old_edge_indexes = [old_edge_indexes[i] for i in order]
+            lows = new_edges.min(axis=1)
+            highs = new_edges.max(axis=1)
+            order = numpy.lexsort([highs, lows])
+            new_edges = new_edges[order]
+            old_edge_indexes = old_edge_indexes[order]
 
             result = Graph(new_edges, num_vertices=len(subvertices))
-            result._old_vertex_indexes = numpy.array(subvertices, dtype=int)
+            result._old_vertex_indexes = subvertices
             #result.new_vertex_indexes = revorder
-            result._old_edge_indexes = numpy.array(old_edge_indexes, dtype=int)
+            result._old_edge_indexes = old_edge_indexes
         else:
-            subvertices = set(subvertices)
-            old_edge_indexes = numpy.array([
-                i for i, edge in enumerate(self.edges)
-                if edge.issubset(subvertices)
-            ], dtype=int)
+            mask = numpy.zeros(self.num_vertices, bool)
+            mask[list(subvertices)] = True
+            edges = self.edge_array
+            old_edge_indexes = (mask[edges[:, 0]] & mask[edges[:, 1]]).nonzero()[0]
             new_edges = tuple(self.edges[i] for i in old_edge_indexes)
             result = Graph(new_edges, self.num_vertices)
             result._old_edge_indexes = old_edge_indexes
@@ -597,39 +849,68 @@ class Graph(ReadOnly):
             # same.
         return result
 
-    def get_vertex_fingerprints(self, vertex_strings, edge_strings, num_iter=None):
-        """Return an array with fingerprints for each vertex"""
-        import hashlib
-        def str2array(x):
-            """convert a has string to a numpy array of bytes"""
-            if len(x) == 0:
-                return numpy.zeros(0, numpy.ubyte)
-            else:
-                return numpy.frombuffer(x, numpy.ubyte)
-        hashrow = lambda x: numpy.frombuffer(hashlib.sha1(x.data).digest(), numpy.ubyte)
+    def get_vertex_fingerprints(self, vertex_strings, edge_strings, num_iter=None, stable=False):
+        """Return an array with fingerprints for each vertex
+
+           Arguments:
+            | ``vertex_strings`` -- a string for each vertex, see
+                                    get_vertex_string
+            | ``edge_strings`` -- a string for each edge, see get_edge_string
+
+           Optional arguments:
+            | ``num_iter`` -- the maximum number of iterations
+            | ``stable`` -- when True, the SHA-1 fingerprints of older
+                            versions are reproduced
+
+           The fingerprints are computed with Weisfeiler-Lehman iterations.
+           By default, each iteration hashes the arrays of all vertices at
+           once with a 64-bit mixing function in three lanes. The iterations
+           stop when the partition of the vertices in classes with the same
+           fingerprint no longer gets refined, or after num_iter iterations.
+
+           When stable is True, each vertex is hashed with SHA-1 and exactly
+           num_iter iterations are carried out. The default num_iter is then
+           max_distance, which requires the full distance matrix.
+
+           In both cases, the result is an (N, 20) array of bytes.
+        """
+        a = self.edge_array[:, 0]
+        b = self.edge_array[:, 1]
+        if stable:
+            # initialization
+            result = _sha1_digests(vertex_strings)
+            tmp = _sha1_digests(edge_strings)
+            numpy.add.at(result, a, tmp)
+            numpy.add.at(result, b, tmp)
+            work = result.copy()
+            # iterations
+            if num_iter is None:
+                num_iter = self.max_distance
+            for i in xrange(num_iter):
+                numpy.add.at(work, a, result[b])
+                numpy.add.at(work, b, result[a])
+                result = _sha1_digests([row.tostring() for row in work])
+            return result
+
         # initialization
-        result = numpy.zeros((self.num_vertices, 20), numpy.ubyte)
-        for i in xrange(self.num_vertices):
-            result[i] = hashrow(str2array(vertex_strings[i]))
-        for i in xrange(self.num_edges):
-            a, b = self.edges[i]
-            tmp = hashrow(str2array(edge_strings[i]))
-            result[a] += tmp
-            result[b] += tmp
-        work = result.copy()
+        state = _hash_strings(vertex_strings, _LANE_SEEDS)
+        edge_hashes = _hash_strings(edge_strings, _mix64(_LANE_SEEDS))
+        num_classes = len(numpy.unique(state[:, 0]))
         # iterations
         if num_iter is None:
-            num_iter = self.max_distance
+            num_iter = self.num_vertices
         for i in xrange(num_iter):
-            for a, b in self.edges:
-                work[a] += result[b]
-                work[b] += result[a]
-            #for a in xrange(self.num_vertices):
-            #    for b in xrange(self.num_vertices):
-            #        work[a] += hashrow(result[b]*self.distances[a, b])
-            for a in xrange(self.num_vertices):
-                result[a] = hashrow(work[a])
-        return result
+            work = state.copy()
+            numpy.add.at(work, a, _mix64(state[b] + edge_hashes))
+            numpy.add.at(work, b, _mix64(state[a] + edge_hashes))
+            state = _mix64(work)
+            # the partition can only be refined further if it changed
+            new_num_classes = len(numpy.unique(state[:, 0]))
+            if new_num_classes == num_classes:
+                break
+            num_classes = new_num_classes
+        result = state.astype("<u8").view(numpy.ubyte).reshape(-1, 24)
+        return result[:, :20].copy()
 
     def get_halfs(self, vertex1, vertex2):
         """Split the graph in two halfs by cutting the edge: vertex1-vertex2
@@ -639,42 +920,39 @@ class Graph(ReadOnly):
 
            Returns the vertices in both halfs.
         """
-        vertex1_new = set(self.neighbors[vertex1])
-        vertex1_new.discard(vertex2)
-        vertex1_part = set([vertex1])
-
-        while len(vertex1_new) > 0:
-            pivot = vertex1_new.pop()
-            if pivot == vertex2:
-                raise GraphError("The graph can not be separated in two halfs "
-                                 "by disconnecting vertex1 and vertex2.")
-            pivot_neighbors = set(self.neighbors[pivot])
-            pivot_neighbors -= vertex1_part
-            vertex1_new |= pivot_neighbors
-            vertex1_part.add(pivot)
-
+        mask, hits = self._bfs_part(vertex1, [vertex2])
+        # the only allowed edge to vertex2 is the one that is cut
+        indptr, indices = self.csr[:2]
+        if hits > (indices[indptr[vertex1]:indptr[vertex1+1]] == vertex2).sum():
+            raise GraphError("The graph can not be separated in two halfs "
+                             "by disconnecting vertex1 and vertex2.")
+        vertex1_part = set((mask == 2).nonzero()[0].tolist())
         # find vertex_b_part: easy, is just the rest
-        vertex2_part = set(xrange(self.num_vertices)) - vertex1_part
-
+        vertex2_part = set((mask != 2).nonzero()[0].tolist())
         return vertex1_part, vertex2_part
 
     def get_part(self, vertex_in, vertices_border):
         """List all vertices that are connected to vertex_in, but are not
            included in or 'behind' vertices_border.
         """
-        vertices_new = set(self.neighbors[vertex_in])
-        vertices_part = set([vertex_in])
+        mask = self._bfs_part(vertex_in, vertices_border)[0]
+        return set((mask == 2).nonzero()[0].tolist())
 
-        while len(vertices_new) > 0:
-            pivot = vertices_new.pop()
-            if pivot in vertices_border:
-                continue
-            vertices_part.add(pivot)
-            pivot_neighbors = set(self.neighbors[pivot])
-            pivot_neighbors -= vertices_part
-            vertices_new |= pivot_neighbors
+    def _bfs_part(self, vertex_in, vertices_border):
+        """Breadth first search from vertex_in that does not enter the border
 
-        return vertices_part
+           Returns a mask array, in which the visited vertices are set to 2
+           and the border vertices to 1, and the number of edges between
+           visited and border vertices.
+        """
+        from molmod.ext import graphs_bfs_part
+        indptr, indices = self.csr[:2]
+        mask = numpy.zeros(self.num_vertices, numpy.int32)
+        mask[numpy.array(list(vertices_border), int)] = 1
+        hits = numpy.zeros(1, numpy.int32)
+        if graphs_bfs_part(indptr, indices, vertex_in, mask, hits) < 0:
+            raise MemoryError("Could not allocate the work arrays for the breadth first search.")
+        return mask, hits[0]
 
     def get_halfs_double(self, vertex_a1, vertex_b1, vertex_a2, vertex_b2):
         """Compute the two parts separated by ``(vertex_a1, vertex_b1)`` and ``(vertex_a2, vertex_b2)``
@@ -778,47 +1056,129 @@ class Graph(ReadOnly):
            implement get_vertex_string and get_edge_string to make this method
            aware of the different nature of certain vertices. In case molecules,
            this would make the algorithm sensitive to atom numbers etc.
+
+           The connected components are paired by their canonical form and
+           matched through their canonical labelings.
         """
-        # we need normalize subgraphs because these graphs are used as patterns.
         graphs0 = [
             self.get_subgraph(group, normalize=True)
             for group in self.independent_vertices
         ]
         graphs1 = [
-            other.get_subgraph(group)
+            other.get_subgraph(group, normalize=True)
             for group in other.independent_vertices
         ]
 
         if len(graphs0) != len(graphs1):
             return
 
-        matches = []
+        candidates = {}
+        for graph1 in graphs1:
+            candidates.setdefault(graph1.canonical_form, []).append(graph1)
 
+        result = OneToOne()
         for graph0 in graphs0:
-            pattern = EqualPattern(graph0)
-            found_match = False
-            for i, graph1 in enumerate(graphs1):
-                local_matches = list(GraphSearch(pattern)(graph1, one_match=True))
-                if len(local_matches) == 1:
-                    match = local_matches[0]
-                    # we need to restore the relation between the normalized
-                    # graph0 and its original indexes
-                    old_to_new = OneToOne((
-                        (j, i) for i, j
-                        in enumerate(graph0._old_vertex_indexes)
-                    ))
-                    matches.append(match * old_to_new)
-                    del graphs1[i]
-                    found_match = True
-                    break
-            if not found_match:
+            graphs = candidates.get(graph0.canonical_form)
+            if not graphs:
                 return
+            graph1 = graphs.pop()
+            # we need to restore the relation between the normalized graphs
+            # and their original indexes
+            result.add_relations(zip(
+                graph0._old_vertex_indexes[graph0.canonical_labeling].tolist(),
+                graph1._old_vertex_indexes[graph1.canonical_labeling].tolist(),
+            ))
+        return result
 
-        result = OneToOne()
-        for match in matches:
-            result.add_relations(match.forward.iteritems())
+
+class GraphIndex(object):
+    """A collection of graphs without topological duplicates
+
+       The graphs are stored in buckets based on their fingerprint. Only when
+       a bucket already contains graphs, the canonical forms are compared, such
+       that fingerprint collisions can not result in false duplicates. Insertion
+       and lookup therefore take an amortized constant time per graph.
+
+       Example::
+
+           index = GraphIndex()
+           for molecule in molecules:
+               i, new = index.insert(molecule.graph)
+               if new:
+                   print "Molecule %i is the first of its kind" % i
+    """
+
+    def __init__(self, graphs=None):
+        """
+           Optional argument:
+            | ``graphs``  --  an iterable of graphs that are inserted initially
+        """
+        self.graphs = []
+        self._buckets = {}
+        if graphs is not None:
+            for graph in graphs:
+                self.insert(graph)
+
+    @classmethod
+    def from_file(cls, filename):
+        """Load an index of molecular graphs written with write_to_file"""
+        from molmod.molecular_graphs import MolecularGraph
+        f = file(filename)
+        result = cls(MolecularGraph.from_blob(line.strip()) for line in f)
+        f.close()
         return result
 
+    def __len__(self):
+        return len(self.graphs)
+
+    def __iter__(self):
+        return iter(self.graphs)
+
+    def __contains__(self, graph):
+        return self.lookup(graph) is not None
+
+    def _find(self, graph):
+        """Return the fingerprint key and the index of an isomorphic graph"""
+        key = str(buffer(graph.fingerprint))
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            for index in bucket:
+                if self.graphs[index].canonical_form == graph.canonical_form:
+                    return key, index
+        return key, None
+
+    def lookup(self, graph):
+        """Return the index of a stored graph that is isomorphic with graph
+
+           The result is None when no such graph is present.
+        """
+        return self._find(graph)[1]
+
+    def insert(self, graph):
+        """Add a graph, unless an isomorphic graph is already present
+
+           Returns: ``index, new``. The first is the index of the graph in the
+           collection, the second is True when the graph was not present yet.
+        """
+        key, index = self._find(graph)
+        if index is not None:
+            return index, False
+        index = len(self.graphs)
+        self.graphs.append(graph)
+        self._buckets.setdefault(key, []).append(index)
+        return index, True
+
+    def write_to_file(self, filename):
+        """Write the molecular graphs to a file, one blob per line
+
+           This only works when all graphs are
+           :class:`molmod.molecular_graphs.MolecularGraph` instances.
+        """
+        f = file(filename, "w")
+        for graph in self.graphs:
+            print >> f, graph.blob
+        f.close()
+
 
 # Pattern matching
 
@@ -950,6 +1310,9 @@ class Pattern(object):
 
     # This means that matching vertices must not have equal number of neighbors:
     sub = True
+    # This means that a match can only be complete when all edges returned by
+    # get_new_edges are matched, which enables a look-ahead in the search:
+    lookahead = False
     MatchClass = Match
 
     def iter_initial_relations(self, subject_graph):
@@ -1201,6 +1564,8 @@ class CustomPattern(Pattern):
         self._set_pattern_graph(pattern_graph)
         Pattern.__init__(self)
 
+    lookahead = True
+
     def _set_pattern_graph(self, pattern_graph):
         """Initialize the pattern_graph"""
         self.pattern_graph = pattern_graph
@@ -1237,6 +1602,10 @@ class CustomPattern(Pattern):
             if self.compare(vertex0, vertex1, subject_graph):
                 yield vertex0, vertex1
 
+    def compare(self, vertex0, vertex1, subject_graph):
+        """Test if ``vertex1`` has at least as many neighbors as ``vertex0``"""
+        return len(subject_graph.neighbors[vertex1]) >= len(self.pattern_graph.neighbors[vertex0])
+
     def get_new_edges(self, level):
         """Get new edges from the pattern graph for the graph search algorithm
 
@@ -1446,18 +1815,24 @@ class RingPattern(Pattern):
                 #print "RingPattern.check_next_match: duplicate start", vertex1, match.forward[0]
                 return False
         # can this ever become a strong ring?
+        counter = self._get_path_counter(subject_graph)
         for vertex1 in new_relations.itervalues():
-            paths = list(subject_graph.iter_shortest_paths(vertex1, match.forward[0]))
-            if len(paths) != 1:
+            distance, count = counter(vertex1, match.forward[0])
+            if count != 1:
                 #print "RingPattern.check_next_match: not strong 1"
                 return False
-            if len(paths[0]) != (len(match)+1)/2:
+            if distance != (len(match)-1)/2:
                 #print "RingPattern.check_next_match: not strong 2"
                 return False
         return True
 
+    def _get_path_counter(self, subject_graph):
+        """Return a counter for the shortest paths that fit in a ring"""
+        return subject_graph.get_path_counter(self.max_size/2 + 1)
+
     def complete(self, match, subject_graph):
         """Check the completeness of a ring match"""
+        counter = self._get_path_counter(subject_graph)
         size = len(match)
         # check whether we have an odd strong ring
         if match.forward[size-1] in subject_graph.neighbors[match.forward[size-2]]:
@@ -1468,17 +1843,17 @@ class RingPattern(Pattern):
                 # Count the number of paths between two opposite points in the
                 # ring. Since the ring has an odd number of vertices, each
                 # vertex has two semi-opposite vertices.
-                count = len(list(subject_graph.iter_shortest_paths(
+                count = counter(
                     match.forward[order[i]],
                     match.forward[order[(i+size/2)%size]]
-                )))
+                )[1]
                 if count > 1:
                     ok = False
                     break
-                count = len(list(subject_graph.iter_shortest_paths(
+                count = counter(
                     match.forward[order[i]],
                     match.forward[order[(i+size/2+1)%size]]
-                )))
+                )[1]
                 if count > 1:
                     ok = False
                     break
@@ -1488,26 +1863,25 @@ class RingPattern(Pattern):
                 return True
             #print "RingPattern.complete: no odd ring"
         # check whether we have an even strong ring
-        paths = list(subject_graph.iter_shortest_paths(
-            match.forward[size-1],
-            match.forward[size-2]
-        ))
-        #print "RingPattern.complete: even paths", paths
-        if (size > 3 and len(paths) == 1 and len(paths[0]) == 3) or \
-           (size == 3 and len(paths) == 2 and len(paths[0]) == 3):
-            path = paths[0]
-            if size == 3 and path[1] == match.forward[0]:
-                path = paths[1]
+        distance, count = counter(match.forward[size-1], match.forward[size-2])
+        #print "RingPattern.complete: even paths", distance, count
+        if distance == 2 and ((size > 3 and count == 1) or (size == 3 and count == 2)):
+            # the middle vertex of the (other) shortest path
+            middle = (
+                subject_graph.neighbors[match.forward[size-1]] &
+                subject_graph.neighbors[match.forward[size-2]]
+            ) - set([match.forward[0]])
+            middle = min(middle)
             # we have an even closed cycle. check if this is a strong ring
-            match.add_relation(size, path[1])
+            match.add_relation(size, middle)
             size += 1
             order = range(0, size, 2) + range(size-1, 0, -2)
             ok = True
             for i in xrange(len(order)/2):
-                count = len(list(subject_graph.iter_shortest_paths(
+                count = counter(
                     match.forward[order[i]],
                     match.forward[order[(i+size/2)%size]]
-                )))
+                )[1]
                 if count != 2:
                     ok = False
                     break
@@ -1530,6 +1904,29 @@ class RingPattern(Pattern):
         return False
 
 
+# The graph search and the subject graph in a worker process of a parallel
+# graph search
+_search_worker_state = {}
+
+
+def _init_search_worker(graph_search, subject_graph):
+    """Store the graph search and the subject graph in a worker process"""
+    _search_worker_state["graph_search"] = graph_search
+    _search_worker_state["subject_graph"] = subject_graph
+
+
+def _run_search_task(task):
+    """Return the list of final matches that start with one relation"""
+    vertex0, vertex1, one_match = task
+    graph_search = _search_worker_state["graph_search"]
+    subject_graph = _search_worker_state["subject_graph"]
+    result = []
+    for final_match in graph_search._iter_final_matches(vertex0, vertex1, subject_graph, one_match):
+        result.append(final_match)
+        if one_match: break
+    return result
+
+
 class GraphSearch(object):
     """An algorithm that searches for all matches of a pattern in a graph
 
@@ -1538,18 +1935,38 @@ class GraphSearch(object):
          >>> gs = GraphSearch(pattern)
          >>> for match in gs(graph):
          ...     print match.forward
+
+       At each level, the new relations are constructed one vertex at a time
+       in a depth-first search. The candidates for each new pattern vertex are
+       filtered with :meth:`Pattern.compare` beforehand, the most constrained
+       vertex is related first and partial relations are rejected as soon as
+       a constraint fails or when a subject vertex has too few free neighbors
+       for the next level. The older exhaustive enumeration of all
+       combinations of candidate relations can still be used with
+       ``prune=False``.
+
+       With ``workers=N``, the initial relations are distributed over a pool
+       of N processes. The subject graph is passed once to each worker and
+       the matches are yielded in the same order as in a serial search. The
+       pattern and the matches must be picklable in this case.
     """
 
-    def __init__(self, pattern, debug=False):
+    def __init__(self, pattern, debug=False, prune=True, workers=None):
         """
            Arguments:
             | ``pattern``  --  A Pattern instance, describing the pattern to
                                look for
             | ``debug``  --  When true, debugging info is printed on screen
                              [default=False]
+            | ``prune``  --  When False, the exhaustive enumeration of older
+                             versions is used [default=True]
+            | ``workers``  --  The number of worker processes. When None or
+                               one, the search is serial [default=None]
         """
         self.pattern = pattern
         self.debug = debug
+        self.prune = prune
+        self.workers = workers
 
     def __call__(self, subject_graph, one_match=False):
         """Iterator over all matches of self.pattern in the given graph.
@@ -1560,22 +1977,56 @@ class GraphSearch(object):
             | one_match --  If True, only one match will be returned. This
                             allows certain optimizations.
         """
+        if self.workers is not None and self.workers > 1:
+            for final_match in self._iter_parallel(subject_graph, one_match):
+                yield final_match
+            return
         # Matches are grown iteratively.
         for vertex0, vertex1 in self.pattern.iter_initial_relations(subject_graph):
-            init_match = self.pattern.MatchClass.from_first_relation(vertex0, vertex1)
-            # init_match cotains only one source -> dest relation. starting from
-            # this initial match, the function iter_matches extends the match
-            # in all possible ways and yields the completed matches
-            for canonical_match in self._iter_matches(init_match, subject_graph, one_match):
-                # Some patterns my exclude symmetrically equivalent matches as
-                # to aviod dupplicates. with such a 'canonical' solution,
-                # the pattern is allowed to generate just those symmatrical
-                # duplicates of interest.
-                ifm = self.pattern.iter_final_matches(canonical_match, subject_graph, one_match)
-                for final_match in ifm:
-                    self.print_debug("final_match: %s" % final_match)
+            for final_match in self._iter_final_matches(vertex0, vertex1, subject_graph, one_match):
+                yield final_match
+                if one_match: return
+
+    def _iter_final_matches(self, vertex0, vertex1, subject_graph, one_match):
+        """Iterate over all final matches that start with one relation"""
+        init_match = self.pattern.MatchClass.from_first_relation(vertex0, vertex1)
+        # init_match cotains only one source -> dest relation. starting from
+        # this initial match, the function iter_matches extends the match
+        # in all possible ways and yields the completed matches
+        for canonical_match in self._iter_matches(init_match, subject_graph, one_match):
+            # Some patterns my exclude symmetrically equivalent matches as
+            # to aviod dupplicates. with such a 'canonical' solution,
+            # the pattern is allowed to generate just those symmatrical
+            # duplicates of interest.
+            ifm = self.pattern.iter_final_matches(canonical_match, subject_graph, one_match)
+            for final_match in ifm:
+                self.print_debug("final_match: %s" % final_match)
+                yield final_match
+
+    def _iter_parallel(self, subject_graph, one_match):
+        """Distribute the initial relations over a pool of worker processes
+
+           Each task consists of one initial relation. The results of the
+           tasks are collected in order, such that the matches come out in the
+           same order as in a serial search.
+        """
+        from multiprocessing import Pool
+        relations = list(self.pattern.iter_initial_relations(subject_graph))
+        if len(relations) == 0:
+            return
+        # compute the neighbors before the workers are forked
+        subject_graph.neighbors
+        pool = Pool(self.workers, _init_search_worker, (self, subject_graph))
+        try:
+            chunksize = max(1, len(relations)/(4*self.workers))
+            tasks = [(vertex0, vertex1, one_match) for vertex0, vertex1 in relations]
+            for final_matches in pool.imap(_run_search_task, tasks, chunksize):
+                for final_match in final_matches:
                     yield final_match
                     if one_match: return
+        finally:
+            pool.terminate()
+            pool.join()
 
     def print_debug(self, text, indent=0):
         """Only prints debug info on screen when self.debug == True."""
@@ -1604,8 +2055,97 @@ class GraphSearch(object):
             yield end_vertices0, end_vertices1
 
 
-    def _iter_new_relations(self, init_match, subject_graph, edges0, constraints0, edges1):
+    def _iter_new_relations(self, init_match, subject_graph, edges0, constraints0, edges1, level):
         """Given an onset for a match, iterate over all possible new key-value pairs"""
+        if not self.prune:
+            return self._iter_new_relations_exhaustive(init_match, subject_graph, edges0, constraints0, edges1)
+        # collect the parents of each new vertex in the pattern graph
+        parents = {}
+        for start_vertex0, end_vertex0 in edges0:
+            l = parents.setdefault(end_vertex0, [])
+            l.append(start_vertex0)
+        if len(parents) == 0:
+            return iter([])
+        # the free neighbors of each parent in the subject graph
+        neighbors1 = {}
+        for start_vertex1, end_vertex1 in edges1:
+            l = neighbors1.setdefault(init_match.reverse[start_vertex1], [])
+            l.append(end_vertex1)
+        if not self.pattern.sub:
+            # an exact match is sought, all free neighbors must be related
+            for end_vertices0, end_vertices1 in self._iter_candidate_groups(init_match, edges0, edges1):
+                if len(end_vertices0) != len(end_vertices1):
+                    return iter([])
+        # the candidates for a new vertex are neighbors of all its parents
+        domains = {}
+        for end_vertex0, start_vertices0 in parents.iteritems():
+            domain = neighbors1.get(start_vertices0[0], [])
+            for start_vertex0 in start_vertices0[1:]:
+                others = set(neighbors1.get(start_vertex0, []))
+                domain = [vertex1 for vertex1 in domain if vertex1 in others]
+            domain = [
+                vertex1 for vertex1 in domain
+                if self.pattern.compare(end_vertex0, vertex1, subject_graph)
+            ]
+            if len(domain) == 0:
+                return iter([])
+            domains[end_vertex0] = domain
+        # relate the vertices with the fewest candidates first
+        order = sorted(domains, key=(lambda vertex0: (len(domains[vertex0]), vertex0)))
+        constrained = {}
+        for a0, b0 in constraints0:
+            constrained.setdefault(a0, []).append(b0)
+            constrained.setdefault(b0, []).append(a0)
+        # the number of free neighbors each new vertex needs at the next level
+        num_children = {}
+        if self.pattern.lookahead:
+            for start_vertex0, end_vertex0 in self.pattern.get_new_edges(level+1)[0]:
+                num_children[start_vertex0] = num_children.get(start_vertex0, 0) + 1
+        self.print_debug("domains: %s" % domains)
+
+        forward = {}
+        used = set([])
+
+        def is_feasible(vertex0, vertex1):
+            """Test a new relation against the partial set of relations"""
+            if vertex1 in used:
+                return False
+            neighbors = subject_graph.neighbors[vertex1]
+            for other0 in constrained.get(vertex0, []):
+                other1 = forward.get(other0)
+                if other1 is not None and other1 not in neighbors:
+                    return False
+            required = num_children.get(vertex0, 0)
+            if required > 0:
+                free = 0
+                for neighbor in neighbors:
+                    if not (neighbor in used or neighbor in init_match.reverse):
+                        free += 1
+                if free < required:
+                    return False
+            return True
+
+        def extend(pos=0):
+            """Iterate over all ways to relate the remaining new vertices"""
+            if pos == len(order):
+                self.print_debug("new_relations: %s" % forward)
+                yield forward.copy()
+                return
+            vertex0 = order[pos]
+            for vertex1 in domains[vertex0]:
+                if not is_feasible(vertex0, vertex1):
+                    continue
+                forward[vertex0] = vertex1
+                used.add(vertex1)
+                for result in extend(pos+1):
+                    yield result
+                del forward[vertex0]
+                used.discard(vertex1)
+
+        return extend()
+
+    def _iter_new_relations_exhaustive(self, init_match, subject_graph, edges0, constraints0, edges1):
+        """Iterate over all possible new key-value pairs by trying all combinations"""
         # Count the number of unique edges0[i][1] values. This is also
         # the number of new relations.
         num_new_relations = len(set(j for i, j in edges0))
@@ -1719,7 +2259,7 @@ class GraphSearch(object):
         # whether vertex1[j] also satisfies additional conditions inherent
         # vertex0[i].
         inr = self._iter_new_relations(input_match, subject_graph, edges0,
-                                       constraints0, edges1)
+                                       constraints0, edges1, level)
         for new_relations in inr:
             # for each set of new_relations, construct a next_match and recurse
             next_match = input_match.copy_with_new_relations(new_relations)
@@ -32,6 +32,12 @@ Two auxiliary classes Scalar and Vector3 support most of the mathematical
 operations required to compute the internal coordinates. Additionally they also
 know the chain rule for each operation and can therefore evaluate the
 derivatives simultaneously.
+
+The values of a Scalar may also be arrays, in which case the derivatives have
+the same leading dimensions. This is used by the functions with a _batch
+suffix, e.g. bond_length_batch, that evaluate an internal coordinate for many
+atom tuples and frames at once, with the same formulas as the corresponding
+functions for a single tuple of positions.
 """
 
 import numpy as np
@@ -44,6 +50,10 @@ __all__ = [
     "dihed_cos", "dihed_angle",
     "opbend_cos", "opbend_angle", "opbend_dist",
     "opbend_mcos", "opbend_mangle",
+    "bond_length_batch", "bend_cos_batch", "bend_angle_batch",
+    "dihed_cos_batch", "dihed_angle_batch",
+    "opbend_cos_batch", "opbend_angle_batch", "opbend_dist_batch",
+    "opbend_mcos_batch", "opbend_mangle_batch",
 ]
 
 
@@ -51,6 +61,16 @@ __all__ = [
 # Auxiliary classes
 #
 
+def _expand(value, ndim):
+    """Append ndim axes to a (batch of) value(s) for broadcasting with derivatives"""
+    return np.reshape(value, np.shape(value) + (1,)*ndim)
+
+
+def _outer(a, b):
+    """The outer product of the last axes of a and b, with leading batch axes"""
+    return a[..., :, None]*b[..., None, :]
+
+
 class Scalar(object):
     """A scalar object with optional first and second order derivates
 
@@ -65,7 +85,9 @@ class Scalar(object):
             | ``size`` -- The number of inputs on which this ic depends. e.g. a
                           distance depends on 6 Cartesian coordinates.
             | ``deriv`` -- Consider up to deriv order derivatives. (max=2)
-            | ``value`` -- The initial value.
+            | ``value`` -- The initial value. This may also be an array, in
+                           which case the derivatives get the same leading
+                           dimensions.
             | ``index`` -- If this scalar is one of the input variables, this is
                            its index.
 
@@ -73,20 +95,22 @@ class Scalar(object):
         """
         self.deriv = deriv
         self.size = size
+        if isinstance(value, np.ndarray):
+            value = value.copy()
         self.v = value
+        shape = np.shape(value)
         if deriv > 0:
-            self.d = np.zeros(size, float)
+            self.d = np.zeros(shape + (size,), float)
             if index is not None:
-                self.d[index] = 1
+                self.d[..., index] = 1
         if deriv > 1:
-            self.dd = np.zeros((size, size), float)
+            self.dd = np.zeros(shape + (size, size), float)
         if deriv > 2:
             raise ValueError("This implementation (only) supports up to second order derivatives.")
 
     def copy(self):
         """Return a deep copy"""
-        result = Scalar(self.size, self.deriv)
-        result.v = self.v
+        result = Scalar(self.size, self.deriv, self.v)
         if self.deriv > 0: result.d[:] = self.d[:]
         if self.deriv > 1: result.dd[:] = self.dd[:]
         return result
@@ -132,14 +156,14 @@ class Scalar(object):
         elif isinstance(other, Scalar):
             # trying to avoid temporaries as much as possible
             if self.deriv > 1:
-                self.dd *= other.v
-                self.dd += self.v*other.dd
-                tmp = np.outer(self.d, other.d)
+                self.dd *= _expand(other.v, 2)
+                self.dd += _expand(self.v, 2)*other.dd
+                tmp = _outer(self.d, other.d)
                 self.dd += tmp
-                self.dd += tmp.transpose()
+                self.dd += np.swapaxes(tmp, -1, -2)
             if self.deriv > 0:
-                self.d *= other.v
-                self.d += self.v*other.d
+                self.d *= _expand(other.v, 1)
+                self.d += _expand(self.v, 1)*other.d
             self.v *= other.v
         else:
             raise TypeError("Second argument must be float, int or Scalar")
@@ -161,14 +185,14 @@ class Scalar(object):
             # trying to avoid temporaries as much as possible
             self.v /= other.v
             if self.deriv > 0:
-                self.d -= self.v*other.d
-                self.d /= other.v
+                self.d -= _expand(self.v, 1)*other.d
+                self.d /= _expand(other.v, 1)
             if self.deriv > 1:
-                self.dd -= self.v*other.dd
-                tmp = np.outer(self.d, other.d)
+                self.dd -= _expand(self.v, 2)*other.dd
+                tmp = _outer(self.d, other.d)
                 self.dd -= tmp
-                self.dd -= tmp.transpose()
-                self.dd /= other.v
+                self.dd -= np.swapaxes(tmp, -1, -2)
+                self.dd /= _expand(other.v, 2)
         else:
             raise TypeError("Second argument must be float, int or Scalar")
         return self
@@ -178,9 +202,9 @@ class Scalar(object):
         self.v = 1/self.v
         tmp = self.v**2
         if self.deriv > 1:
-            self.dd[:] = tmp*(2*self.v*np.outer(self.d, self.d) - self.dd)
+            self.dd[:] = _expand(tmp, 2)*(2*_expand(self.v, 2)*_outer(self.d, self.d) - self.dd)
         if self.deriv > 0:
-            self.d[:] = -tmp*self.d[:]
+            self.d[:] = -_expand(tmp, 1)*self.d[:]
 
 
 class Vector3(object):
@@ -195,12 +219,15 @@ class Vector3(object):
             | ``size`` -- The number of inputs on which this ic depends. e.g. a
                           distance depends on 6 Cartesian coordinates.
             | ``deriv`` -- Consider up to deriv order derivatives. (max=2)
-            | ``values`` -- The initial values.
+            | ``values`` -- The initial values. This may also be an array with
+                            shape (..., 3) for a batch of vectors.
             | ``indexes`` -- If this vector is one of the input variables, these
                              are the indexes of the components.
         """
         self.deriv = deriv
         self.size = size
+        if np.ndim(values) > 1:
+            values = values[..., 0], values[..., 1], values[..., 2]
         self.x = Scalar(size, deriv, values[0], indexes[0])
         self.y = Scalar(size, deriv, values[1], indexes[1])
         self.z = Scalar(size, deriv, values[2], indexes[2])
@@ -208,17 +235,9 @@ class Vector3(object):
     def copy(self):
         """Return a deep copy"""
         result = Vector3(self.size, self.deriv)
-        result.x.v = self.x.v
-        result.y.v = self.y.v
-        result.z.v = self.z.v
-        if self.deriv > 0:
-            result.x.d[:] = self.x.d
-            result.y.d[:] = self.y.d
-            result.z.d[:] = self.z.d
-        if self.deriv > 1:
-            result.x.dd[:] = self.x.dd
-            result.y.dd[:] = self.y.dd
-            result.z.dd[:] = self.z.dd
+        result.x = self.x.copy()
+        result.y = self.y.copy()
+        result.z = self.z.copy()
         return result
 
     def __iadd__(self, other):
@@ -247,28 +266,27 @@ class Vector3(object):
 
     def norm(self):
         """Return a Scalar object with the norm of this vector"""
-        result = Scalar(self.size, self.deriv)
-        result.v = np.sqrt(self.x.v**2 + self.y.v**2 + self.z.v**2)
+        result = Scalar(self.size, self.deriv, np.sqrt(self.x.v**2 + self.y.v**2 + self.z.v**2))
         if self.deriv > 0:
-            result.d += self.x.v*self.x.d
-            result.d += self.y.v*self.y.d
-            result.d += self.z.v*self.z.d
-            result.d /= result.v
+            result.d += _expand(self.x.v, 1)*self.x.d
+            result.d += _expand(self.y.v, 1)*self.y.d
+            result.d += _expand(self.z.v, 1)*self.z.d
+            result.d /= _expand(result.v, 1)
         if self.deriv > 1:
-            result.dd += self.x.v*self.x.dd
-            result.dd += self.y.v*self.y.dd
-            result.dd += self.z.v*self.z.dd
+            result.dd += _expand(self.x.v, 2)*self.x.dd
+            result.dd += _expand(self.y.v, 2)*self.y.dd
+            result.dd += _expand(self.z.v, 2)*self.z.dd
             denom = result.v**2
-            result.dd += (1 - self.x.v**2/denom)*np.outer(self.x.d, self.x.d)
-            result.dd += (1 - self.y.v**2/denom)*np.outer(self.y.d, self.y.d)
-            result.dd += (1 - self.z.v**2/denom)*np.outer(self.z.d, self.z.d)
-            tmp = -self.x.v*self.y.v/denom*np.outer(self.x.d, self.y.d)
-            result.dd += tmp+tmp.transpose()
-            tmp = -self.y.v*self.z.v/denom*np.outer(self.y.d, self.z.d)
-            result.dd += tmp+tmp.transpose()
-            tmp = -self.z.v*self.x.v/denom*np.outer(self.z.d, self.x.d)
-            result.dd += tmp+tmp.transpose()
-            result.dd /= result.v
+            result.dd += _expand(1 - self.x.v**2/denom, 2)*_outer(self.x.d, self.x.d)
+            result.dd += _expand(1 - self.y.v**2/denom, 2)*_outer(self.y.d, self.y.d)
+            result.dd += _expand(1 - self.z.v**2/denom, 2)*_outer(self.z.d, self.z.d)
+            tmp = _expand(-self.x.v*self.y.v/denom, 2)*_outer(self.x.d, self.y.d)
+            result.dd += tmp+np.swapaxes(tmp, -1, -2)
+            tmp = _expand(-self.y.v*self.z.v/denom, 2)*_outer(self.y.d, self.z.d)
+            result.dd += tmp+np.swapaxes(tmp, -1, -2)
+            tmp = _expand(-self.z.v*self.x.v/denom, 2)*_outer(self.z.d, self.x.d)
+            result.dd += tmp+np.swapaxes(tmp, -1, -2)
+            result.dd /= _expand(result.v, 2)
         return result
 
 
@@ -426,6 +444,124 @@ def opbend_mcos(rs, deriv=0):
     return _opbend_transform_mean(rs, _opbend_cos_low, deriv)
 
 
+#
+# Batch versions of the internal coordinate functions
+#
+
+
+def _split_batch(rs, size):
+    """Split an array with shape (..., size, 3) into a list of position arrays"""
+    rs = np.asarray(rs, float)
+    if rs.ndim < 2 or rs.shape[-2:] != (size, 3):
+        raise TypeError("The last two dimensions of rs must have shape (%i, 3)." % size)
+    return [rs[..., i, :] for i in xrange(size)]
+
+
+def bond_length_batch(rs, deriv=0):
+    """Compute many bond lengths at once, see :func:`bond_length`
+
+       Arguments:
+        | ``rs``  --  an array with shape (..., 2, 3), the leading dimensions
+                      can be used for different atom pairs, frames, ...
+        | ``deriv``  --  the derivatives to be computed: 0, 1 or 2 [default=0]
+
+       Returns a tuple with an array of values, shape (...), and optionally
+       the gradients, shape (..., 2, 3), and the Hessians, shape
+       (..., 2, 3, 2, 3).
+    """
+    return _bond_transform(_split_batch(rs, 2), _bond_length_low, deriv)
+
+
+def bend_cos_batch(rs, deriv=0):
+    """Compute many bend cosines at once, see :func:`bend_cos`
+
+       Arguments:
+        | ``rs``  --  an array with shape (..., 3, 3)
+        | ``deriv``  --  the derivatives to be computed: 0, 1 or 2 [default=0]
+    """
+    return _bend_transform(_split_batch(rs, 3), _bend_cos_low, deriv)
+
+
+def bend_angle_batch(rs, deriv=0):
+    """Compute many bend angles at once, see :func:`bend_angle`
+
+       Arguments:
+        | ``rs``  --  an array with shape (..., 3, 3)
+        | ``deriv``  --  the derivatives to be computed: 0, 1 or 2 [default=0]
+    """
+    return _bend_transform(_split_batch(rs, 3), _bend_angle_low, deriv)
+
+
+def dihed_cos_batch(rs, deriv=0):
+    """Compute many dihedral cosines at once, see :func:`dihed_cos`
+
+       Arguments:
+        | ``rs``  --  an array with shape (..., 4, 3)
+        | ``deriv``  --  the derivatives to be computed: 0, 1 or 2 [default=0]
+    """
+    return _dihed_transform(_split_batch(rs, 4), _dihed_cos_low, deriv)
+
+
+def dihed_angle_batch(rs, deriv=0):
+    """Compute many dihedral angles at once, see :func:`dihed_angle`
+
+       Arguments:
+        | ``rs``  --  an array with shape (..., 4, 3)
+        | ``deriv``  --  the derivatives to be computed: 0, 1 or 2 [default=0]
+    """
+    return _dihed_transform(_split_batch(rs, 4), _dihed_angle_low, deriv)
+
+
+def opbend_dist_batch(rs, deriv=0):
+    """Compute many out-of-plane distances at once, see :func:`opbend_dist`
+
+       Arguments:
+        | ``rs``  --  an array with shape (..., 4, 3)
+        | ``deriv``  --  the derivatives to be computed: 0, 1 or 2 [default=0]
+    """
+    return _opbend_transform(_split_batch(rs, 4), _opdist_low, deriv)
+
+
+def opbend_cos_batch(rs, deriv=0):
+    """Compute many out-of-plane cosines at once, see :func:`opbend_cos`
+
+       Arguments:
+        | ``rs``  --  an array with shape (..., 4, 3)
+        | ``deriv``  --  the derivatives to be computed: 0, 1 or 2 [default=0]
+    """
+    return _opbend_transform(_split_batch(rs, 4), _opbend_cos_low, deriv)
+
+
+def opbend_angle_batch(rs, deriv=0):
+    """Compute many out-of-plane angles at once, see :func:`opbend_angle`
+
+       Arguments:
+        | ``rs``  --  an array with shape (..., 4, 3)
+        | ``deriv``  --  the derivatives to be computed: 0, 1 or 2 [default=0]
+    """
+    return _opbend_transform(_split_batch(rs, 4), _opbend_angle_low, deriv)
+
+
+def opbend_mangle_batch(rs, deriv=0):
+    """Compute many mean out-of-plane angles at once, see :func:`opbend_mangle`
+
+       Arguments:
+        | ``rs``  --  an array with shape (..., 4, 3)
+        | ``deriv``  --  the derivatives to be computed: 0, 1 or 2 [default=0]
+    """
+    return _opbend_transform_mean(_split_batch(rs, 4), _opbend_angle_low, deriv)
+
+
+def opbend_mcos_batch(rs, deriv=0):
+    """Compute many mean out-of-plane cosines at once, see :func:`opbend_mcos`
+
+       Arguments:
+        | ``rs``  --  an array with shape (..., 4, 3)
+        | ``deriv``  --  the derivatives to be computed: 0, 1 or 2 [default=0]
+    """
+    return _opbend_transform_mean(_split_batch(rs, 4), _opbend_cos_low, deriv)
+
+
 #
 # Transformers
 #
@@ -437,16 +573,16 @@ def _bond_transform(rs, fn_low, deriv):
     v = result[0]
     if deriv == 0:
         return v,
-    d = np.zeros((2, 3), float)
-    d[0] = result[1]
-    d[1] = -result[1]
+    d = np.zeros(np.shape(v) + (2, 3), float)
+    d[..., 0, :] = result[1]
+    d[..., 1, :] = -result[1]
     if deriv == 1:
         return v, d
-    dd = np.zeros((2, 3, 2, 3), float)
-    dd[0, :, 0, :] = result[2]
-    dd[1, :, 1, :] = result[2]
-    dd[0, :, 1, :] = -result[2]
-    dd[1, :, 0, :] = -result[2]
+    dd = np.zeros(np.shape(v) + (2, 3, 2, 3), float)
+    dd[..., 0, :, 0, :] = result[2]
+    dd[..., 1, :, 1, :] = result[2]
+    dd[..., 0, :, 1, :] = -result[2]
+    dd[..., 1, :, 0, :] = -result[2]
     if deriv == 2:
         return v, d, dd
     raise ValueError("deriv must be 0, 1 or 2.")
@@ -459,26 +595,26 @@ def _bend_transform(rs, fn_low, deriv):
     v = result[0]
     if deriv == 0:
         return v,
-    d = np.zeros((3, 3), float)
-    d[0] = result[1][:3]
-    d[1] = -result[1][:3]-result[1][3:]
-    d[2] = result[1][3:]
+    d = np.zeros(np.shape(v) + (3, 3), float)
+    d[..., 0, :] = result[1][..., :3]
+    d[..., 1, :] = -result[1][..., :3]-result[1][..., 3:]
+    d[..., 2, :] = result[1][..., 3:]
     if deriv == 1:
         return v, d
-    dd = np.zeros((3, 3, 3, 3), float)
-    aa = result[2][:3, :3]
-    ab = result[2][:3, 3:]
-    ba = result[2][3:, :3]
-    bb = result[2][3:, 3:]
-    dd[0, :, 0, :] =   aa
-    dd[0, :, 1, :] = - aa - ab
-    dd[0, :, 2, :] =   ab
-    dd[1, :, 0, :] = - aa - ba
-    dd[1, :, 1, :] =   aa + ba + ab + bb
-    dd[1, :, 2, :] = - ab - bb
-    dd[2, :, 0, :] =   ba
-    dd[2, :, 1, :] = - ba - bb
-    dd[2, :, 2, :] =   bb
+    dd = np.zeros(np.shape(v) + (3, 3, 3, 3), float)
+    aa = result[2][..., :3, :3]
+    ab = result[2][..., :3, 3:]
+    ba = result[2][..., 3:, :3]
+    bb = result[2][..., 3:, 3:]
+    dd[..., 0, :, 0, :] =   aa
+    dd[..., 0, :, 1, :] = - aa - ab
+    dd[..., 0, :, 2, :] =   ab
+    dd[..., 1, :, 0, :] = - aa - ba
+    dd[..., 1, :, 1, :] =   aa + ba + ab + bb
+    dd[..., 1, :, 2, :] = - ab - bb
+    dd[..., 2, :, 0, :] =   ba
+    dd[..., 2, :, 1, :] = - ba - bb
+    dd[..., 2, :, 2, :] =   bb
     if deriv == 2:
         return v, d, dd
     raise ValueError("deriv must be 0, 1 or 2.")
@@ -492,43 +628,43 @@ def _dihed_transform(rs, fn_low, deriv):
     v = result[0]
     if deriv == 0:
         return v,
-    d = np.zeros((4, 3), float)
-    d[0] = result[1][:3]
-    d[1] = -result[1][:3]-result[1][3:6]
-    d[2] = result[1][3:6]-result[1][6:]
-    d[3] = result[1][6:]
+    d = np.zeros(np.shape(v) + (4, 3), float)
+    d[..., 0, :] = result[1][..., :3]
+    d[..., 1, :] = -result[1][..., :3]-result[1][..., 3:6]
+    d[..., 2, :] = result[1][..., 3:6]-result[1][..., 6:]
+    d[..., 3, :] = result[1][..., 6:]
     if deriv == 1:
         return v, d
-    dd = np.zeros((4, 3, 4, 3), float)
-    aa = result[2][:3, :3]
-    ab = result[2][:3, 3:6]
-    ac = result[2][:3, 6:]
-    ba = result[2][3:6, :3]
-    bb = result[2][3:6, 3:6]
-    bc = result[2][3:6, 6:]
-    ca = result[2][6:, :3]
-    cb = result[2][6:, 3:6]
-    cc = result[2][6:, 6:]
-
-    dd[0, :, 0, :] =   aa
-    dd[0, :, 1, :] = - aa - ab
-    dd[0, :, 2, :] =   ab - ac
-    dd[0, :, 3, :] =   ac
-
-    dd[1, :, 0, :] = - aa - ba
-    dd[1, :, 1, :] =   aa + ba + ab + bb
-    dd[1, :, 2, :] = - ab - bb + ac + bc
-    dd[1, :, 3, :] = - ac - bc
-
-    dd[2, :, 0, :] =   ba - ca
-    dd[2, :, 1, :] = - ba + ca - bb + cb
-    dd[2, :, 2, :] =   bb - cb - bc + cc
-    dd[2, :, 3, :] =   bc - cc
-
-    dd[3, :, 0, :] =   ca
-    dd[3, :, 1, :] = - ca - cb
-    dd[3, :, 2, :] =   cb - cc
-    dd[3, :, 3, :] =   cc
+    dd = np.zeros(np.shape(v) + (4, 3, 4, 3), float)
+    aa = result[2][..., :3, :3]
+    ab = result[2][..., :3, 3:6]
+    ac = result[2][..., :3, 6:]
+    ba = result[2][..., 3:6, :3]
+    bb = result[2][..., 3:6, 3:6]
+    bc = result[2][..., 3:6, 6:]
+    ca = result[2][..., 6:, :3]
+    cb = result[2][..., 6:, 3:6]
+    cc = result[2][..., 6:, 6:]
+
+    dd[..., 0, :, 0, :] =   aa
+    dd[..., 0, :, 1, :] = - aa - ab
+    dd[..., 0, :, 2, :] =   ab - ac
+    dd[..., 0, :, 3, :] =   ac
+
+    dd[..., 1, :, 0, :] = - aa - ba
+    dd[..., 1, :, 1, :] =   aa + ba + ab + bb
+    dd[..., 1, :, 2, :] = - ab - bb + ac + bc
+    dd[..., 1, :, 3, :] = - ac - bc
+
+    dd[..., 2, :, 0, :] =   ba - ca
+    dd[..., 2, :, 1, :] = - ba + ca - bb + cb
+    dd[..., 2, :, 2, :] =   bb - cb - bc + cc
+    dd[..., 2, :, 3, :] =   bc - cc
+
+    dd[..., 3, :, 0, :] =   ca
+    dd[..., 3, :, 1, :] = - ca - cb
+    dd[..., 3, :, 2, :] =   cb - cc
+    dd[..., 3, :, 3, :] =   cc
     if deriv == 2:
         return v, d, dd
     raise ValueError("deriv must be 0, 1 or 2.")
@@ -542,43 +678,43 @@ def _opbend_transform(rs, fn_low, deriv):
     v = result[0]
     if deriv == 0:
         return v,
-    d = np.zeros((4, 3), float)
-    d[0] = -result[1][:3]-result[1][3:6]-result[1][6:]
-    d[1] = result[1][:3]
-    d[2] = result[1][3:6]
-    d[3] = result[1][6:]
+    d = np.zeros(np.shape(v) + (4, 3), float)
+    d[..., 0, :] = -result[1][..., :3]-result[1][..., 3:6]-result[1][..., 6:]
+    d[..., 1, :] = result[1][..., :3]
+    d[..., 2, :] = result[1][..., 3:6]
+    d[..., 3, :] = result[1][..., 6:]
     if deriv == 1:
         return v, d
-    dd = np.zeros((4, 3, 4, 3), float)
-    aa = result[2][:3, :3]
-    ab = result[2][:3, 3:6]
-    ac = result[2][:3, 6:]
-    ba = result[2][3:6, :3]
-    bb = result[2][3:6, 3:6]
-    bc = result[2][3:6, 6:]
-    ca = result[2][6:, :3]
-    cb = result[2][6:, 3:6]
-    cc = result[2][6:, 6:]
-
-    dd[0, :, 0, :] =   aa + ab + ac + ba + bb + bc + ca + cb + cc
-    dd[0, :, 1, :] = - aa - ba - ca
-    dd[0, :, 2, :] = - ab - bb - cb
-    dd[0, :, 3, :] = - ac - bc - cc
-
-    dd[1, :, 0, :] = - aa - ab - ac
-    dd[1, :, 1, :] =   aa
-    dd[1, :, 2, :] =   ab
-    dd[1, :, 3, :] =   ac
-
-    dd[2, :, 0, :] = - ba - bb - bc
-    dd[2, :, 1, :] =   ba
-    dd[2, :, 2, :] =   bb
-    dd[2, :, 3, :] =   bc
-
-    dd[3, :, 0, :] = - ca - cb - cc
-    dd[3, :, 1, :] =   ca
-    dd[3, :, 2, :] =   cb
-    dd[3, :, 3, :] =   cc
+    dd = np.zeros(np.shape(v) + (4, 3, 4, 3), float)
+    aa = result[2][..., :3, :3]
+    ab = result[2][..., :3, 3:6]
+    ac = result[2][..., :3, 6:]
+    ba = result[2][..., 3:6, :3]
+    bb = result[2][..., 3:6, 3:6]
+    bc = result[2][..., 3:6, 6:]
+    ca = result[2][..., 6:, :3]
+    cb = result[2][..., 6:, 3:6]
+    cc = result[2][..., 6:, 6:]
+
+    dd[..., 0, :, 0, :] =   aa + ab + ac + ba + bb + bc + ca + cb + cc
+    dd[..., 0, :, 1, :] = - aa - ba - ca
+    dd[..., 0, :, 2, :] = - ab - bb - cb
+    dd[..., 0, :, 3, :] = - ac - bc - cc
+
+    dd[..., 1, :, 0, :] = - aa - ab - ac
+    dd[..., 1, :, 1, :] =   aa
+    dd[..., 1, :, 2, :] =   ab
+    dd[..., 1, :, 3, :] =   ac
+
+    dd[..., 2, :, 0, :] = - ba - bb - bc
+    dd[..., 2, :, 1, :] =   ba
+    dd[..., 2, :, 2, :] =   bb
+    dd[..., 2, :, 3, :] =   bc
+
+    dd[..., 3, :, 0, :] = - ca - cb - cc
+    dd[..., 3, :, 1, :] =   ca
+    dd[..., 3, :, 2, :] =   cb
+    dd[..., 3, :, 3, :] =   cc
     if deriv == 2:
         return v, d, dd
     raise ValueError("deriv must be 0, 1 or 2.")
@@ -587,9 +723,10 @@ def _opbend_transform(rs, fn_low, deriv):
 def _opbend_transform_mean(rs, fn_low, deriv=0):
     """Compute the mean of the 3 opbends
     """
+    shape = np.shape(rs[0])[:-1]
     v = 0.0
-    d = np.zeros((4,3), float)
-    dd = np.zeros((4,3,4,3), float)
+    d = np.zeros(shape + (4,3), float)
+    dd = np.zeros(shape + (4,3,4,3), float)
     #loop over the 3 cyclic permutations
     for p in np.array([[0,1,2], [2,0,1], [1,2,0]]):
         opbend = _opbend_transform([rs[p[0]], rs[p[1]], rs[p[2]], rs[3]], fn_low, deriv)
@@ -599,30 +736,30 @@ def _opbend_transform_mean(rs, fn_low, deriv=0):
         index2 = np.where(p==2)[0][0]
         index3 = 3
         if deriv>0:
-            d[0] += opbend[1][index0]/3
-            d[1] += opbend[1][index1]/3
-            d[2] += opbend[1][index2]/3
-            d[3] += opbend[1][index3]/3
+            d[..., 0, :] += opbend[1][..., index0, :]/3
+            d[..., 1, :] += opbend[1][..., index1, :]/3
+            d[..., 2, :] += opbend[1][..., index2, :]/3
+            d[..., 3, :] += opbend[1][..., index3, :]/3
         if deriv>1:
-            dd[0, :, 0, :] += opbend[2][index0, :, index0, :]/3
-            dd[0, :, 1, :] += opbend[2][index0, :, index1, :]/3
-            dd[0, :, 2, :] += opbend[2][index0, :, index2, :]/3
-            dd[0, :, 3, :] += opbend[2][index0, :, index3, :]/3
-
-            dd[1, :, 0, :] += opbend[2][index1, :, index0, :]/3
-            dd[1, :, 1, :] += opbend[2][index1, :, index1, :]/3
-            dd[1, :, 2, :] += opbend[2][index1, :, index2, :]/3
-            dd[1, :, 3, :] += opbend[2][index1, :, index3, :]/3
-
-            dd[2, :, 0, :] += opbend[2][index2, :, index0, :]/3
-            dd[2, :, 1, :] += opbend[2][index2, :, index1, :]/3
-            dd[2, :, 2, :] += opbend[2][index2, :, index2, :]/3
-            dd[2, :, 3, :] += opbend[2][index2, :, index3, :]/3
-
-            dd[3, :, 0, :] += opbend[2][index3, :, index0, :]/3
-            dd[3, :, 1, :] += opbend[2][index3, :, index1, :]/3
-            dd[3, :, 2, :] += opbend[2][index3, :, index2, :]/3
-            dd[3, :, 3, :] += opbend[2][index3, :, index3, :]/3
+            dd[..., 0, :, 0, :] += opbend[2][..., index0, :, index0, :]/3
+            dd[..., 0, :, 1, :] += opbend[2][..., index0, :, index1, :]/3
+            dd[..., 0, :, 2, :] += opbend[2][..., index0, :, index2, :]/3
+            dd[..., 0, :, 3, :] += opbend[2][..., index0, :, index3, :]/3
+
+            dd[..., 1, :, 0, :] += opbend[2][..., index1, :, index0, :]/3
+            dd[..., 1, :, 1, :] += opbend[2][..., index1, :, index1, :]/3
+            dd[..., 1, :, 2, :] += opbend[2][..., index1, :, index2, :]/3
+            dd[..., 1, :, 3, :] += opbend[2][..., index1, :, index3, :]/3
+
+            dd[..., 2, :, 0, :] += opbend[2][..., index2, :, index0, :]/3
+            dd[..., 2, :, 1, :] += opbend[2][..., index2, :, index1, :]/3
+            dd[..., 2, :, 2, :] += opbend[2][..., index2, :, index2, :]/3
+            dd[..., 2, :, 3, :] += opbend[2][..., index2, :, index3, :]/3
+
+            dd[..., 3, :, 0, :] += opbend[2][..., index3, :, index0, :]/3
+            dd[..., 3, :, 1, :] += opbend[2][..., index3, :, index1, :]/3
+            dd[..., 3, :, 2, :] += opbend[2][..., index3, :, index2, :]/3
+            dd[..., 3, :, 3, :] += opbend[2][..., index3, :, index3, :]/3
     if deriv==0:
         return v,
     elif deriv==1:
@@ -693,18 +830,31 @@ def _dihed_angle_low(av, bv, cv, deriv):
     c /= c.norm()
     result = dot(a, c).results()
     # avoid trobles with the gradients by either using arccos or arcsin
-    if abs(result[0]) < 0.5:
-        # if the cosine is far away for -1 or +1, it is safe to take the arccos
-        # and fix the sign of the angle.
-        sign = 1-(np.linalg.det([av, bv, cv]) > 0)*2
-        return _cos_to_angle(result, deriv, sign)
+    if np.ndim(result[0]) == 0:
+        if abs(result[0]) < 0.5:
+            # if the cosine is far away for -1 or +1, it is safe to take the
+            # arccos and fix the sign of the angle.
+            sign = 1-(np.linalg.det([av, bv, cv]) > 0)*2
+            return _cos_to_angle(result, deriv, sign)
+        else:
+            # if the cosine is close to -1 or +1, it is better to compute the
+            # sine, take the arcsin and fix the sign of the angle
+            d = cross(b, a)
+            side = (result[0] > 0)*2-1 # +1 means angle in range [-pi/2,pi/2]
+            result = dot(d, c).results()
+            return _sin_to_angle(result, deriv, side)
     else:
-        # if the cosine is close to -1 or +1, it is better to compute the sine,
-        # take the arcsin and fix the sign of the angle
+        # a batch: compute both and select the appropriate one for each element
+        sign = 1-(np.linalg.det(np.stack([av, bv, cv], axis=-2)) > 0)*2
+        result_cos = _cos_to_angle(result, deriv, sign)
         d = cross(b, a)
-        side = (result[0] > 0)*2-1 # +1 means angle in range [-pi/2,pi/2]
-        result = dot(d, c).results()
-        return _sin_to_angle(result, deriv, side)
+        side = (result[0] > 0)*2-1
+        result_sin = _sin_to_angle(dot(d, c).results(), deriv, side)
+        mask = abs(result[0]) < 0.5
+        return tuple(
+            np.where(_expand(mask, np.ndim(x) - mask.ndim), x, y)
+            for x, y in zip(result_cos, result_sin)
+        )
 
 
 def _opdist_low(av, bv, cv, deriv):
@@ -730,13 +880,13 @@ def _opbend_cos_low(a, b, c, deriv):
     result = temp.copy()
     result.v = np.sqrt(1.0-temp.v**2)
     if result.deriv > 0:
-        result.d *= -temp.v
-        result.d /= result.v
+        result.d *= _expand(-temp.v, 1)
+        result.d /= _expand(result.v, 1)
     if result.deriv > 1:
-        result.dd *= -temp.v
-        result.dd /= result.v
-        temp2 = np.array([temp.d]).transpose()*temp.d
-        temp2 /= result.v**3
+        result.dd *= _expand(-temp.v, 2)
+        result.dd /= _expand(result.v, 2)
+        temp2 = _outer(temp.d, temp.d)
+        temp2 /= _expand(result.v**3, 2)
         result.dd -= temp2
     return result.results()
 
@@ -744,7 +894,7 @@ def _opbend_cos_low(a, b, c, deriv):
 def _opbend_angle_low(a, b, c, deriv=0):
     """Similar to opbend_angle, but with relative vectors"""
     result = _opbend_cos_low(a, b, c, deriv)
-    sign = np.sign(np.linalg.det([a, b, c]))
+    sign = np.sign(np.linalg.det(np.stack([a, b, c], axis=-2)))
     return _cos_to_angle(result, deriv, sign)
 
 
@@ -758,17 +908,15 @@ def _cos_to_angle(result, deriv, sign=1):
     v = np.arccos(np.clip(result[0], -1, 1))
     if deriv == 0:
         return v*sign,
-    if abs(result[0]) >= 1:
-        factor1 = 0
-    else:
-        factor1 = -1.0/np.sqrt(1-result[0]**2)
-    d = factor1*result[1]
+    inside = abs(result[0]) < 1
+    factor1 = np.where(inside, -1.0/np.sqrt(1-np.where(inside, result[0], 0)**2), 0)
+    d = _expand(factor1, 1)*result[1]
     if deriv == 1:
-        return v*sign, d*sign
+        return v*sign, d*_expand(sign, 1)
     factor2 = result[0]*factor1**3
-    dd = factor2*np.outer(result[1], result[1]) + factor1*result[2]
+    dd = _expand(factor2, 2)*_outer(result[1], result[1]) + _expand(factor1, 2)*result[2]
     if deriv == 2:
-        return v*sign, d*sign, dd*sign
+        return v*sign, d*_expand(sign, 1), dd*_expand(sign, 2)
     raise ValueError("deriv must be 0, 1 or 2.")
 
 
@@ -776,24 +924,16 @@ def _sin_to_angle(result, deriv, side=1):
     """Convert a sine and its derivatives to an angle and its derivatives"""
     v = np.arcsin(np.clip(result[0], -1, 1))
     sign = side
-    if sign == -1:
-        if v < 0:
-            offset = -np.pi
-        else:
-            offset = np.pi
-    else:
-        offset = 0.0
+    offset = np.where(sign == -1, np.where(v < 0, -np.pi, np.pi), 0.0)
     if deriv == 0:
         return v*sign + offset,
-    if abs(result[0]) >= 1:
-        factor1 = 0
-    else:
-        factor1 = 1.0/np.sqrt(1-result[0]**2)
-    d = factor1*result[1]
+    inside = abs(result[0]) < 1
+    factor1 = np.where(inside, 1.0/np.sqrt(1-np.where(inside, result[0], 0)**2), 0)
+    d = _expand(factor1, 1)*result[1]
     if deriv == 1:
-        return v*sign + offset, d*sign
+        return v*sign + offset, d*_expand(sign, 1)
     factor2 = result[0]*factor1**3
-    dd = factor2*np.outer(result[1], result[1]) + factor1*result[2]
+    dd = _expand(factor2, 2)*_outer(result[1], result[1]) + _expand(factor1, 2)*result[2]
     if deriv == 2:
-        return v*sign + offset, d*sign, dd*sign
+        return v*sign + offset, d*_expand(sign, 1), dd*_expand(sign, 2)
     raise ValueError("deriv must be 0, 1 or 2.")
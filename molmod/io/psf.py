@@ -38,11 +38,8 @@
 import numpy
 from molmod.periodic import periodic
 from molmod.units import unified
-from molmod.graphs import CriteriaSet, GraphSearch
-from molmod.molecular_graphs import MolecularGraph, BondPattern, \
-    BendingAnglePattern, DihedralAnglePattern, OutOfPlanePattern, \
-    HasNumNeighbors
-from molmod.graphs import Graph
+from molmod.molecular_graphs import MolecularGraph
+from molmod.graphs import Graph, GraphIndex
 from molmod.io.common import FileFormatError
 
 
@@ -76,7 +73,7 @@ class PSFFile(object):
         self.dihedrals = numpy.zeros((0, 4), int)
         self.impropers = numpy.zeros((0, 4), int)
 
-        self.name_cache = {}
+        self.name_index = GraphIndex()
 
     def read_from_file(self, filename):
         """Load a PSF file"""
@@ -152,12 +149,7 @@ class PSFFile(object):
         if group is not None:
             graph = graph.get_subgraph(group, normalize=True)
 
-        fingerprint = str(buffer(graph.fingerprint))
-        name = self.name_cache.get(fingerprint)
-        if name is None:
-            name = "NM%02i" % len(self.name_cache)
-            self.name_cache[fingerprint] = name
-        return name
+        return "NM%02i" % self.name_index.insert(graph)[0]
 
     def write_to_file(self, filename):
         """Write the data structure to a file"""
@@ -325,70 +317,28 @@ class PSFFile(object):
 
     def _add_graph_bonds(self, molecular_graph, offset, atom_types, molecule):
         # add bonds
-        match_generator = GraphSearch(BondPattern([CriteriaSet()]))
-        tmp = [(
-            match.get_destination(0),
-            match.get_destination(1),
-        ) for match in match_generator(molecular_graph)]
-        tmp.sort()
-        new = len(tmp)
-        if new > 0:
-            prev = len(self.bonds)
-            self.bonds.resize((prev + len(tmp), 2))
-            self.bonds[-len(tmp):] = tmp
-            self.bonds[-len(tmp):] += offset
+        self.bonds = self._append_tuples(self.bonds, molecular_graph.bonds, offset)
 
     def _add_graph_bends(self, molecular_graph, offset, atom_types, molecule):
         # add bends
-        match_generator = GraphSearch(BendingAnglePattern([CriteriaSet()]))
-        tmp = [(
-            match.get_destination(0),
-            match.get_destination(1),
-            match.get_destination(2),
-        ) for match in match_generator(molecular_graph)]
-        tmp.sort()
-        new = len(tmp)
-        if new > 0:
-            prev = len(self.bends)
-            self.bends.resize((prev + len(tmp), 3))
-            self.bends[-len(tmp):] = tmp
-            self.bends[-len(tmp):] += offset
+        self.bends = self._append_tuples(self.bends, molecular_graph.bends, offset)
 
     def _add_graph_dihedrals(self, molecular_graph, offset, atom_types, molecule):
         # add dihedrals
-        match_generator = GraphSearch(DihedralAnglePattern([CriteriaSet()]))
-        tmp = [(
-            match.get_destination(0),
-            match.get_destination(1),
-            match.get_destination(2),
-            match.get_destination(3),
-        ) for match in match_generator(molecular_graph)]
-        tmp.sort()
-        new = len(tmp)
-        if new > 0:
-            prev = len(self.dihedrals)
-            self.dihedrals.resize((prev + len(tmp), 4))
-            self.dihedrals[-len(tmp):] = tmp
-            self.dihedrals[-len(tmp):] += offset
+        self.dihedrals = self._append_tuples(self.dihedrals, molecular_graph.dihedrals, offset)
 
     def _add_graph_impropers(self, molecular_graph, offset, atom_types, molecule):
         # add improper dihedrals, only when center has three bonds
-        match_generator = GraphSearch(OutOfPlanePattern([CriteriaSet(
-            vertex_criteria={0: HasNumNeighbors(3)},
-        )], vertex_tags={1:1}))
-        tmp = [(
-            match.get_destination(0),
-            match.get_destination(1),
-            match.get_destination(2),
-            match.get_destination(3),
-        ) for match in match_generator(molecular_graph)]
-        tmp.sort()
-        new = len(tmp)
-        if new > 0:
-            prev = len(self.impropers)
-            self.impropers.resize((prev + len(tmp), 4))
-            self.impropers[-len(tmp):] = tmp
-            self.impropers[-len(tmp):] += offset
+        tmp = molecular_graph.out_of_planes
+        indptr = molecular_graph.csr[0]
+        tmp = tmp[indptr[tmp[:, 0]+1] - indptr[tmp[:, 0]] == 3]
+        self.impropers = self._append_tuples(self.impropers, tmp, offset)
+
+    def _append_tuples(self, tuples, new_tuples, offset):
+        """Return the tuples extended with new_tuples, shifted by offset"""
+        if len(new_tuples) == 0:
+            return tuples
+        return numpy.concatenate([tuples, new_tuples + offset])
 
     def get_graph(self):
         """Return the bond graph represented by the data structure"""
@@ -47,6 +47,10 @@
        )
        print "optimum", minimizer.x, fun(minimizer.x)
 
+   The line search can be skipped with the :class:`FIRE` search direction and
+   ``line_search=None``. Each iteration then needs only one evaluation of the
+   function and its gradient.
+
    The signature of the function ``fun`` must always be the same as in the
    example. The first argument. ``x`` is mandatory and contains a 1D numpy array
    with function arguments. The second argument, ``do_gradient`` is optional
@@ -65,9 +69,11 @@ import numpy as np, time
 
 __all__ = [
     "SearchDirection", "SteepestDescent", "ConjugateGradient", "QuasiNewton",
+    "LBFGS", "FIRE",
     "LineSearch", "GoldenLineSearch", "NewtonLineSearch",
     "Preconditioner", "DiagonalPreconditioner", "FullPreconditioner",
     "ConvergenceCondition", "StopLossCondition", "Constraints", "Minimizer",
+    "BatchMinimizer",
     "check_anagrad", "check_delta", "compute_fd_hessian",
 ]
 
@@ -230,6 +236,184 @@ class QuasiNewton(SearchDirection):
         return self.status == "SD"
 
 
+class LBFGS(SearchDirection):
+    """The limited-memory BFGS method
+
+       Instead of a dense inverse Hessian, only the last few steps and gradient
+       changes are kept. The direction is computed with the two-loop recursion
+       of Nocedal, which takes O(history*N) time and memory. This makes the
+       method suitable for problems with many unknowns, where
+       :class:`QuasiNewton` becomes too expensive.
+
+       Pairs of steps and gradient changes with a non-positive curvature are
+       skipped. The direction reverts to steepest descent after a reset or when
+       the recursion does not give a descent direction.
+    """
+    def __init__(self, history=10):
+        """
+           Optional argument:
+            | ``history``  --  the number of previous steps that are used to
+                               approximate the inverse Hessian [default=10]
+        """
+        if history < 1:
+            raise ValueError("The history must contain at least one step.")
+        self.history = history
+        # the current search direction
+        self.direction = None
+        # the current gradient
+        self.gradient = None
+        # the last steps (s), gradient changes (y) and 1/(s.y)
+        self.pairs = []
+        SearchDirection.__init__(self)
+
+    def update(self, gradient, step):
+        """Update the search direction given the latest gradient and step"""
+        gradient_old = self.gradient
+        self.gradient = gradient
+        if gradient_old is not None and step is not None:
+            y = gradient - gradient_old
+            sy = np.dot(step, y)
+            if sy > 1e-10*np.sqrt(np.dot(step, step)*np.dot(y, y)):
+                self.pairs.append((step, y, 1.0/sy))
+                if len(self.pairs) > self.history:
+                    del self.pairs[0]
+        if len(self.pairs) == 0:
+            self._update_sd()
+        else:
+            self._update_lbfgs()
+
+    def reset(self):
+        """Reset the internal state of the search direction algorithm"""
+        self.gradient = None
+        self.pairs = []
+
+    def is_sd(self):
+        """Return True if the last direction was steepest descent"""
+        return self.status == "SD"
+
+    def _update_lbfgs(self):
+        """Compute the direction with the two-loop recursion"""
+        q = self.gradient.copy()
+        alphas = []
+        for s, y, rho in reversed(self.pairs):
+            alpha = rho*np.dot(s, q)
+            q -= alpha*y
+            alphas.append(alpha)
+        # scale the initial inverse Hessian with the latest curvature
+        s, y, rho = self.pairs[-1]
+        q *= 1.0/(rho*np.dot(y, y))
+        for (s, y, rho), alpha in zip(self.pairs, reversed(alphas)):
+            beta = rho*np.dot(y, q)
+            q += (alpha - beta)*s
+        if np.dot(q, self.gradient) <= 0:
+            self.pairs = []
+            self._update_sd()
+        else:
+            self.direction = -q
+            self.status = "LB"
+
+    def _update_sd(self):
+        """Set the direction to minus the gradient"""
+        self.direction = -self.gradient
+        self.status = "SD"
+
+
+class FIRE(SearchDirection):
+    """The fast inertial relaxation engine
+
+       The unknowns are treated as particles with a unit mass that move under
+       the force (minus the gradient), while the velocity is gradually turned
+       towards the force. As long as the force and the velocity point in the
+       same direction, the time step grows. When the power becomes negative,
+       the particles are stopped and the time step is reduced. See:
+
+           E. Bitzek, P. Koskinen, F. Gahler, M. Moseler and P. Gumbsch,
+           "Structural relaxation made simple", Phys. Rev. Lett. 97, 170201
+           (2006)
+
+       The direction is the complete step of one time step, such that no line
+       search is needed. Use this class in combination with
+       ``line_search=None`` in the :class:`Minimizer`. Each iteration then
+       costs only one function and gradient evaluation.
+    """
+    def __init__(self, dt=0.1, dt_max=1.0, max_step=None, n_min=5,
+                 f_inc=1.1, f_dec=0.5, alpha_start=0.1, f_alpha=0.99):
+        """
+           Optional arguments:
+            | ``dt``  --  the initial time step [default=0.1]
+            | ``dt_max``  --  the maximum time step [default=1.0]
+            | ``max_step``  --  the maximum norm of a step. Longer steps are
+                                scaled down. [default=None]
+            | ``n_min``  --  the number of steps with a positive power before
+                             the time step is increased [default=5]
+            | ``f_inc``  --  the factor to increase the time step [default=1.1]
+            | ``f_dec``  --  the factor to decrease the time step [default=0.5]
+            | ``alpha_start``  --  the initial mixing of the force into the
+                                   velocity [default=0.1]
+            | ``f_alpha``  --  the factor to decrease the mixing [default=0.99]
+        """
+        self.dt_start = dt
+        self.dt_max = dt_max
+        self.max_step = max_step
+        self.n_min = n_min
+        self.f_inc = f_inc
+        self.f_dec = f_dec
+        self.alpha_start = alpha_start
+        self.f_alpha = f_alpha
+        # the current step
+        self.direction = None
+        # the current velocities
+        self.velocity = None
+        self.dt = dt
+        self.alpha = alpha_start
+        # the number of steps since the last negative power
+        self.num_positive = 0
+        SearchDirection.__init__(self)
+
+    def update(self, gradient, step):
+        """Update the search direction given the latest gradient and step"""
+        force = -gradient
+        if self.velocity is None:
+            self.velocity = np.zeros(len(force), float)
+            self.status = "SD"
+        else:
+            power = np.dot(force, self.velocity)
+            if power > 0:
+                force_norm = np.linalg.norm(force)
+                if force_norm > 0:
+                    self.velocity = (1 - self.alpha)*self.velocity + \
+                        (self.alpha*np.linalg.norm(self.velocity)/force_norm)*force
+                if self.num_positive > self.n_min:
+                    self.dt = min(self.dt*self.f_inc, self.dt_max)
+                    self.alpha *= self.f_alpha
+                self.num_positive += 1
+                self.status = "FI"
+            else:
+                self.velocity = np.zeros(len(force), float)
+                self.dt *= self.f_dec
+                self.alpha = self.alpha_start
+                self.num_positive = 0
+                self.status = "SD"
+        # semi-implicit Euler step
+        self.velocity = self.velocity + self.dt*force
+        self.direction = self.dt*self.velocity
+        if self.max_step is not None:
+            norm = np.linalg.norm(self.direction)
+            if norm > self.max_step:
+                self.direction *= self.max_step/norm
+
+    def reset(self):
+        """Reset the internal state of the search direction algorithm"""
+        self.velocity = None
+        self.dt = self.dt_start
+        self.alpha = self.alpha_start
+        self.num_positive = 0
+
+    def is_sd(self):
+        """Return True if the last direction was steepest descent"""
+        return self.status == "SD"
+
+
 phi = 0.5*(1+np.sqrt(5))
 
 
@@ -1309,7 +1493,10 @@ class Minimizer(object):
             | ``x_init``  --  the initial guess for the minimum
             | ``fun``  --  function to be minimized (see below)
             | ``search_direction``  --  a SearchDirection object
-            | ``line_search``  --  a LineSearch object
+            | ``line_search``  --  a LineSearch object, or None when the
+                                   search direction is a FIRE object. In the
+                                   latter case, the direction is used as the
+                                   step without a line search.
             | ``convergence_condition``  --  a ConvergenceCondition object
             | ``stop_loss_condition``  --  a StopLossCondition object
 
@@ -1346,6 +1533,8 @@ class Minimizer(object):
         """
         if len(x_init.shape)!=1:
             raise ValueError("The unknowns must be stored in a plain row vector.")
+        if (line_search is None) != isinstance(search_direction, FIRE):
+            raise ValueError("A line search must be given, unless the search direction is FIRE.")
         # self.x always contains the current parameters
         self.x = x_init.copy()
         if isinstance(fun, Preconditioner):
@@ -1423,7 +1612,10 @@ class Minimizer(object):
             # Keep a copy of the last function value to make sure there is no
             # increase.
             self.last_f = self.f
-        line_success = self._line_opt()
+        if self.line_search is None:
+            line_success = self._free_step()
+        else:
+            line_success = self._line_opt()
         if not line_success:
             self._screen("Line search failed", newline=True)
             if self.search_direction.is_sd():
@@ -1563,11 +1755,354 @@ class Minimizer(object):
             self._reset_state()
             return False
 
+    def _free_step(self):
+        """Take the current direction as the step, without a line search"""
+        step = self.search_direction.direction
+        if self.constraints is not None:
+            try:
+                step = self.constraints.project(self.x, step)
+            except ConstraintError:
+                self._screen("CONSTRAINT PROJECT FAILED", newline=True)
+                return False
+        if (step == 0).all():
+            return False
+        self.step = step
+        self.x = self.x + self.step
+        self._screen(" ")
+        return True
+
     def _reset_state(self):
         """Reset of the internal state of the function"""
         self.fun(self.x) # reset the internal state of the function
 
 
+class BatchMinimizer(object):
+    """Minimizes many independent functions in lock-step
+
+       All problems have the same number of unknowns and are stored as rows of
+       a two-dimensional array. Each iteration carries out the conjugate
+       gradient method with a Newton line search, as in the
+       :class:`Minimizer`, but all function evaluations of the active
+       problems are combined into a single call of a vectorized function.
+       Every problem has its own step size and conjugate direction, and drops
+       out of the iterations as soon as it has converged or lost track.
+       Preconditioners and constraints are not supported.
+    """
+
+    def __init__(self, x_init, fun, line_search, convergence_condition,
+                 stop_loss_condition, sizes=None, epsilon=1e-6, verbose=True,
+                 callback=None, initial_step_size=1.0):
+        """
+           Arguments:
+            | ``x_init``  --  the initial guesses, an array with shape (K, n)
+                              for K problems with n unknowns
+            | ``fun``  --  the vectorized function to be minimized (see below)
+            | ``line_search``  --  a NewtonLineSearch object, whose parameters
+                                   are used for the line searches of all
+                                   problems
+            | ``convergence_condition``  --  a ConvergenceCondition object
+            | ``stop_loss_condition``  --  a StopLossCondition object
+
+           Optional arguments:
+            | ``sizes``  --  the actual number of unknowns of each problem. This
+                             is used to compute the RMS values of the step and
+                             the gradient when the rows are padded with
+                             unknowns that do not affect the function.
+                             [default=n for all problems]
+            | ``epsilon``  --  a small value compared to expected changes in the
+                               unknowns [default=1e-6]. It is used to compute
+                               curvatures along the line.
+            | ``verbose``  --  print progress information on screen
+                               [default=True]
+            | ``callback``  --  optional callback routine after each iteration.
+                                the callback routine gets the minimizer as first
+                                and only argument. [default=None]
+            | ``initial_step_size``  --  The initial step size for the back
+                                         tracking in the line search.
+
+           The function ``fun`` takes a mandatory argument ``x`` and two
+           optional arguments ``do_gradient`` and ``mask``:
+            | ``x``  --  the unknowns of all problems, shape (K, n)
+            | ``do_gradient``  --  when False, only the function values are
+                                   returned. when True, a 2-tuple with the
+                                   function values (shape K) and the gradients
+                                   (shape (K, n)) are returned [default=False]
+            | ``mask``  --  a boolean array with K elements. Only the problems
+                            with a True value must be computed. The results for
+                            other problems are ignored. [default=None]
+
+           After the minimization, the attribute ``success`` is a boolean array
+           that indicates which problems have converged.
+        """
+        if len(x_init.shape) != 2:
+            raise ValueError("The unknowns must be stored in a two-dimensional array.")
+        if not isinstance(line_search, NewtonLineSearch):
+            raise ValueError("The batch minimizer only supports the NewtonLineSearch.")
+        self.x = x_init.copy()
+        self.fun = fun
+        self.line_search = line_search
+        self.convergence_condition = convergence_condition
+        self.stop_loss_condition = stop_loss_condition
+        if sizes is None:
+            self.sizes = np.zeros(len(self.x), float) + self.x.shape[1]
+        else:
+            self.sizes = np.array(sizes, float)
+        self.epsilon = epsilon
+        self.verbose = verbose
+        self.callback = callback
+        self.initial_step_size = initial_step_size
+
+        # the current function values
+        self.f = None
+        # the current gradients
+        self.gradient = None
+        # the current steps
+        self.step = None
+
+        if self.convergence_condition is not None:
+            self._run()
+
+    def get_final(self):
+        """Return the final solutions"""
+        return self.x
+
+    def _run(self):
+        """Run the iterative optimizer"""
+        self.initialize()
+        while self.active.any():
+            self.propagate()
+        return self.success
+
+    def initialize(self):
+        self.counter = 0
+        num_problems = len(self.x)
+        self.active = np.ones(num_problems, bool)
+        self.success = np.zeros(num_problems, bool)
+        self.f, self.gradient = self.fun(self.x, do_gradient=True, mask=self.active)
+        self.step = np.zeros(self.x.shape, float)
+        self.step_sizes = np.zeros(num_problems, float) + self.initial_step_size
+        # state of the conjugate gradient method of each problem
+        self.direction = np.zeros(self.x.shape, float)
+        self.gradient_old = np.zeros(self.x.shape, float)
+        self.do_sd = np.ones(num_problems, bool)
+        self.is_sd = np.ones(num_problems, bool)
+        # state of the stop loss condition of each problem
+        self.fn_lowest = self.f.copy()
+        self.grad_rms_lowest = np.sqrt((self.gradient**2).sum(axis=1)/self.sizes)
+        self.last_end = time.clock()
+
+    def propagate(self):
+        rows = self.active.nonzero()[0]
+        self._update_directions(rows)
+        if self.counter % 20 == 0:
+            self._print_header()
+        # perform the line searches
+        directions = self.direction[rows]
+        norms = np.sqrt((directions**2).sum(axis=1))
+        search = norms > 0
+        success = np.zeros(len(rows), bool)
+        wolfe = np.zeros(len(rows), bool)
+        step = np.zeros(directions.shape, float)
+        if search.any():
+            axis = directions[search]/norms[search].reshape(-1, 1)
+            success[search], wolfe[search], qopt = \
+                self._line_opt(rows[search], axis)
+            step[search] = qopt.reshape(-1, 1)*axis
+        # update the problems with a successful line search
+        moved = rows[success]
+        self.step[moved] = step[success]
+        self.step_sizes[moved] = np.sqrt((self.step[moved]**2).sum(axis=1))
+        self.x[moved] += self.step[moved]
+        # a line search without Wolfe conditions, or a failure after a
+        # conjugate direction, results in a steepest descent step.
+        self.do_sd[rows[~(success & wolfe)]] = True
+        failed = rows[~success & self.is_sd[rows]]
+        self.active[failed] = False
+        # compute the gradient at the new points
+        rows = self.active.nonzero()[0]
+        if len(rows) > 0:
+            f, gradient = self.fun(self.x, do_gradient=True, mask=self.active)
+            self.f[rows] = f[rows]
+            self.gradient[rows] = gradient[rows]
+            converged = self._check_convergence(rows)
+            self.success[rows[converged]] = True
+            self.active[rows[converged]] = False
+            rows = rows[~converged]
+            lost = self._check_stop_loss(rows)
+            self.active[rows[lost]] = False
+        # print some stuff on screen
+        end = time.clock()
+        self._screen("% 5i  % 6i  % 6i  % 6i  %5.2f" % (
+            self.counter, self.active.sum(), self.success.sum(), len(failed),
+            end - self.last_end
+        ))
+        self.last_end = end
+        # call back
+        if self.callback is not None:
+            self.callback(self)
+        self.counter += 1
+
+    def _update_directions(self, rows):
+        """Compute the conjugate gradient directions (Polak-Ribiere)"""
+        gradient = self.gradient[rows]
+        gradient_old = self.gradient_old[rows]
+        do_sd = self.do_sd[rows]
+        norms_old = (gradient_old**2).sum(axis=1)
+        norms_old[do_sd] = 1.0
+        beta = (gradient*(gradient - gradient_old)).sum(axis=1)/norms_old
+        do_sd |= beta < 0
+        beta[do_sd] = 0.0
+        self.direction[rows] = self.direction[rows]*beta.reshape(-1, 1) - gradient
+        self.gradient_old[rows] = gradient
+        self.is_sd[rows] = do_sd
+        self.do_sd[rows] = False
+
+    def _line(self, rows, axis, q, do_gradient=True):
+        """Evaluate the line functions of some problems
+
+           Arguments:
+            | ``rows``  --  the problems that are evaluated
+            | ``axis``  --  the unit vectors along the lines
+            | ``q``  --  the positions on the lines
+        """
+        x = self.x.copy()
+        x[rows] += q.reshape(-1, 1)*axis
+        mask = np.zeros(len(x), bool)
+        mask[rows] = True
+        if do_gradient:
+            f, gradient = self.fun(x, do_gradient=True, mask=mask)
+            return f[rows], (gradient[rows]*axis).sum(axis=1)
+        else:
+            return self.fun(x, do_gradient=False, mask=mask)[rows]
+
+    def _line_opt(self, rows, axis):
+        """Perform the line searches of some problems in lock-step
+
+           This is a vectorized version of :class:`NewtonLineSearch`. Returns
+           the arrays ``success``, ``wolfe`` and ``qopt``.
+        """
+        c1 = self.line_search.c1
+        c2 = self.line_search.c2
+        max_iter = self.line_search.max_iter
+        qmax = self.line_search.qmax
+        epsilon = self.epsilon
+        size = len(rows)
+        f0 = self.f[rows]
+        g0 = (self.gradient[rows]*axis).sum(axis=1)
+        # the curvature along the lines
+        gl = self._line(rows, axis, np.zeros(size) - 0.5*epsilon)[1]
+        gh = self._line(rows, axis, np.zeros(size) + 0.5*epsilon)[1]
+        h1 = (gh - gl)/epsilon
+        # Newton steps for the lines with a positive curvature
+        q1 = np.zeros(size, float)
+        f1 = f0.copy()
+        g1 = g0.copy()
+        counter = np.zeros(size, int)
+        wolfe = np.zeros(size, bool)
+        todo = (h1 > 0).nonzero()[0]
+        while len(todo) > 0:
+            q2 = q1[todo] - g1[todo]/h1[todo]
+            f2, g2 = self._line(rows[todo], axis[todo], q2)
+            # stop when the function or the derivative increases
+            good = (abs(g2) <= abs(g1[todo])) & (f2 <= f1[todo])
+            if qmax is not None:
+                good &= q2 <= qmax
+            counter[todo[good]] += 1
+            if max_iter is not None:
+                good &= counter[todo] <= max_iter
+            todo = todo[good]
+            q1[todo] = q2[good]
+            f1[todo] = f2[good]
+            g1[todo] = g2[good]
+            # check the Wolfe conditions
+            margin = c1*abs(g0[todo]*q1[todo])
+            done = f1[todo] >= f0[todo] + margin
+            ok = (~done) & (f1[todo] <= f0[todo] - margin) & \
+                 (abs(g1[todo]) <= abs(g0[todo]*c2))
+            wolfe[todo[ok]] = True
+            todo = todo[~(done | ok)]
+            if len(todo) > 0:
+                gl = self._line(rows[todo], axis[todo], q1[todo] - 0.5*epsilon)[1]
+                gh = self._line(rows[todo], axis[todo], q1[todo] + 0.5*epsilon)[1]
+                h1[todo] = (gh - gl)/epsilon
+        success = (counter > 0) & (f1 <= f0)
+        # back tracking for the other lines
+        todo = (~success).nonzero()[0]
+        wolfe[todo] = False
+        q1[todo] = -np.sign(g0[todo])*self.step_sizes[rows[todo]]*1.5
+        if qmax is not None:
+            q1[todo] = np.clip(q1[todo], -qmax, qmax)
+        counter[:] = 0
+        while len(todo) > 0:
+            f1[todo] = self._line(rows[todo], axis[todo], q1[todo], do_gradient=False)
+            better = f1[todo] < f0[todo]
+            success[todo[better]] = True
+            todo = todo[~better]
+            q1[todo] *= 0.5
+            counter[todo] += 1
+            if max_iter is not None:
+                todo = todo[counter[todo] <= max_iter]
+        q1[~success] = 0.0
+        return success, wolfe, q1
+
+    def _check_convergence(self, rows):
+        """Return a boolean array with the converged problems"""
+        condition = self.convergence_condition
+        gradient = self.gradient[rows]
+        step = self.step[rows]
+        sizes = self.sizes[rows]
+        f = self.f[rows]
+        f_safe = f.copy()
+        f_safe[f == 0] = np.inf
+        grad_rms = np.sqrt((gradient**2).sum(axis=1)/sizes)
+        grad_max = abs(gradient).max(axis=1)
+        converged = np.ones(len(rows), bool)
+        for measure, threshold in [
+            (np.sqrt((step**2).sum(axis=1)/sizes), condition.step_rms),
+            (abs(step).max(axis=1), condition.step_max),
+            (grad_rms, condition.grad_rms),
+            (grad_max, condition.grad_max),
+            (grad_rms/f_safe, condition.rel_grad_rms),
+            (grad_max/f_safe, condition.rel_grad_max),
+        ]:
+            if threshold is not None:
+                converged &= measure <= threshold
+        return converged
+
+    def _check_stop_loss(self, rows):
+        """Return a boolean array with the problems that lost track"""
+        condition = self.stop_loss_condition
+        lost = np.zeros(len(rows), bool)
+        if condition is None:
+            return lost
+        if condition.max_iter is not None and self.counter >= condition.max_iter:
+            lost[:] = True
+        if condition.fun_margin is not None:
+            f = self.f[rows]
+            lost |= f > self.fn_lowest[rows] + condition.fun_margin
+            self.fn_lowest[rows] = np.minimum(self.fn_lowest[rows], f)
+        if condition.grad_margin is not None:
+            grad_rms = np.sqrt((self.gradient[rows]**2).sum(axis=1)/self.sizes[rows])
+            lost |= grad_rms > self.grad_rms_lowest[rows] + condition.grad_margin
+            self.grad_rms_lowest[rows] = np.minimum(self.grad_rms_lowest[rows], grad_rms)
+        if condition.step_min is not None:
+            step_rms = np.sqrt((self.step[rows]**2).sum(axis=1)/self.sizes[rows])
+            lost |= step_rms < condition.step_min
+        return lost
+
+    def _print_header(self):
+        """Print the header for screen logging"""
+        header = " Iter  Active    Done  Failed   Time"
+        self._screen("-"*(len(header)))
+        self._screen(header)
+        self._screen("-"*(len(header)))
+
+    def _screen(self, s):
+        """Print a line on screen when self.verbose == True"""
+        if self.verbose:
+            print s
+
+
 def check_anagrad(fun, x0, epsilon, threshold):
     """Check the analytical gradient using finite differences
 
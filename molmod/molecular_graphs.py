@@ -167,14 +167,16 @@ class MolecularGraph(Graph):
     @classmethod
     def from_blob(cls, s):
         """Construct a molecular graph from the blob representation"""
-        atom_str, edge_str = s.split()
-        numbers = numpy.array([int(s) for s in atom_str.split(",")])
+        words = s.split()
+        numbers = numpy.array([int(s) for s in words[0].split(",")])
         edges = []
         orders = []
-        for s in edge_str.split(","):
-            i, j, o = (int(w) for w in s.split("_"))
-            edges.append((i, j))
-            orders.append(o)
+        if len(words) > 1:
+            # graphs without edges have no edge string
+            for s in words[1].split(","):
+                i, j, o = (int(w) for w in s.split("_"))
+                edges.append((i, j))
+                orders.append(o)
         return cls(edges, numbers, numpy.array(orders))
 
     def __init__(self, edges, numbers, orders=None, symbols=None, num_vertices=None):
@@ -215,10 +217,8 @@ class MolecularGraph(Graph):
         if not isinstance(repeat, int):
             raise TypeError("Can only multiply a graph with an integer")
         # copy edges
-        new_edges = []
-        for i in xrange(repeat):
-            for vertex1, vertex2 in self.edges:
-                new_edges.append(frozenset([vertex1+i*self.num_vertices, vertex2+i*self.num_vertices]))
+        offsets = numpy.arange(max(repeat, 0))*self.num_vertices
+        new_edges = (self.edge_array + offsets.reshape(-1, 1, 1)).reshape(-1, 2)
         # copy numbers
         new_numbers = numpy.zeros((repeat, len(self.numbers)), int)
         new_numbers[:] = self.numbers
@@ -243,6 +243,78 @@ class MolecularGraph(Graph):
         edge_str = ",".join("%i_%i_%i" % (i, j, o) for (i, j), o in zip(self.edges, self.orders))
         return "%s %s" % (atom_str, edge_str)
 
+    @cached
+    def bonds(self):
+        """All bonds (i, j) with i < j as a sorted integer array"""
+        result = numpy.sort(self.edge_array, axis=1)
+        return _sort_rows(result.reshape(-1, 2))
+
+    @cached
+    def bends(self):
+        """All bending angles (i, j, k) with i < k as a sorted integer array
+
+           The same tuples are found by a GraphSearch with a
+           BendingAnglePattern, but here they are derived directly from the
+           csr attribute.
+        """
+        indptr, indices = self.csr[:2]
+        rows, ends = _get_slot_rows(indptr)
+        first, second = _combine_slots(numpy.arange(len(indices)), ends)
+        result = numpy.array([indices[first], rows[first], indices[second]]).T
+        return _sort_rows(result.reshape(-1, 3))
+
+    @cached
+    def dihedrals(self):
+        """All dihedral angles (i, j, k, l) with i < l as a sorted integer array
+
+           The same tuples are found by a GraphSearch with a
+           DihedralAnglePattern, but here they are derived directly from the
+           csr attribute. Three-membered rings do not give rise to dihedrals.
+        """
+        indptr, indices = self.csr[:2]
+        centers1 = self.edge_array[:, 0]
+        centers2 = self.edge_array[:, 1]
+        degrees = indptr[1:] - indptr[:-1]
+        # all combinations of a neighbor of centers1 and a neighbor of centers2
+        counts = degrees[centers1]*degrees[centers2]
+        edges = numpy.repeat(numpy.arange(len(centers1)), counts)
+        offsets = numpy.arange(len(edges)) - numpy.repeat(counts.cumsum() - counts, counts)
+        ends1 = indices[indptr[centers1[edges]] + offsets//degrees[centers2[edges]]]
+        ends2 = indices[indptr[centers2[edges]] + offsets%degrees[centers2[edges]]]
+        result = numpy.array([ends1, centers1[edges], centers2[edges], ends2]).T
+        result = result[(ends1 != centers2[edges]) & (ends2 != centers1[edges]) & (ends1 != ends2)]
+        # first index lower than the last one
+        swap = result[:, 0] > result[:, 3]
+        result[swap] = result[swap, ::-1]
+        return _sort_rows(result.reshape(-1, 4))
+
+    @cached
+    def out_of_planes(self):
+        """All out-of-plane tuples (i, j, k, l) as a sorted integer array
+
+           Vertex i is a center with at least three neighbors, j is one of
+           these neighbors and k < l are two other neighbors. For each triplet
+           of neighbors, there are three tuples, one for each choice of j. The
+           same tuples are found by a GraphSearch with an OutOfPlanePattern
+           and ``vertex_tags={1:1}``, apart from the order of k and l.
+        """
+        indptr, indices = self.csr[:2]
+        rows, ends = _get_slot_rows(indptr)
+        first, second = _combine_slots(numpy.arange(len(indices)), ends)
+        pairs, third = _combine_slots(second, ends[second])
+        first = first[pairs]
+        second = second[pairs]
+        centers = rows[first]
+        first = indices[first]
+        second = indices[second]
+        third = indices[third]
+        result = numpy.array([
+            [centers, first, second, third],
+            [centers, second, first, third],
+            [centers, third, first, second],
+        ]).transpose(0, 2, 1)
+        return _sort_rows(result.reshape(-1, 4))
+
     def get_vertex_string(self, i):
         """Return a string based on the atom number"""
         number = self.numbers[i]
@@ -278,7 +350,7 @@ class MolecularGraph(Graph):
         else:
             new_symbols = self.symbols
         new_orders = self.orders[graph._old_edge_indexes]
-        result = MolecularGraph(graph.edges, new_numbers, new_orders, new_symbols)
+        result = MolecularGraph(graph.edge_array, new_numbers, new_orders, new_symbols)
         if normalize:
             result._old_vertex_indexes = graph._old_vertex_indexes
         result._old_edge_indexes = graph._old_edge_indexes
@@ -334,6 +406,35 @@ class MolecularGraph(Graph):
 
 # basic criteria for molecular patterns
 
+def _get_slot_rows(indptr):
+    """Return the row and the end of the row for each slot in a CSR structure"""
+    degrees = indptr[1:] - indptr[:-1]
+    rows = numpy.repeat(numpy.arange(len(degrees)), degrees)
+    return rows, indptr[rows+1]
+
+
+def _combine_slots(slots, ends):
+    """Combine slots in a CSR structure with all later slots in the same row
+
+       Arguments:
+        | ``slots`` -- an array with positions in the indices array
+        | ``ends`` -- the end of the row for each slot
+
+       Returns an array with indexes in slots and an array with the later
+       slots in the same row.
+    """
+    counts = ends - slots - 1
+    first = numpy.repeat(numpy.arange(len(slots)), counts)
+    offsets = numpy.arange(len(first)) - numpy.repeat(counts.cumsum() - counts, counts)
+    return first, slots[first] + 1 + offsets
+
+
+def _sort_rows(tuples):
+    """Sort the rows of an integer array lexicographically"""
+    order = numpy.lexsort(tuples.T[::-1])
+    return tuples[order]
+
+
 class HasAtomNumber(object):
     """Criterion for the atom number of a vertex"""
 
@@ -39,3 +39,20 @@ void molecules_distance_matrix(int n, double *cor, int periodic, double *matrix,
     }
   }
 }
+
+void molecules_distance_condensed(int n, double *cor, int periodic, double *matrix, double *reciprocal, double *condensed) {
+  /* Same as molecules_distance_matrix, but only the strictly lower triangle
+     is written, row by row: (1,0), (2,0), (2,1), (3,0), ... This is the same
+     order as in similarity_table_labels. */
+  int i, j;
+  for (i=0; i<n; i++) {
+    for (j=0; j<i; j++) {
+      if (periodic) {
+        *condensed = distance_periodic(cor + 3*i, cor + 3*j, matrix, reciprocal);
+      } else {
+        *condensed = distance(cor + 3*i, cor + 3*j);
+      }
+      condensed++;
+    }
+  }
+}
@@ -28,6 +28,7 @@ from molmod.units import angstrom
 from molmod.utils import cached, ReadOnly, ReadOnlyAttribute
 from molmod.molecular_graphs import MolecularGraph
 from molmod.unit_cells import UnitCell
+from molmod.binning import SparseDistanceMatrix
 from molmod.transformations import fit_rmsd
 from molmod.symmetry import compute_rotsym
 
@@ -164,6 +165,34 @@ class Molecule(ReadOnly):
         from molmod.ext import molecules_distance_matrix
         return molecules_distance_matrix(self.coordinates)
 
+    def get_distance_matrix(self, cutoff=None, format="dense"):
+        """Return the matrix with atom pair distances
+
+           Optional arguments:
+            | ``cutoff``  --  Only distances below the cutoff are stored. This
+                              is mandatory for the csr format.
+            | ``format``  --  ``"dense"`` returns the (cached) attribute
+                              :attr:`distance_matrix`. ``"csr"`` returns a
+                              :class:`molmod.binning.SparseDistanceMatrix`
+                              that only contains the distances below the
+                              cutoff. It is computed with the binning module
+                              and requires no O(N**2) memory. When the
+                              molecule has a unit cell, the minimum image
+                              convention is applied.
+        """
+        if format == "dense":
+            if cutoff is not None:
+                raise ValueError("A cutoff is only supported by the csr format.")
+            return self.distance_matrix
+        elif format == "csr":
+            if cutoff is None:
+                raise ValueError("The csr format requires a cutoff.")
+            return SparseDistanceMatrix.from_coordinates(
+                self.coordinates, cutoff, self.unit_cell
+            )
+        else:
+            raise ValueError("Unknown format: %s" % format)
+
     @cached
     def mass(self):
         """the total mass of the molecule"""
@@ -34,6 +34,25 @@ __all__ = [
 ]
 
 
+def _get_pair_parameters(parameters, index1, index2, rule):
+    """Return the parameters of (arrays of) atom pairs
+
+       Arguments:
+         parameters  --  a symmetric NxN array with a parameter for each atom
+                         pair, or an array with N parameters, one for each
+                         atom
+         index1, index2  --  the atom indexes of the pairs
+         rule  --  the combination rule for per-atom parameters: "geometric"
+                   for sqrt(p_1*p_2) or "arithmetic" for (p_1 + p_2)/2
+    """
+    if parameters.ndim == 2:
+        return parameters[index1, index2]
+    if rule == "geometric":
+        return np.sqrt(parameters[index1]*parameters[index2])
+    else:
+        return 0.5*(parameters[index1] + parameters[index2])
+
+
 class PairFF(object):
     """Evaluates the energy, gradient and Hessian of pairwise potential
 
@@ -42,24 +61,60 @@ class PairFF(object):
        In the derived classes one must provide functions that iterate over all
        the corresponding function values, derivatives and second derivatives of
        s and v for a given r_ij.
+
+       The energy, gradient and Hessian are computed with array operations
+       over all pairs at once. They call the methods get_pair_energies,
+       get_pair_gradients and get_pair_hessians, which return the same terms
+       as the yield_pair_* generators, but for arrays of pairs. By default,
+       these methods just collect the results of the generators, so derived
+       classes only have to override them for efficiency.
+
+       There are two ways to select the interacting pairs. By default, a dense
+       NxN scaling matrix is given. Alternatively, one can specify a cutoff,
+       a list of excluded pairs and optionally a unit cell. In the latter
+       case, the pairs are searched with :class:`molmod.binning.PairSearchIntra`
+       and only arrays with one element per pair are stored, which is
+       feasible for large (periodic) systems. The yield_pair_* generators and
+       the NxN attributes (distances, deltas, ...) are not available in this
+       mode, so the get_pair_* methods must be implemented.
     """
 
-    def __init__(self, scaling, coordinates=None):
+    def __init__(self, scaling, coordinates=None, cutoff=None, exclusions=None, unit_cell=None):
         """Initialize a pair potential object
 
            Arguments:
              scaling  --  symmetric NxN array with pairwise scaling factors.
                           When an element is set to zero, it will be excluded.
+                          Must be None when a cutoff is given.
 
            Optional argument:
              coordinates  --  the initial Cartesian coordinates of the system,
                               which can be updated with the update_coordinates
                               method
+             cutoff  --  only pairs with a distance below the cutoff interact
+             exclusions  --  a Mx2 integer array with pairs that do not
+                             interact, only used in combination with a cutoff
+             unit_cell  --  the periodic boundary conditions, only used in
+                            combination with a cutoff
         """
+        if cutoff is None:
+            if scaling is None:
+                raise TypeError("Either a scaling matrix or a cutoff must be given.")
+            if exclusions is not None or unit_cell is not None:
+                raise TypeError("Exclusions and a unit cell can only be used in combination with a cutoff.")
+            self.scaling = scaling
+            self.scaling.ravel()[::len(self.scaling)+1] = 0
+        else:
+            if scaling is not None:
+                raise TypeError("A scaling matrix can not be combined with a cutoff.")
+            self.scaling = None
+        self.cutoff = cutoff
+        if exclusions is None:
+            exclusions = np.zeros((0, 2), int)
+        self.exclusions = np.asarray(exclusions, int).reshape(-1, 2)
+        self.unit_cell = unit_cell
         if coordinates is not None:
             self.update_coordinates(coordinates)
-        self.scaling = scaling
-        self.scaling.ravel()[::len(self.scaling)+1] = 0
 
     def update_coordinates(self, coordinates=None):
         """Update the coordinates (and derived quantities)
@@ -70,20 +125,47 @@ class PairFF(object):
         if coordinates is not None:
             self.coordinates = coordinates
         self.numc = len(self.coordinates)
-        self.distances = np.zeros((self.numc, self.numc), float)
-        self.deltas = np.zeros((self.numc, self.numc, 3), float)
-        self.directions = np.zeros((self.numc, self.numc, 3), float)
-        self.dirouters = np.zeros((self.numc, self.numc, 3, 3), float)
-        for index1, coordinate1 in enumerate(self.coordinates):
-            for index2, coordinate2 in enumerate(self.coordinates):
-                delta = coordinate1 - coordinate2
-                self.deltas[index1, index2] = delta
-                distance = np.linalg.norm(delta)
-                self.distances[index1, index2] = distance
-                if index1 != index2:
-                    tmp = delta/distance
-                    self.directions[index1, index2] = tmp
-                    self.dirouters[index1, index2] = np.outer(tmp, tmp)
+        if self.cutoff is None:
+            self._update_dense()
+        else:
+            self._update_sparse()
+        self.pair_directions = self.pair_deltas/self.pair_distances.reshape(-1, 1)
+
+    def _update_dense(self):
+        """Compute all NxN derived quantities and the corresponding pair arrays"""
+        self.deltas = self.coordinates.reshape(-1, 1, 3) - self.coordinates
+        self.distances = np.sqrt((self.deltas**2).sum(axis=2))
+        # avoid divisions by zero on the diagonal
+        tmp = self.distances.copy()
+        tmp.ravel()[::self.numc+1] = 1
+        self.directions = self.deltas/tmp.reshape(self.numc, self.numc, 1)
+        self.dirouters = self.directions.reshape(self.numc, self.numc, 3, 1)*self.directions.reshape(self.numc, self.numc, 1, 3)
+        # both orderings of each pair with a non-zero scaling factor
+        self.pair_index1, self.pair_index2 = (self.scaling > 0).nonzero()
+        self.pair_deltas = self.deltas[self.pair_index1, self.pair_index2]
+        self.pair_distances = self.distances[self.pair_index1, self.pair_index2]
+        self.pair_scaling = self.scaling[self.pair_index1, self.pair_index2]
+
+    def _update_sparse(self):
+        """Search all pairs within the cutoff and compute the pair arrays"""
+        from molmod.binning import PairSearchIntra
+        pair_search = PairSearchIntra(self.coordinates, self.cutoff, self.unit_cell)
+        index1, index2, deltas, distances = pair_search.get_arrays()
+        # remove the exclusions, index2 < index1 in the pair search
+        if len(self.exclusions) > 0 and len(index1) > 0:
+            keys = index1.astype(int)*self.numc + index2
+            excluded = self.exclusions.max(axis=1)*self.numc + self.exclusions.min(axis=1)
+            mask = ~np.in1d(keys, excluded)
+            index1 = index1[mask]
+            index2 = index2[mask]
+            deltas = deltas[mask]
+            distances = distances[mask]
+        # both orderings of each pair, with deltas = r_1 - r_2
+        self.pair_index1 = np.concatenate([index1, index2]).astype(int)
+        self.pair_index2 = np.concatenate([index2, index1]).astype(int)
+        self.pair_deltas = np.concatenate([-deltas, deltas])
+        self.pair_distances = np.concatenate([distances, distances])
+        self.pair_scaling = np.ones(len(self.pair_distances), float)
 
     def yield_pair_energies(self, index1, index2):
         """Yields pairs ((s(r_ij), v(bar{r}_ij))"""
@@ -97,73 +179,163 @@ class PairFF(object):
         """Yields pairs ((s''(r_ij), grad_i (x) grad_i v(bar{r}_ij))"""
         raise NotImplementedError
 
+    def _stack_pair_terms(self, yield_pair_terms, index1, index2):
+        """Collect the terms of a yield_pair_* generator for arrays of pairs"""
+        if self.cutoff is not None:
+            raise NotImplementedError("The yield_pair_* generators can not be used in combination with a cutoff.")
+        rows = [list(yield_pair_terms(i1, i2)) for i1, i2 in zip(index1, index2)]
+        if len(rows) == 0:
+            return []
+        return [
+            (np.array([row[k][0] for row in rows], float),
+             np.array([row[k][1] for row in rows], float))
+            for k in xrange(len(rows[0]))
+        ]
+
+    def get_pair_energies(self, index1, index2, deltas, distances):
+        """Returns a list of pairs (s(r_ij), v(bar{r}_ij)) for arrays of pairs
+
+           Arguments:
+             index1, index2  --  integer arrays with the atom indexes of P pairs
+             deltas  --  array with the relative vectors r_1 - r_2, shape (P,3)
+             distances  --  array with the norms of the deltas, shape (P,)
+
+           The elements of each pair in the list are arrays with shape (P,).
+           The default implementation calls yield_pair_energies for each pair.
+           Derived classes should override this method with an implementation
+           based on array operations.
+        """
+        return self._stack_pair_terms(self.yield_pair_energies, index1, index2)
+
+    def get_pair_gradients(self, index1, index2, deltas, distances):
+        """Returns a list of pairs (s'(r_ij), grad_i v(bar{r}_ij)) for arrays of pairs
+
+           Arguments: see :meth:`get_pair_energies`
+
+           The elements of each pair in the list are arrays with shape (P,)
+           and (P,3). The default implementation calls yield_pair_gradients for
+           each pair.
+        """
+        return self._stack_pair_terms(self.yield_pair_gradients, index1, index2)
+
+    def get_pair_hessians(self, index1, index2, deltas, distances):
+        """Returns a list of pairs (s''(r_ij), grad_i (x) grad_i v(bar{r}_ij)) for arrays of pairs
+
+           Arguments: see :meth:`get_pair_energies`
+
+           The elements of each pair in the list are arrays with shape (P,)
+           and (P,3,3). The default implementation calls yield_pair_hessians
+           for each pair.
+        """
+        return self._stack_pair_terms(self.yield_pair_hessians, index1, index2)
+
+    def _get_pair_args(self, mask=None):
+        """Return the arguments for the get_pair_* methods
+
+           Optional argument:
+             mask  --  a boolean array or an integer index array to select a
+                       subset of the pairs
+        """
+        if mask is None:
+            return self.pair_index1, self.pair_index2, self.pair_deltas, self.pair_distances
+        return self.pair_index1[mask], self.pair_index2[mask], self.pair_deltas[mask], self.pair_distances[mask]
+
+    def _compute_pair_gradients(self, mask=None):
+        """Compute the (scaled) gradient contributions for (a subset of) the pairs
+
+           The result has shape (P,3), where row k is the contribution of pair
+           k to the gradient of its first atom.
+        """
+        args = self._get_pair_args(mask)
+        result = np.zeros((len(args[0]), 3), float)
+        if len(args[0]) == 0:
+            return result
+        directions = self.pair_directions if mask is None else self.pair_directions[mask]
+        for (se, ve), (sg, vg) in zip(self.get_pair_energies(*args), self.get_pair_gradients(*args)):
+            result += (sg*ve).reshape(-1, 1)*directions + se.reshape(-1, 1)*vg
+        scaling = self.pair_scaling if mask is None else self.pair_scaling[mask]
+        result *= scaling.reshape(-1, 1)
+        return result
+
+    def _compute_pair_hessians(self, mask=None):
+        """Compute the (scaled) Hessian contributions for (a subset of) the pairs
+
+           The result has shape (P,3,3). Block k is added to the diagonal block
+           of the first atom of pair k and subtracted from the off-diagonal
+           block of the pair.
+        """
+        args = self._get_pair_args(mask)
+        result = np.zeros((len(args[0]), 3, 3), float)
+        if len(args[0]) == 0:
+            return result
+        d_1 = (1/args[3]).reshape(-1, 1, 1)
+        directions = self.pair_directions if mask is None else self.pair_directions[mask]
+        dirouters = directions.reshape(-1, 3, 1)*directions.reshape(-1, 1, 3)
+        projectors = np.identity(3, float) - dirouters
+        for (se, ve), (sg, vg), (sh, vh) in zip(
+            self.get_pair_energies(*args),
+            self.get_pair_gradients(*args),
+            self.get_pair_hessians(*args)
+        ):
+            se = se.reshape(-1, 1, 1)
+            ve = ve.reshape(-1, 1, 1)
+            sg = sg.reshape(-1, 1, 1)
+            sh = sh.reshape(-1, 1, 1)
+            outer = directions.reshape(-1, 3, 1)*vg.reshape(-1, 1, 3)
+            result += (
+                +sh*dirouters*ve
+                +sg*projectors*ve*d_1
+                +sg*outer
+                +sg*outer.transpose(0, 2, 1)
+                +se*vh
+            )
+        scaling = self.pair_scaling if mask is None else self.pair_scaling[mask]
+        result *= scaling.reshape(-1, 1, 1)
+        return result
+
     def energy(self):
         """Compute the energy of the system"""
+        mask = self.pair_index2 < self.pair_index1
+        args = self._get_pair_args(mask)
+        if len(args[0]) == 0:
+            return 0.0
+        scaling = self.pair_scaling[mask]
         result = 0.0
-        for index1 in xrange(self.numc):
-            for index2 in xrange(index1):
-                if self.scaling[index1, index2] > 0:
-                    for se, ve in self.yield_pair_energies(index1, index2):
-                        result += se*ve*self.scaling[index1, index2]
+        for se, ve in self.get_pair_energies(*args):
+            result += (se*ve*scaling).sum()
         return result
 
     def gradient_component(self, index1):
         """Compute the gradient of the energy for one atom"""
-        result = np.zeros(3, float)
-        for index2 in xrange(self.numc):
-            if self.scaling[index1, index2] > 0:
-                for (se, ve), (sg, vg) in zip(self.yield_pair_energies(index1, index2), self.yield_pair_gradients(index1, index2)):
-                    result += (sg*self.directions[index1, index2]*ve + se*vg)*self.scaling[index1, index2]
-        return result
+        return self._compute_pair_gradients(self.pair_index1 == index1).sum(axis=0)
 
     def gradient(self):
         """Compute the gradient of the energy for all atoms"""
+        contributions = self._compute_pair_gradients()
         result = np.zeros((self.numc, 3), float)
-        for index1 in xrange(self.numc):
-            result[index1] = self.gradient_component(index1)
+        for i in xrange(3):
+            result[:, i] = np.bincount(self.pair_index1, contributions[:, i], minlength=self.numc)
         return result
 
     def hessian_component(self, index1, index2):
         """Compute the hessian of the energy for one atom pair"""
-        result = np.zeros((3, 3), float)
         if index1 == index2:
-            for index3 in xrange(self.numc):
-                if self.scaling[index1, index3] > 0:
-                    d_1 = 1/self.distances[index1, index3]
-                    for (se, ve), (sg, vg), (sh, vh) in zip(
-                        self.yield_pair_energies(index1, index3),
-                        self.yield_pair_gradients(index1, index3),
-                        self.yield_pair_hessians(index1, index3)
-                    ):
-                        result += (
-                            +sh*self.dirouters[index1, index3]*ve
-                            +sg*(np.identity(3, float) - self.dirouters[index1, index3])*ve*d_1
-                            +sg*np.outer(self.directions[index1, index3],  vg)
-                            +sg*np.outer(vg, self.directions[index1, index3])
-                            +se*vh
-                        )*self.scaling[index1, index3]
-        elif self.scaling[index1, index2] > 0:
-            d_1 = 1/self.distances[index1, index2]
-            for (se, ve), (sg, vg), (sh, vh) in zip(
-                self.yield_pair_energies(index1, index2),
-                self.yield_pair_gradients(index1, index2),
-                self.yield_pair_hessians(index1, index2)
-            ):
-                result -= (
-                    +sh*self.dirouters[index1, index2]*ve
-                    +sg*(np.identity(3, float) - self.dirouters[index1, index2])*ve*d_1
-                    +sg*np.outer(self.directions[index1, index2],  vg)
-                    +sg*np.outer(vg, self.directions[index1, index2])
-                    +se*vh
-                )*self.scaling[index1, index2]
-        return result
+            return self._compute_pair_hessians(self.pair_index1 == index1).sum(axis=0)
+        else:
+            mask = (self.pair_index1 == index1) & (self.pair_index2 == index2)
+            return -self._compute_pair_hessians(mask).sum(axis=0)
 
     def hessian(self):
         """Compute the hessian of the energy"""
+        contributions = self._compute_pair_hessians()
         result = np.zeros((self.numc, 3, self.numc, 3), float)
-        for index1 in xrange(self.numc):
-            for index2 in xrange(self.numc):
-                result[index1, :, index2, :] = self.hessian_component(index1, index2)
+        result[self.pair_index1, :, self.pair_index2, :] = -contributions
+        diagonal = np.zeros((self.numc, 9), float)
+        for i in xrange(9):
+            diagonal[:, i] = np.bincount(self.pair_index1, contributions.reshape(-1, 9)[:, i], minlength=self.numc)
+        diagonal = diagonal.reshape(-1, 3, 3)
+        for index in xrange(self.numc):
+            result[index, :, index, :] = diagonal[index]
         return result
 
     def gradient_flat(self):
@@ -178,12 +350,13 @@ class PairFF(object):
 class CoulombFF(PairFF):
     """Computes the electrostatic interactions using charges and point dipoles"""
 
-    def __init__(self, scaling, charges=None, dipoles=None, coordinates=None):
+    def __init__(self, scaling, charges=None, dipoles=None, coordinates=None, cutoff=None, exclusions=None, unit_cell=None, ewald=None):
         """Initialize a CoulombFF object
 
            Arguments:
              scaling  --  symmetric NxN array with pairwise scaling factors.
                           When an element is set to zero, it will be excluded.
+                          Must be None when a cutoff is given.
 
            Optio1nal arguments:
              charges  --  the atomic partial charges
@@ -191,10 +364,66 @@ class CoulombFF(PairFF):
              coordinates  --  the initial Cartesian coordinates of the system,
                               which can be updated with the update_coordinates
                               method
+             cutoff, exclusions, unit_cell  --  see :class:`PairFF`
+             ewald  --  an :class:`molmod.ewald.EwaldSum` or
+                        :class:`molmod.ewald.ParticleMeshEwald` object. When
+                        given, the interactions between the charges and all
+                        their periodic images are included. The cutoff is then
+                        used for the real-space part and must not exceed half
+                        of the smallest spacing between crystal planes. This
+                        only works for charges in a three-dimensional periodic
+                        unit cell and the Hessian is not available.
         """
-        PairFF.__init__(self, scaling, coordinates)
+        if ewald is not None:
+            if cutoff is None or charges is None or dipoles is not None:
+                raise TypeError("Ewald summation requires a cutoff and charges, but no dipoles.")
+            ewald.check_unit_cell(unit_cell)
+            if cutoff > 0.5*unit_cell.spacings.min():
+                raise ValueError("The real-space cutoff must not exceed half of the smallest spacing of the unit cell.")
+        self.ewald = ewald
         self.charges = charges
         self.dipoles = dipoles
+        PairFF.__init__(self, scaling, coordinates, cutoff, exclusions, unit_cell)
+
+    def update_coordinates(self, coordinates=None):
+        """Update the coordinates (and derived quantities)
+
+           Argument:
+             coordinates  --  new Cartesian coordinates of the system
+        """
+        PairFF.update_coordinates(self, coordinates)
+        self._long_range = None
+
+    def _get_long_range(self):
+        """Return the energy, esp and efield of the Ewald terms
+
+           These include the reciprocal-space and self-interaction terms of
+           the ewald object and the correction for the excluded pairs, whose
+           interactions are also present in the reciprocal-space sum.
+        """
+        if self._long_range is None:
+            energy, esp, efield = self.ewald.compute(self.coordinates, self.charges, self.unit_cell)
+            esp = esp.copy()
+            efield = efield.copy()
+            if len(self.exclusions) > 0:
+                index1, index2 = self.exclusions.transpose()
+                deltas = self.unit_cell.shortest_vector(self.coordinates[index1] - self.coordinates[index2])
+                distances = np.sqrt((deltas**2).sum(axis=1))
+                kernel, kernel_deriv = self.ewald.get_real_kernel(distances)[:2]
+                # the long-range part of the pair potential is erf(alpha*r)/r
+                long_kernel = 1/distances - kernel
+                long_kernel_deriv = -1/distances**2 - kernel_deriv
+                c1 = self.charges[index1]
+                c2 = self.charges[index2]
+                energy -= (c1*c2*long_kernel).sum()
+                esp -= np.bincount(index1, c2*long_kernel, minlength=self.numc)
+                esp -= np.bincount(index2, c1*long_kernel, minlength=self.numc)
+                fields = (long_kernel_deriv/distances).reshape(-1, 1)*deltas
+                for i in xrange(3):
+                    efield[:, i] += np.bincount(index1, c2*fields[:, i], minlength=self.numc)
+                    efield[:, i] -= np.bincount(index2, c1*fields[:, i], minlength=self.numc)
+            self._long_range = energy, esp, efield
+        return self._long_range
 
     def yield_pair_energies(self, index1, index2):
         """Yields pairs ((s(r_ij), v(bar{r}_ij))"""
@@ -253,7 +482,126 @@ class CoulombFF(PairFF):
                 yield 12*c1*d_5, np.zeros((3, 3))
                 yield 12*c2*d_5, np.zeros((3, 3))
 
+    def get_pair_energies(self, index1, index2, deltas, distances):
+        """Returns a list of pairs (s(r_ij), v(bar{r}_ij)) for arrays of pairs"""
+        result = []
+        d_1 = 1/distances
+        ones = np.ones(len(index1), float)
+        if self.ewald is not None:
+            c1 = self.charges[index1]
+            c2 = self.charges[index2]
+            result.append((c1*c2*self.ewald.get_real_kernel(distances)[0], ones))
+            return result
+        if self.charges is not None:
+            c1 = self.charges[index1]
+            c2 = self.charges[index2]
+            result.append((c1*c2*d_1, ones))
+        if self.dipoles is not None:
+            d_3 = d_1**3
+            d_5 = d_1**5
+            delta = deltas
+            p1 = self.dipoles[index1]
+            p2 = self.dipoles[index2]
+            result.append((d_3*(p1*p2).sum(axis=1), ones))
+            result.append((-3*d_5, (p1*delta).sum(axis=1)*(delta*p2).sum(axis=1)))
+            if self.charges is not None:
+                result.append((c1*d_3, (p2*delta).sum(axis=1)))
+                result.append((c2*d_3, -(p1*delta).sum(axis=1)))
+        return result
+
+    def get_pair_gradients(self, index1, index2, deltas, distances):
+        """Returns a list of pairs (s'(r_ij), grad_i v(bar{r}_ij)) for arrays of pairs"""
+        result = []
+        d_2 = 1/distances**2
+        zeros = np.zeros((len(index1), 3), float)
+        if self.ewald is not None:
+            c1 = self.charges[index1]
+            c2 = self.charges[index2]
+            result.append((c1*c2*self.ewald.get_real_kernel(distances)[1], zeros))
+            return result
+        if self.charges is not None:
+            c1 = self.charges[index1]
+            c2 = self.charges[index2]
+            result.append((-c1*c2*d_2, zeros))
+        if self.dipoles is not None:
+            d_4 = d_2**2
+            d_6 = d_2**3
+            delta = deltas
+            p1 = self.dipoles[index1]
+            p2 = self.dipoles[index2]
+            result.append((-3*d_4*(p1*p2).sum(axis=1), zeros))
+            result.append((15*d_6,
+                p1*(p2*delta).sum(axis=1).reshape(-1, 1) +
+                p2*(p1*delta).sum(axis=1).reshape(-1, 1)
+            ))
+            if self.charges is not None:
+                result.append((-3*c1*d_4, p2))
+                result.append((-3*c2*d_4, -p1))
+        return result
+
+    def get_pair_hessians(self, index1, index2, deltas, distances):
+        """Returns a list of pairs (s''(r_ij), grad_i (x) grad_i v(bar{r}_ij)) for arrays of pairs"""
+        result = []
+        d_1 = 1/distances
+        d_3 = d_1**3
+        zeros = np.zeros((len(index1), 3, 3), float)
+        if self.ewald is not None:
+            c1 = self.charges[index1]
+            c2 = self.charges[index2]
+            result.append((c1*c2*self.ewald.get_real_kernel(distances)[2], zeros))
+            return result
+        if self.charges is not None:
+            c1 = self.charges[index1]
+            c2 = self.charges[index2]
+            result.append((2*c1*c2*d_3, zeros))
+        if self.dipoles is not None:
+            d_5 = d_1**5
+            d_7 = d_1**7
+            p1 = self.dipoles[index1]
+            p2 = self.dipoles[index2]
+            outer = p1.reshape(-1, 3, 1)*p2.reshape(-1, 1, 3)
+            result.append((12*d_5*(p1*p2).sum(axis=1), zeros))
+            result.append((-90*d_7, outer + outer.transpose(0, 2, 1)))
+            if self.charges is not None:
+                result.append((12*c1*d_5, zeros))
+                result.append((12*c2*d_5, zeros))
+        return result
+
+    def energy(self):
+        """Compute the energy of the system"""
+        result = PairFF.energy(self)
+        if self.ewald is not None:
+            result += self._get_long_range()[0]
+        return result
+
+    def gradient_component(self, index1):
+        """Compute the gradient of the energy for one atom"""
+        if self.ewald is not None:
+            return self.gradient()[index1]
+        return PairFF.gradient_component(self, index1)
+
+    def gradient(self):
+        """Compute the gradient of the energy for all atoms"""
+        result = PairFF.gradient(self)
+        if self.ewald is not None:
+            result -= self.charges.reshape(-1, 1)*self._get_long_range()[2]
+        return result
+
+    def hessian_component(self, index1, index2):
+        """Compute the hessian of the energy for one atom pair"""
+        if self.ewald is not None:
+            raise NotImplementedError("The Hessian is not available in combination with Ewald summation.")
+        return PairFF.hessian_component(self, index1, index2)
+
+    def hessian(self):
+        """Compute the hessian of the energy"""
+        if self.ewald is not None:
+            raise NotImplementedError("The Hessian is not available in combination with Ewald summation.")
+        return PairFF.hessian(self)
+
     def esp_point(self, point):
+        if self.ewald is not None:
+            raise NotImplementedError("The esp at an arbitrary point is not available in combination with Ewald summation.")
         result = 0.0
         for index2 in xrange(self.numc):
             delta = point - self.coordinates[index2]
@@ -265,25 +613,34 @@ class CoulombFF(PairFF):
                 result += np.dot(self.dipoles[index2], direction)/d**2
         return result
 
-    def esp_component(self, index1):
-        result = 0.0
-        for index2 in xrange(self.numc):
-            if self.scaling[index1, index2] > 0:
-                d = self.distances[index1, index2]
-                if self.charges is not None:
-                    result += self.charges[index2]/d
-                if self.dipoles is not None:
-                    result += np.dot(self.dipoles[index2], self.directions[index1, index2])/d**2
+    def _compute_pair_esp(self, mask=None):
+        """Compute the contributions to the electrostatic potential for (a subset of) the pairs"""
+        index1, index2, deltas, distances = self._get_pair_args(mask)
+        result = np.zeros(len(index1), float)
+        if self.ewald is not None:
+            result += self.charges[index2]*self.ewald.get_real_kernel(distances)[0]
+            return result
+        if self.charges is not None:
+            result += self.charges[index2]/distances
+        if self.dipoles is not None:
+            result += (self.dipoles[index2]*deltas).sum(axis=1)/distances**3
         return result
 
+    def esp_component(self, index1):
+        if self.ewald is not None:
+            return self.esp()[index1]
+        return self._compute_pair_esp(self.pair_index1 == index1).sum()
+
     def esp(self):
         """Compute the electrostatic potential at each atom due to other atoms"""
-        result = np.zeros(self.numc, float)
-        for index1 in xrange(self.numc):
-            result[index1] = self.esp_component(index1)
+        result = np.bincount(self.pair_index1, self._compute_pair_esp(), minlength=self.numc)
+        if self.ewald is not None:
+            result = result + self._get_long_range()[1]
         return result
 
     def efield_point(self, point):
+        if self.ewald is not None:
+            raise NotImplementedError("The efield at an arbitrary point is not available in combination with Ewald summation.")
         result = 0.0
         for index2 in xrange(self.numc):
             delta = point - self.coordinates[index2]
@@ -296,24 +653,36 @@ class CoulombFF(PairFF):
                 result += (3*np.dot(p, direction)*direction - p)/d**3
         return result
 
-    def efield_component(self, index1):
-        result = 0.0
-        for index2 in xrange(self.numc):
-            if self.scaling[index1, index2] > 0:
-                d = self.distances[index1, index2]
-                direction = self.directions[index1, index2]
-                if self.charges is not None:
-                    result += self.charges[index2]*direction/d**2
-                if self.dipoles is not None:
-                    p = self.dipoles[index2]
-                    result += (3*np.dot(p, direction)*direction - p)/d**3
+    def _compute_pair_efield(self, mask=None):
+        """Compute the contributions to the electric field for (a subset of) the pairs"""
+        index1, index2, deltas, distances = self._get_pair_args(mask)
+        distances = distances.reshape(-1, 1)
+        directions = deltas/distances
+        result = np.zeros((len(index1), 3), float)
+        if self.ewald is not None:
+            kernel_deriv = self.ewald.get_real_kernel(distances)[1]
+            result -= self.charges[index2].reshape(-1, 1)*kernel_deriv*directions
+            return result
+        if self.charges is not None:
+            result += self.charges[index2].reshape(-1, 1)*directions/distances**2
+        if self.dipoles is not None:
+            p = self.dipoles[index2]
+            result += (3*(p*directions).sum(axis=1).reshape(-1, 1)*directions - p)/distances**3
         return result
 
+    def efield_component(self, index1):
+        if self.ewald is not None:
+            return self.efield()[index1]
+        return self._compute_pair_efield(self.pair_index1 == index1).sum(axis=0)
+
     def efield(self):
         """Compute the electrostatic potential at each atom due to other atoms"""
-        result = np.zeros((self.numc,3), float)
-        for index1 in xrange(self.numc):
-            result[index1] = self.efield_component(index1)
+        contributions = self._compute_pair_efield()
+        result = np.zeros((self.numc, 3), float)
+        for i in xrange(3):
+            result[:, i] = np.bincount(self.pair_index1, contributions[:, i], minlength=self.numc)
+        if self.ewald is not None:
+            result += self._get_long_range()[2]
         return result
 
 
@@ -321,121 +690,195 @@ class CoulombFF(PairFF):
 class DispersionFF(PairFF):
     """Computes the London dispersion interaction"""
 
-    def __init__(self, scaling, strengths, coordinates=None):
+    def __init__(self, scaling, strengths, coordinates=None, cutoff=None, exclusions=None, unit_cell=None):
         """Initialize a DispersionFF object
 
            Arguments:
              scaling  --  symmetric NxN array with pairwise scaling factors.
                           When an element is set to zero, it will be excluded.
-             strengths  --  a symmetric with linear coefficients in front of
-                            r**-6 for each atom pair
+                          Must be None when a cutoff is given.
+             strengths  --  a symmetric NxN array with linear coefficients in
+                            front of r**-6 for each atom pair, or an array
+                            with one coefficient for each atom. In the latter
+                            case, the geometric mean is used for each pair,
+                            which avoids NxN arrays in combination with a
+                            cutoff. (Per-type coefficients can be converted
+                            with ``strengths[types]``.)
 
            Optional arguments:
              coordinates  --  the initial Cartesian coordinates of the system,
                               which can be updated with the update_coordinates
                               method
+             cutoff, exclusions, unit_cell  --  see :class:`PairFF`
         """
-        PairFF.__init__(self, scaling, coordinates)
-        self.strengths = strengths
+        PairFF.__init__(self, scaling, coordinates, cutoff, exclusions, unit_cell)
+        self.strengths = np.asarray(strengths)
 
     def yield_pair_energies(self, index1, index2):
         """Yields pairs ((s(r_ij), v(bar{r}_ij))"""
-        strength = self.strengths[index1, index2]
+        strength = _get_pair_parameters(self.strengths, index1, index2, "geometric")
         distance = self.distances[index1, index2]
         yield strength*distance**(-6), 1
 
     def yield_pair_gradients(self, index1, index2):
         """Yields pairs ((s'(r_ij), grad_i v(bar{r}_ij))"""
-        strength = self.strengths[index1, index2]
+        strength = _get_pair_parameters(self.strengths, index1, index2, "geometric")
         distance = self.distances[index1, index2]
         yield -6*strength*distance**(-7), np.zeros(3)
 
     def yield_pair_hessians(self, index1, index2):
         """Yields pairs ((s''(r_ij), grad_i (x) grad_i v(bar{r}_ij))"""
-        strength = self.strengths[index1, index2]
+        strength = _get_pair_parameters(self.strengths, index1, index2, "geometric")
         distance = self.distances[index1, index2]
         yield 42*strength*distance**(-8), np.zeros((3, 3))
 
+    def get_pair_energies(self, index1, index2, deltas, distances):
+        """Returns a list of pairs (s(r_ij), v(bar{r}_ij)) for arrays of pairs"""
+        strength = _get_pair_parameters(self.strengths, index1, index2, "geometric")
+        distance = distances
+        return [(strength*distance**(-6), np.ones(len(index1), float))]
+
+    def get_pair_gradients(self, index1, index2, deltas, distances):
+        """Returns a list of pairs (s'(r_ij), grad_i v(bar{r}_ij)) for arrays of pairs"""
+        strength = _get_pair_parameters(self.strengths, index1, index2, "geometric")
+        distance = distances
+        return [(-6*strength*distance**(-7), np.zeros((len(index1), 3), float))]
+
+    def get_pair_hessians(self, index1, index2, deltas, distances):
+        """Returns a list of pairs (s''(r_ij), grad_i (x) grad_i v(bar{r}_ij)) for arrays of pairs"""
+        strength = _get_pair_parameters(self.strengths, index1, index2, "geometric")
+        distance = distances
+        return [(42*strength*distance**(-8), np.zeros((len(index1), 3, 3), float))]
+
 
 class PauliFF(PairFF):
     """Computes the Pauli repulsion interaction"""
 
-    def __init__(self, scaling, strengths, coordinates=None):
+    def __init__(self, scaling, strengths, coordinates=None, cutoff=None, exclusions=None, unit_cell=None):
         """Initialize a PauliFF
 
            Arguments:
              scaling  --  symmetric NxN array with pairwise scaling factors.
                           When an element is set to zero, it will be excluded.
-             strengths  --  a symmetric with linear coefficients in front of
-                            r**-12 for each atom pair
+                          Must be None when a cutoff is given.
+             strengths  --  a symmetric NxN array with linear coefficients in
+                            front of r**-12 for each atom pair, or an array
+                            with one coefficient for each atom, see
+                            :class:`DispersionFF`
 
            Optional arguments:
              coordinates  --  the initial Cartesian coordinates of the system,
                               which can be updated with the update_coordinates
                               method
+             cutoff, exclusions, unit_cell  --  see :class:`PairFF`
         """
-        PairFF.__init__(self, scaling, coordinates)
-        self.strengths = strengths
+        PairFF.__init__(self, scaling, coordinates, cutoff, exclusions, unit_cell)
+        self.strengths = np.asarray(strengths)
 
     def yield_pair_energies(self, index1, index2):
         """Yields pairs ((s(r_ij), v(bar{r}_ij))"""
-        strength = self.strengths[index1, index2]
+        strength = _get_pair_parameters(self.strengths, index1, index2, "geometric")
         distance = self.distances[index1, index2]
         yield strength*distance**(-12), 1
 
     def yield_pair_gradients(self, index1, index2):
         """Yields pairs ((s'(r_ij), grad_i v(bar{r}_ij))"""
-        strength = self.strengths[index1, index2]
+        strength = _get_pair_parameters(self.strengths, index1, index2, "geometric")
         distance = self.distances[index1, index2]
         yield -12*strength*distance**(-13), np.zeros(3)
 
     def yield_pair_hessians(self, index1, index2):
         """Yields pairs ((s''(r_ij), grad_i (x) grad_i v(bar{r}_ij))"""
-        strength = self.strengths[index1, index2]
+        strength = _get_pair_parameters(self.strengths, index1, index2, "geometric")
         distance = self.distances[index1, index2]
         yield 12*13*strength*distance**(-14), np.zeros((3, 3))
 
+    def get_pair_energies(self, index1, index2, deltas, distances):
+        """Returns a list of pairs (s(r_ij), v(bar{r}_ij)) for arrays of pairs"""
+        strength = _get_pair_parameters(self.strengths, index1, index2, "geometric")
+        distance = distances
+        return [(strength*distance**(-12), np.ones(len(index1), float))]
+
+    def get_pair_gradients(self, index1, index2, deltas, distances):
+        """Returns a list of pairs (s'(r_ij), grad_i v(bar{r}_ij)) for arrays of pairs"""
+        strength = _get_pair_parameters(self.strengths, index1, index2, "geometric")
+        distance = distances
+        return [(-12*strength*distance**(-13), np.zeros((len(index1), 3), float))]
+
+    def get_pair_hessians(self, index1, index2, deltas, distances):
+        """Returns a list of pairs (s''(r_ij), grad_i (x) grad_i v(bar{r}_ij)) for arrays of pairs"""
+        strength = _get_pair_parameters(self.strengths, index1, index2, "geometric")
+        distance = distances
+        return [(12*13*strength*distance**(-14), np.zeros((len(index1), 3, 3), float))]
+
 
 class ExpRepFF(PairFF):
     """Computes the exponential repulsion interaction"""
 
-    def __init__(self, scaling, As, Bs, coordinates=None):
+    def __init__(self, scaling, As, Bs, coordinates=None, cutoff=None, exclusions=None, unit_cell=None):
         """Initialize a ExpRepFF
 
            Arguments:
              scaling  --  symmetric NxN array with pairwise scaling factors.
                           When an element is set to zero, it will be excluded.
+                          Must be None when a cutoff is given.
              As  --  A matrix with pre-exponential factors
              Bs  --  A matrix with exponents
 
-           The repulsion has the form A*exp(-B*r)
+           The repulsion has the form A*exp(-B*r). Instead of NxN matrices, As
+           and Bs can also be arrays with one parameter for each atom. Then the
+           geometric mean of the As and the arithmetic mean of the Bs is used
+           for each pair, which avoids NxN arrays in combination with a
+           cutoff.
 
            Optional arguments:
              coordinates  --  the initial Cartesian coordinates of the system,
                               which can be updated with the update_coordinates
                               method
+             cutoff, exclusions, unit_cell  --  see :class:`PairFF`
         """
-        PairFF.__init__(self, scaling, coordinates)
-        self.As = As
-        self.Bs = Bs
+        PairFF.__init__(self, scaling, coordinates, cutoff, exclusions, unit_cell)
+        self.As = np.asarray(As)
+        self.Bs = np.asarray(Bs)
 
     def yield_pair_energies(self, index1, index2):
         """Yields pairs ((s(r_ij), v(bar{r}_ij))"""
-        A = self.As[index1, index2]
-        B = self.Bs[index1, index2]
+        A = _get_pair_parameters(self.As, index1, index2, "geometric")
+        B = _get_pair_parameters(self.Bs, index1, index2, "arithmetic")
         distance = self.distances[index1, index2]
         yield A*np.exp(-B*distance), 1
 
     def yield_pair_gradients(self, index1, index2):
         """Yields pairs ((s'(r_ij), grad_i v(bar{r}_ij))"""
-        A = self.As[index1, index2]
-        B = self.Bs[index1, index2]
+        A = _get_pair_parameters(self.As, index1, index2, "geometric")
+        B = _get_pair_parameters(self.Bs, index1, index2, "arithmetic")
         distance = self.distances[index1, index2]
         yield -B*A*np.exp(-B*distance), np.zeros(3)
 
     def yield_pair_hessians(self, index1, index2):
         """Yields pairs ((s''(r_ij), grad_i (x) grad_i v(bar{r}_ij))"""
-        A = self.As[index1, index2]
-        B = self.Bs[index1, index2]
+        A = _get_pair_parameters(self.As, index1, index2, "geometric")
+        B = _get_pair_parameters(self.Bs, index1, index2, "arithmetic")
         distance = self.distances[index1, index2]
         yield B*B*A*np.exp(-B*distance), np.zeros((3, 3))
+
+    def get_pair_energies(self, index1, index2, deltas, distances):
+        """Returns a list of pairs (s(r_ij), v(bar{r}_ij)) for arrays of pairs"""
+        A = _get_pair_parameters(self.As, index1, index2, "geometric")
+        B = _get_pair_parameters(self.Bs, index1, index2, "arithmetic")
+        distance = distances
+        return [(A*np.exp(-B*distance), np.ones(len(index1), float))]
+
+    def get_pair_gradients(self, index1, index2, deltas, distances):
+        """Returns a list of pairs (s'(r_ij), grad_i v(bar{r}_ij)) for arrays of pairs"""
+        A = _get_pair_parameters(self.As, index1, index2, "geometric")
+        B = _get_pair_parameters(self.Bs, index1, index2, "arithmetic")
+        distance = distances
+        return [(-B*A*np.exp(-B*distance), np.zeros((len(index1), 3), float))]
+
+    def get_pair_hessians(self, index1, index2, deltas, distances):
+        """Returns a list of pairs (s''(r_ij), grad_i (x) grad_i v(bar{r}_ij)) for arrays of pairs"""
+        A = _get_pair_parameters(self.As, index1, index2, "geometric")
+        B = _get_pair_parameters(self.Bs, index1, index2, "arithmetic")
+        distance = distances
+        return [(B*B*A*np.exp(-B*distance), np.zeros((len(index1), 3, 3), float))]
@@ -26,6 +26,7 @@
 from random import shuffle, sample
 
 from molmod.molecules import Molecule
+from molmod.binning import PairSearchIntra
 from molmod.graphs import GraphError
 from molmod.transformations import Translation, Complete
 from molmod.vectors import random_orthonormal, random_unit
@@ -339,12 +340,23 @@ def check_nonbond(molecule, thresholds):
     """
 
     # check that no atoms overlap
-    for atom1 in xrange(molecule.graph.num_vertices):
-        for atom2 in xrange(atom1):
-            if molecule.graph.distances[atom1, atom2] > 2:
-                distance = numpy.linalg.norm(molecule.coordinates[atom1] - molecule.coordinates[atom2])
-                if distance < thresholds[frozenset([molecule.numbers[atom1], molecule.numbers[atom2]])]:
-                    return False
+    if len(thresholds) == 0:
+        return True
+    graph = molecule.graph
+    size = graph.num_vertices
+    pair_search = PairSearchIntra(molecule.coordinates, max(thresholds.itervalues()))
+    index0, index1, deltas, distances = pair_search.get_arrays()
+    # only consider atoms in the same molecule, separated by more than two bonds
+    components = numpy.zeros(size, int)
+    for index, vertices in enumerate(graph.independent_vertices):
+        components[vertices] = index
+    close = graph.get_distances(max_depth=2)
+    close_rows = numpy.repeat(numpy.arange(size), close.indptr[1:] - close.indptr[:-1])
+    mask = components[index0] == components[index1]
+    mask &= ~numpy.in1d(index0.astype(int)*size + index1, close_rows*size + close.indices)
+    for atom1, atom2, distance in zip(index0[mask], index1[mask], distances[mask]):
+        if distance < thresholds[frozenset([molecule.numbers[atom1], molecule.numbers[atom2]])]:
+            return False
     return True
 
 
@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+# MolMod is a collection of molecular modelling tools for python.
+# Copyright (C) 2007 - 2012 Toon Verstraelen <Toon.Verstraelen@UGent.be>, Center
+# for Molecular Modeling (CMM), Ghent University, Ghent, Belgium; all rights
+# reserved unless otherwise stated.
+#
+# This file is part of MolMod.
+#
+# MolMod is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 3
+# of the License, or (at your option) any later version.
+#
+# MolMod is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>
+#
+#--
+"""Ring perception without an exhaustive pattern search
+
+   The routines in this module work directly on the compressed sparse row
+   representation of a :class:`molmod.graphs.Graph`. Rings are always returned
+   as integer arrays with the vertices in the order they appear in the ring.
+   The results are also available as cached attributes of a graph, e.g.
+   ``graph.sssr``, ``graph.relevant_cycles`` and ``graph.cycle_basis``.
+
+   The smallest set of smallest rings and the relevant cycles are computed with
+   the algorithm of Vismara:
+
+       P. Vismara, "Union of all the minimum cycle bases of a graph",
+       Electron. J. Combin. 4, R9 (1997)
+
+   Cycles are represented as sets of edges, encoded as the bits of a Python
+   integer, such that linear independence can be tested with a Gaussian
+   elimination over GF(2).
+"""
+
+
+from collections import deque
+
+import numpy
+
+
+__all__ = [
+    "PathCounter", "get_cycle_basis", "perceive_rings",
+]
+
+
+class _BFSWork(object):
+    """Work arrays for repeated breadth first searches on the same graph"""
+
+    def __init__(self, graph):
+        """
+           Argument:
+            | ``graph``  --  the graph on which the searches are carried out
+        """
+        self.indptr, self.indices = graph.csr[:2]
+        size = graph.num_vertices
+        self.queue = numpy.zeros(size, numpy.int32)
+        self.depth = numpy.zeros(size, numpy.int32)
+        self.depth[:] = -1
+        self.counts = numpy.zeros(size, numpy.int32)
+
+    def __call__(self, source, max_depth=None, limit=None):
+        """Return the visited vertices, their distances and path counts
+
+           Arguments:
+            | ``source``  --  the vertex where the search starts
+
+           Optional arguments:
+            | ``max_depth``  --  the search does not go further than this
+                                 distance from the source
+            | ``limit``  --  only vertices with a lower index are visited,
+                             besides the source
+        """
+        from molmod.ext import graphs_bfs_count
+        if max_depth is None:
+            max_depth = -1
+        if limit is None:
+            limit = len(self.depth)
+        count = graphs_bfs_count(
+            self.indptr, self.indices, source, max_depth, limit, self.queue,
+            self.depth, self.counts
+        )
+        queue = self.queue[:count].copy()
+        depth = self.depth[queue]
+        counts = self.counts[queue]
+        self.depth[queue] = -1
+        return queue, depth, counts
+
+
+class PathCounter(object):
+    """Counts the shortest paths between nearby vertices of a graph
+
+       The breadth first searches are carried out on demand, from each source
+       only up to max_depth, and their results are kept for later use. Use
+       :meth:`molmod.graphs.Graph.get_path_counter` to share one instance among
+       all users of the same graph.
+    """
+
+    def __init__(self, graph, max_depth):
+        """
+           Arguments:
+            | ``graph``  --  the graph in which the paths are counted
+            | ``max_depth``  --  the maximum length of the counted paths
+        """
+        self.graph = graph
+        self.max_depth = max_depth
+        self._bfs = _BFSWork(graph)
+        self._rows = {}
+
+    def __call__(self, a, b):
+        """Return the distance and the number of shortest paths from a to b
+
+           When b can not be reached from a within max_depth steps, the result
+           is (-1, 0).
+        """
+        row = self._rows.get(a)
+        if row is None:
+            queue, depth, counts = self._bfs(a, self.max_depth)
+            row = dict(zip(queue.tolist(), zip(depth.tolist(), counts.tolist())))
+            self._rows[a] = row
+        return row.get(b, (-1, 0))
+
+
+def _get_ring(path0, path1):
+    """Join two paths with a common first vertex into a ring array"""
+    return numpy.array(list(path0) + list(path1[:0:-1]), int)
+
+
+def get_cycle_basis(graph):
+    """Return a fundamental cycle basis of a graph
+
+       Argument:
+        | ``graph``  --  a :class:`molmod.graphs.Graph` instance
+
+       A breadth first search tree is constructed for each connected component.
+       Every edge that is not part of a tree closes one cycle of the basis.
+       The result is a list with num_edges - num_vertices + num_components
+       integer arrays.
+    """
+    indptr, indices = graph.csr[:2]
+    indptr = indptr.tolist()
+    indices = indices.tolist()
+    parents = [-1]*graph.num_vertices
+    depths = [-1]*graph.num_vertices
+    result = []
+    for root in xrange(graph.num_vertices):
+        if depths[root] >= 0:
+            continue
+        depths[root] = 0
+        todo = deque([root])
+        while len(todo) > 0:
+            i = todo.popleft()
+            for j in indices[indptr[i]:indptr[i+1]]:
+                if depths[j] < 0:
+                    depths[j] = depths[i] + 1
+                    parents[j] = i
+                    todo.append(j)
+                elif j > i and parents[i] != j and parents[j] != i:
+                    # a non-tree edge: walk up to the common ancestor
+                    path0 = [i]
+                    path1 = [j]
+                    while path0[-1] != path1[-1]:
+                        if depths[path0[-1]] >= depths[path1[-1]]:
+                            path0.append(parents[path0[-1]])
+                        else:
+                            path1.append(parents[path1[-1]])
+                    result.append(_get_ring(path0[::-1], path1[::-1]))
+    return result
+
+
+def _iter_paths(preds, source, vertex):
+    """Iterate over all shortest paths from source to vertex"""
+    if vertex == source:
+        yield [source]
+        return
+    for pred in preds[vertex]:
+        for path in _iter_paths(preds, source, pred):
+            path.append(vertex)
+            yield path
+
+
+def _get_path(preds, source, vertex):
+    """Return one shortest path from source to vertex"""
+    path = [vertex]
+    while vertex != source:
+        vertex = preds[vertex][0]
+        path.append(vertex)
+    return path[::-1]
+
+
+def _reduce(bits, basis):
+    """Reduce a cycle with a basis in row echelon form over GF(2)
+
+       The basis is a dictionary with the leading bit as key. The result is zero
+       when the cycle is a linear combination of the basis vectors.
+    """
+    while bits:
+        other = basis.get(bits.bit_length() - 1)
+        if other is None:
+            break
+        bits ^= other
+    return bits
+
+
+def perceive_rings(graph, max_size=None):
+    """Return the smallest set of smallest rings and the relevant cycles
+
+       Argument:
+        | ``graph``  --  a :class:`molmod.graphs.Graph` instance
+
+       Optional argument:
+        | ``max_size``  --  only consider rings up to this size. This limits the
+                            depth of all breadth first searches, which makes the
+                            cost linear in the number of vertices for graphs
+                            with a bounded degree.
+
+       Returns: ``sssr, relevant_cycles``. The first is a minimum cycle basis,
+       (or the part of it with rings up to max_size), the second is the union
+       of all minimum cycle bases. Both are lists of integer arrays, sorted by
+       ring size.
+
+       The candidate cycles (prototypes) are constructed from the shortest
+       paths from each vertex r that only pass through vertices with a lower
+       index. The prototypes that are not a linear combination of strictly
+       smaller cycles are relevant, and their families of equivalent cycles
+       are enumerated to obtain all relevant cycles.
+    """
+    if max_size is None:
+        max_depth = None
+    else:
+        max_depth = max_size/2
+    edge_ids = {}
+    for index, (a, b) in enumerate(graph.edge_array.tolist()):
+        edge_ids[a, b] = index
+        edge_ids[b, a] = index
+
+    def get_bits(ring):
+        """Return the edges of a ring as the bits of an integer"""
+        bits = 0
+        for i in xrange(len(ring)):
+            bits |= 1 << edge_ids[ring[i-1], ring[i]]
+        return bits
+
+    # A) Construct the prototypes
+    bfs = _BFSWork(graph)
+    indptr, indices = graph.csr[:2]
+    indptr = indptr.tolist()
+    indices = indices.tolist()
+    prototypes = []
+    for r in xrange(graph.num_vertices):
+        queue, depth, counts = bfs(r, max_depth, r)
+        distances = dict(zip(queue.tolist(), depth.tolist()))
+        preds = {}
+        for y in queue.tolist()[1:]:
+            d = distances[y]
+            neighbors = indices[indptr[y]:indptr[y+1]]
+            preds[y] = [z for z in neighbors if distances.get(z) == d - 1]
+        for y in queue.tolist()[1:]:
+            d = distances[y]
+            path_y = _get_path(preds, r, y)
+            # odd cycles
+            if max_size is None or 2*d + 1 <= max_size:
+                for z in indices[indptr[y]:indptr[y+1]]:
+                    if z < y and distances.get(z) == d:
+                        path_z = _get_path(preds, r, z)
+                        if len(set(path_y).intersection(path_z)) == 1:
+                            ring = path_y + path_z[:0:-1]
+                            prototypes.append((2*d + 1, get_bits(ring), ring, (r, preds, (y,), (z,))))
+            # even cycles
+            if max_size is None or 2*d <= max_size:
+                ends = preds[y]
+                for i0 in xrange(len(ends)):
+                    path_p = _get_path(preds, r, ends[i0])
+                    for i1 in xrange(i0):
+                        path_q = _get_path(preds, r, ends[i1])
+                        if len(set(path_p).intersection(path_q)) == 1:
+                            ring = path_p + [y] + path_q[:0:-1]
+                            prototypes.append((2*d, get_bits(ring), ring, (r, preds, (ends[i0], y), (ends[i1],))))
+    prototypes.sort(key=(lambda item: item[0]))
+
+    # B) Select the relevant prototypes and the minimum cycle basis
+    basis = {}
+    sssr = []
+    relevant = []
+    begin = 0
+    while begin < len(prototypes):
+        size = prototypes[begin][0]
+        end = begin
+        while end < len(prototypes) and prototypes[end][0] == size:
+            end += 1
+        group = [
+            prototype for prototype in prototypes[begin:end]
+            if _reduce(prototype[1], basis) != 0
+        ]
+        for prototype in group:
+            bits = _reduce(prototype[1], basis)
+            if bits != 0:
+                basis[bits.bit_length() - 1] = bits
+                sssr.append(numpy.array(prototype[2], int))
+        relevant.extend(group)
+        begin = end
+
+    # C) Enumerate the families of the relevant prototypes
+    relevant_cycles = []
+    done = set([])
+    for size, bits, ring, (r, preds, tail0, tail1) in relevant:
+        for path0 in _iter_paths(preds, r, tail0[0]):
+            path0 = path0 + list(tail0[1:])
+            for path1 in _iter_paths(preds, r, tail1[0]):
+                if len(set(path0).intersection(path1)) != 1:
+                    continue
+                ring = path0 + path1[:0:-1]
+                bits = get_bits(ring)
+                if bits not in done:
+                    done.add(bits)
+                    relevant_cycles.append(numpy.array(ring, int))
+    return sssr, relevant_cycles
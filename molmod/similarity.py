@@ -54,11 +54,19 @@ class SimilarityDescriptor(object):
 
            Arguments:
              distance_matrix  --  a matrix with interatomic distances, this can
-                                  also be distances in a graph
+                                  also be distances in a graph. One may also
+                                  give the condensed form of the distance
+                                  matrix, i.e. a 1D array with the strictly
+                                  lower triangle, row by row. (See
+                                  molecules_distance_condensed in the ext
+                                  module.)
              labels  --  a list with integer labels used to identify atoms of
                          the same type
         """
-        self.table_distances = similarity_table_distances(distance_matrix)
+        if len(distance_matrix.shape) == 1:
+            self.table_distances = distance_matrix
+        else:
+            self.table_distances = similarity_table_distances(distance_matrix)
         self.table_labels = similarity_table_labels(labels.astype(numpy.int32))
         order = numpy.lexsort([self.table_labels[:, 1], self.table_labels[:, 0]])
         self.table_labels = self.table_labels[order]
@@ -76,7 +84,7 @@ class SimilarityDescriptor(object):
         """
         if labels is None:
             labels = molecule.numbers
-        return cls(molecule.distance_matrix, labels)
+        return cls.from_coordinates(molecule.coordinates, labels)
 
     @classmethod
     def from_molecular_graph(cls, molecular_graph, labels=None):
@@ -101,9 +109,8 @@ class SimilarityDescriptor(object):
              labels  --  a list with integer labels used to identify atoms of
                          the same type
         """
-        from molmod.ext import molecules_distance_matrix
-        distance_matrix = molecules_distance_matrix(coordinates)
-        return cls(distance_matrix, labels)
+        from molmod.ext import molecules_distance_condensed
+        return cls(molecules_distance_condensed(coordinates), labels)
 
 
 def compute_similarity(a, b, margin=1.0, cutoff=10.0):
@@ -58,7 +58,7 @@ class BinningTestCase(unittest.TestCase):
                 fast_distance = distances.get(identifier)
                 if fast_distance is None:
                     missing_pairs.append(tuple(identifier) + (distance,))
-                elif fast_distance != distance:
+                elif abs(fast_distance - distance) > 1e-10:
                     wrong_distances.append(tuple(identifier) + (fast_distance, distance))
                 else:
                     num_correct += 1
@@ -185,6 +185,18 @@ class BinningTestCase(unittest.TestCase):
             ]
             self.verify_distances_intra(coordinates, cutoff, distances, unit_cell)
 
+    def test_distances_intra_dense(self):
+        # more pairs than the initial size of the buffers in the extension
+        coordinates = numpy.random.uniform(0,1,(200,3))
+        cutoff = 10.0
+        distances = [
+            (frozenset([i0, i1]), distance)
+            for i0, i1, delta, distance
+            in PairSearchIntra(coordinates, cutoff)
+        ]
+        self.assertEqual(len(distances), 200*199/2)
+        self.verify_distances_intra(coordinates, cutoff, distances)
+
     def test_distances_inter_random(self):
         for i in xrange(10):
             coordinates0 = numpy.random.uniform(0,5,(20,3))
@@ -221,3 +233,78 @@ class BinningTestCase(unittest.TestCase):
                 in pair_search
             ]
             self.verify_distances_inter(coordinates0, coordinates1, cutoff, distances, unit_cell)
+
+    def test_get_arrays_intra_periodic(self):
+        coordinates = XYZFile(context.get_fn("test/lau.xyz")).geometries[0]
+        cutoff = periodic.max_radius*2
+        unit_cell = UnitCell.from_parameters3(
+            numpy.array([14.59, 12.88, 7.61])*angstrom,
+            numpy.array([ 90.0, 111.0, 90.0])*deg,
+        )
+        pair_search = PairSearchIntra(coordinates, cutoff, unit_cell)
+        index0, index1, deltas, distances = pair_search.get_arrays()
+        self.assertEqual(deltas.shape, (len(index0), 3))
+        self.assert_((index1 < index0).all())
+        self.assert_((distances <= cutoff).all())
+        expected = unit_cell.shortest_vector(coordinates[index1] - coordinates[index0])
+        self.assert_(abs(deltas - expected).max() < 1e-10)
+        self.assert_(abs(numpy.sqrt((deltas**2).sum(axis=1)) - distances).max() < 1e-10)
+        self.assertEqual(
+            set(zip(index0, index1)),
+            set((i0, i1) for i0, i1, delta, distance in pair_search)
+        )
+
+    def test_get_arrays_inter_empty(self):
+        coordinates0 = numpy.zeros((3, 3), float)
+        coordinates1 = numpy.ones((2, 3), float)*10
+        index0, index1, deltas, distances = PairSearchInter(coordinates0, coordinates1, 1.0).get_arrays()
+        self.assertEqual(index0.shape, (0,))
+        self.assertEqual(index1.shape, (0,))
+        self.assertEqual(deltas.shape, (0, 3))
+        self.assertEqual(distances.shape, (0,))
+
+    def test_verlet_list_random_periodic(self):
+        unit_cell = UnitCell(numpy.identity(3)*10.0)
+        cutoff = 2.5
+        verlet_list = VerletList(cutoff, 1.0, unit_cell)
+        coordinates = numpy.random.uniform(0, 10, (100, 3))
+        for i in xrange(20):
+            coordinates += numpy.random.uniform(-0.1, 0.1, coordinates.shape)
+            index0, index1, deltas, distances = verlet_list.update(coordinates)
+            distances = [
+                (frozenset([i0, i1]), distance)
+                for i0, i1, distance
+                in zip(index0, index1, distances)
+            ]
+            self.verify_distances_intra(coordinates, cutoff, distances, unit_cell)
+        self.assert_(verlet_list.num_builds > 1)
+        self.assert_(verlet_list.num_builds < 20)
+
+    def test_verlet_list_candidates(self):
+        cutoff = 2.5
+        verlet_list = VerletList(cutoff, 1.0)
+        coordinates = numpy.random.uniform(0, 10, (100, 3))
+        old = None
+        for i in xrange(20):
+            coordinates += numpy.random.uniform(-0.1, 0.1, coordinates.shape)
+            index0, index1 = verlet_list.get_candidates(coordinates)
+            if old is not None and verlet_list.num_builds == old[2]:
+                # the same arrays are returned until the next pair search
+                self.assert_(index0 is old[0])
+                self.assert_(index1 is old[1])
+            old = index0, index1, verlet_list.num_builds
+            candidates = set(zip(index0.tolist(), index1.tolist()))
+            for i0, i1 in zip(*verlet_list.update(coordinates)[:2]):
+                self.assert_((i0, i1) in candidates)
+        self.assert_(verlet_list.num_builds > 1)
+        self.assert_(verlet_list.num_builds < 20)
+
+    def test_verlet_list_empty(self):
+        verlet_list = VerletList(2.5, 1.0)
+        coordinates = numpy.zeros((0, 3), float)
+        for i in xrange(2):
+            index0, index1 = verlet_list.get_candidates(coordinates)
+            self.assertEqual(len(index0), 0)
+            index0, index1, deltas, distances = verlet_list.update(coordinates)
+            self.assertEqual(len(distances), 0)
+        self.assertEqual(verlet_list.num_builds, 1)
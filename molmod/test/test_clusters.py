@@ -63,3 +63,55 @@ class ClusterTestCase(unittest.TestCase):
         self.assertEqual(clusters[0].rules, ["u=v"])
         self.assertEqual(clusters[1].items, set(["x", "y", "z"]))
         self.assertEqual(clusters[1].rules, ["x*z=2", "x+y=1"])
+
+    def test_union_find(self):
+        size = 1000
+        pairs = numpy.random.randint(0, size, (600, 2))
+        # reference with one union at a time
+        uf0 = UnionFind(size)
+        merged = 0
+        for i, j in pairs:
+            merged += uf0.union(i, j)
+        uf1 = UnionFind(size)
+        self.assertEqual(uf1.add_pairs(pairs), merged)
+        groups = uf1.get_groups()
+        self.assertEqual(groups, uf0.get_groups())
+        self.assertEqual(len(groups), size - merged)
+        self.assertEqual(sorted(sum(groups, [])), range(size))
+        labels = uf1.get_labels()
+        for i, j in pairs:
+            self.assertEqual(labels[i], labels[j])
+            self.assertEqual(uf1.find(i), uf1.find(j))
+        self.assertEqual([group[0] for group in groups], sorted(group[0] for group in groups))
+        # compare with the clusters of the ClusterFactory
+        cf = ClusterFactory()
+        for i in xrange(size):
+            cf.add_related(i)
+        for i, j in pairs:
+            cf.add_related(i, j)
+        self.assertEqual(
+            sorted(sorted(cluster.items) for cluster in cf.get_clusters()),
+            sorted(groups),
+        )
+
+    def test_union_find_grow(self):
+        uf = UnionFind()
+        self.assertEqual(uf.get_groups(), [])
+        uf.grow(3)
+        uf.add_pairs([(0, 2)])
+        uf.grow(5)
+        uf.union(4, 1)
+        self.assertEqual(uf.get_groups(), [[0, 2], [1, 4], [3]])
+        self.assertRaises(ValueError, uf.add_pairs, [(0, 5)])
+        # a failed call does not merge the valid pairs before the invalid one
+        self.assertRaises(ValueError, uf.add_pairs, [(0, 3), (1, -1)])
+        self.assertEqual(uf.get_groups(), [[0, 2], [1, 4], [3]])
+
+    def test_union_find_empty(self):
+        uf = UnionFind()
+        self.assertEqual(uf.add_pairs(numpy.zeros((0, 2), int)), 0)
+        self.assertEqual(uf.get_labels().shape, (0,))
+        self.assertEqual(uf.get_labels().dtype, numpy.int32)
+        self.assertEqual(uf.get_groups(), [])
+        self.assertRaises(ValueError, uf.add_pairs, [(0, 0)])
+        self.assertEqual(ClusterFactory().get_clusters(), set([]))
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# MolMod is a collection of molecular modelling tools for python.
+# Copyright (C) 2007 - 2012 Toon Verstraelen <Toon.Verstraelen@UGent.be>, Center
+# for Molecular Modeling (CMM), Ghent University, Ghent, Belgium; all rights
+# reserved unless otherwise stated.
+#
+# This file is part of MolMod.
+#
+# MolMod is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 3
+# of the License, or (at your option) any later version.
+#
+# MolMod is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>
+#
+#--
+
+
+from molmod.test.common import BaseTestCase
+from molmod.ewald import _bspline_weights
+from molmod import *
+
+import numpy, unittest
+
+
+__all__ = ["EwaldTestCase"]
+
+
+class EwaldTestCase(BaseTestCase):
+    def get_random_system(self, size=20):
+        unit_cell = UnitCell(numpy.diag([10.0, 11.0, 12.0]) + numpy.random.uniform(-1, 1, (3, 3)))
+        coordinates = numpy.random.uniform(0, 10, (size, 3))
+        charges = numpy.random.normal(0, 1, size)
+        charges -= charges.mean()
+        return coordinates, charges, unit_cell
+
+    def test_bspline_weights(self):
+        fractions = numpy.random.uniform(0, 1, 10)
+        for order in 3, 4, 6:
+            values, derivatives = _bspline_weights(fractions, order)
+            self.assertEqual(values.shape, (10, order))
+            # partition of unity
+            self.assertArraysAlmostEqual(values.sum(axis=1), numpy.ones(10))
+            self.assertArraysAlmostEqual(derivatives.sum(axis=1), numpy.zeros(10), doabs=True)
+            # finite differences
+            eps = 1e-6
+            values_eps = _bspline_weights(fractions + eps, order)[0]
+            self.assertArraysAlmostEqual((values_eps - values)/eps, derivatives, 1e-4, doabs=True)
+
+    def test_real_kernel(self):
+        ewald = EwaldSum(0.7, 5.0)
+        distances = numpy.random.uniform(0.5, 3.0, 10)
+        eps = 1e-6
+        k0, d0, dd0 = ewald.get_real_kernel(distances)
+        k1, d1, dd1 = ewald.get_real_kernel(distances + eps)
+        self.assertArraysAlmostEqual((k1 - k0)/eps, d0, 1e-4)
+        self.assertArraysAlmostEqual((d1 - d0)/eps, dd0, 1e-4)
+        # large distances
+        self.assertArraysAlmostEqual(ewald.get_real_kernel(numpy.array([10.0]))[0], numpy.zeros(1), doabs=True)
+
+    def test_pme_vs_sum(self):
+        coordinates, charges, unit_cell = self.get_random_system()
+        energy1, esp1, efield1 = EwaldSum(0.5, 12.0).compute(coordinates, charges, unit_cell)
+        energy2, esp2, efield2 = ParticleMeshEwald(0.5, 0.3, 6).compute(coordinates, charges, unit_cell)
+        self.assertAlmostEqual(energy1, energy2, 5)
+        self.assertArraysAlmostEqual(esp1, esp2, 1e-5, doabs=True)
+        self.assertArraysAlmostEqual(efield1, efield2, 1e-5, doabs=True)
+        # the number of grid points can also be given explicitly
+        energy3 = ParticleMeshEwald(0.5, [36, 40, 44], 6).compute(coordinates, charges, unit_cell)[0]
+        self.assertAlmostEqual(energy1, energy3, 5)
+
+    def check_efield(self, ewald):
+        coordinates, charges, unit_cell = self.get_random_system(5)
+        energy, esp, efield = ewald.compute(coordinates, charges, unit_cell)
+        self.assertAlmostEqual(energy, 0.5*numpy.dot(charges, esp))
+        eps = 1e-5
+        for i in xrange(3):
+            tmp = coordinates.copy()
+            tmp[1, i] += eps
+            energy_eps = ewald.compute(tmp, charges, unit_cell)[0]
+            self.assertAlmostEqual((energy_eps - energy)/eps, -charges[1]*efield[1, i], 4)
+
+    def test_efield_sum(self):
+        self.check_efield(EwaldSum(0.5, 12.0))
+
+    def test_efield_pme(self):
+        self.check_efield(ParticleMeshEwald(0.5, 0.5, 6))
+
+    def test_charged_background(self):
+        coordinates, charges, unit_cell = self.get_random_system(5)
+        charges += 0.3
+        ewald = EwaldSum(0.5, 12.0)
+        energy, esp = ewald.compute(coordinates, charges, unit_cell)[:2]
+        # the esp is the derivative of the energy towards the charges
+        eps = 1e-6
+        for i in xrange(5):
+            tmp = charges.copy()
+            tmp[i] += eps
+            self.assertAlmostEqual((ewald.compute(coordinates, tmp, unit_cell)[0] - energy)/eps, esp[i], 4)
+
+    def test_errors(self):
+        self.assertRaises(ValueError, EwaldSum, 0.0, 10.0)
+        self.assertRaises(ValueError, ParticleMeshEwald, 0.5, 1.0, 2)
+        coordinates, charges, unit_cell = self.get_random_system(5)
+        ewald = EwaldSum(0.5, 12.0)
+        self.assertRaises(ValueError, ewald.compute, coordinates, charges, None)
+        unit_cell = UnitCell(unit_cell.matrix, numpy.array([True, True, False]))
+        self.assertRaises(ValueError, ewald.compute, coordinates, charges, unit_cell)
@@ -289,6 +289,72 @@ class GraphTestCase(unittest.TestCase):
         self.assertEqual(expecting.shape,graph.distances.shape)
         self.assert_((expecting==graph.distances).all())
 
+    def test_distances_floyd_warshall(self):
+        from molmod.ext import graphs_floyd_warshall
+        for case in self.iter_cases(disconnected=True):
+            g = case.graph
+            expecting = numpy.zeros((g.num_vertices,)*2, numpy.int32)
+            for i, j in g.edges:
+                expecting[i, j] = 1
+                expecting[j, i] = 1
+            graphs_floyd_warshall(expecting)
+            self.assert_((expecting == g.distances).all())
+
+    def test_get_distances_max_depth(self):
+        for case in self.iter_cases(disconnected=True):
+            g = case.graph
+            for max_depth in 0, 1, 2, 3:
+                sparse = g.get_distances(max_depth)
+                expecting = g.distances*(g.distances <= max_depth)
+                self.assert_((sparse.to_dense() == expecting).all())
+                self.assertEqual(sparse.num_nonzero, (expecting > 0).sum())
+                for i in xrange(g.num_vertices):
+                    neighbors, distances = sparse.get_row(i)
+                    self.assert_((numpy.diff(neighbors) > 0).all())
+                    self.assert_((distances <= max_depth).all())
+        self.assert_(g.get_distances() is g.distances)
+        # a long chain, which does not fit in the initial buffer
+        g = Graph([(i, i+1) for i in xrange(50)])
+        self.assert_((g.get_distances(100).to_dense() == g.distances).all())
+
+    def test_independent_vertices_empty(self):
+        self.assertEqual(Graph([], 0).independent_vertices, [])
+
+    def test_csr(self):
+        for case in self.iter_cases(disconnected=True):
+            g = case.graph
+            indptr, indices, edge_ids = g.csr
+            self.assertEqual(len(indptr), g.num_vertices+1)
+            self.assertEqual(len(indices), 2*g.num_edges)
+            for i in xrange(g.num_vertices):
+                neighbors = indices[indptr[i]:indptr[i+1]]
+                self.assertEqual(list(neighbors), sorted(g.neighbors[i]))
+                for j, edge_id in zip(neighbors, edge_ids[indptr[i]:indptr[i+1]]):
+                    self.assertEqual(g.edges[edge_id], frozenset([i, j]))
+
+    def test_edge_array(self):
+        import cPickle
+        for case in self.iter_cases(disconnected=True):
+            g0 = case.graph
+            g1 = Graph(numpy.array([sorted(edge) for edge in g0.edges]))
+            self.assertEqual(g1.num_vertices, g0.num_vertices)
+            self.assertEqual(g1.num_edges, g0.num_edges)
+            self.assertEqual(g1.edges, g0.edges)
+            self.assert_((g1.csr[0] == g0.csr[0]).all())
+            self.assert_((g1.csr[1] == g0.csr[1]).all())
+            self.assertEqual(g1.independent_vertices, g0.independent_vertices)
+            g2 = cPickle.loads(cPickle.dumps(Graph(g1.edge_array)))
+            self.assertEqual(g2.edges, g0.edges)
+            g3 = g1*3
+            self.assertEqual(g3.num_vertices, 3*g0.num_vertices)
+            self.assertEqual(set(g3.edges), set((g0*3).edges))
+        self.assertEqual(Graph(numpy.zeros((0, 2), int), 4).num_vertices, 4)
+        self.assertRaises(TypeError, Graph, numpy.zeros((3, 3), int))
+        self.assertRaises(TypeError, Graph, numpy.zeros((3, 2), float))
+        self.assertRaises(TypeError, Graph, numpy.array([[0, 1], [-1, 2]]))
+        self.assertRaises(ValueError, Graph, numpy.array([[0, 1], [2, 2]]))
+        self.assertRaises(ValueError, Graph, numpy.array([[0, 1], [1, 2]]), 2)
+
     def test_neighbors(self):
         for case in self.iter_cases():
             g = case.graph
@@ -324,6 +390,43 @@ class GraphTestCase(unittest.TestCase):
             for i in xrange(g0.num_vertices):
                 self.assert_((g0.vertex_fingerprints[i]==g1.vertex_fingerprints[permutation[i]]).all())
 
+    def test_vertex_fingerprints_stable(self):
+        import hashlib
+        def get_reference(g, vertex_strings, edge_strings):
+            hashrow = lambda x: numpy.frombuffer(hashlib.sha1(x).digest(), numpy.ubyte)
+            result = numpy.zeros((g.num_vertices, 20), numpy.ubyte)
+            for i in xrange(g.num_vertices):
+                result[i] = hashrow(vertex_strings[i])
+            for i in xrange(g.num_edges):
+                a, b = g.edges[i]
+                tmp = hashrow(edge_strings[i])
+                result[a] += tmp
+                result[b] += tmp
+            work = result.copy()
+            for i in xrange(g.max_distance):
+                for a, b in g.edges:
+                    work[a] += result[b]
+                    work[b] += result[a]
+                for a in xrange(g.num_vertices):
+                    result[a] = hashrow(work[a].tostring())
+            return result
+        def get_classes(fingerprints):
+            return sorted(set(
+                tuple((fingerprints == row).all(axis=1).nonzero()[0])
+                for row in fingerprints
+            ))
+        for case in self.iter_cases():
+            g = case.graph
+            vertex_strings = [str(i%3) for i in xrange(g.num_vertices)]
+            edge_strings = [str(i%2) for i in xrange(g.num_edges)]
+            fps0 = get_reference(g, vertex_strings, edge_strings)
+            fps1 = g.get_vertex_fingerprints(vertex_strings, edge_strings, stable=True)
+            self.assert_((fps0 == fps1).all())
+            # the fast fingerprints must lead to the same equivalent vertices
+            fps0 = get_reference(g, [""]*g.num_vertices, [""]*g.num_edges)
+            self.assertEqual(g.vertex_fingerprints.shape, fps0.shape)
+            self.assertEqual(get_classes(g.vertex_fingerprints), get_classes(fps0))
+
     def test_symmetries(self):
         cases = self.iter_cases()
         for case in cases:
@@ -375,6 +478,44 @@ class GraphTestCase(unittest.TestCase):
             self.assert_(len(unexpected) == 0, message())
             self.assert_(len(unsatisfied) == 0, message())
 
+    def test_canonical_form(self):
+        forms = set([])
+        for case in self.iter_cases(disconnected=True):
+            g0 = case.graph
+            self.assertEqual(sorted(g0.canonical_labeling), range(g0.num_vertices))
+            for i in xrange(3):
+                permutation = numpy.random.permutation(g0.num_vertices)
+                g1 = g0.get_subgraph(permutation, normalize=True)
+                self.assertEqual(g0.canonical_form, g1.canonical_form)
+                self.assertEqual(
+                    g0.get_subgraph(g0.canonical_labeling, normalize=True).edges,
+                    g1.get_subgraph(g1.canonical_labeling, normalize=True).edges,
+                )
+                match = g0.full_match(g1)
+                self.assertEqual(len(match), g0.num_vertices)
+                self.assertEqual(
+                    set(frozenset(match.forward[vertex0] for vertex0 in edge) for edge in g0.edges),
+                    set(g1.edges),
+                )
+            forms.add((g0.edges, g0.canonical_form))
+        # only the test cases with the same edges are isomorphic
+        self.assertEqual(len(forms), len(set(form for edges, form in forms)))
+
+    def test_automorphism_generators(self):
+        for case in self.iter_cases(disconnected=True):
+            g = case.graph
+            edges = set(g.edges)
+            for generator in g.automorphism_generators:
+                self.assertEqual(sorted(generator), range(g.num_vertices))
+                self.assertEqual(set(frozenset(generator[list(edge)]) for edge in edges), edges)
+            if len(g.independent_vertices) == 1:
+                # compare with an exhaustive search
+                cycles = set(
+                    match.get_closed_cycles() for match
+                    in GraphSearch(EqualPattern(g))(g)
+                )
+                self.assertEqual(cycles, g.symmetry_cycles)
+
     def test_equivalent_vertices(self):
         for case in self.iter_cases(disconnected=False):
             g = case.graph
@@ -463,6 +604,52 @@ class GraphTestCase(unittest.TestCase):
                 #print path
             self.assertEqual(len(expected_paths), 0)
 
+    def test_path_counter(self):
+        for case in self.iter_cases(disconnected=True):
+            graph = case.graph
+            counter = graph.get_path_counter(4)
+            self.assert_(graph.get_path_counter(4) is counter)
+            for a in xrange(graph.num_vertices):
+                for b in xrange(graph.num_vertices):
+                    paths = list(graph.iter_shortest_paths(a, b))
+                    if len(paths) == 0 or len(paths[0]) > 5:
+                        self.assertEqual(counter(a, b), (-1, 0))
+                    else:
+                        self.assertEqual(counter(a, b), (len(paths[0])-1, len(paths)))
+
+    def test_ring_perception(self):
+        from molmod.rings import _reduce
+        def check_ring(graph, ring):
+            self.assertEqual(len(set(ring)), len(ring))
+            for i in xrange(len(ring)):
+                self.assert_(ring[i-1] in graph.neighbors[ring[i]])
+            return frozenset(
+                graph.edge_index[frozenset([ring[i-1], ring[i]])]
+                for i in xrange(len(ring))
+            )
+        for case in self.iter_cases(disconnected=True):
+            graph = case.graph
+            rank = graph.num_edges - graph.num_vertices + len(graph.independent_vertices)
+            for rings in graph.cycle_basis, graph.sssr:
+                self.assertEqual(len(rings), rank)
+                basis = {}
+                for ring in rings:
+                    bits = sum(1 << edge for edge in check_ring(graph, ring))
+                    bits = _reduce(bits, basis)
+                    self.assertNotEqual(bits, 0)
+                    basis[bits.bit_length() - 1] = bits
+            sizes = [len(ring) for ring in graph.sssr]
+            self.assertEqual(sizes, sorted(sizes))
+            relevant = set(check_ring(graph, ring) for ring in graph.relevant_cycles)
+            self.assertEqual(len(relevant), len(graph.relevant_cycles))
+            for ring in graph.sssr:
+                self.assert_(check_ring(graph, ring) in relevant)
+            if case.name in ["cube", "tetraeder"]:
+                self.assertEqual(relevant, set(check_ring(graph, ring) for ring in case.rings))
+            elif case.name == "cage":
+                self.assertEqual(len(relevant), 3)
+                self.assertEqual(set(len(ring) for ring in graph.relevant_cycles), set([6]))
+
     def test_get_subgraph(self):
         for case in self.iter_cases():
             #print case.name
@@ -570,6 +757,14 @@ class GraphTestCase(unittest.TestCase):
         self.assertEqual(part2, set([3,4,9,10,11,12]))
         self.assertEqual(hinges, (1,4,2,3))
 
+    def test_get_part(self):
+        edges = [(0,1), (1,2), (2,3), (1,4), (1,5), (5,6), (3,7), (7,8), (8,9), (9,3)]
+        g = Graph(edges)
+        self.assertEqual(g.get_part(1, [2, 5]), set([0,1,4]))
+        self.assertEqual(g.get_part(3, [2]), set([3,7,8,9]))
+        self.assertEqual(g.get_part(3, []), set(range(10)))
+        self.assertEqual(g.get_part(8, [3, 9]), set([7,8]))
+
     # match generator related tests
 
     def check_graph_search(self, pattern, verbose=False, debug=False, callback=None):
@@ -616,6 +811,46 @@ class GraphTestCase(unittest.TestCase):
 
             graph_search(case.graph).next()
 
+    def test_prune(self):
+        def get_matches(pattern, subject_graph, prune):
+            return set(
+                frozenset(match.forward.iteritems()) for match
+                in GraphSearch(pattern, prune=prune)(subject_graph)
+            )
+        pattern_graphs = [case.graph for case in self.iter_cases()][:8]
+        for case in self.iter_cases():
+            patterns = [RingPattern(10), EqualPattern(case.graph)]
+            for pattern_graph in pattern_graphs:
+                patterns.append(CustomPattern(pattern_graph))
+                patterns.append(CustomPattern(pattern_graph, criteria_sets=[CriteriaSet()]))
+            for pattern in patterns:
+                matches0 = get_matches(pattern, case.graph, False)
+                matches1 = get_matches(pattern, case.graph, True)
+                self.assertEqual(matches0, matches1)
+
+    def test_workers(self):
+        mol = Molecule.from_file(context.get_fn("test/opt_5ring12T.xyz"))
+        mol.set_default_graph()
+        patterns = [
+            RingPattern(12),
+            CustomPattern(Graph([(0, 1), (1, 2)]), criteria_sets=[CriteriaSet(tag="bend")]),
+        ]
+        for pattern in patterns:
+            matches0 = list(GraphSearch(pattern)(mol.graph))
+            matches1 = list(GraphSearch(pattern, workers=2)(mol.graph))
+            self.assert_(len(matches0) > 0)
+            self.assertEqual(
+                [match.forward for match in matches0],
+                [match.forward for match in matches1],
+            )
+            self.assertEqual(
+                [match.__dict__.get("tag") for match in matches0],
+                [match.__dict__.get("tag") for match in matches1],
+            )
+            match0 = GraphSearch(pattern)(mol.graph, one_match=True).next()
+            match1 = GraphSearch(pattern, workers=2)(mol.graph, one_match=True).next()
+            self.assertEqual(match0.forward, match1.forward)
+
     def test_start_vertex(self):
         subject_graph = Graph([(0,1),(1,2),(1,3),(2,4)])
         pattern_graph = Graph([(0,1),(1,2)])
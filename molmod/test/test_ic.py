@@ -245,3 +245,50 @@ def test_opbend_ethene():
         ]
         assert abs(ic.opbend_cos([c[0], c[5], c[4], c[3]])[0] - np.cos(angle)) < 1e-5
         assert abs(ic.opbend_angle([c[0], c[5], c[4], c[3]])[0] - angle) < 1e-5
+
+
+def check_batch_ic(icfn, icfn_batch, iterp):
+    rs = np.array([np.array(ps) for ps in iterp()])
+    rs = rs.reshape((2, -1) + rs.shape[1:])
+    for deriv in 0, 1, 2:
+        results = icfn_batch(rs, deriv)
+        assert len(results) == deriv+1
+        for i0 in xrange(rs.shape[0]):
+            for i1 in xrange(rs.shape[1]):
+                expected = icfn(rs[i0, i1], deriv)
+                for result, e in zip(results, expected):
+                    assert result.shape[:2] == rs.shape[:2]
+                    assert abs(result[i0, i1] - e).max() < 1e-12
+
+
+def test_batch_bond():
+    check_batch_ic(ic.bond_length, ic.bond_length_batch, iter_bonds)
+
+
+def test_batch_bend():
+    check_batch_ic(ic.bend_cos, ic.bend_cos_batch, iter_bends)
+    check_batch_ic(ic.bend_angle, ic.bend_angle_batch, iter_bends)
+
+
+def test_batch_dihed():
+    check_batch_ic(ic.dihed_cos, ic.dihed_cos_batch, iter_diheds)
+    check_batch_ic(ic.dihed_angle, ic.dihed_angle_batch, iter_diheds)
+    check_batch_ic(ic.dihed_angle, ic.dihed_angle_batch, iter_diheds_special)
+
+
+def test_batch_opbend():
+    check_batch_ic(ic.opbend_dist, ic.opbend_dist_batch, iter_diheds)
+    check_batch_ic(ic.opbend_cos, ic.opbend_cos_batch, iter_diheds)
+    check_batch_ic(ic.opbend_angle, ic.opbend_angle_batch, iter_diheds)
+    check_batch_ic(ic.opbend_mcos, ic.opbend_mcos_batch, iter_diheds)
+    check_batch_ic(ic.opbend_mangle, ic.opbend_mangle_batch, iter_diheds)
+
+
+def test_batch_shape():
+    rs = np.random.normal(0, big, (4, 3))
+    assert abs(ic.dihed_angle_batch(rs)[0] - ic.dihed_angle(rs)[0]) < 1e-12
+    try:
+        ic.dihed_angle_batch(np.zeros((5, 3, 3)))
+        assert False
+    except TypeError:
+        pass
@@ -31,11 +31,11 @@ __all__ = ["MetaTestCase"]
 
 
 class MetaTestCase(unittest.TestCase):
-    def check_example(self, dirname, fn_py):
+    def check_example(self, dirname, fn_py, args=""):
         root = context.get_fn("examples")
         self.assert_(os.path.isdir(root))
         cwd = os.getcwd()
-        command = "cd %s/%s; PYTHONPATH=%s:${PYTHONPATH} ./%s 1> /dev/null 2> /dev/null" % (root, dirname, cwd, fn_py)
+        command = "cd %s/%s; PYTHONPATH=%s:${PYTHONPATH} ./%s %s 1> /dev/null 2> /dev/null" % (root, dirname, cwd, fn_py, args)
         print command
         retcode = os.system(command)
         self.assertEqual(retcode, 0)
@@ -67,6 +67,12 @@ class MetaTestCase(unittest.TestCase):
     def test_example_004(self):
         self.check_example("004_patterns", "a_propane_types.py")
         self.check_example("004_patterns", "b_dopamine_types.py")
+        self.check_example("004_patterns", "c_search_benchmark.py")
+
+    def test_example_005(self):
+        # the benchmarks are only run in their quick mode
+        self.check_example("005_geometries", "a_minimizer_benchmark.py", "--quick")
+        self.check_example("005_geometries", "b_batch_benchmark.py", "--quick")
 
     def test_code_quality(self):
         if context.data_dir == os.path.abspath('data/') and os.path.isdir('.git'):
@@ -218,6 +218,172 @@ class MinimizerTestCase(BaseTestCase):
             anagrad=True, verbose=False,
         )
 
+    def test_lbfgs_newtong(self):
+        x_init = np.zeros(2, float)
+        search_direction = LBFGS()
+        line_search = NewtonLineSearch()
+        convergence = ConvergenceCondition(grad_rms=1e-6, step_rms=1e-6, grad_max=3e-6, step_max=3e-6)
+        stop_loss = StopLossCondition(max_iter=50, fun_margin=1e-3)
+        minimizer = Minimizer(
+            x_init, fun, search_direction, line_search, convergence, stop_loss,
+            anagrad=True, verbose=False,
+        )
+        self.check_min(minimizer.get_final(), 1e-6, 1e-6)
+
+    def test_lbfgs_newtong_full_prec(self):
+        x_init = np.zeros(2, float)
+        search_direction = LBFGS(history=3)
+        line_search = NewtonLineSearch()
+        convergence = ConvergenceCondition(grad_rms=1e-6, step_rms=1e-6, grad_max=3e-6, step_max=3e-6)
+        stop_loss = StopLossCondition(max_iter=50, fun_margin=1e-3)
+        prec_fun = FullPreconditioner(fun, 3, 1e-2)
+        minimizer = Minimizer(
+            x_init, prec_fun, search_direction, line_search, convergence, stop_loss,
+            anagrad=True, verbose=False,
+        )
+        self.assert_(prec_fun.scales is not None)
+        self.check_min(minimizer.get_final(), 1e-6, 1e-6)
+
+    def test_lbfgs_history(self):
+        # an ill-conditioned quadratic function with many unknowns
+        scales = 10**np.linspace(-2, 2, 200)
+        def ellipsoid(x, do_gradient=False):
+            value = 0.5*(scales*(x - 1)**2).sum()
+            if do_gradient:
+                return value, scales*(x - 1)
+            else:
+                return value
+        x_init = np.zeros(200, float)
+        search_direction = LBFGS(history=7)
+        line_search = NewtonLineSearch()
+        convergence = ConvergenceCondition(grad_rms=1e-6)
+        stop_loss = StopLossCondition(max_iter=1000)
+        minimizer = Minimizer(
+            x_init, ellipsoid, search_direction, line_search, convergence,
+            stop_loss, anagrad=True, verbose=False,
+        )
+        self.assert_(minimizer.success)
+        self.assert_(abs(minimizer.x - 1).max() < 1e-4)
+        self.assertEqual(len(search_direction.pairs), 7)
+
+    def test_lbfgs_reset(self):
+        search_direction = LBFGS(history=2)
+        search_direction.update(np.array([1.0, 2.0]), None)
+        self.assert_(search_direction.is_sd())
+        search_direction.update(np.array([0.5, 1.0]), np.array([-0.5, -1.0]))
+        self.assertEqual(search_direction.status, "LB")
+        self.assert_(np.dot(search_direction.direction, search_direction.gradient) < 0)
+        # a step with negative curvature is ignored
+        search_direction.update(np.array([1.0, 1.0]), np.array([-0.5, -1.0]))
+        self.assertEqual(len(search_direction.pairs), 1)
+        search_direction.reset()
+        search_direction.update(np.array([0.5, 1.0]), np.array([-0.5, -1.0]))
+        self.assert_(search_direction.is_sd())
+        self.assertEqual(len(search_direction.pairs), 0)
+
+    def test_fire(self):
+        x_init = np.zeros(2, float)
+        search_direction = FIRE()
+        convergence = ConvergenceCondition(grad_rms=1e-8, grad_max=3e-8)
+        stop_loss = StopLossCondition(max_iter=500, fun_margin=1e-3)
+        minimizer = Minimizer(
+            x_init, fun, search_direction, None, convergence, stop_loss,
+            anagrad=True, verbose=False,
+        )
+        self.assert_(minimizer.success)
+        self.check_min(minimizer.get_final(), 1e-6, 1e-6)
+
+    def test_fire_diag_prec(self):
+        x_init = np.zeros(2, float)
+        search_direction = FIRE(max_step=0.5)
+        convergence = ConvergenceCondition(grad_rms=1e-8, grad_max=3e-8)
+        stop_loss = StopLossCondition(max_iter=500, fun_margin=1e-3)
+        prec_fun = DiagonalPreconditioner(fun, 3, 1e-2)
+        minimizer = Minimizer(
+            x_init, prec_fun, search_direction, None, convergence, stop_loss,
+            anagrad=True, verbose=False,
+        )
+        self.assert_(minimizer.success)
+        self.assert_(prec_fun.scales is not None)
+        self.check_min(minimizer.get_final(), 1e-6, 1e-6)
+
+    def test_fire_line_search(self):
+        x_init = np.zeros(2, float)
+        convergence = ConvergenceCondition(grad_rms=1e-6)
+        stop_loss = StopLossCondition(max_iter=50)
+        self.assertRaises(ValueError, Minimizer, x_init, fun, FIRE(),
+            NewtonLineSearch(), convergence, stop_loss, verbose=False)
+        self.assertRaises(ValueError, Minimizer, x_init, fun,
+            ConjugateGradient(), None, convergence, stop_loss, verbose=False)
+
+    def test_fire_max_step(self):
+        search_direction = FIRE(dt=1.0, max_step=0.1)
+        search_direction.update(np.array([3.0, 4.0]), None)
+        self.assertAlmostEqual(np.linalg.norm(search_direction.direction), 0.1)
+        self.assert_(search_direction.is_sd())
+        search_direction.update(np.array([3.0, 4.0]), None)
+        self.assertEqual(search_direction.status, "FI")
+        # the velocity is reset when the power becomes negative
+        search_direction.update(np.array([-3.0, -4.0]), None)
+        self.assert_(search_direction.is_sd())
+        self.assertAlmostEqual(search_direction.dt, 0.5)
+        search_direction.reset()
+        self.assertEqual(search_direction.velocity, None)
+        self.assertAlmostEqual(search_direction.dt, 1.0)
+
+    def test_batch(self):
+        # a few shifted copies of the test function, in one vectorized function
+        shifts = np.array([[0.0, 0.0], [0.5, -0.2], [-1.0, 1.0], [2.0, 0.3]])
+        def batch_fun(x, do_gradient=False, mask=None):
+            values = np.zeros(len(x))
+            gradient = np.zeros(x.shape)
+            for i in xrange(len(x)):
+                if mask is None or mask[i]:
+                    values[i], gradient[i] = fun(x[i] - shifts[i], True)
+            if do_gradient:
+                return values, gradient
+            else:
+                return values
+        x_init = np.zeros((4, 2), float)
+        line_search = NewtonLineSearch()
+        convergence = ConvergenceCondition(grad_rms=1e-6, step_rms=1e-6, grad_max=3e-6, step_max=3e-6)
+        stop_loss = StopLossCondition(max_iter=50, fun_margin=1e-3)
+        minimizer = BatchMinimizer(
+            x_init, batch_fun, line_search, convergence, stop_loss,
+            verbose=False,
+        )
+        self.assert_(minimizer.success.all())
+        for i in xrange(4):
+            self.check_min(minimizer.get_final()[i] - shifts[i], 1e-6, 1e-6)
+        # compare with the plain minimizer
+        minimizer1 = Minimizer(
+            x_init[2], (lambda x, do_gradient=False: fun(x - shifts[2], do_gradient)),
+            ConjugateGradient(), line_search, convergence, stop_loss,
+            anagrad=True, verbose=False,
+        )
+        self.assert_(abs(minimizer1.x - minimizer.x[2]).max() < 1e-5)
+
+    def test_batch_stop_loss(self):
+        scales = np.array([1.0, 2.0, 3.0])
+        def batch_quad(x, do_gradient=False, mask=None):
+            values = (scales*(x - 1)**2).sum(axis=1)
+            if do_gradient:
+                return values, 2*scales*(x - 1)
+            else:
+                return values
+        # the first problem is solved with one line search
+        x_init = np.array([[1.0, 1.0, 0.0], [0.0, 0.0, 0.0]])
+        minimizer = BatchMinimizer(
+            x_init, batch_quad, NewtonLineSearch(),
+            ConvergenceCondition(grad_rms=1e-6), StopLossCondition(max_iter=0),
+            verbose=False,
+        )
+        self.assertEqual(list(minimizer.success), [True, False])
+        self.assertRaises(ValueError, BatchMinimizer, x_init[0], batch_quad,
+            NewtonLineSearch(), None, None)
+        self.assertRaises(ValueError, BatchMinimizer, x_init, batch_quad,
+            GoldenLineSearch(1e-5), None, None)
+
     def test_check_anagrad(self):
         x_init = np.zeros(2, float)
         check_anagrad(fun, x_init, 1e-5, 1e-4)
@@ -353,6 +519,31 @@ class MinimizerTestCase(BaseTestCase):
         assert minimizer.x[1] == 5.0
         assert np.sqrt((minimizer.gradient**2).mean()) < 1e-6
 
+    def test_constraints_lbfgs(self):
+        x_init = np.array([-2.0, 0.1], float)
+        search_direction = LBFGS()
+        line_search = NewtonLineSearch()
+        convergence = ConvergenceCondition(grad_rms=1e-6)
+        stop_loss = StopLossCondition(max_iter=50)
+        constraints = Constraints([(1, circle1), (-1, circle2)], 1e-10)
+        minimizer = Minimizer(
+            x_init, quad, search_direction, line_search, convergence, stop_loss,
+            anagrad=True, verbose=False, constraints=constraints
+        )
+        assert np.sqrt((minimizer.gradient**2).mean()) < 1e-6
+
+    def test_constraints_fire(self):
+        x_init = np.array([0.1, 0.5], float)
+        search_direction = FIRE()
+        convergence = ConvergenceCondition(grad_rms=1e-6)
+        stop_loss = StopLossCondition(max_iter=500)
+        constraints = Constraints([(0, circle1)], 1e-10)
+        minimizer = Minimizer(
+            x_init, quad, search_direction, None, convergence, stop_loss,
+            anagrad=True, verbose=False, constraints=constraints
+        )
+        assert np.sqrt((minimizer.gradient**2).mean()) < 1e-6
+
     def test_constraints6(self):
         x_init = np.array([3.5, 1.2], float)
         search_direction = ConjugateGradient()
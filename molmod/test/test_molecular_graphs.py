@@ -23,6 +23,7 @@
 
 from molmod import *
 from molmod.bonds import BOND_SINGLE
+from molmod.test.common import tmpdir
 
 import unittest, numpy, os
 from nose.plugins.skip import SkipTest
@@ -288,6 +289,47 @@ class MolecularGraphTestCase(unittest.TestCase):
 
         self.verify_graph_search(molecule.graph, expected_results, test_results, iter_alternatives)
 
+    def test_valence_tuples(self):
+        def get_matches(pattern, graph):
+            return set(
+                tuple(match.get_destination(index) for index in xrange(len(match)))
+                for match in GraphSearch(pattern)(graph)
+            )
+        for molecule in self.iter_molecules(allow_multi=True):
+            graph = molecule.graph
+            self.assertEqual(graph.bonds.shape[1], 2)
+            self.assertEqual(
+                set(tuple(row) for row in graph.bonds.tolist()),
+                set((min(a, b), max(a, b)) for a, b in get_matches(BondPattern([CriteriaSet()]), graph)),
+            )
+            self.assertEqual(graph.bends.shape[1], 3)
+            self.assertEqual(
+                set(tuple(row) for row in graph.bends.tolist()),
+                set(
+                    (a, b, c) if a < c else (c, b, a) for a, b, c
+                    in get_matches(BendingAnglePattern([CriteriaSet()]), graph)
+                ),
+            )
+            self.assertEqual(graph.dihedrals.shape[1], 4)
+            self.assertEqual(
+                set(tuple(row) for row in graph.dihedrals.tolist()),
+                set(
+                    (a, b, c, d) if a < d else (d, c, b, a) for a, b, c, d
+                    in get_matches(DihedralAnglePattern([CriteriaSet()]), graph)
+                ),
+            )
+            self.assertEqual(graph.out_of_planes.shape[1], 4)
+            self.assertEqual(
+                set(tuple(row) for row in graph.out_of_planes.tolist()),
+                set(
+                    (a, b, min(c, d), max(c, d)) for a, b, c, d
+                    in get_matches(OutOfPlanePattern([CriteriaSet()], vertex_tags={1:1}), graph)
+                ),
+            )
+            for tuples in graph.bonds, graph.bends, graph.dihedrals, graph.out_of_planes:
+                self.assertEqual(len(set(tuple(row) for row in tuples.tolist())), len(tuples))
+                self.assertEqual(tuples.tolist(), sorted(tuples.tolist()))
+
     def test_rings_5ringOH(self):
         molecule = self.load_molecule("5ringOH.xyz")
         pattern = NRingPattern(10, [CriteriaSet(tag="all")])
@@ -432,6 +474,11 @@ class MolecularGraphTestCase(unittest.TestCase):
                 for i in xrange(len(path)-1):
                     self.assert_(path[i] in molecule.graph.neighbors[path[i+1]])
 
+    def test_full_match_empty(self):
+        graph0 = MolecularGraph([], numpy.zeros(0, int))
+        graph1 = MolecularGraph([], numpy.zeros(0, int))
+        self.assertNotEqual(graph0.full_match(graph1), None)
+
     def test_full_match_on_self(self):
         for molecule in self.iter_molecules(allow_multi=True):
             g = molecule.graph
@@ -442,21 +489,44 @@ class MolecularGraphTestCase(unittest.TestCase):
     def test_canonical_order(self):
         # TODO: analogous tests voor pure graphs + fixen
         for molecule in self.iter_molecules():
-            try:
-                g0 = molecule.graph
-                order0 = g0.canonical_order
-                g0_bis = g0.get_subgraph(order0, normalize=True)
+            g0 = molecule.graph
+            order0 = g0.canonical_order
+            g0_bis = g0.get_subgraph(order0, normalize=True)
 
-                permutation = numpy.random.permutation(g0.num_vertices)
-                g1 = g0.get_subgraph(permutation, normalize=True)
-                order1 = g1.canonical_order
-                g1_bis = g1.get_subgraph(order1, normalize=True)
-
-                self.assertEqual(str(g0_bis), str(g1_bis))
-                self.assert_((g0_bis.numbers==g1_bis.numbers).all())
-                self.assert_((g0_bis.orders==g1_bis.orders).all())
-            except NotImplementedError:
-                pass
+            permutation = numpy.random.permutation(g0.num_vertices)
+            g1 = g0.get_subgraph(permutation, normalize=True)
+            order1 = g1.canonical_order
+            g1_bis = g1.get_subgraph(order1, normalize=True)
+
+            self.assertEqual(str(g0_bis), str(g1_bis))
+            self.assert_((g0_bis.numbers==g1_bis.numbers).all())
+            self.assert_((g0_bis.orders==g1_bis.orders).all())
+            self.assertEqual(g0.canonical_form, g1.canonical_form)
+
+    def test_graph_index(self):
+        graphs = [molecule.graph for molecule in self.iter_molecules(allow_multi=True)]
+        index = GraphIndex()
+        for i, graph in enumerate(graphs):
+            self.assertEqual(index.insert(graph), (i, True))
+        self.assertEqual(len(index), len(graphs))
+        for i, graph in enumerate(graphs):
+            permutation = numpy.random.permutation(graph.num_vertices)
+            other = graph.get_subgraph(permutation, normalize=True)
+            self.assert_(other in index)
+            self.assertEqual(index.lookup(other), i)
+            self.assertEqual(index.insert(other), (i, False))
+        self.assertEqual(len(index), len(graphs))
+        # same topology, other atom numbers
+        graph = graphs[0]
+        other = MolecularGraph(graph.edges, graph.numbers + 1)
+        self.assert_(other not in index)
+        with tmpdir() as dn:
+            fn = os.path.join(dn, "index.txt")
+            index.write_to_file(fn)
+            index_bis = GraphIndex.from_file(fn)
+        self.assertEqual(len(index_bis), len(index))
+        for i, graph in enumerate(graphs):
+            self.assertEqual(index_bis.lookup(graph), i)
 
     def test_blob(self):
         for molecule in self.iter_molecules(allow_multi=True):
@@ -464,6 +534,10 @@ class MolecularGraphTestCase(unittest.TestCase):
             graph = MolecularGraph.from_blob(blob)
             self.assert_((graph.numbers==molecule.graph.numbers).all(), "Atom numbers do not match.")
             self.assert_(graph.edges==molecule.graph.edges, "edges do not match.")
+        # a graph without edges
+        graph = MolecularGraph.from_blob(MolecularGraph([], numpy.array([18, 18])).blob)
+        self.assertEqual(list(graph.numbers), [18, 18])
+        self.assertEqual(graph.num_edges, 0)
 
     def test_halfs_double_thf(self):
         molecule = self.load_molecule("thf_single.xyz")
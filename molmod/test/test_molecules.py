@@ -59,6 +59,35 @@ class MoleculeTestCase(BaseTestCase):
                     distance = numpy.linalg.norm(delta)
                     self.assertAlmostEqual(dm[i,j], distance)
 
+    def test_distance_condensed(self):
+        from molmod.ext import molecules_distance_matrix, molecules_distance_condensed
+        unit_cell = UnitCell(
+            numpy.random.uniform(0,1,(3,3)),
+            numpy.random.randint(0,2,3).astype(bool),
+        )
+        coordinates = unit_cell.to_cartesian(numpy.random.uniform(0,1,(10,3)))
+        for args in (), (unit_cell.matrix, unit_cell.reciprocal):
+            dm = molecules_distance_matrix(coordinates, *args)
+            condensed = molecules_distance_condensed(coordinates, *args)
+            self.assertEqual(condensed.shape, (45,))
+            mask = numpy.arange(10).reshape(-1,1) > numpy.arange(10)
+            self.assert_((condensed == dm[mask]).all())
+
+    def test_distance_matrix_csr(self):
+        molecule = Molecule.from_file(context.get_fn("test/tpa.xyz"))
+        cutoff = 5*angstrom
+        dm = molecule.get_distance_matrix(cutoff, format="csr")
+        self.assertEqual(dm.indptr[-1], dm.num_nonzero)
+        expected = molecule.distance_matrix.copy()
+        expected[expected > cutoff] = 0.0
+        self.assert_((abs(dm.to_dense() - expected) < 1e-10).all())
+        for i in xrange(molecule.size):
+            indices, distances = dm.get_row(i)
+            self.assert_((indices[1:] > indices[:-1]).all())
+            self.assertEqual(len(indices), (expected[i] > 0).sum())
+        self.assertRaises(ValueError, molecule.get_distance_matrix, format="csr")
+        self.assertRaises(ValueError, molecule.get_distance_matrix, cutoff, "dense")
+
     def test_read_only(self):
         numbers = [8, 1]
         coordinates = [
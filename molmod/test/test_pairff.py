@@ -28,7 +28,7 @@ from molmod import *
 import unittest, numpy as np
 
 
-__all__ = ["PairFFTestCase", "CoulombFFTestCase"]
+__all__ = ["PairFFTestCase", "PairFFCutoffTestCase", "CoulombFFEwaldTestCase", "CoulombFFTestCase"]
 
 
 class Debug1FF(PairFF):
@@ -75,7 +75,7 @@ class Debug4FF(PairFF):
         yield 2, np.array([[2, 0, 0], [0, 0, 0], [0, 0, 0]], float)
 
 
-class PairFFTestCase(unittest.TestCase):
+class PairFFTestCase(BaseTestCase):
     def make_coulombff(self, do_charges, do_dipoles):
         coordinates = np.array([
             [ 0.5, 2.5, 0.1],
@@ -301,6 +301,18 @@ class PairFFTestCase(unittest.TestCase):
                 self.assertAlmostEqual(error, 0.0, 3, "num_vh: % 12.8f / % 12.8f" % (error, reference))
 
 
+        # 0) the array versions of the yield_pair_* generators
+        index1, index2 = (1 - np.identity(numc)).nonzero()
+        ff.update_coordinates(coordinates)
+        args = (index1, index2, ff.deltas[index1, index2], ff.distances[index1, index2])
+        for name in "energies", "gradients", "hessians":
+            fast = getattr(ff, "get_pair_%s" % name)(*args)
+            slow = getattr(PairFF, "get_pair_%s" % name)(ff, *args)
+            self.assertEqual(len(fast), len(slow))
+            for (fast_s, fast_v), (slow_s, slow_v) in zip(fast, slow):
+                self.assertArraysAlmostEqual(fast_s, slow_s, 1e-10, doabs=True)
+                self.assertArraysAlmostEqual(fast_v, slow_v, 1e-10, doabs=True)
+
         # 1) hessian should be symmetric
         hessian_flat = ff.hessian_flat()
         error = sum((hessian_flat - hessian_flat.transpose()).ravel()**2)
@@ -381,6 +393,202 @@ class PairFFTestCase(unittest.TestCase):
         self.assertAlmostEqual(error, 0.0, 3, "2b) The off-diagonal blocks of the analytical hessian are incorrect: % 12.8f / %12.8f" % (error, reference))
 
 
+class PairFFCutoffTestCase(BaseTestCase):
+    def check_cutoff(self, make_ff, unit_cell=None):
+        coordinates = np.random.uniform(0, 4, (12, 3))
+        cutoff = 3.0
+        exclusions = np.array([[0, 1], [5, 3], [7, 11]])
+        sparse_ff = make_ff(None, coordinates, cutoff, exclusions, unit_cell)
+        # reference with a dense scaling matrix
+        deltas = coordinates.reshape(-1, 1, 3) - coordinates
+        if unit_cell is not None:
+            deltas = unit_cell.shortest_vector(deltas)
+        scaling = (np.sqrt((deltas**2).sum(axis=2)) <= cutoff).astype(float)
+        scaling[exclusions[:, 0], exclusions[:, 1]] = 0.0
+        scaling[exclusions[:, 1], exclusions[:, 0]] = 0.0
+        if unit_cell is None:
+            dense_ff = make_ff(scaling, coordinates)
+            self.assertAlmostEqual(sparse_ff.energy(), dense_ff.energy())
+            self.assertArraysAlmostEqual(sparse_ff.gradient(), dense_ff.gradient())
+            self.assertArraysAlmostEqual(sparse_ff.hessian(), dense_ff.hessian())
+            for index in xrange(len(coordinates)):
+                self.assertArraysAlmostEqual(sparse_ff.gradient_component(index), dense_ff.gradient_component(index), 1e-8, doabs=True)
+                self.assertArraysAlmostEqual(sparse_ff.hessian_component(index, 3), dense_ff.hessian_component(index, 3), 1e-8, doabs=True)
+        scaling.ravel()[::len(scaling)+1] = 0
+        self.assertEqual(len(sparse_ff.pair_distances), scaling.sum())
+        self.assert_((sparse_ff.pair_distances <= cutoff).all())
+        return sparse_ff
+
+    def make_coulombff(self, scaling, coordinates, cutoff=None, exclusions=None, unit_cell=None):
+        charges = np.linspace(-1, 1, len(coordinates))
+        dipoles = np.cos(np.arange(len(coordinates)*3).reshape(-1, 3))
+        return CoulombFF(scaling, charges, dipoles, coordinates, cutoff, exclusions, unit_cell)
+
+    def test_coulombff(self):
+        ff = self.check_cutoff(self.make_coulombff)
+        # esp and efield
+        dense_ff = self.make_coulombff(np.ones((12, 12), float), ff.coordinates)
+        sparse_ff = self.make_coulombff(None, ff.coordinates, 100.0)
+        self.assertArraysAlmostEqual(sparse_ff.esp(), dense_ff.esp())
+        self.assertArraysAlmostEqual(sparse_ff.efield(), dense_ff.efield())
+
+    def test_coulombff_periodic(self):
+        self.check_cutoff(self.make_coulombff, UnitCell(np.identity(3)*5.0))
+
+    def make_dispersionff(self, scaling, coordinates, cutoff=None, exclusions=None, unit_cell=None):
+        atom_strengths = np.linspace(0.1, 0.9, len(coordinates))
+        strengths = np.outer(atom_strengths, atom_strengths)
+        return DispersionFF(scaling, strengths, coordinates, cutoff, exclusions, unit_cell)
+
+    def test_dispersionff(self):
+        self.check_cutoff(self.make_dispersionff)
+
+    def make_exprepff(self, scaling, coordinates, cutoff=None, exclusions=None, unit_cell=None):
+        atom_As = np.linspace(0.1, 0.9, len(coordinates))
+        atom_Bs = np.linspace(0.1, 0.3, len(coordinates))
+        As = np.sqrt(np.outer(atom_As, atom_As))
+        Bs = 0.5*np.add.outer(atom_Bs, atom_Bs)
+        return ExpRepFF(scaling, As, Bs, coordinates, cutoff, exclusions, unit_cell)
+
+    def test_exprepff(self):
+        self.check_cutoff(self.make_exprepff)
+
+    def test_exprepff_periodic(self):
+        self.check_cutoff(self.make_exprepff, UnitCell(np.identity(3)*5.0))
+
+    def check_atom_parameters(self, make_ff, make_atom_ff, unit_cell=None):
+        coordinates = np.random.uniform(0, 4, (12, 3))
+        exclusions = np.array([[0, 1], [5, 3], [7, 11]])
+        # only per-atom parameters, no NxN input
+        atom_ff = make_atom_ff(coordinates, 3.0, exclusions, unit_cell)
+        ff = make_ff(None, coordinates, 3.0, exclusions, unit_cell)
+        self.assertAlmostEqual(atom_ff.energy(), ff.energy())
+        self.assertArraysAlmostEqual(atom_ff.gradient(), ff.gradient())
+        self.assertArraysAlmostEqual(atom_ff.hessian(), ff.hessian())
+        return atom_ff
+
+    def test_dispersionff_atoms(self):
+        def make_atom_ff(coordinates, cutoff, exclusions, unit_cell):
+            atom_strengths = np.linspace(0.1, 0.9, len(coordinates))**2
+            return DispersionFF(None, atom_strengths, coordinates, cutoff, exclusions, unit_cell)
+        ff = self.check_atom_parameters(self.make_dispersionff, make_atom_ff)
+        self.assertEqual(ff.strengths.shape, (12,))
+        self.check_atom_parameters(self.make_dispersionff, make_atom_ff, UnitCell(np.identity(3)*5.0))
+
+    def test_pauliff_atoms(self):
+        def make_ff(scaling, coordinates, cutoff, exclusions, unit_cell):
+            atom_strengths = np.linspace(0.1, 0.9, len(coordinates))
+            strengths = np.outer(atom_strengths, atom_strengths)
+            return PauliFF(scaling, strengths, coordinates, cutoff, exclusions, unit_cell)
+        def make_atom_ff(coordinates, cutoff, exclusions, unit_cell):
+            atom_strengths = np.linspace(0.1, 0.9, len(coordinates))**2
+            return PauliFF(None, atom_strengths, coordinates, cutoff, exclusions, unit_cell)
+        self.check_atom_parameters(make_ff, make_atom_ff)
+
+    def test_exprepff_atoms(self):
+        def make_atom_ff(coordinates, cutoff, exclusions, unit_cell):
+            # per-type parameters converted to per-atom parameters
+            types = np.arange(len(coordinates)) % 3
+            type_As = np.array([0.1, 0.5, 0.9])
+            type_Bs = np.array([0.1, 0.2, 0.3])
+            return ExpRepFF(None, type_As[types], type_Bs[types], coordinates, cutoff, exclusions, unit_cell)
+        def make_ff(scaling, coordinates, cutoff, exclusions, unit_cell):
+            types = np.arange(len(coordinates)) % 3
+            atom_As = np.array([0.1, 0.5, 0.9])[types]
+            atom_Bs = np.array([0.1, 0.2, 0.3])[types]
+            As = np.sqrt(np.outer(atom_As, atom_As))
+            Bs = 0.5*np.add.outer(atom_Bs, atom_Bs)
+            return ExpRepFF(scaling, As, Bs, coordinates, cutoff, exclusions, unit_cell)
+        ff = self.check_atom_parameters(make_ff, make_atom_ff, UnitCell(np.identity(3)*5.0))
+        self.assertEqual(ff.As.shape, (12,))
+        self.assertEqual(ff.Bs.shape, (12,))
+
+    def test_exclusions_list(self):
+        coordinates = np.random.uniform(0, 4, (12, 3))
+        exclusions = [(0, 1), (5, 3), (7, 11)]
+        ff1 = self.make_dispersionff(None, coordinates, 3.0, exclusions)
+        ff2 = self.make_dispersionff(None, coordinates, 3.0, np.array(exclusions))
+        self.assertEqual(ff1.exclusions.shape, (3, 2))
+        self.assertAlmostEqual(ff1.energy(), ff2.energy())
+        self.assertArraysAlmostEqual(ff1.gradient(), ff2.gradient())
+
+    def test_yield_pair_not_supported(self):
+        ff = Debug1FF(None, np.random.uniform(0, 4, (5, 3)), 3.0)
+        self.assertRaises(NotImplementedError, ff.energy)
+
+
+class CoulombFFEwaldTestCase(BaseTestCase):
+    def get_rocksalt(self):
+        # conventional cubic cell of rock salt, nearest neighbor distance 1
+        unit_cell = UnitCell(np.identity(3)*2.0)
+        coordinates = np.array([
+            [0, 0, 0], [1, 1, 0], [1, 0, 1], [0, 1, 1],
+            [1, 0, 0], [0, 1, 0], [0, 0, 1], [1, 1, 1],
+        ], float)
+        charges = np.array([1, 1, 1, 1, -1, -1, -1, -1], float)
+        return coordinates, charges, unit_cell
+
+    def test_madelung(self):
+        coordinates, charges, unit_cell = self.get_rocksalt()
+        for ewald in EwaldSum(4.5, 50.0), ParticleMeshEwald(4.5, 0.05, 6):
+            ff = CoulombFF(None, charges, coordinates=coordinates, cutoff=0.99, unit_cell=unit_cell, ewald=ewald)
+            self.assertAlmostEqual(ff.energy(), -4*1.747564594633, 5)
+            self.assertArraysAlmostEqual(ff.esp(), -1.747564594633*charges, 1e-5)
+            self.assertArraysAlmostEqual(ff.gradient(), np.zeros((8, 3)), 1e-5, doabs=True)
+
+    def make_ff(self, alpha, exclusions=None):
+        ewald = EwaldSum(alpha, 2*alpha*6.0)
+        return CoulombFF(None, self.charges, coordinates=self.coordinates,
+            cutoff=4.9, exclusions=exclusions, unit_cell=self.unit_cell, ewald=ewald)
+
+    def setUp(self):
+        self.unit_cell = UnitCell(np.identity(3)*10.0)
+        self.coordinates = np.random.uniform(0, 10, (12, 3))
+        self.charges = np.linspace(-1, 1, 12)
+
+    def test_alpha_independence(self):
+        exclusions = np.array([[0, 1], [5, 3], [7, 11]])
+        ff1 = self.make_ff(0.8, exclusions)
+        ff2 = self.make_ff(1.0, exclusions)
+        self.assertAlmostEqual(ff1.energy(), ff2.energy(), 6)
+        self.assertArraysAlmostEqual(ff1.gradient(), ff2.gradient(), 1e-5, doabs=True)
+        self.assertArraysAlmostEqual(ff1.esp(), ff2.esp(), 1e-5, doabs=True)
+        self.assertArraysAlmostEqual(ff1.efield(), ff2.efield(), 1e-5, doabs=True)
+        self.assertArraysAlmostEqual(ff1.gradient(), -self.charges.reshape(-1, 1)*ff1.efield(), 1e-8, doabs=True)
+        # the exclusions only remove the direct interaction (minimum image)
+        ff3 = self.make_ff(0.8)
+        deltas = self.unit_cell.shortest_vector(self.coordinates[exclusions[:, 0]] - self.coordinates[exclusions[:, 1]])
+        distances = np.sqrt((deltas**2).sum(axis=1))
+        direct = (self.charges[exclusions[:, 0]]*self.charges[exclusions[:, 1]]/distances).sum()
+        self.assertAlmostEqual(ff3.energy() - direct, ff1.energy(), 6)
+
+    def test_gradient(self):
+        exclusions = np.array([[0, 1], [2, 3]])
+        ff = self.make_ff(0.8, exclusions)
+        energy = ff.energy()
+        gradient = ff.gradient()
+        eps = 1e-6
+        for i in 0, 2, 5:
+            for j in xrange(3):
+                coordinates = self.coordinates.copy()
+                coordinates[i, j] += eps
+                ff.update_coordinates(coordinates)
+                self.assertAlmostEqual((ff.energy() - energy)/eps, gradient[i, j], 4)
+        ff.update_coordinates(self.coordinates)
+        self.assertArraysAlmostEqual(ff.gradient_component(5), gradient[5])
+        self.assertAlmostEqual(ff.esp_component(5), ff.esp()[5])
+        self.assertArraysAlmostEqual(ff.efield_component(5), ff.efield()[5])
+
+    def test_errors(self):
+        ewald = EwaldSum(0.8, 10.0)
+        self.assertRaises(TypeError, CoulombFF, np.ones((12, 12)), self.charges, ewald=ewald)
+        self.assertRaises(ValueError, CoulombFF, None, self.charges, cutoff=4.9, ewald=ewald)
+        self.assertRaises(ValueError, CoulombFF, None, self.charges, cutoff=5.1, unit_cell=self.unit_cell, ewald=ewald)
+        ff = self.make_ff(0.8)
+        self.assertRaises(NotImplementedError, ff.hessian)
+        self.assertRaises(NotImplementedError, ff.esp_point, np.zeros(3))
+
+
 class CoulombFFTestCase(BaseTestCase):
     def test_cc1(self):
         coordinates = np.array([
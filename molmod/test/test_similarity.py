@@ -46,6 +46,13 @@ class SimilarityTestCase(unittest.TestCase):
             molecule.descriptor = SimilarityDescriptor.from_molecule(molecule)
         self.check(molecules, margin=0.2*angstrom, cutoff=7.0*angstrom)
 
+    def test_condensed(self):
+        for molecule in self.get_molecules():
+            a = SimilarityDescriptor.from_molecule(molecule)
+            b = SimilarityDescriptor(molecule.distance_matrix, molecule.numbers)
+            self.assert_((a.table_labels == b.table_labels).all())
+            self.assert_((a.table_distances == b.table_distances).all())
+
     def test_graph(self):
         molecules = self.get_molecules()
         for molecule in molecules:
@@ -58,13 +58,38 @@ class ToyFFTestCase(unittest.TestCase):
             output_mol.title = input_mol.title
             #output_mol.write_to_file("guess_%s.xyz" % input_mol.title)
 
+    def test_guess_geometry_random_state(self):
+        graph = self.load_molecule("butane.xyz").graph
+        mol1 = guess_geometry(graph, random_state=numpy.random.RandomState(1))
+        mol2 = guess_geometry(graph, random_state=numpy.random.RandomState(1))
+        self.assert_((mol1.coordinates == mol2.coordinates).all())
+
+    def test_guess_geometries(self):
+        graphs = [molecule.graph for molecule in self.iter_molecules()][:4]
+        # an unknown element makes guess_geometry fail
+        graphs.insert(2, MolecularGraph([(0, 1)], numpy.array([6, 200])))
+        results1 = list(guess_geometries(graphs, seed=3))
+        self.assertEqual([index for index, mol, error in results1], range(len(graphs)))
+        results2 = sorted(guess_geometries(graphs, workers=2, seed=3))
+        for (index, mol1, error1), (index, mol2, error2) in zip(results1, results2):
+            if index == 2:
+                self.assertEqual(mol1, None)
+                self.assertEqual(mol2, None)
+                self.assert_("AttributeError" in error1)
+                self.assert_("AttributeError" in error2)
+            else:
+                self.assertEqual(error1, None)
+                self.assertEqual(error2, None)
+                self.assert_((mol1.numbers == graphs[index].numbers).all())
+                self.assert_((mol1.coordinates == mol2.coordinates).all())
+
     def test_tune_geometry(self):
         for input_mol in self.iter_molecules(allow_multi=False):
             output_mol = tune_geometry(input_mol.graph, input_mol)
             output_mol.title = input_mol.title
             #output_mol.write_to_file("tune_%s.xyz" % input_mol.title)
 
-    def get_random_ff(self):
+    def get_random_graph(self):
         N = 6
 
         mask = numpy.zeros((N,N), bool)
@@ -100,8 +125,12 @@ class ToyFFTestCase(unittest.TestCase):
         edges = tuple(edges)
         numbers = numpy.random.randint(6, 10, N)
         graph = MolecularGraph(edges, numbers)
-        ff = ToyFF(graph, unit_cell)
 
+        return graph, coordinates, dm, mask, unit_cell
+
+    def get_random_ff(self):
+        graph, coordinates, dm, mask, unit_cell = self.get_random_graph()
+        ff = ToyFF(graph, unit_cell)
         return ff, coordinates, dm, mask, unit_cell
 
     def check_toyff_gradient(self, ff, coordinates):
@@ -153,6 +182,62 @@ class ToyFFTestCase(unittest.TestCase):
             ff.dm_reci = 1.0
             self.check_toyff_gradient(ff, coordinates)
 
+    def test_dm_quad_max_depth(self):
+        for i in xrange(10):
+            graph, coordinates, dm, mask, unit_cell = self.get_random_graph()
+            ff = ToyFF(graph, unit_cell)
+            for max_depth in 6, 2, 1:
+                sparse_ff = ToyFF(graph, unit_cell, max_depth=max_depth)
+                sparse_ff.dm_quad = 1.0
+                energy, gradient = sparse_ff(coordinates, True)
+                ff.dmk[ff.dm > max_depth] = 0.0
+                ff.dm_quad = 1.0
+                self.assertAlmostEqual(energy, ff(coordinates, False))
+                self.check_toyff_gradient(sparse_ff, coordinates)
+
+    def test_dm_reci_skin(self):
+        for i in xrange(10):
+            graph, coordinates, dm, mask, unit_cell = self.get_random_graph()
+            ff = ToyFF(graph, unit_cell)
+            ff.dm_reci = 1.0
+            energy0, gradient0 = ff(coordinates, True)
+            sparse_ff = ToyFF(graph, unit_cell, skin=1.0)
+            sparse_ff.dm_reci = 1.0
+            energy1, gradient1 = sparse_ff(coordinates, True)
+            self.assertAlmostEqual(energy0, energy1)
+            self.assert_(abs(gradient0 - gradient1).max() < 1e-10)
+            self.check_toyff_gradient(sparse_ff, coordinates)
+
+    def test_sparse(self):
+        molecule = self.load_molecule("tpa.xyz")
+        graph = molecule.graph
+        ff = ToyFF(graph)
+        sparse_ff = ToyFF(graph, max_depth=graph.max_distance, skin=2.0)
+        self.assertEqual(sparse_ff.dm, None)
+        coordinates = molecule.coordinates
+        for i in xrange(5):
+            coordinates = coordinates + numpy.random.uniform(-0.2, 0.2, coordinates.shape)
+            for name in "dm_quad", "dm_reci":
+                setattr(ff, name, 1.0)
+                setattr(sparse_ff, name, 1.0)
+            energy0, gradient0 = ff(coordinates, True)
+            energy1, gradient1 = sparse_ff(coordinates, True)
+            self.assertAlmostEqual(energy0, energy1)
+            self.assert_(abs(gradient0 - gradient1).max() < 1e-10)
+        mol = guess_geometry(graph, max_depth=4, skin=2.0)
+        self.assertEqual(mol.size, graph.num_vertices)
+        self.assert_(numpy.isfinite(mol.coordinates).all())
+
+    def test_sparse_empty(self):
+        graph = MolecularGraph([], numpy.zeros(0, int))
+        ff = ToyFF(graph, max_depth=3, skin=1.0)
+        ff.dm_quad = 1.0
+        ff.dm_reci = 1.0
+        for i in xrange(2):
+            energy, gradient = ff(numpy.zeros(0, float), True)
+            self.assertEqual(energy, 0.0)
+            self.assertEqual(gradient.shape, (0,))
+
     def test_bond_quad_energy(self):
         for i in xrange(10):
             ff, coordinates, dm, mask, unit_cell = self.get_random_ff()
@@ -197,3 +282,55 @@ class ToyFFTestCase(unittest.TestCase):
         dm = dm + dm.max()*numpy.identity(len(dm))
         mol = tune_geometry(mol.graph, mol, unit_cell)
         #mol.write_to_file("caplayer.xyz")
+
+    def test_batch(self):
+        molecules = list(self.iter_molecules(allow_multi=True))[:8]
+        graphs = [molecule.graph for molecule in molecules]
+        ffs = [ToyFF(graph) for graph in graphs]
+        batch_ff = BatchToyFF(graphs)
+        self.assertEqual(list(batch_ff.sizes), [3*graph.num_vertices for graph in graphs])
+        coordinates = [
+            numpy.random.normal(0, 3, (graph.num_vertices, 3))
+            for graph in graphs
+        ]
+        x = batch_ff.pack(coordinates)
+        self.assertEqual(x.shape, (len(graphs), batch_ff.sizes.max()))
+        for i, c in enumerate(batch_ff.unpack(x)):
+            self.assert_((c == coordinates[i]).all())
+        for params in [(1.0, 0.0, 0.0, 0.0, 0.0), (1.0, 1.0, 0.0, 0.0, 0.0),
+                       (0.0, 0.2, 1.0, 0.0, 0.0), (0.0, 0.2, 0.0, 1.0, 1.0)]:
+            for ff in ffs + [batch_ff]:
+                ff.dm_quad, ff.dm_reci, ff.bond_quad, ff.bond_hyper, ff.span_quad = params
+            energies, gradient = batch_ff(x, True)
+            # the padding does not feel any force
+            for i, size in enumerate(batch_ff.sizes):
+                self.assert_((gradient[i, size:] == 0).all())
+            for i, g in enumerate(batch_ff.unpack(gradient)):
+                energy, g_check = ffs[i](coordinates[i], True)
+                self.assertAlmostEqual(energies[i]/energy, 1.0)
+                self.assert_(abs(g - g_check.reshape((-1, 3))).max() < 1e-8*abs(g_check).max())
+            # only the masked molecules are computed
+            mask = numpy.arange(len(graphs)) % 2 == 0
+            energies_mask = batch_ff(x, False, mask)
+            self.assert_((energies_mask[mask] == energies[mask]).all())
+            self.assert_((energies_mask[~mask] == 0).all())
+
+    def test_batch_minimizer(self):
+        from molmod.minimizer import BatchMinimizer, NewtonLineSearch, \
+            ConvergenceCondition, StopLossCondition
+        graphs = [molecule.graph for molecule in self.iter_molecules()][:4]
+        batch_ff = BatchToyFF(graphs)
+        batch_ff.dm_quad = 1.0
+        x_init = batch_ff.pack([
+            numpy.random.normal(0, 1, (graph.num_vertices, 3))
+            for graph in graphs
+        ])
+        minimizer = BatchMinimizer(
+            x_init, batch_ff, NewtonLineSearch(),
+            ConvergenceCondition(grad_rms=1e-6), StopLossCondition(max_iter=500),
+            sizes=batch_ff.sizes, verbose=False,
+        )
+        self.assert_(minimizer.success.all())
+        gradient = batch_ff(minimizer.x, True)[1]
+        for i, size in enumerate(batch_ff.sizes):
+            self.assert_(numpy.sqrt((gradient[i]**2).sum()/size) < 1e-6)
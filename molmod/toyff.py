@@ -33,15 +33,20 @@ from molmod import context
 from molmod.molecules import Molecule
 from molmod.periodic import periodic
 
-from molmod.ext import ff_dm_quad, ff_dm_reci, ff_bond_quad, ff_bond_hyper
+from molmod.ext import ff_dm_quad, ff_dm_reci, ff_bond_quad, ff_bond_hyper, \
+    ff_batch, ff_pair_quad, ff_pair_reci
 
 import numpy
 
 
-__all__ = ["guess_geometry", "tune_geometry", "ToyFF", "SpecialAngles"]
+__all__ = [
+    "guess_geometry", "guess_geometries", "tune_geometry", "ToyFF",
+    "BatchToyFF", "SpecialAngles",
+]
 
 
-def guess_geometry(graph, unit_cell=None, verbose=False):
+def guess_geometry(graph, unit_cell=None, verbose=False, random_state=None,
+                   max_depth=None, skin=None):
     """Construct a molecular geometry based on a molecular graph.
 
        This routine does not require initial coordinates and will give a very
@@ -57,19 +62,28 @@ def guess_geometry(graph, unit_cell=None, verbose=False):
         | ``unit_cell``  --  periodic boundry conditions, see
                              :class:`molmod.unit_cells.UnitCell`
         | ``verbose``  --  Show optimizer progress when True
+        | ``random_state``  --  A numpy.random.RandomState object for the
+                                random initial coordinates. When not given,
+                                the global random state of numpy is used.
+        | ``max_depth``, ``skin``  --  see :class:`ToyFF`. Give both to
+                                       avoid the quadratic cost for large
+                                       graphs.
     """
 
     N = len(graph.numbers)
     from molmod.minimizer import Minimizer, ConjugateGradient, \
         NewtonLineSearch, ConvergenceCondition, StopLossCondition
 
+    if random_state is None:
+        random_state = numpy.random
+
     search_direction = ConjugateGradient()
     line_search = NewtonLineSearch()
     convergence = ConvergenceCondition(grad_rms=1e-6, step_rms=1e-6)
     stop_loss = StopLossCondition(max_iter=500, fun_margin=0.1)
 
-    ff = ToyFF(graph, unit_cell)
-    x_init = numpy.random.normal(0, 1, N*3)
+    ff = ToyFF(graph, unit_cell, max_depth, skin)
+    x_init = random_state.normal(0, 1, N*3)
 
     #  level 1 geometry optimization: graph based
     ff.dm_quad = 1.0
@@ -83,7 +97,7 @@ def guess_geometry(graph, unit_cell=None, verbose=False):
     x_init = minimizer.x
 
     # Add a little noise to avoid saddle points
-    x_init += numpy.random.uniform(-0.01, 0.01, len(x_init))
+    x_init += random_state.uniform(-0.01, 0.01, len(x_init))
 
     #  level 3 geometry optimization: bond lengths + pauli
     ff.dm_quad = 0.0
@@ -105,6 +119,78 @@ def guess_geometry(graph, unit_cell=None, verbose=False):
     return mol
 
 
+def _guess_geometry_task(task):
+    """Construct the geometry of one graph, also in a worker process
+
+       Argument:
+        | ``task``  --  a tuple with the index of the graph, its blob, the
+                        seed of the batch and the keyword arguments for
+                        guess_geometry.
+
+       Returns: ``index, molecule, error``. When guess_geometry fails, the
+       molecule is None and error is a string with the traceback.
+    """
+    from molmod.molecular_graphs import MolecularGraph
+    index, blob, seed, kwargs = task
+    try:
+        graph = MolecularGraph.from_blob(blob)
+        # an independent random stream for each graph
+        random_state = numpy.random.RandomState([seed, index])
+        return index, guess_geometry(graph, random_state=random_state, **kwargs), None
+    except Exception:
+        import traceback
+        return index, None, traceback.format_exc()
+
+
+def guess_geometries(graphs, workers=None, seed=None, chunksize=1,
+                     max_depth=None, skin=None):
+    """Construct molecular geometries for many molecular graphs
+
+       This is a driver for :func:`guess_geometry`. Each graph is sent to a
+       worker process as its blob. The random initial coordinates of each
+       graph are generated with a separate random state, derived from the
+       seed and the index of the graph. Hence, the results do not depend on
+       the number of workers or on the order in which the graphs are
+       processed.
+
+       Argument:
+        | ``graphs``  --  A list or iterator of molecular graphs, see
+                          :class:molmod.molecular_graphs.MolecularGraph
+
+       Optional arguments:
+        | ``workers``  --  The number of worker processes. When None or one,
+                           the graphs are processed serially in the current
+                           process. [default=None]
+        | ``seed``  --  An integer seed for the random initial coordinates.
+                        When not given, it is drawn from the global random
+                        state of numpy.
+        | ``chunksize``  --  The number of graphs sent to a worker at once.
+                             [default=1]
+        | ``max_depth``, ``skin``  --  see :class:`ToyFF`
+
+       Yields tuples ``(index, molecule, error)`` as soon as the geometries are
+       ready. With more than one worker, they do not come in the same order as
+       the graphs. When the guess fails for one graph, the molecule is None
+       and error contains the traceback. Otherwise, error is None.
+    """
+    if seed is None:
+        seed = numpy.random.randint(2**31)
+    kwargs = {"max_depth": max_depth, "skin": skin}
+    tasks = ((index, graph.blob, seed, kwargs) for index, graph in enumerate(graphs))
+    if workers is None or workers <= 1:
+        for task in tasks:
+            yield _guess_geometry_task(task)
+        return
+    from multiprocessing import Pool
+    pool = Pool(workers)
+    try:
+        for result in pool.imap_unordered(_guess_geometry_task, tasks, chunksize):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+
 def tune_geometry(graph, mol, unit_cell=None, verbose=False):
     """Fine tune a molecular geometry, starting from a (very) poor guess of
        the initial geometry.
@@ -162,16 +248,30 @@ class ToyFF(object):
        cases.
     """
 
-    def __init__(self, graph, unit_cell=None):
+    # the database with special angles is loaded only once
+    _special_angles = None
+
+    def __init__(self, graph, unit_cell=None, max_depth=None, skin=None):
         """
            Argument:
             | ``graph``  --  the molecular graph from which the force field terms
                              are extracted. See
                              :class:molmod.molecular_graphs.MolecularGraph
 
-           Optional argument:
+           Optional arguments:
             | ``unit_cell``  --  periodic boundry conditions, see
                                  :class:`molmod.unit_cells.UnitCell`
+            | ``max_depth``  --  when given, the dm_quad term only includes
+                                 pairs of atoms whose graph distance is at
+                                 most max_depth.
+            | ``skin``  --  when given, the dm_reci term is computed with a
+                            :class:`molmod.binning.VerletList` with this skin
+                            instead of a loop over all pairs of atoms.
+
+           The dense distance matrices, dm, dm0 and dmk, are only constructed
+           when max_depth or skin is not given. With both arguments, the
+           memory usage and the cost of the force field scale linearly with
+           the number of atoms.
         """
         from molmod.bonds import bonds
 
@@ -182,11 +282,51 @@ class ToyFF(object):
             self.matrix = unit_cell.matrix
             self.reciprocal = unit_cell.reciprocal
 
-        self.dm = graph.distances.astype(numpy.int32)
-        dm = self.dm.astype(float)
-        self.dm0 = dm**2
-        self.dmk = (dm+0.1)**(-3)
         self.vdw_radii = numpy.array([periodic[number].vdw_radius for number in graph.numbers], dtype=float)
+        if max_depth is None or skin is None:
+            self.dm = graph.distances.astype(numpy.int32)
+            dm = self.dm.astype(float)
+            self.dm0 = dm**2
+            self.dmk = (dm+0.1)**(-3)
+        else:
+            self.dm = None
+            self.dm0 = None
+            self.dmk = None
+
+        if max_depth is None:
+            self.quad_pairs = None
+        else:
+            # the pairs within max_depth, each with index1 < index0
+            sparse = graph.get_distances(max_depth)
+            rows = numpy.repeat(numpy.arange(sparse.size), sparse.indptr[1:] - sparse.indptr[:-1])
+            mask = sparse.indices < rows
+            dm = sparse.data[mask].astype(float)
+            self.quad_pairs = numpy.array([rows[mask], sparse.indices[mask]], numpy.int32).transpose().copy()
+            self.quad_lengths = dm**2
+            self.quad_weights = (dm+0.1)**(-3)
+
+        if skin is None:
+            self.verlet_list = None
+        else:
+            from molmod.binning import VerletList
+            from molmod.clusters import UnionFind
+            # No pair can have a non-zero dm_reci term beyond this cutoff.
+            cutoff = 2*self.vdw_radii.max() if graph.num_vertices > 0 else 0.0
+            if unit_cell is None:
+                # Coarse bins work best for this short-ranged term.
+                grid = cutoff + skin
+            else:
+                grid = None
+            self.verlet_list = VerletList(cutoff, skin, unit_cell, grid)
+            self._reci_pairs = None
+            # Like in the dense version, bonded atoms and atoms that are not
+            # connected in the graph do not repel each other.
+            union_find = UnionFind(graph.num_vertices)
+            union_find.add_pairs(graph.edge_array)
+            self._components = union_find.get_labels()
+            edges = graph.edge_array.astype(numpy.int64)
+            self._bonded_keys = numpy.sort(edges.max(axis=1)*graph.num_vertices + edges.min(axis=1))
+
         self.covalent_radii = numpy.array([periodic[number].covalent_radius for number in graph.numbers], dtype=float)
 
         bond_edges = []
@@ -194,13 +334,16 @@ class ToyFF(object):
         for i, j in graph.edges:
             bond_edges.append((i, j))
             bond_lengths.append(bonds.get_length(graph.numbers[i], graph.numbers[j]))
-        self.bond_edges = numpy.array(bond_edges, numpy.int32)
+        self.bond_edges = numpy.array(bond_edges, numpy.int32).reshape((-1, 2))
         self.bond_lengths = numpy.array(bond_lengths, float)
 
-        special_angles = SpecialAngles()
+        if ToyFF._special_angles is None:
+            ToyFF._special_angles = SpecialAngles()
+        special_angles = ToyFF._special_angles
 
         span_edges = []
         span_lengths = []
+        default_angles = numpy.zeros(graph.num_vertices, float)
         for i, neighbors in graph.neighbors.iteritems():
             number_i = graph.numbers[i]
             if (number_i >= 5 and number_i <=8):
@@ -210,39 +353,40 @@ class ToyFF(object):
             else:
                 valence = -1
             if valence < 2 or valence > 6:
-                default_angle = numpy.pi/180.0*115.0
+                default_angles[i] = numpy.pi/180.0*115.0
             elif valence == 2:
-                default_angle = numpy.pi
+                default_angles[i] = numpy.pi
             elif valence == 3:
-                default_angle = numpy.pi/180.0*125.0
+                default_angles[i] = numpy.pi/180.0*125.0
             elif valence == 4:
-                default_angle = numpy.pi/180.0*109.0
+                default_angles[i] = numpy.pi/180.0*109.0
             elif valence == 5:
-                default_angle = numpy.pi/180.0*100.0
+                default_angles[i] = numpy.pi/180.0*100.0
             elif valence == 6:
-                default_angle = numpy.pi/180.0*90.0
-            for j in neighbors:
-                number_j = graph.numbers[j]
-                for k in neighbors:
-                    if j < k and not frozenset([j, k]) in graph.edges:
-                        number_k = graph.numbers[k]
-
-                        triplet = (
-                            number_j, len(graph.neighbors[j]),
-                            number_i, len(graph.neighbors[i]),
-                            number_k, len(graph.neighbors[k]),
-                        )
-
-                        angle = special_angles.get_angle(triplet)
-                        if angle is None:
-                            angle = default_angle
-
-                        dj = bonds.get_length(number_i, number_j)
-                        dk = bonds.get_length(number_i, number_k)
-                        d = numpy.sqrt(dj**2+dk**2-2*dj*dk*numpy.cos(angle))
-                        span_edges.append((j, k))
-                        span_lengths.append(d)
-        self.span_edges = numpy.array(span_edges, numpy.int32)
+                default_angles[i] = numpy.pi/180.0*90.0
+        for j, i, k in graph.bends.tolist():
+            if frozenset([j, k]) in graph.edge_index:
+                continue
+            number_i = graph.numbers[i]
+            number_j = graph.numbers[j]
+            number_k = graph.numbers[k]
+
+            triplet = (
+                number_j, len(graph.neighbors[j]),
+                number_i, len(graph.neighbors[i]),
+                number_k, len(graph.neighbors[k]),
+            )
+
+            angle = special_angles.get_angle(triplet)
+            if angle is None:
+                angle = default_angles[i]
+
+            dj = bonds.get_length(number_i, number_j)
+            dk = bonds.get_length(number_i, number_k)
+            d = numpy.sqrt(dj**2+dk**2-2*dj*dk*numpy.cos(angle))
+            span_edges.append((j, k))
+            span_lengths.append(d)
+        self.span_edges = numpy.array(span_edges, numpy.int32).reshape((-1, 2))
         self.span_lengths = numpy.array(span_lengths, float)
 
         self.dm_quad = 0.0
@@ -265,20 +409,32 @@ class ToyFF(object):
 
         gradient = numpy.zeros(x.shape, float)
         if self.dm_quad > 0.0:
-            result += ff_dm_quad(x, self.dm0, self.dmk, self.dm_quad,
-                                 gradient, self.matrix, self.reciprocal)
+            if self.quad_pairs is None:
+                result += ff_dm_quad(x, self.dm0, self.dmk, self.dm_quad,
+                                     gradient, self.matrix, self.reciprocal)
+            elif len(self.quad_pairs) > 0:
+                result += ff_pair_quad(x, self.quad_pairs, self.quad_lengths,
+                                       self.quad_weights, self.dm_quad,
+                                       gradient, self.matrix, self.reciprocal)
         if self.dm_reci:
-            result += ff_dm_reci(x, self.vdw_radii, self.dm, self.dm_reci,
-                                 gradient, self.matrix, self.reciprocal)
-        if self.bond_quad:
+            if self.verlet_list is None:
+                result += ff_dm_reci(x, self.vdw_radii, self.dm, self.dm_reci,
+                                     gradient, self.matrix, self.reciprocal)
+            else:
+                pairs = self._get_reci_pairs(x)
+                if len(pairs) > 0:
+                    result += ff_pair_reci(x, pairs, self.vdw_radii,
+                                           self.dm_reci, gradient,
+                                           self.matrix, self.reciprocal)
+        if self.bond_quad and len(self.bond_edges) > 0:
             result += ff_bond_quad(x, self.bond_edges, self.bond_lengths,
                                    self.bond_quad, gradient, self.matrix,
                                    self.reciprocal)
-        if self.span_quad:
+        if self.span_quad and len(self.span_edges) > 0:
             result += ff_bond_quad(x, self.span_edges, self.span_lengths,
                                    self.span_quad, gradient, self.matrix,
                                    self.reciprocal)
-        if self.bond_hyper:
+        if self.bond_hyper and len(self.bond_edges) > 0:
             result += ff_bond_hyper(x, self.bond_edges, self.bond_lengths,
                                     self.bond_hyper_scale, self.bond_hyper,
                                     gradient, self.matrix, self.reciprocal)
@@ -288,6 +444,142 @@ class ToyFF(object):
         else:
             return result
 
+    def _get_reci_pairs(self, x):
+        """Return the pairs from the Verlet list that may repel each other"""
+        index0, index1 = self.verlet_list.get_candidates(x)
+        if self._reci_pairs is None or self._reci_pairs[0] is not index0:
+            # the pairs were searched again
+            mask = self._components[index0] == self._components[index1]
+            if len(self._bonded_keys) > 0:
+                keys = index0.astype(numpy.int64)*len(x) + index1
+                positions = numpy.searchsorted(self._bonded_keys, keys)
+                positions[positions == len(self._bonded_keys)] = 0
+                mask &= self._bonded_keys[positions] != keys
+            pairs = numpy.array([index0[mask], index1[mask]], numpy.int32).transpose().copy()
+            self._reci_pairs = index0, pairs
+        return self._reci_pairs[1]
+
+
+class BatchToyFF(object):
+    """The ToyFF for many molecular graphs at once
+
+       This is meant to be used with the
+       :class:`molmod.minimizer.BatchMinimizer`. The coordinates of all
+       molecules are stored as the rows of a two-dimensional array, padded with
+       zeros up to the size of the largest molecule. Internally, the atoms,
+       distance matrices, bonds and spans of all molecules are concatenated,
+       such that the energies and gradients of all molecules are computed in a
+       single call to the C extension. Periodic boundary conditions are not
+       supported.
+    """
+
+    def __init__(self, graphs):
+        """
+           Argument:
+            | ``graphs``  --  a list of molecular graphs, see
+                              :class:molmod.molecular_graphs.MolecularGraph
+        """
+        ffs = [ToyFF(graph) for graph in graphs]
+        natoms = numpy.array([graph.num_vertices for graph in graphs], int)
+        self.sizes = 3*natoms
+        self.atom_offsets = numpy.zeros(len(graphs)+1, numpy.int32)
+        self.atom_offsets[1:] = natoms.cumsum()
+        self.dm_offsets = numpy.zeros(len(graphs)+1, numpy.int32)
+        self.dm_offsets[1:] = (natoms**2).cumsum()
+        self.dm0 = numpy.concatenate([ff.dm0.ravel() for ff in ffs])
+        self.dmk = numpy.concatenate([ff.dmk.ravel() for ff in ffs])
+        self.dm = numpy.concatenate([ff.dm.ravel() for ff in ffs])
+        self.vdw_radii = numpy.concatenate([ff.vdw_radii for ff in ffs])
+
+        def concatenate_pairs(name):
+            """Concatenate pairs of atoms with global atom indexes"""
+            offsets = numpy.zeros(len(graphs)+1, numpy.int32)
+            pairs = []
+            lengths = []
+            for index, ff in enumerate(ffs):
+                edges = getattr(ff, "%s_edges" % name)
+                pairs.append(edges + self.atom_offsets[index])
+                lengths.append(getattr(ff, "%s_lengths" % name))
+                offsets[index+1] = offsets[index] + len(edges)
+            return offsets, numpy.concatenate(pairs).astype(numpy.int32), \
+                numpy.concatenate(lengths)
+
+        self.bond_offsets, self.bond_edges, self.bond_lengths = concatenate_pairs("bond")
+        self.span_offsets, self.span_edges, self.span_lengths = concatenate_pairs("span")
+
+        # indexes to go from the padded to the concatenated layout
+        self._rows = numpy.repeat(numpy.arange(len(graphs)), natoms)
+        self._cols = numpy.concatenate([numpy.arange(natom) for natom in natoms])
+
+        self.dm_quad = 0.0
+        self.dm_reci = 0.0
+        self.bond_quad = 0.0
+        self.span_quad = 0.0
+        self.bond_hyper = 0.0
+        self.bond_hyper_scale = 5.0
+
+    def pack(self, coordinates):
+        """Convert a list of coordinate arrays to the padded layout
+
+           Argument:
+            | ``coordinates``  --  a list with an array with shape (N, 3) for
+                                   each molecule
+        """
+        x = numpy.zeros((len(self.sizes), self.sizes.max()), float)
+        x.reshape((len(self.sizes), -1, 3))[self._rows, self._cols] = \
+            numpy.concatenate(coordinates)
+        return x
+
+    def unpack(self, x):
+        """Convert coordinates in the padded layout to a list of arrays
+
+           Argument:
+            | ``x``  --  an array with shape (K, n), where K is the number of
+                         molecules and n is three times the largest number of
+                         atoms
+        """
+        x = x.reshape((len(self.sizes), -1, 3))
+        return [x[index, :size/3].copy() for index, size in enumerate(self.sizes)]
+
+    def __call__(self, x, do_gradient=False, mask=None):
+        """Compute the energies (and gradients) of all molecules
+
+           Argument:
+            | ``x``  --  the Cartesian coordinates in the padded layout
+
+           Optional arguments:
+            | ``do_gradient``  --  when set to True, the gradients are also
+                                   computed and returned. [default=False]
+            | ``mask``  --  a boolean array that selects the molecules whose
+                            energy must be computed. The energies and
+                            gradients of the other molecules are zero.
+                            [default=None]
+        """
+        num_problems = len(self.sizes)
+        cor = x.reshape((num_problems, -1, 3))[self._rows, self._cols]
+        if mask is None:
+            active = numpy.ones(num_problems, numpy.int32)
+        else:
+            active = mask.astype(numpy.int32)
+        amps = numpy.array([
+            self.dm_quad, self.dm_reci, self.bond_quad, self.span_quad,
+            self.bond_hyper, self.bond_hyper_scale
+        ])
+        gradient = numpy.zeros(cor.shape, float)
+        energies = numpy.zeros(num_problems, float)
+        ff_batch(
+            cor, active, self.atom_offsets, self.dm_offsets, self.dm0,
+            self.dmk, self.dm, self.vdw_radii, self.bond_offsets,
+            self.bond_edges, self.bond_lengths, self.span_offsets,
+            self.span_edges, self.span_lengths, amps, gradient, energies
+        )
+        if do_gradient:
+            result = numpy.zeros(x.shape, float)
+            result.reshape((num_problems, -1, 3))[self._rows, self._cols] = gradient
+            return energies, result
+        else:
+            return energies
+
 
 class SpecialAngles(object):
     """A database with precomputed valence angles from small molecules"""
@@ -62,8 +62,8 @@ setup(
         for dn in glob('data/examples/???_*')
     ],
     ext_modules=[
-        Extension("molmod.ext", ["molmod/ext.pyf", "molmod/common.c",
-            "molmod/ff.c", "molmod/graphs.c", "molmod/similarity.c",
+        Extension("molmod.ext", ["molmod/ext.pyf", "molmod/binning.c", "molmod/clusters.c", "molmod/common.c",
+            "molmod/ewald.c", "molmod/ff.c", "molmod/graphs.c", "molmod/similarity.c",
             "molmod/molecules.c", "molmod/unit_cells.c",
         ]),
     ],